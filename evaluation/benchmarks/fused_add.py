@@ -0,0 +1,96 @@
+"""
+Benchmark `Memory.add` inference: the default two-call pipeline vs. the single-call "fused" add mode.
+
+The default mode extracts facts with one LLM call, embeds and searches every fact, then decides the memory updates
+with a second LLM call. The fused mode embeds and searches the raw conversation turn once and returns the facts and
+their ADD/UPDATE/DELETE/NONE decisions from a single structured-output call.
+
+Both modes replay the same scripted conversation, which introduces, revises and retracts facts so that every kind
+of decision occurs, against their own fresh collection. Requires API access for the chosen LLM and embedder, e.g.:
+
+    export OPENAI_API_KEY=...
+    python benchmarks/fused_add.py --provider openai_structured --model gpt-4o-mini --runs 3
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+import uuid
+
+from mem0 import Memory
+
+CONVERSATION = [
+    "Hi, I'm Sam. I just started as a data engineer at a logistics startup in Berlin.",
+    "I'm vegetarian, so please keep that in mind for restaurant suggestions.",
+    "My sister Maya is visiting next month; she loves Italian food.",
+    "Actually I moved from Berlin to Munich last week for the same job.",
+    "I've been training for a half marathon in October, running four times a week.",
+    "I'm no longer vegetarian, I started eating fish again.",
+    "Maya cancelled her trip, she can't make it next month after all.",
+    "I got promoted to senior data engineer today!",
+    "I hurt my knee, so the half marathon is off and I'm switching to swimming.",
+    "For work I'm mostly writing Spark jobs and Airflow DAGs these days.",
+]
+
+
+def build_memory(args, mode, workdir):
+    config = {
+        "llm": {"provider": args.provider, "config": {"model": args.model, "temperature": 0}},
+        "vector_store": {
+            "provider": "qdrant",
+            "config": {"collection_name": f"bench_{mode}", "path": f"{workdir}/qdrant_{mode}", "on_disk": False},
+        },
+        "history_db_path": f"{workdir}/history_{mode}.db",
+        "add_mode": mode,
+    }
+    return Memory.from_config(config)
+
+
+def replay(memory, user_id):
+    """Add every turn of the conversation in order; return the per-turn latencies (ms) and the number of changes."""
+    latencies, changes = [], 0
+    for turn in CONVERSATION:
+        start = time.perf_counter()
+        result = memory.add([{"role": "user", "content": turn}], user_id=user_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+        changes += len(result["results"])
+    return latencies, changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the default and fused add modes")
+    parser.add_argument("--provider", default="openai_structured", help="LLM provider")
+    parser.add_argument("--model", default="gpt-4o-mini", help="LLM model")
+    parser.add_argument("--runs", type=int, default=3, help="Conversation replays per mode")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in ("default", "fused"):
+            memory = build_memory(args, mode, workdir)
+            latencies, changes = [], 0
+            for _ in range(args.runs):
+                run_latencies, run_changes = replay(memory, user_id=f"bench_{uuid.uuid4().hex[:8]}")
+                latencies.extend(run_latencies)
+                changes += run_changes
+            usage = memory.llm.usage
+            rows.append(
+                (
+                    mode,
+                    statistics.median(latencies),
+                    statistics.quantiles(latencies, n=20)[-1],
+                    usage["requests"] / len(latencies),
+                    usage["input_tokens"] / len(latencies),
+                    changes / args.runs,
+                )
+            )
+
+    print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'LLM calls':>12}{'input tok':>12}{'changes':>10}")
+    for mode, p50, p95, calls, tokens, changes in rows:
+        print(f"{mode:<10}{p50:>10.0f}{p95:>10.0f}{calls:>12.2f}{tokens:>12.0f}{changes:>10.1f}")
+    print(f"p50 speedup: {rows[0][1] / rows[1][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
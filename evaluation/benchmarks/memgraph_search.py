@@ -0,0 +1,172 @@
+"""
+Benchmark graph search on Memgraph: pairwise cosine scan vs. vector index lookup.
+
+Builds a synthetic graph of random entity embeddings for several users, then times the query that
+`mem0.memory.memgraph_memory.MemoryGraph._search_graph_db` used to run (one `node_similarity.cosine_pairwise`
+query per query entity over all of the user's relations) against the current single UNWIND query driven by
+`vector_search.search`.
+
+Requires a running Memgraph with MAGE, e.g.:
+
+    docker run -p 7687:7687 memgraph/memgraph-mage:latest --schema-info-enabled=True
+    python benchmarks/memgraph_search.py --users 20 --entities 500
+
+The benchmark wipes the target database.
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from langchain_memgraph.graphs.memgraph import Memgraph
+
+from mem0.memory.memgraph_memory import VECTOR_INDEX_NAME
+
+PAIRWISE_QUERY = """
+MATCH (n:Entity {user_id: $user_id})-[r]->(m:Entity)
+WHERE n.embedding IS NOT NULL
+WITH collect(n) AS nodes1, collect(m) AS nodes2, r
+CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
+YIELD node1, node2, similarity
+WITH node1, node2, similarity, r
+WHERE similarity >= $threshold
+RETURN node1.name AS source, type(r) AS relationship, node2.name AS destination, similarity
+UNION
+MATCH (n:Entity {user_id: $user_id})<-[r]-(m:Entity)
+WHERE n.embedding IS NOT NULL
+WITH collect(n) AS nodes1, collect(m) AS nodes2, r
+CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
+YIELD node1, node2, similarity
+WITH node1, node2, similarity, r
+WHERE similarity >= $threshold
+RETURN node2.name AS source, type(r) AS relationship, node1.name AS destination, similarity
+ORDER BY similarity DESC
+LIMIT $limit;
+"""
+
+VECTOR_QUERY = f"""
+UNWIND $entities AS entity
+CALL vector_search.search("{VECTOR_INDEX_NAME}", $candidates, entity.embedding)
+YIELD distance, node, similarity
+WITH node AS n, similarity
+WHERE n.user_id = $user_id AND similarity >= $threshold
+WITH n, max(similarity) AS similarity
+MATCH (n)-[r]-(m:Entity)
+WHERE m.user_id = $user_id
+WITH startNode(r) AS source_node, r, endNode(r) AS destination_node, max(similarity) AS similarity
+RETURN source_node.name AS source, type(r) AS relationship, destination_node.name AS destination, similarity
+ORDER BY similarity DESC
+LIMIT $limit;
+"""
+
+
+def build_graph(graph, rng, users, entities, degree, dims, batch_size=1000):
+    """Create `entities` nodes with `degree` outgoing relations each for every user; return their embeddings."""
+    graph.query("MATCH (n) DETACH DELETE n;", params={})
+    try:
+        graph.query(f"DROP VECTOR INDEX {VECTOR_INDEX_NAME};", params={})
+    except Exception:
+        pass
+    capacity = int(users * entities / 0.9) + 1
+    graph.query(
+        f"CREATE VECTOR INDEX {VECTOR_INDEX_NAME} ON :Entity(embedding) WITH CONFIG "
+        f"{{'dimension': {dims}, 'capacity': {capacity}, 'metric': 'cos'}};",
+        params={},
+    )
+    graph.query("CREATE INDEX ON :Entity(user_id);", params={})
+    graph.query("CREATE INDEX ON :Entity(name);", params={})
+
+    embeddings = {}
+    for user in range(users):
+        user_id = f"user_{user}"
+        vectors = rng.normal(size=(entities, dims)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        embeddings[user_id] = vectors
+
+        nodes = [{"name": f"entity_{i}", "embedding": vectors[i].tolist()} for i in range(entities)]
+        for start in range(0, len(nodes), batch_size):
+            graph.query(
+                "UNWIND $nodes AS node CREATE (:Entity {name: node.name, user_id: $user_id, embedding: node.embedding});",
+                params={"nodes": nodes[start : start + batch_size], "user_id": user_id},
+            )
+
+        edges = [
+            {"source": f"entity_{i}", "destination": f"entity_{j}"}
+            for i in range(entities)
+            for j in rng.choice(entities, size=degree, replace=False)
+            if i != j
+        ]
+        for start in range(0, len(edges), batch_size):
+            graph.query(
+                """
+                UNWIND $edges AS edge
+                MATCH (s:Entity {user_id: $user_id, name: edge.source}), (d:Entity {user_id: $user_id, name: edge.destination})
+                CREATE (s)-[:RELATED_TO]->(d);
+                """,
+                params={"edges": edges[start : start + batch_size], "user_id": user_id},
+            )
+    return embeddings
+
+
+def query_entities(rng, vectors, count, noise=0.05):
+    """Perturbed copies of stored embeddings, standing in for the embeddings of a query's entities."""
+    picked = vectors[rng.choice(len(vectors), size=count, replace=False)]
+    perturbed = picked + rng.normal(scale=noise, size=picked.shape).astype(np.float32)
+    perturbed /= np.linalg.norm(perturbed, axis=1, keepdims=True)
+    return [{"name": f"query_{i}", "embedding": vector.tolist()} for i, vector in enumerate(perturbed)]
+
+
+def time_ms(fn, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Memgraph graph search strategies")
+    parser.add_argument("--url", default="bolt://localhost:7687", help="Memgraph URL")
+    parser.add_argument("--username", default="memgraph", help="Memgraph username")
+    parser.add_argument("--password", default="mem0graph", help="Memgraph password")
+    parser.add_argument("--users", type=int, default=10, help="Number of users in the graph")
+    parser.add_argument("--entities", type=int, default=500, help="Entities per user")
+    parser.add_argument("--degree", type=int, default=3, help="Outgoing relations per entity")
+    parser.add_argument("--dims", type=int, default=256, help="Embedding dimensions")
+    parser.add_argument("--query_entities", type=int, default=3, help="Entities extracted per search query")
+    parser.add_argument("--candidates", type=int, default=100, help="Vector index candidates per entity")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per strategy")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    graph = Memgraph(args.url, args.username, args.password)
+
+    print(f"Building graph: {args.users} users x {args.entities} entities, degree {args.degree}, {args.dims} dims")
+    embeddings = build_graph(graph, rng, args.users, args.entities, args.degree, args.dims)
+
+    user_id = "user_0"
+    entities = query_entities(rng, embeddings[user_id], args.query_entities)
+    params = {"user_id": user_id, "threshold": 0.7, "limit": 100}
+
+    def pairwise():
+        # One query per entity; the old query never used the entity embedding
+        for _ in entities:
+            graph.query(PAIRWISE_QUERY, params=params)
+
+    def vector():
+        graph.query(VECTOR_QUERY, params={**params, "entities": entities, "candidates": args.candidates})
+
+    pairwise_ms = time_ms(pairwise, args.runs)
+    vector_ms = time_ms(vector, args.runs)
+
+    print(f"{'strategy':<24}{'median ms':>12}")
+    print(f"{'cosine_pairwise':<24}{pairwise_ms:>12.1f}")
+    print(f"{'vector_search':<24}{vector_ms:>12.1f}")
+    print(f"speedup: {pairwise_ms / vector_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
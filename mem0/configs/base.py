@@ -1,7 +1,7 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from mem0.embeddings.configs import EmbedderConfig
 from mem0.graphs.configs import GraphStoreConfig
@@ -26,6 +26,35 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class InputWindowConfig(BaseModel):
+    """
+    Windowing of the conversation given to `add` before facts are extracted from it.
+
+    Args:
+        skip_processed (bool): Skip the messages of a session up to the last ones a previous `add` processed, so
+            that agents can pass their whole history on every turn.
+        chunk_tokens (int): Tokens of conversation per fact extraction call. Longer inputs are split into chunks
+            that are extracted in parallel. Not split when None.
+        max_sessions (int): Sessions whose last processed messages are remembered, least recently used first out.
+    """
+
+    skip_processed: bool = Field(description="Skip the messages processed by earlier adds", default=True)
+    chunk_tokens: Optional[int] = Field(description="Tokens of conversation per extraction call", default=4000, gt=0)
+    max_sessions: int = Field(description="Sessions whose last processed messages are remembered", default=10000, gt=0)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -59,6 +88,26 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    add_mode: Literal["default", "fused"] = Field(
+        description=(
+            "How `add` infers memories: 'default' extracts facts and decides the memory updates in two LLM calls, "
+            "'fused' retrieves related memories from the conversation first and does both in a single call"
+        ),
+        default="default",
+    )
+    fused_add_candidates: int = Field(
+        description="Number of existing memories retrieved for the conversation in the 'fused' add mode",
+        default=10,
+    )
+    input_window: Optional[InputWindowConfig] = Field(
+        description="Skip already processed messages and split long conversations before facts are extracted",
+        default=None,
+    )
+    max_parse_reasks: int = Field(
+        description="Follow-up requests asking the LLM to fix the invalid part of a fact or memory update response",
+        default=1,
+        ge=0,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -83,3 +132,103 @@ class AzureConfig(BaseModel):
     default_headers: Optional[Dict[str, str]] = Field(
         description="Headers to include in requests to the Azure API.", default=None
     )
+
+
+class RateLimitConfig(BaseModel):
+    """
+    Client-side rate limits of an LLM or embedding model, shared by every Memory instance in the process that uses
+    the same provider and model.
+
+    Args:
+        requests_per_minute (int): Requests allowed per minute. Unlimited when None.
+        tokens_per_minute (int): Tokens allowed per minute, estimated from the text sent and received. Unlimited
+            when None.
+        max_concurrency (int): Upper bound of the adaptive number of concurrent requests.
+        max_retries (int): Retries of a request that was rate limited or failed transiently.
+        target_latency (float): Latency in seconds above which concurrency is reduced. Only rate limiting reduces
+            it when None.
+    """
+
+    requests_per_minute: Optional[int] = Field(description="Requests allowed per minute", default=None, gt=0)
+    tokens_per_minute: Optional[int] = Field(description="Tokens allowed per minute", default=None, gt=0)
+    max_concurrency: int = Field(description="Upper bound of the number of concurrent requests", default=16, gt=0)
+    max_retries: int = Field(description="Retries of rate limited or transiently failed requests", default=3, ge=0)
+    target_latency: Optional[float] = Field(
+        description="Latency in seconds above which concurrency is reduced", default=None, gt=0
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+
+class HttpPoolConfig(BaseModel):
+    """
+    HTTP connection pool of the provider clients. Clients with the same settings share one pool per process.
+
+    Args:
+        max_connections (int): Open connections allowed, per pool.
+        max_keepalive_connections (int): Idle connections kept open for reuse.
+        keepalive_expiry (float): Seconds an idle connection is kept open.
+        timeout (float): Seconds to wait for a response.
+        connect_timeout (float): Seconds to wait for a connection.
+        http2 (bool): Use HTTP/2 when the server supports it (requires the `h2` package).
+    """
+
+    max_connections: int = Field(description="Open connections allowed", default=100, gt=0)
+    max_keepalive_connections: int = Field(description="Idle connections kept open for reuse", default=20, ge=0)
+    keepalive_expiry: float = Field(description="Seconds an idle connection is kept open", default=30.0, ge=0)
+    timeout: float = Field(description="Seconds to wait for a response", default=600.0, gt=0)
+    connect_timeout: float = Field(description="Seconds to wait for a connection", default=5.0, gt=0)
+    http2: bool = Field(description="Use HTTP/2 when the server supports it", default=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+
+class LlmCacheConfig(BaseModel):
+    """
+    Cache of LLM responses, keyed by the provider, model, sampling parameters, messages, tools and response format
+    of the request.
+
+    Args:
+        max_entries (int): Responses kept in memory, least recently used first out.
+        path (str): SQLite file where responses are also stored, so they survive restarts and are shared between
+            processes. In memory only when None.
+        max_disk_entries (int): Responses kept in the SQLite file, least recently used first out.
+        ttl (float): Seconds a response stays valid. Forever when None.
+    """
+
+    max_entries: int = Field(description="Responses kept in memory", default=1024, ge=0)
+    path: Optional[str] = Field(description="SQLite file for the responses", default=None)
+    max_disk_entries: int = Field(description="Responses kept in the SQLite file", default=100_000, gt=0)
+    ttl: Optional[float] = Field(description="Seconds a response stays valid", default=None, gt=0)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
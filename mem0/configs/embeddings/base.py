@@ -1,9 +1,8 @@
 from abc import ABC
 from typing import Dict, Optional, Union
 
-import httpx
-
-from mem0.configs.base import AzureConfig
+from mem0.configs.base import AzureConfig, HttpPoolConfig, RateLimitConfig
+from mem0.utils.http import get_http_client
 
 
 class BaseEmbedderConfig(ABC):
@@ -26,6 +25,7 @@ class BaseEmbedderConfig(ABC):
         # AzureOpenAI specific
         azure_kwargs: Optional[AzureConfig] = {},
         http_client_proxies: Optional[Union[Dict, str]] = None,
+        http_pool: Optional[Union[Dict, HttpPoolConfig]] = None,
         # VertexAI specific
         vertex_credentials_json: Optional[str] = None,
         memory_add_embedding_type: Optional[str] = None,
@@ -39,6 +39,8 @@ class BaseEmbedderConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = "us-west-2",
+        # Client-side rate limiting
+        rate_limit: Optional[Union[Dict, RateLimitConfig]] = None,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -61,6 +63,9 @@ class BaseEmbedderConfig(ABC):
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param http_client_proxies: The proxy server settings used to create self.http_client, defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
+        :param http_pool: Connection pool limits, timeouts and HTTP/2 of the provider client. Clients with the same
+        settings and proxies share one pool per process, defaults to None (HttpPoolConfig defaults)
+        :type http_pool: Optional[Dict | HttpPoolConfig], optional
         :param vertex_credentials_json: The path to the Vertex AI credentials JSON file, defaults to None
         :type vertex_credentials_json: Optional[str], optional
         :param memory_add_embedding_type: The type of embedding to use for the add memory action, defaults to None
@@ -71,6 +76,9 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param rate_limit: Client-side request and token quotas, adaptive concurrency and retries shared by every
+        instance using the same provider and model, defaults to None (requests are sent as they come)
+        :type rate_limit: Optional[Dict | RateLimitConfig], optional
         """
 
         self.model = model
@@ -79,7 +87,8 @@ class BaseEmbedderConfig(ABC):
         self.embedding_dims = embedding_dims
 
         # AzureOpenAI specific
-        self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_pool = HttpPoolConfig(**http_pool) if isinstance(http_pool, dict) else http_pool or HttpPoolConfig()
+        self.http_client = get_http_client(self.http_pool, http_client_proxies)
 
         # Ollama specific
         self.ollama_base_url = ollama_base_url
@@ -106,3 +115,6 @@ class BaseEmbedderConfig(ABC):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
+
+        # Client-side rate limiting
+        self.rate_limit = RateLimitConfig(**rate_limit) if isinstance(rate_limit, dict) else rate_limit
@@ -1,9 +1,8 @@
 from abc import ABC
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
-import httpx
-
-from mem0.configs.base import AzureConfig
+from mem0.configs.base import AzureConfig, HttpPoolConfig, LlmCacheConfig, RateLimitConfig
+from mem0.utils.http import get_http_client
 
 
 class BaseLlmConfig(ABC):
@@ -21,6 +20,8 @@ class BaseLlmConfig(ABC):
         top_k: int = 1,
         enable_vision: bool = False,
         vision_details: Optional[str] = "auto",
+        vision_concurrency: int = 4,
+        vision_cache: Optional[Union[Dict, LlmCacheConfig]] = None,
         # Openrouter specific
         models: Optional[list[str]] = None,
         route: Optional[str] = "fallback",
@@ -35,6 +36,7 @@ class BaseLlmConfig(ABC):
         azure_kwargs: Optional[AzureConfig] = {},
         # AzureOpenAI specific
         http_client_proxies: Optional[Union[Dict, str]] = None,
+        http_pool: Optional[Union[Dict, HttpPoolConfig]] = None,
         # DeepSeek specific
         deepseek_base_url: Optional[str] = None,
         # XAI specific
@@ -50,6 +52,18 @@ class BaseLlmConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = "us-west-2",
+        # Anthropic / AWS Bedrock specific
+        prompt_caching: Optional[bool] = None,
+        # Client-side rate limiting
+        rate_limit: Optional[Union[Dict, RateLimitConfig]] = None,
+        # Response cache
+        cache: Optional[Union[Dict, LlmCacheConfig]] = None,
+        # Router specific
+        routes: Optional[List[Dict]] = None,
+        hedge_percentile: Optional[float] = 95.0,
+        hedge_delay: float = 2.0,
+        circuit_breaker_threshold: int = 3,
+        circuit_breaker_timeout: float = 30.0,
     ):
         """
         Initializes a configuration class instance for the LLM.
@@ -72,6 +86,11 @@ class BaseLlmConfig(ABC):
         :type enable_vision: bool, optional
         :param vision_details: Details of the vision to be used [low, high, auto], defaults to "auto"
         :type vision_details: Optional[str], optional
+        :param vision_concurrency: Images described at the same time when `add` receives several, defaults to 4
+        :type vision_concurrency: int, optional
+        :param vision_cache: Cache of the image descriptions, by image URL or content, defaults to None (1024
+        descriptions kept in memory)
+        :type vision_cache: Optional[Dict | LlmCacheConfig], optional
         :param models: Openrouter models to use, defaults to None
         :type models: Optional[list[str]], optional
         :param route: Openrouter route to be used, defaults to "fallback"
@@ -90,6 +109,9 @@ class BaseLlmConfig(ABC):
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param http_client_proxies: The proxy server(s) settings used to create self.http_client, defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
+        :param http_pool: Connection pool limits, timeouts and HTTP/2 of the provider client. Clients with the same
+        settings and proxies share one pool per process, defaults to None (HttpPoolConfig defaults)
+        :type http_pool: Optional[Dict | HttpPoolConfig], optional
         :param deepseek_base_url: DeepSeek base URL to be use, defaults to None
         :type deepseek_base_url: Optional[str], optional
         :param xai_base_url: XAI base URL to be use, defaults to None
@@ -102,6 +124,27 @@ class BaseLlmConfig(ABC):
         :type lmstudio_response_format: Optional[Dict], optional
         :param vllm_base_url: vLLM base URL to be use, defaults to "http://localhost:8000/v1"
         :type vllm_base_url: Optional[str], optional
+        :param prompt_caching: Mark the system prompt as a prompt cache breakpoint (Anthropic, AWS Bedrock). Defaults to
+        None: enabled for Anthropic and disabled for AWS Bedrock, where only some models support prompt caching
+        :type prompt_caching: Optional[bool], optional
+        :param rate_limit: Client-side request and token quotas, adaptive concurrency and retries shared by every
+        instance using the same provider and model, defaults to None (requests are sent as they come)
+        :type rate_limit: Optional[Dict | RateLimitConfig], optional
+        :param cache: Cache identical requests in memory and optionally in a SQLite file, defaults to None (no cache)
+        :type cache: Optional[Dict | LlmCacheConfig], optional
+        :param routes: Router LLMs in order of preference, each a {"provider": ..., "config": {...}} dict like the
+        `llm` section of the memory config, defaults to None
+        :type routes: Optional[List[Dict]], optional
+        :param hedge_percentile: Percentile of a route's recent latencies after which the router sends a duplicate
+        request to the next route, defaults to 95. None disables hedging (routes are only used as fallbacks)
+        :type hedge_percentile: Optional[float], optional
+        :param hedge_delay: Hedge delay in seconds until a route has enough latency samples, defaults to 2.0
+        :type hedge_delay: float, optional
+        :param circuit_breaker_threshold: Consecutive failures after which the router stops using a route, defaults
+        to 3
+        :type circuit_breaker_threshold: int, optional
+        :param circuit_breaker_timeout: Seconds before a route with an open circuit is tried again, defaults to 30.0
+        :type circuit_breaker_timeout: float, optional
         """
 
         self.model = model
@@ -112,9 +155,12 @@ class BaseLlmConfig(ABC):
         self.top_k = top_k
         self.enable_vision = enable_vision
         self.vision_details = vision_details
+        self.vision_concurrency = vision_concurrency
+        self.vision_cache = LlmCacheConfig(**vision_cache) if isinstance(vision_cache, dict) else vision_cache
 
         # AzureOpenAI specific
-        self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_pool = HttpPoolConfig(**http_pool) if isinstance(http_pool, dict) else http_pool or HttpPoolConfig()
+        self.http_client = get_http_client(self.http_pool, http_client_proxies)
 
         # Openrouter specific
         self.models = models
@@ -150,3 +196,19 @@ class BaseLlmConfig(ABC):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
+
+        # Anthropic / AWS Bedrock specific
+        self.prompt_caching = prompt_caching
+
+        # Client-side rate limiting
+        self.rate_limit = RateLimitConfig(**rate_limit) if isinstance(rate_limit, dict) else rate_limit
+
+        # Response cache
+        self.cache = LlmCacheConfig(**cache) if isinstance(cache, dict) else cache
+
+        # Router specific
+        self.routes = routes
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_timeout = circuit_breaker_timeout
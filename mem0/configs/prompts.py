@@ -288,46 +288,143 @@ You are a memory summarization system that records and preserves the complete in
 """
 
 
-def get_update_memory_messages(retrieved_old_memory_dict, response_content, custom_update_memory_prompt=None):
+UPDATE_MEMORY_INSTRUCTIONS = """You will be given the current content of my memory, which I have collected till now, and the new retrieved facts, each in triple backticks. You have to analyze the new retrieved facts and determine whether these facts should be added, updated, or deleted in the memory.
+
+You must return your response in the following JSON structure only:
+
+{
+    "memory" : [
+        {
+            "id" : "<ID of the memory>",                # Use existing ID for updates/deletes, or new ID for additions
+            "text" : "<Content of the memory>",         # Content of the memory
+            "event" : "<Operation to be performed>",    # Must be "ADD", "UPDATE", "DELETE", or "NONE"
+            "old_memory" : "<Old memory content>"       # Required only if the event is "UPDATE"
+        },
+        ...
+    ]
+}
+
+Follow the instruction mentioned below:
+- Do not return anything from the custom few shot prompts provided above.
+- If the current memory is empty, then you have to add the new retrieved facts to the memory.
+- You should return the updated memory in only JSON format as shown above. The memory key should be the same if no changes are made.
+- If there is an addition, generate a new key and add the new memory corresponding to it.
+- If there is a deletion, the memory key-value pair should be removed from the memory.
+- If there is an update, the ID key should remain the same and only the value needs to be updated.
+
+Do not return anything except the JSON format.
+"""
+
+
+def get_update_memory_prompts(retrieved_old_memory_dict, response_content, custom_update_memory_prompt=None):
+    """
+    Build the memory update decision prompt as a static system prompt and a per-request user prompt.
+
+    Every instruction lives in the system prompt, which only changes with `custom_update_memory_prompt`, so
+    providers can cache it across requests (automatic prefix caching on OpenAI, Azure OpenAI and Gemini, cache
+    breakpoints on Anthropic and AWS Bedrock). The existing memories and the new facts come last, in the user prompt.
+
+    Returns:
+        tuple: (system_prompt, user_prompt)
+    """
     if custom_update_memory_prompt is None:
-        global DEFAULT_UPDATE_MEMORY_PROMPT
         custom_update_memory_prompt = DEFAULT_UPDATE_MEMORY_PROMPT
 
-    return f"""{custom_update_memory_prompt}
+    system_prompt = f"{custom_update_memory_prompt}\n\n{UPDATE_MEMORY_INSTRUCTIONS}"
+    user_prompt = f"""Below is the current content of my memory which I have collected till now. You have to update it in the following format only:
 
-    Below is the current content of my memory which I have collected till now. You have to update it in the following format only:
+```
+{retrieved_old_memory_dict}
+```
 
-    ```
-    {retrieved_old_memory_dict}
-    ```
+The new retrieved facts are mentioned in the triple backticks. You have to analyze the new retrieved facts and determine whether these facts should be added, updated, or deleted in the memory.
 
-    The new retrieved facts are mentioned in the triple backticks. You have to analyze the new retrieved facts and determine whether these facts should be added, updated, or deleted in the memory.
+```
+{response_content}
+```
+"""
+    return system_prompt, user_prompt
 
-    ```
-    {response_content}
-    ```
 
-    You must return your response in the following JSON structure only:
+def get_update_memory_messages(retrieved_old_memory_dict, response_content, custom_update_memory_prompt=None):
+    """The memory update decision prompt as a single message: the static instructions first, the dynamic content last."""
+    system_prompt, user_prompt = get_update_memory_prompts(
+        retrieved_old_memory_dict, response_content, custom_update_memory_prompt
+    )
+    return f"{system_prompt}\n{user_prompt}"
 
-    {{
-        "memory" : [
-            {{
-                "id" : "<ID of the memory>",                # Use existing ID for updates/deletes, or new ID for additions
-                "text" : "<Content of the memory>",         # Content of the memory
-                "event" : "<Operation to be performed>",    # Must be "ADD", "UPDATE", "DELETE", or "NONE"
-                "old_memory" : "<Old memory content>"       # Required only if the event is "UPDATE"
-            }},
-            ...
-        ]
-    }}
 
-    Follow the instruction mentioned below:
-    - Do not return anything from the custom few shot prompts provided above.
-    - If the current memory is empty, then you have to add the new retrieved facts to the memory.
-    - You should return the updated memory in only JSON format as shown below. The memory key should be the same if no changes are made.
-    - If there is an addition, generate a new key and add the new memory corresponding to it.
-    - If there is a deletion, the memory key-value pair should be removed from the memory.
-    - If there is an update, the ID key should remain the same and only the value needs to be updated.
+FUSED_MEMORY_INSTRUCTIONS = """You will be given the existing memories that are most related to a new conversation, and the conversation itself, each in triple backticks. Do both steps described above in one pass:
+1. Extract the relevant facts and preferences from the conversation, following the fact extraction guidelines.
+2. Compare those facts with the existing memories and decide, following the memory update guidelines, whether each fact adds a new memory, updates or deletes an existing one, or changes nothing.
+
+You must return your response in the following JSON structure only:
 
-    Do not return anything except the JSON format.
+{
+    "facts" : ["<Fact extracted from the conversation>", ...],
+    "memory" : [
+        {
+            "id" : "<ID of the memory>",                # Use existing ID for updates/deletes/no change, or a new ID for additions
+            "text" : "<Content of the memory>",         # Content of the memory
+            "event" : "<Operation to be performed>",    # Must be "ADD", "UPDATE", "DELETE", or "NONE"
+            "old_memory" : "<Old memory content>"       # Required only if the event is "UPDATE", otherwise null
+        },
+        ...
+    ]
+}
+
+Follow the instruction mentioned below:
+- Do not return anything from the custom few shot prompts provided above.
+- Only use the IDs of the existing memories given to you for "UPDATE", "DELETE" and "NONE" events.
+- If no facts are found in the conversation, return empty "facts" and "memory" lists.
+- If the existing memories are empty, add every extracted fact to the memory.
+
+Do not return anything except the JSON format.
+"""
+
+
+def get_fused_memory_prompts(
+    retrieved_old_memory_dict,
+    conversation,
+    custom_fact_extraction_prompt=None,
+    custom_update_memory_prompt=None,
+):
+    """
+    Build the single-call prompt that extracts facts from a conversation and decides the memory updates together.
+
+    The fact extraction and memory update guidelines (the custom prompts when set) are followed by the combined
+    output instructions in a static system prompt, so providers can cache it across requests. The existing
+    memories and the conversation come last, in the user prompt.
+
+    Returns:
+        tuple: (system_prompt, user_prompt)
     """
+    if custom_fact_extraction_prompt is None:
+        custom_fact_extraction_prompt = FACT_RETRIEVAL_PROMPT
+    if custom_update_memory_prompt is None:
+        custom_update_memory_prompt = DEFAULT_UPDATE_MEMORY_PROMPT
+
+    system_prompt = f"""# Fact extraction guidelines
+
+{custom_fact_extraction_prompt}
+
+# Memory update guidelines
+
+{custom_update_memory_prompt}
+
+# Task
+
+{FUSED_MEMORY_INSTRUCTIONS}"""
+    user_prompt = f"""Below are the existing memories related to the conversation:
+
+```
+{retrieved_old_memory_dict}
+```
+
+Below is the conversation. Extract the facts from it and determine how they change the memory.
+
+```
+{conversation}
+```
+"""
+    return system_prompt, user_prompt
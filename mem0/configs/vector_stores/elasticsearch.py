@@ -19,6 +19,16 @@ class ElasticsearchConfig(BaseModel):
     custom_search_query: Optional[Callable[[List[float], int, Optional[Dict]], Dict]] = Field(
         None, description="Custom search query function. Parameters: (query, limit, filters) -> Dict"
     )
+    num_candidates: Optional[int] = Field(
+        None, description="Number of kNN candidates considered per shard. Defaults to twice the search limit"
+    )
+    index_type: str = Field(
+        "hnsw", description="Vector index type (hnsw, int8_hnsw, int4_hnsw, bbq_hnsw, flat, int8_flat)"
+    )
+    index_options: Optional[Dict[str, Any]] = Field(
+        None, description="Extra dense_vector index options (e.g. {'m': 16, 'ef_construction': 100})"
+    )
+    list_page_size: int = Field(1000, description="Page size used when listing memories with search_after")
 
     @model_validator(mode="before")
     @classmethod
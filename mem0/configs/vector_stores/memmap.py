@@ -0,0 +1,44 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class MemmapConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Default name for the collection")
+    path: Optional[str] = Field(None, description="Directory holding the vector matrix and payload database")
+    embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    distance_strategy: str = Field(
+        "cosine", description="Distance strategy to use. Options: 'cosine', 'inner_product', 'euclidean'"
+    )
+    dtype: str = Field("float32", description="Storage type of the vector matrix. Options: 'float32', 'float16'")
+    block_size: int = Field(65536, description="Number of rows scored per matrix multiplication block")
+    compaction_threshold: float = Field(
+        0.25, description="Fraction of deleted rows that triggers compaction of the vector matrix"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_options(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        distance_strategy = values.get("distance_strategy")
+        if distance_strategy and distance_strategy not in ["cosine", "inner_product", "euclidean"]:
+            raise ValueError("Invalid distance_strategy. Must be one of: 'cosine', 'inner_product', 'euclidean'")
+        dtype = values.get("dtype")
+        if dtype and dtype not in ["float32", "float16"]:
+            raise ValueError("Invalid dtype. Must be one of: 'float32', 'float16'")
+        return values
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
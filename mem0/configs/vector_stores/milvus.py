@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -25,6 +25,20 @@ class MilvusDBConfig(BaseModel):
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: int = Field(1536, description="Dimensions of the embedding model")
     metric_type: str = Field("L2", description="Metric type for similarity search")
+    index_type: str = Field("AUTOINDEX", description="Vector index type (e.g. AUTOINDEX, HNSW, IVF_SQ8, DISKANN)")
+    index_params: Optional[Dict[str, Any]] = Field(
+        None, description="Build parameters for the vector index (e.g. {'M': 16, 'efConstruction': 200})"
+    )
+    search_params: Optional[Dict[str, Any]] = Field(
+        None, description="Search parameters for the vector index (e.g. {'ef': 64} or {'nprobe': 16})"
+    )
+    enable_partition_key: bool = Field(
+        True, description="Store user_id as a partition key scalar field so scoped searches prune partitions"
+    )
+    num_partitions: Optional[int] = Field(None, description="Number of partitions used by the partition key")
+    json_index_keys: Optional[List[str]] = Field(
+        ["agent_id", "run_id", "actor_id"], description="Metadata keys to create JSON path indexes for"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -18,6 +18,19 @@ class OpenSearchConfig(BaseModel):
         "RequestsHttpConnection", description="Connection class for OpenSearch"
     )
     pool_maxsize: int = Field(20, description="Maximum number of connections in the pool")
+    engine: str = Field("nmslib", description="k-NN engine used for the vector field (nmslib, faiss, lucene)")
+    space_type: str = Field("cosinesimil", description="Distance function used by the k-NN index")
+    ef_construction: Optional[int] = Field(None, description="HNSW ef_construction build parameter")
+    m: Optional[int] = Field(None, description="HNSW m build parameter")
+    ef_search: Optional[int] = Field(None, description="HNSW ef_search parameter used at query time")
+    encoder: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Quantization encoder for faiss/lucene engines (e.g. {'name': 'sq', 'parameters': {'type': 'fp16'}})",
+    )
+    num_candidates: Optional[int] = Field(
+        None, description="Number of neighbours (k) retrieved per shard. Defaults to twice the search limit"
+    )
+    list_page_size: int = Field(1000, description="Page size used when listing memories with search_after")
 
     @model_validator(mode="before")
     @classmethod
@@ -3,7 +3,7 @@ import os
 from typing import Literal, Optional
 
 try:
-    import boto3
+    import boto3  # noqa: F401
 except ImportError:
     raise ImportError("The 'boto3' library is required. Please install it using 'pip install boto3'.")
 
@@ -11,6 +11,7 @@ import numpy as np
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.http import get_boto3_client
 
 
 class AWSBedrockEmbedding(EmbeddingBase):
@@ -38,12 +39,13 @@ class AWSBedrockEmbedding(EmbeddingBase):
         if hasattr(self.config, "aws_region"):
             aws_region = self.config.aws_region
 
-        self.client = boto3.client(
+        self.client = get_boto3_client(
             "bedrock-runtime",
             region_name=aws_region,
             aws_access_key_id=aws_access_key if aws_access_key else None,
             aws_secret_access_key=aws_secret_key if aws_secret_key else None,
             aws_session_token=aws_session_token if aws_session_token else None,
+            config=self.config.http_pool,
         )
 
     def _normalize_vector(self, embeddings):
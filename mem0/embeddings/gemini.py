@@ -6,6 +6,7 @@ from google.genai import types
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.http import get_http_transport
 
 
 class GoogleGenAIEmbedding(EmbeddingBase):
@@ -17,7 +18,11 @@ class GoogleGenAIEmbedding(EmbeddingBase):
 
         api_key = self.config.api_key or os.getenv("GOOGLE_API_KEY")
 
-        self.client = genai.Client(api_key=api_key)
+        http_options = None
+        # Older google-genai releases do not take arguments for the httpx client
+        if "client_args" in types.HttpOptions.model_fields:
+            http_options = types.HttpOptions(client_args={"transport": get_http_transport(self.config.http_pool)})
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -17,7 +17,7 @@ class HuggingFaceEmbedding(EmbeddingBase):
         super().__init__(config)
 
         if config.huggingface_base_url:
-            self.client = OpenAI(base_url=config.huggingface_base_url)
+            self.client = OpenAI(base_url=config.huggingface_base_url, http_client=self.config.http_client)
         else:
             self.config.model = self.config.model or "multi-qa-MiniLM-L6-cos-v1"
 
@@ -4,6 +4,7 @@ from typing import Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.http import get_http_transport
 
 try:
     from ollama import Client
@@ -28,7 +29,7 @@ class OllamaEmbedding(EmbeddingBase):
         self.config.model = self.config.model or "nomic-embed-text"
         self.config.embedding_dims = self.config.embedding_dims or 512
 
-        self.client = Client(host=self.config.ollama_base_url)
+        self.client = Client(host=self.config.ollama_base_url, transport=get_http_transport(self.config.http_pool))
         self._ensure_model_exists()
 
     def _ensure_model_exists(self):
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -11,6 +11,12 @@ class Neo4jConfig(BaseModel):
     password: Optional[str] = Field(None, description="Password for the graph database")
     database: Optional[str] = Field(None, description="Database for the graph database")
     base_label: Optional[bool] = Field(None, description="Whether to use base node label __Entity__ for all entities")
+    vector_index: bool = Field(
+        True, description="Whether to search entity embeddings through a native vector index (requires base_label)"
+    )
+    vector_index_candidates: int = Field(
+        100, description="Number of nearest entities fetched from the vector index before user filters are applied"
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -28,6 +34,17 @@ class MemgraphConfig(BaseModel):
     url: Optional[str] = Field(None, description="Host address for the graph database")
     username: Optional[str] = Field(None, description="Username for the graph database")
     password: Optional[str] = Field(None, description="Password for the graph database")
+    vector_index_capacity: int = Field(
+        1000, gt=0, description="Initial number of entity embeddings the vector index is sized for"
+    )
+    vector_index_growth_factor: float = Field(
+        2.0, gt=1.0, description="Factor by which the vector index capacity grows when it is nearly full"
+    )
+    vector_index_candidates: int = Field(
+        100,
+        gt=0,
+        description="Number of nearest entities fetched from the vector index before user filters are applied",
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -70,18 +87,62 @@ class NeptuneConfig(BaseModel):
             )
 
 
+class SQLiteGraphConfig(BaseModel):
+    path: Optional[str] = Field(
+        None, description="Path of the SQLite database file. Defaults to graph.db in the mem0 directory"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
+
+
 class GraphStoreConfig(BaseModel):
     provider: str = Field(
-        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune')",
+        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune', 'sqlite')",
         default="neo4j",
     )
-    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig] = Field(
+    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig, SQLiteGraphConfig] = Field(
         description="Configuration for the specific data store", default=None
     )
     llm: Optional[LlmConfig] = Field(description="LLM configuration for querying the graph store", default=None)
     custom_prompt: Optional[str] = Field(
         description="Custom prompt to fetch entities from the given text", default=None
     )
+    entity_matching: bool = Field(
+        description="Find the entities of search queries by matching known entity names instead of calling the LLM",
+        default=False,
+    )
+    entity_matching_llm_fallback: bool = Field(
+        description="Extract entities with the LLM when no known entity name matches the search query",
+        default=True,
+    )
+    entity_matching_ttl: Optional[float] = Field(
+        description="Seconds after which the cached entity names of a user are reloaded from the graph store, to "
+        "pick up entities written by other processes. Never reloaded when None",
+        default=300.0,
+        gt=0,
+    )
+    max_connection_pool_size: Optional[int] = Field(
+        description="Maximum number of connections the shared graph driver keeps per endpoint", default=None, gt=0
+    )
+    connection_timeout: Optional[float] = Field(
+        description="Seconds to wait for a new connection to the graph store to be established", default=None, gt=0
+    )
+    connection_acquisition_timeout: Optional[float] = Field(
+        description="Seconds to wait for a free connection from the pool", default=None, gt=0
+    )
+    max_connection_lifetime: Optional[float] = Field(
+        description="Seconds after which pooled connections are closed and replaced", default=None, gt=0
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -92,5 +153,7 @@ class GraphStoreConfig(BaseModel):
             return MemgraphConfig(**v.model_dump())
         elif provider == "neptune":
             return NeptuneConfig(**v.model_dump())
+        elif provider == "sqlite":
+            return SQLiteGraphConfig(**v.model_dump())
         else:
             raise ValueError(f"Unsupported graph store provider: {provider}")
@@ -0,0 +1,89 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Graph clients are shared per process so that every Memory instance talking to the same endpoint with the same
+# credentials reuses one driver and its connection pool, and idempotent schema setup runs only once.
+_graph_registry: Dict[Tuple, Any] = {}
+_schema_registry: Dict[Tuple, Any] = {}
+_registry_lock = threading.RLock()
+
+
+def pool_settings(graph_store_config) -> Dict[str, Any]:
+    """
+    Connection pool settings of a `GraphStoreConfig` that were set explicitly.
+
+    Returns:
+        dict: Bolt driver settings (max_connection_pool_size, connection_timeout, connection_acquisition_timeout,
+            max_connection_lifetime); unset values are left to the driver defaults.
+    """
+    settings = {
+        "max_connection_pool_size": graph_store_config.max_connection_pool_size,
+        "connection_timeout": graph_store_config.connection_timeout,
+        "connection_acquisition_timeout": graph_store_config.connection_acquisition_timeout,
+        "max_connection_lifetime": graph_store_config.max_connection_lifetime,
+    }
+    return {name: value for name, value in settings.items() if value is not None}
+
+
+def get_shared_graph(key: Tuple, factory: Callable[[], Any]):
+    """
+    Return the process-wide graph client for `key`, creating it with `factory` on first use.
+
+    Args:
+        key (tuple): Provider, endpoint, credentials and pool settings identifying the connection.
+        factory (Callable[[], Any]): Builds the client.
+
+    Returns:
+        Any: Shared graph client.
+    """
+    with _registry_lock:
+        graph = _graph_registry.get(key)
+        if graph is None:
+            graph = factory()
+            _graph_registry[key] = graph
+        return graph
+
+
+def run_once(key: Tuple, setup: Callable[[], Any]):
+    """
+    Run idempotent schema setup (indexes, constraints) or a server capability probe once per process for `key`
+    and return its result.
+
+    A setup that raises is not recorded, so the next caller retries it.
+
+    Args:
+        key (tuple): Connection key followed by the parameters the setup depends on.
+        setup (Callable[[], Any]): Runs the DDL or probe and returns state the callers share, or None.
+
+    Returns:
+        Any: The result of the first successful setup.
+    """
+    with _registry_lock:
+        if key not in _schema_registry:
+            _schema_registry[key] = setup()
+        return _schema_registry[key]
+
+
+def clear_graph_registry(close: bool = False, key: Optional[Tuple] = None):
+    """
+    Forget shared graph clients and completed schema setups.
+
+    Args:
+        close (bool): Also close the drivers of the forgotten clients. Defaults to False.
+        key (tuple, optional): Forget only this connection. Defaults to every connection.
+    """
+    with _registry_lock:
+        keys = [key] if key is not None else list(_graph_registry)
+        for graph_key in keys:
+            graph = _graph_registry.pop(graph_key, None)
+            if close and graph is not None and hasattr(graph, "close"):
+                try:
+                    graph.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close graph client: {e}")
+        for schema_key in list(_schema_registry):
+            if key is None or schema_key[: len(key)] == key:
+                del _schema_registry[schema_key]
@@ -0,0 +1,212 @@
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+SELF_REFERENCES = {"i", "me", "my", "mine", "myself", "i'm", "i've", "i'd", "i'll"}
+
+_TOKEN_PATTERN = re.compile(r"[\w']+")
+
+
+def _normalize(name: str) -> str:
+    """Normalize an entity name the way graph memory stores it."""
+    return name.strip().lower().replace(" ", "_")
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _UserEntities:
+    """Known entity names of one user: a token trie for exact phrases and a trigram index for fuzzy matches."""
+
+    def __init__(self):
+        self.loaded_at = time.monotonic()
+        self.names = set()
+        self.trie = {}
+        self.trigram_index = defaultdict(set)
+
+    def add(self, name: str):
+        name = _normalize(name)
+        if not name or name in self.names:
+            return
+        self.names.add(name)
+
+        node = self.trie
+        for token in name.split("_"):
+            node = node.setdefault(token, {})
+        node[None] = name
+
+        for trigram in _trigrams(name):
+            self.trigram_index[trigram].add(name)
+
+
+class EntityMatcher:
+    """
+    Extracts the entities of a search query by matching it against the entity names already stored in the graph.
+
+    Names are loaded per user/agent through `loader`, kept current with the writes of this process through `add`,
+    and reloaded after `ttl` seconds to pick up the writes of other processes. A query is scanned
+    with a token trie for the longest known phrases; query n-grams without an exact match are compared with
+    known names by trigram similarity. Self references ("I", "my", ...) resolve to the user's own node.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Dict], Iterable[str]],
+        max_ngram: int = 4,
+        fuzzy_threshold: float = 0.75,
+        max_users: int = 1024,
+        ttl: Optional[float] = 300.0,
+    ):
+        """
+        Initialize the matcher.
+
+        Args:
+            loader (Callable[[Dict], Iterable[str]]): Returns all entity names stored for the given filters.
+            max_ngram (int, optional): Longest query n-gram compared by trigram similarity. Defaults to 4.
+            fuzzy_threshold (float, optional): Minimum trigram Dice similarity of a fuzzy match. Defaults to 0.75.
+            max_users (int, optional): Number of users whose names are kept in memory (LRU). Defaults to 1024.
+            ttl (float, optional): Seconds after which the names of a user are reloaded. Never when None.
+                Defaults to 300.
+        """
+        self.loader = loader
+        self.max_ngram = max_ngram
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_users = max_users
+        self.ttl = ttl
+        self._users: "OrderedDict[Tuple, _UserEntities]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(filters: Dict) -> Tuple:
+        return filters["user_id"], filters.get("agent_id")
+
+    def _get_user(self, filters: Dict, load: bool = True) -> Optional[_UserEntities]:
+        key = self._key(filters)
+        with self._lock:
+            entities = self._users.get(key)
+            if entities is not None and self.ttl is not None and time.monotonic() - entities.loaded_at >= self.ttl:
+                del self._users[key]
+                entities = None
+            if entities is not None:
+                self._users.move_to_end(key)
+                return entities
+        if not load:
+            return None
+
+        entities = _UserEntities()
+        for name in self.loader(filters):
+            if name:
+                entities.add(name)
+
+        with self._lock:
+            # Another thread may have loaded the same user meanwhile; keep the first copy
+            entities = self._users.setdefault(key, entities)
+            self._users.move_to_end(key)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return entities
+
+    def add(self, filters: Dict, names: Iterable[str]):
+        """Record newly written entity names. Users that were never loaded are skipped; they load fresh later."""
+        entities = self._get_user(filters, load=False)
+        if entities is None:
+            return
+        with self._lock:
+            for name in names:
+                entities.add(name)
+
+    def has_entities(self, filters: Dict) -> bool:
+        """Whether any entity is stored for the user (and agent)."""
+        return bool(self._get_user(filters).names)
+
+    def forget(self, filters: Optional[Dict] = None):
+        """
+        Drop cached names so they are reloaded on the next match.
+
+        Args:
+            filters (dict, optional): Drop only this user/agent; without an agent_id, every agent of the user.
+                Drops everything when None.
+        """
+        with self._lock:
+            if filters is None:
+                self._users.clear()
+                return
+            for key in list(self._users):
+                if key[0] == filters["user_id"] and (filters.get("agent_id") is None or key[1] == filters["agent_id"]):
+                    del self._users[key]
+
+    def _fuzzy_match(self, entities: _UserEntities, phrase: str) -> Optional[str]:
+        phrase_trigrams = _trigrams(phrase)
+        candidates = set()
+        for trigram in phrase_trigrams:
+            candidates.update(entities.trigram_index.get(trigram, ()))
+
+        best, best_score = None, self.fuzzy_threshold
+        for name in candidates:
+            name_trigrams = _trigrams(name)
+            score = 2 * len(phrase_trigrams & name_trigrams) / (len(phrase_trigrams) + len(name_trigrams))
+            if score >= best_score:
+                best, best_score = name, score
+        return best
+
+    def _scan(self, entities: _UserEntities, tokens: List[str], filters: Dict) -> List[str]:
+        """Match the query tokens left to right, preferring the longest exact phrase at each position."""
+        matches = []
+
+        user_node = _normalize(filters["user_id"])
+        if user_node in entities.names and SELF_REFERENCES.intersection(tokens):
+            matches.append(user_node)
+
+        i = 0
+        while i < len(tokens):
+            # Longest exact phrase starting at token i
+            node, matched, matched_end = entities.trie, None, i
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if None in node:
+                    matched, matched_end = node[None], j + 1
+            if matched:
+                matches.append(matched)
+                i = matched_end
+                continue
+
+            for n in range(min(self.max_ngram, len(tokens) - i), 0, -1):
+                phrase = "_".join(tokens[i : i + n])
+                if len(phrase) < 3:
+                    continue
+                fuzzy = self._fuzzy_match(entities, phrase)
+                if fuzzy:
+                    matches.append(fuzzy)
+                    i += n
+                    break
+            else:
+                i += 1
+
+        return matches
+
+    def match(self, query: str, filters: Dict) -> List[str]:
+        """
+        Find the known entities mentioned in a query.
+
+        Args:
+            query (str): Search query.
+            filters (dict): Filters with the user_id and optional agent_id whose entities are searched.
+
+        Returns:
+            List[str]: Matched entity names, in the order they appear in the query.
+        """
+        entities = self._get_user(filters)
+        if not entities.names:
+            return []
+
+        tokens = [re.sub(r"'s$", "", token.lower()) for token in _TOKEN_PATTERN.findall(query)]
+        with self._lock:
+            matches = self._scan(entities, tokens, filters)
+
+        return list(dict.fromkeys(matches))
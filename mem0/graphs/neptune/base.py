@@ -3,11 +3,6 @@ from abc import ABC, abstractmethod
 
 from mem0.memory.utils import format_entities
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -16,7 +11,13 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import (
+    EXTRACT_RELATIONS_PROMPT,
+    extract_graph_changes,
+    get_delete_messages,
+    iter_graph_relations,
+    paginate_relations,
+)
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
@@ -54,13 +55,11 @@ class NeptuneBase(ABC):
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        entity_type_map, to_be_added, to_be_deleted = extract_graph_changes(self, data, filters)
 
         deleted_entities = self._delete_entities(to_be_deleted, filters["user_id"])
         added_entities = self._add_entities(to_be_added, filters["user_id"], entity_type_map)
+        self.reranker.update(filters, added_entities, deleted_entities)
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -284,17 +283,10 @@ class NeptuneBase(ABC):
         if not search_output:
             return []
 
-        search_outputs_sequence = [
-            [item["source"], item["relationship"], item["destination"]] for item in search_output
+        search_results = [
+            {"source": item["source"], "relationship": item["relationship"], "destination": item["destination"]}
+            for item in self.reranker.rerank(query, search_output, filters, n=5)
         ]
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
-
-        search_results = []
-        for item in reranked_results:
-            search_results.append({"source": item[0], "relationship": item[1], "destination": item[2]})
 
         return search_results
 
@@ -325,6 +317,7 @@ class NeptuneBase(ABC):
     def delete_all(self, filters):
         cypher, params = self._delete_all_cypher(filters)
         self.graph.query(cypher, params=params)
+        self.reranker.forget(filters)
 
     @abstractmethod
     def _delete_all_cypher(self, filters):
@@ -333,62 +326,73 @@ class NeptuneBase(ABC):
         """
         pass
 
-    def get_all(self, filters, limit=100):
+    def get_all(self, filters, limit=100, cursor=None):
         """
-        Retrieves all nodes and relationships from the graph database based on filtering criteria.
+        Retrieves relationships from the graph database based on filtering criteria, ordered by relationship id.
 
         Args:
             filters (dict): A dictionary containing filters to be applied during the retrieval.
-            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (str, optional): Cursor returned by `get_all_page` to continue after. Defaults to None.
         Returns:
             list: A list of dictionaries, each containing:
-                - 'contexts': The base data store response for each memory.
-                - 'entities': A list of strings representing the nodes and relationships
+                - 'source': The source node name.
+                - 'relationship': The relationship type.
+                - 'target': The target node name.
         """
+        return self.get_all_page(filters, limit=limit, cursor=cursor)[0]
 
-        # return all nodes and relationships
-        query, params = self._get_all_cypher(filters, limit)
-        results = self.graph.query(query, params=params)
+    def get_all_page(self, filters, limit=100, cursor=None):
+        """
+        Retrieves one page of relationships, ordered by relationship id.
 
-        final_results = []
-        for result in results:
-            final_results.append(
-                {
-                    "source": result["source"],
-                    "relationship": result["relationship"],
-                    "target": result["target"],
-                }
-            )
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (str, optional): Id of the last relationship of the previous page. Defaults to None.
+
+        Returns:
+            tuple: (relationships, next_cursor); next_cursor is None on the last page.
+        """
+        # One extra row tells whether another page follows
+        query, params = self._get_all_cypher(filters, limit + 1, cursor)
+        final_results, next_cursor = paginate_relations(self.graph.query(query, params=params), limit)
 
         logger.debug(f"Retrieved {len(final_results)} relationships")
 
-        return final_results
+        return final_results, next_cursor
+
+    def iter_all(self, filters, page_size=1000):
+        """Stream all relationships of a user in pages of `page_size`, in bounded memory."""
+        return iter_graph_relations(self, filters, page_size=page_size)
 
     @abstractmethod
-    def _get_all_cypher(self, filters, limit):
+    def _get_all_cypher(self, filters, limit, cursor=None):
         """
-        Returns the OpenCypher query and parameters to get all edges/nodes in the memory store
+        Returns the OpenCypher query and parameters to get a page of edges in the memory store, ordered by
+        relationship id and starting after `cursor`
         """
         pass
 
     def _search_graph_db(self, node_list, filters, limit=100):
         """
         Search similar nodes among and their respective incoming and outgoing relations.
-        """
-        result_relations = []
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-            cypher_query, params = self._search_graph_db_cypher(n_embedding, filters, limit)
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+        All entity names are embedded in one batch and searched with a single query.
+        """
+        if not node_list:
+            return []
 
-        return result_relations
+        embeddings = self.embedding_model.embed_batch(node_list)
+        entities = [{"name": node, "embedding": embedding} for node, embedding in zip(node_list, embeddings)]
+        cypher_query, params = self._search_graph_db_cypher(entities, filters, limit)
+        return self.graph.query(cypher_query, params=params)
 
     @abstractmethod
-    def _search_graph_db_cypher(self, n_embedding, filters, limit):
+    def _search_graph_db_cypher(self, entities, filters, limit):
         """
-        Returns the OpenCypher query and parameters to search for similar nodes in the memory store
+        Returns the OpenCypher query and parameters to search for nodes similar to any of the entities
+        (dicts with "name" and "embedding") in the memory store, as a single UNWIND query
         """
         pass
 
@@ -408,3 +412,4 @@ class NeptuneBase(ABC):
         )
         waiter = self.graph.client.get_waiter("graph_available")
         waiter.wait(graphIdentifier=graph_id, WaiterConfig={"Delay": 10, "MaxAttempts": 60})
+        self.reranker.forget()
@@ -1,4 +1,8 @@
 import logging
+
+from mem0.graphs.connections import get_shared_graph, pool_settings
+from mem0.graphs.reranker import BM25Reranker
+
 from .base import NeptuneBase
 
 try:
@@ -17,7 +21,12 @@ class MemoryGraph(NeptuneBase):
         endpoint = self.config.graph_store.config.endpoint
         if endpoint and endpoint.startswith("neptune-graph://"):
             graph_identifier = endpoint.replace("neptune-graph://", "")
-            self.graph = NeptuneAnalyticsGraph(graph_identifier)
+            driver_settings = pool_settings(self.config.graph_store)
+            # Instances on the same graph and pool settings share one client per process
+            self.connection_key = ("neptune", graph_identifier, tuple(sorted(driver_settings.items())))
+            self.graph = get_shared_graph(
+                self.connection_key, lambda: MemoryGraph._create_graph(graph_identifier, driver_settings)
+            )
 
         if not self.graph:
             raise ValueError("Unable to create a Neptune client: missing 'endpoint' in config")
@@ -35,6 +44,27 @@ class MemoryGraph(NeptuneBase):
         self.llm = NeptuneBase._create_llm(self.config, self.llm_provider)
         self.user_id = None
         self.threshold = 0.7
+        self.reranker = BM25Reranker(self.iter_all)
+
+    @staticmethod
+    def _create_graph(graph_identifier, driver_settings):
+        """
+        Create the Neptune Analytics client. Pool settings map to the boto3 client config: the pool size to
+        max_pool_connections and the connection timeout to connect_timeout.
+        """
+        if "max_connection_pool_size" not in driver_settings and "connection_timeout" not in driver_settings:
+            return NeptuneAnalyticsGraph(graph_identifier)
+
+        import boto3
+        from botocore.config import Config
+
+        client_config = {}
+        if "max_connection_pool_size" in driver_settings:
+            client_config["max_pool_connections"] = driver_settings["max_connection_pool_size"]
+        if "connection_timeout" in driver_settings:
+            client_config["connect_timeout"] = driver_settings["connection_timeout"]
+        client = boto3.client("neptune-graph", config=Config(**client_config))
+        return NeptuneAnalyticsGraph(graph_identifier, client=client)
 
     def _delete_entities_cypher(self, source, destination, relationship, user_id):
         """
@@ -309,37 +339,46 @@ class MemoryGraph(NeptuneBase):
         logger.debug(f"delete_all query={cypher}")
         return cypher, params
 
-    def _get_all_cypher(self, filters, limit):
+    def _get_all_cypher(self, filters, limit, cursor=None):
         """
-        Returns the OpenCypher query and parameters to get all edges/nodes in the memory store
+        Returns the OpenCypher query and parameters to get a page of edges in the memory store
 
         :param filters: search filters
         :param limit: return limit
+        :param cursor: id of the last edge of the previous page
         :return: str, dict
         """
 
+        cursor_filter = ""
+        params = {"user_id": filters["user_id"], "limit": limit}
+        if cursor is not None:
+            cursor_filter = "WHERE id(r) > $cursor"
+            params["cursor"] = cursor
+
         cypher = f"""
         MATCH (n {self.node_label} {{user_id: $user_id}})-[r]->(m {self.node_label} {{user_id: $user_id}})
-        RETURN n.name AS source, type(r) AS relationship, m.name AS target
+        {cursor_filter}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target, id(r) AS relation_id
+        ORDER BY relation_id
         LIMIT $limit
         """
-        params = {"user_id": filters["user_id"], "limit": limit}
         return cypher, params
 
-    def _search_graph_db_cypher(self, n_embedding, filters, limit):
+    def _search_graph_db_cypher(self, entities, filters, limit):
         """
         Returns the OpenCypher query and parameters to search for similar nodes in the memory store
 
-        :param n_embedding: node vector
+        :param entities: list of dicts with the entity "name" and its "embedding"
         :param filters: search filters
         :param limit: return limit
         :return: str, dict
         """
 
         cypher_query = f"""
+            UNWIND $entities AS entity
             MATCH (n {self.node_label})
             WHERE n.user_id = $user_id
-            WITH n, $n_embedding as n_embedding
+            WITH n, entity.embedding as n_embedding
             CALL neptune.algo.vectors.distanceByEmbedding(
                 n_embedding,
                 n,
@@ -347,6 +386,7 @@ class MemoryGraph(NeptuneBase):
             ) YIELD distance
             WITH n, distance as similarity
             WHERE similarity >= $threshold
+            WITH n, max(similarity) AS similarity
             CALL {{
                 WITH n
                 MATCH (n)-[r]->(m) 
@@ -356,13 +396,13 @@ class MemoryGraph(NeptuneBase):
                 MATCH (m)-[r]->(n) 
                 RETURN m.name AS source, id(m) AS source_id, type(r) AS relationship, id(r) AS relation_id, n.name AS destination, id(n) AS destination_id
             }}
-            WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
+            WITH source, source_id, relationship, relation_id, destination, destination_id, max(similarity) AS similarity
             RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
             ORDER BY similarity DESC
             LIMIT $limit
             """
         params = {
-            "n_embedding": n_embedding,
+            "entities": entities,
             "threshold": self.threshold,
             "user_id": filters["user_id"],
             "limit": limit,
@@ -0,0 +1,287 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are as at be because been before being below between both
+    but by can could did do does doing down during each few for from further had has have having he her here hers
+    herself him himself his how i if in into is it its itself just me more most my myself no nor not now of off on
+    once only or other our ours ourselves out over own same she should so some such than that the their theirs them
+    themselves then there these they this those through to too under until up very was we were what when where which
+    while who whom why will with would you your yours yourself yourselves s t d ll m re ve
+    """.split()
+)
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+Triple = Tuple[str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase `text` and split it into alphanumeric terms, dropping English stopwords."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+@lru_cache(maxsize=65536)
+def _relation_terms(source: str, relationship: str, destination: str) -> Tuple[str, ...]:
+    """Terms of a stored relation. Relations recur across searches, so their tokenization is memoized."""
+    return tuple(tokenize(f"{source} {relationship} {destination}"))
+
+
+def _normalize(triple: Sequence[str]) -> Triple:
+    """Normalize a relation the way graph memory stores it."""
+    return tuple(part.strip().lower().replace(" ", "_") for part in triple)
+
+
+def _triples(rows: Iterable) -> Iterator[Triple]:
+    """(source, relationship, target) of relation rows as returned by graph `get_all` and writes."""
+    for row in rows or []:
+        if isinstance(row, dict) and row.get("source") and row.get("relationship") and row.get("target"):
+            yield row["source"], row["relationship"], row["target"]
+
+
+class _UserCorpus:
+    """BM25 statistics over the distinct relations of one user: a term vocabulary and document frequencies."""
+
+    def __init__(self):
+        self.loaded_at = time.monotonic()
+        self.triples = set()
+        self.vocabulary: Dict[str, int] = {}
+        self.document_frequency = np.zeros(64, dtype=np.int32)
+        self.total_length = 0
+
+    def _term_id(self, term: str) -> int:
+        term_id = self.vocabulary.setdefault(term, len(self.vocabulary))
+        if term_id == len(self.document_frequency):
+            grown = np.zeros(2 * len(self.document_frequency), dtype=np.int32)
+            grown[:term_id] = self.document_frequency
+            self.document_frequency = grown
+        return term_id
+
+    def add(self, triple: Triple):
+        triple = _normalize(triple)
+        if triple in self.triples:
+            return
+        self.triples.add(triple)
+        terms = _relation_terms(*triple)
+        self.total_length += len(terms)
+        for term in set(terms):
+            term_id = self._term_id(term)
+            self.document_frequency[term_id] += 1
+
+    def remove(self, triple: Triple):
+        triple = _normalize(triple)
+        if triple not in self.triples:
+            return
+        self.triples.discard(triple)
+        terms = _relation_terms(*triple)
+        self.total_length -= len(terms)
+        for term in set(terms):
+            self.document_frequency[self.vocabulary[term]] -= 1
+
+    def frequencies(self, terms: List[str]) -> np.ndarray:
+        ids = [self.vocabulary.get(term) for term in terms]
+        return np.array([self.document_frequency[i] if i is not None else 0 for i in ids], dtype=np.float64)
+
+
+class BM25Reranker:
+    """
+    Reranks graph search results against the query with Okapi BM25.
+
+    Term statistics are kept per user/agent over all of their stored relations, so IDF reflects the user's whole
+    graph rather than the handful of retrieved candidates. Relations are loaded per user through `loader`, kept
+    current with the writes of this process through `update`, and reloaded after `ttl` seconds to pick up the
+    writes of other processes; scoring a query is then one vectorized pass over the candidates.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Dict], Iterable[Dict]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        max_users: int = 1024,
+        ttl: Optional[float] = 300.0,
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            loader (Callable[[Dict], Iterable[Dict]]): Returns every relation stored for the given filters, as
+                "source", "relationship" and "target" rows (e.g. the graph's `iter_all`).
+            k1 (float, optional): Term frequency saturation. Defaults to 1.5.
+            b (float, optional): Document length normalization. Defaults to 0.75.
+            max_users (int, optional): Number of users whose statistics are kept in memory (LRU). Defaults to 1024.
+            ttl (float, optional): Seconds after which the statistics of a user are reloaded. Never when None.
+                Defaults to 300.
+        """
+        self.loader = loader
+        self.k1 = k1
+        self.b = b
+        self.max_users = max_users
+        self.ttl = ttl
+        self._users: "OrderedDict[Tuple, _UserCorpus]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Loads in flight per user_id, and the writes to that user since they started: a load that overlapped a
+        # write may miss it, so it is not kept
+        self._loading: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+
+    @staticmethod
+    def _key(filters: Dict) -> Tuple:
+        return filters["user_id"], filters.get("agent_id")
+
+    def _get_user(self, filters: Dict) -> _UserCorpus:
+        key = self._key(filters)
+        user_id = key[0]
+        with self._lock:
+            corpus = self._users.get(key)
+            if corpus is not None and self.ttl is not None and time.monotonic() - corpus.loaded_at >= self.ttl:
+                del self._users[key]
+                corpus = None
+            if corpus is not None:
+                self._users.move_to_end(key)
+                return corpus
+            self._loading[user_id] = self._loading.get(user_id, 0) + 1
+            generation = (self._epoch, self._generations.get(user_id, 0))
+
+        try:
+            corpus = _UserCorpus()
+            for triple in _triples(self.loader(filters)):
+                corpus.add(triple)
+        finally:
+            with self._lock:
+                unchanged = generation == (self._epoch, self._generations.get(user_id, 0))
+                self._loading[user_id] -= 1
+                if not self._loading[user_id]:
+                    del self._loading[user_id]
+                    self._generations.pop(user_id, None)
+
+        with self._lock:
+            if not unchanged:
+                # Scores this query only; the next one loads again
+                return corpus
+            # Another thread may have loaded the same user meanwhile; keep the first copy
+            corpus = self._users.setdefault(key, corpus)
+            self._users.move_to_end(key)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return corpus
+
+    def _changed(self, user_id: str):
+        """Invalidate the loads of `user_id` in flight. Callers hold the lock."""
+        if user_id in self._loading:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def _drop_overlapping(self, filters: Dict, keep: Optional[Tuple] = None):
+        """Drop the loaded statistics whose scope overlaps `filters`, except `keep`. Callers hold the lock."""
+        user_id, agent_id = self._key(filters)
+        for key in list(self._users):
+            if key == keep or key[0] != user_id:
+                continue
+            if agent_id is None or key[1] is None or key[1] == agent_id:
+                del self._users[key]
+
+    def update(self, filters: Dict, added: Iterable = (), deleted: Iterable = ()):
+        """
+        Apply a graph write to the statistics of its user/agent. Users that were never loaded are skipped; they
+        load fresh later. Other loaded scopes of the same user that the write may have touched (the user-wide
+        scope of an agent write, or any agent scope of a user-wide write) are dropped and reloaded on next use.
+
+        Args:
+            filters (dict): Filters of the write.
+            added (Iterable): The "added_entities" of the write, lists of "source", "relationship", "target" rows.
+            deleted (Iterable): The "deleted_entities" of the write, in the same form.
+        """
+        key = self._key(filters)
+        with self._lock:
+            self._changed(key[0])
+            self._drop_overlapping(filters, keep=key)
+            corpus = self._users.get(key)
+            if corpus is None:
+                return
+            for rows in deleted or []:
+                for triple in _triples(rows):
+                    corpus.remove(triple)
+            for rows in added or []:
+                for triple in _triples(rows):
+                    corpus.add(triple)
+
+    def forget(self, filters: Optional[Dict] = None):
+        """
+        Drop cached statistics so they are reloaded on the next rerank.
+
+        Args:
+            filters (dict, optional): Drop the scopes overlapping this user/agent. Drops everything when None.
+        """
+        with self._lock:
+            if filters is None:
+                self._epoch += 1
+                self._users.clear()
+            else:
+                self._changed(filters["user_id"])
+                self._drop_overlapping(filters)
+
+    def scores(self, query: str, documents: List[Sequence[str]], filters: Dict) -> np.ndarray:
+        """
+        BM25 score of each tokenized document against the query, with the user's corpus statistics.
+
+        Args:
+            query (str): Search query.
+            documents (List[Sequence[str]]): Tokenized candidate relations.
+            filters (dict): Filters with the user_id and optional agent_id whose statistics are used.
+
+        Returns:
+            np.ndarray: One score per document.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not documents:
+            return np.zeros(len(documents))
+
+        corpus = self._get_user(filters)
+        with self._lock:
+            corpus_size = len(corpus.triples)
+            total_length = corpus.total_length
+            document_frequency = corpus.frequencies(terms)
+
+        lengths = np.array([len(document) for document in documents], dtype=np.float64)
+        average_length = total_length / corpus_size if corpus_size else lengths.mean()
+        # Candidates the statistics have not seen yet (a concurrent write) still count as documents
+        corpus_size = max(corpus_size, len(documents), 1)
+        document_frequency = np.minimum(document_frequency, corpus_size)
+        idf = np.log1p((corpus_size - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        term_index = {term: j for j, term in enumerate(terms)}
+        tf = np.zeros((len(documents), len(terms)))
+        for i, document in enumerate(documents):
+            for term in document:
+                j = term_index.get(term)
+                if j is not None:
+                    tf[i, j] += 1
+
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(average_length, 1e-9))
+        return (idf * tf * (self.k1 + 1) / (tf + norm[:, None])).sum(axis=1)
+
+    def rerank(self, query: str, candidates: List[Dict], filters: Dict, n: int = 5) -> List[Dict]:
+        """
+        Order graph search results by BM25 relevance to the query.
+
+        Args:
+            query (str): Search query.
+            candidates (List[Dict]): Search results with "source", "relationship" and "destination".
+            filters (dict): Filters with the user_id and optional agent_id.
+            n (int, optional): Number of results to keep. Defaults to 5.
+
+        Returns:
+            List[Dict]: The `n` best candidates. Equal scores keep the candidates' (similarity) order.
+        """
+        documents = [_relation_terms(item["source"], item["relationship"], item["destination"]) for item in candidates]
+        scores = self.scores(query, documents, filters)
+        order = np.argsort(-scores, kind="stable")[:n]
+        return [candidates[i] for i in order]
@@ -1,3 +1,6 @@
+import asyncio
+import concurrent.futures
+
 UPDATE_GRAPH_PROMPT = """
 You are an AI expert specializing in graph memory management and optimization. Your task is to analyze existing graph memories alongside new information, and update the relationships in the memory list to ensure the most accurate, current, and coherent representation of knowledge.
 
@@ -95,3 +98,104 @@ def get_delete_messages(existing_memories_string, data, user_id):
     return DELETE_RELATIONS_SYSTEM_PROMPT.replace(
         "USER_ID", user_id
     ), f"Here are the existing memories: {existing_memories_string} \n\n New Information: {data}"
+
+
+def extract_graph_changes(memory_graph, data, filters):
+    """
+    Run the LLM and search stages of a graph add as a dependency graph.
+
+    Relation extraction and the neighbourhood search only depend on the extracted entities, so they run
+    concurrently. The delete decision is skipped when the search found no existing relations.
+
+    Args:
+        memory_graph: Graph memory exposing the `_retrieve_nodes_from_data`, `_establish_nodes_relations_from_data`,
+            `_search_graph_db` and `_get_delete_entities_from_search_output` stages.
+        data (str): The data to add to the graph.
+        filters (dict): A dictionary containing filters to be applied during the addition.
+
+    Returns:
+        tuple: (entity_type_map, to_be_added, to_be_deleted)
+    """
+    entity_type_map = memory_graph._retrieve_nodes_from_data(data, filters)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        relations_future = executor.submit(
+            memory_graph._establish_nodes_relations_from_data, data, filters, entity_type_map
+        )
+        search_output = memory_graph._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        to_be_deleted = []
+        if search_output:
+            to_be_deleted = memory_graph._get_delete_entities_from_search_output(search_output, data, filters)
+        to_be_added = relations_future.result()
+
+    return entity_type_map, to_be_added, to_be_deleted
+
+
+async def aextract_graph_changes(memory_graph, data, filters):
+    """
+    Async variant of `extract_graph_changes`. The blocking stages run in worker threads and are awaited as
+    concurrent tasks.
+
+    Returns:
+        tuple: (entity_type_map, to_be_added, to_be_deleted)
+    """
+    entity_type_map = await asyncio.to_thread(memory_graph._retrieve_nodes_from_data, data, filters)
+
+    relations_task = asyncio.create_task(
+        asyncio.to_thread(memory_graph._establish_nodes_relations_from_data, data, filters, entity_type_map)
+    )
+    try:
+        search_output = await asyncio.to_thread(
+            memory_graph._search_graph_db, node_list=list(entity_type_map.keys()), filters=filters
+        )
+        to_be_deleted = []
+        if search_output:
+            to_be_deleted = await asyncio.to_thread(
+                memory_graph._get_delete_entities_from_search_output, search_output, data, filters
+            )
+    except BaseException:
+        relations_task.cancel()
+        raise
+    to_be_added = await relations_task
+
+    return entity_type_map, to_be_added, to_be_deleted
+
+
+def paginate_relations(rows, limit):
+    """
+    Split the `limit + 1` rows of a keyset page query into the relations of the page and the next cursor.
+
+    Args:
+        rows (list): Rows ordered by "relation_id", with "source", "relationship" and "target".
+        limit (int): Page size.
+
+    Returns:
+        tuple: (relations, next_cursor), where next_cursor is the id of the last relation of the page, or None
+            when this is the last page.
+    """
+    page = rows[:limit]
+    relations = [
+        {"source": row["source"], "relationship": row["relationship"], "target": row["target"]} for row in page
+    ]
+    next_cursor = page[-1]["relation_id"] if len(rows) > limit else None
+    return relations, next_cursor
+
+
+def iter_graph_relations(memory_graph, filters, page_size=1000):
+    """
+    Stream every relation of a user page by page, holding at most one page in memory.
+
+    Args:
+        memory_graph: Graph memory exposing `get_all_page(filters, limit, cursor)`.
+        filters (dict): A dictionary containing filters to be applied during the retrieval.
+        page_size (int): Number of relations fetched per query. Defaults to 1000.
+
+    Yields:
+        dict: Relations with "source", "relationship" and "target", ordered by relation id.
+    """
+    cursor = None
+    while True:
+        relations, cursor = memory_graph.get_all_page(filters, limit=page_size, cursor=cursor)
+        yield from relations
+        if cursor is None:
+            return
@@ -48,10 +48,15 @@ class AnthropicLLM(LLMBase):
             else:
                 filtered_messages.append(message)
 
+        system = system_message
+        if system_message and self.config.prompt_caching is not False:
+            # Cache breakpoint after the static system prompt; tools precede it and are cached with it
+            system = [{"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}]
+
         params = {
             "model": self.config.model,
             "messages": filtered_messages,
-            "system": system_message,
+            "system": system,
             "temperature": self.config.temperature,
             "max_tokens": self.config.max_tokens,
             "top_p": self.config.top_p,
@@ -61,4 +66,16 @@ class AnthropicLLM(LLMBase):
             params["tool_choice"] = tool_choice
 
         response = self.client.messages.create(**params)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            prompt_tokens = [
+                getattr(usage, name, None)
+                for name in ("input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+            ]
+            self._record_usage(
+                input_tokens=sum(count for count in prompt_tokens if isinstance(count, int)),
+                output_tokens=getattr(usage, "output_tokens", None),
+                cached_input_tokens=prompt_tokens[1],
+                cache_creation_input_tokens=prompt_tokens[2],
+            )
         return response.content[0].text
@@ -4,12 +4,13 @@ import re
 from typing import Any, Dict, List, Optional
 
 try:
-    import boto3
+    import boto3  # noqa: F401
 except ImportError:
     raise ImportError("The 'boto3' library is required. Please install it using 'pip install boto3'.")
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.http import get_boto3_client
 
 PROVIDERS = ["ai21", "amazon", "anthropic", "cohere", "meta", "mistral", "stability", "writer"]
 
@@ -41,11 +42,12 @@ class AWSBedrockLLM(LLMBase):
         if hasattr(self.config, "aws_region"):
             aws_region = self.config.aws_region
 
-        self.client = boto3.client(
+        self.client = get_boto3_client(
             "bedrock-runtime",
             region_name=aws_region,
             aws_access_key_id=aws_access_key if aws_access_key else None,
             aws_secret_access_key=aws_secret_key if aws_secret_key else None,
+            config=self.config.http_pool,
         )
 
         self.model_kwargs = {
@@ -88,6 +90,14 @@ class AWSBedrockLLM(LLMBase):
         if tools:
             processed_response = {"tool_calls": []}
 
+            usage = response.get("usage") or {}
+            self._record_bedrock_usage(
+                usage.get("inputTokens"),
+                usage.get("outputTokens"),
+                usage.get("cacheReadInputTokens"),
+                usage.get("cacheWriteInputTokens"),
+            )
+
             if response["output"]["message"]["content"]:
                 for item in response["output"]["message"]["content"]:
                     if "toolUse" in item:
@@ -102,8 +112,25 @@ class AWSBedrockLLM(LLMBase):
 
         response_body = response.get("body").read().decode()
         response_json = json.loads(response_body)
+        usage = response_json.get("usage") or {}
+        self._record_bedrock_usage(
+            usage.get("input_tokens"),
+            usage.get("output_tokens"),
+            usage.get("cache_read_input_tokens"),
+            usage.get("cache_creation_input_tokens"),
+        )
         return response_json.get("content", [{"text": ""}])[0].get("text", "")
 
+    def _record_bedrock_usage(self, input_tokens, output_tokens, cached_input_tokens, cache_creation_input_tokens):
+        """Record the usage of a Bedrock response, whose input token count excludes cache reads and writes."""
+        prompt_tokens = [input_tokens, cached_input_tokens, cache_creation_input_tokens]
+        self._record_usage(
+            input_tokens=sum(count for count in prompt_tokens if isinstance(count, int)),
+            output_tokens=output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_creation_input_tokens=cache_creation_input_tokens,
+        )
+
     def _prepare_input(
         self,
         provider: str,
@@ -214,12 +241,17 @@ class AWSBedrockLLM(LLMBase):
             str: The generated response.
         """
 
+        # The static system prompt is sent ahead of the conversation, where it can be cached across requests
+        system_prompt = "\n\n".join(message["content"] for message in messages if message["role"] == "system")
+        conversation = [message for message in messages if message["role"] != "system"]
+        prompt_caching = self.config.prompt_caching is True
+
         if tools:
             # Use converse method when tools are provided
             messages = [
                 {
                     "role": "user",
-                    "content": [{"text": message["content"]} for message in messages],
+                    "content": [{"text": message["content"]} for message in conversation],
                 }
             ]
             inference_config = {
@@ -229,16 +261,23 @@ class AWSBedrockLLM(LLMBase):
             }
             tools_config = {"tools": self._convert_tool_format(tools)}
 
-            response = self.client.converse(
-                modelId=self.config.model,
-                messages=messages,
-                inferenceConfig=inference_config,
-                toolConfig=tools_config,
-            )
+            converse_params = {
+                "modelId": self.config.model,
+                "messages": messages,
+                "inferenceConfig": inference_config,
+                "toolConfig": tools_config,
+            }
+            if system_prompt:
+                converse_params["system"] = [{"text": system_prompt}]
+                if prompt_caching:
+                    converse_params["system"].append({"cachePoint": {"type": "default"}})
+
+            response = self.client.converse(**converse_params)
         else:
             # Use invoke_model method when no tools are provided
-            prompt = self._format_messages(messages)
             provider = extract_provider(self.config.model)
+            separate_system = provider == "anthropic" and system_prompt and conversation
+            prompt = self._format_messages(conversation if separate_system else messages)
             input_body = self._prepare_input(provider, self.config.model, prompt, model_kwargs=self.model_kwargs)
             body = json.dumps(input_body)
 
@@ -250,6 +289,11 @@ class AWSBedrockLLM(LLMBase):
                     "top_p": self.model_kwargs["top_p"] or 0.9,
                     "anthropic_version": "bedrock-2023-05-31",
                 }
+                if separate_system:
+                    system_block = {"type": "text", "text": system_prompt}
+                    if prompt_caching:
+                        system_block["cache_control"] = {"type": "ephemeral"}
+                    input_body["system"] = [system_block]
 
                 body = json.dumps(input_body)
 
@@ -1,12 +1,11 @@
-import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from openai import AzureOpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
-from mem0.memory.utils import extract_json
+from mem0.memory.utils import parse_tool_arguments
 
 
 class AzureOpenAILLM(LLMBase):
@@ -54,7 +53,7 @@ class AzureOpenAILLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": parse_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -62,26 +61,14 @@ class AzureOpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
+    def _build_params(
         self,
         messages: List[Dict[str, str]],
         response_format=None,
         tools: Optional[List[Dict]] = None,
         tool_choice: str = "auto",
     ):
-        """
-        Generate a response based on the given messages using Azure OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-
-        Returns:
-            str: The generated response.
-        """
-
+        """Chat completion request parameters for the given messages."""
         user_prompt = messages[-1]['content']
 
         user_prompt = user_prompt.replace("assistant", "ai")
@@ -107,6 +94,41 @@ class AzureOpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using Azure OpenAI.
 
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._build_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
+        self._record_chat_completion_usage(response)
         return self._parse_response(response, tools)
+
+    def stream_response(self, messages: List[Dict[str, str]], response_format=None) -> Iterator[str]:
+        """
+        Stream the text of a response based on the given messages using Azure OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+
+        Returns:
+            Iterator[str]: The generated text, in chunks as they arrive.
+        """
+        return self._stream_chat_completion(self._build_params(messages, response_format), include_usage=True)
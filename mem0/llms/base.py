@@ -1,8 +1,12 @@
+import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from mem0.configs.llms.base import BaseLlmConfig
 
+logger = logging.getLogger(__name__)
+
 
 class LLMBase(ABC):
     def __init__(self, config: Optional[BaseLlmConfig] = None):
@@ -16,6 +20,87 @@ class LLMBase(ABC):
         else:
             self.config = config
 
+        # Token usage accumulated over all requests; input_tokens includes cached and cache-writing tokens
+        self.usage = {
+            "requests": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "output_tokens": 0,
+        }
+        self._usage_lock = threading.Lock()
+
+    def _record_usage(self, input_tokens=0, output_tokens=0, cached_input_tokens=0, cache_creation_input_tokens=0):
+        """
+        Add the token usage of one request to `self.usage`. Counts that are missing from the response are
+        passed as None and recorded as zero.
+
+        Args:
+            input_tokens (int): All prompt tokens, including cached ones.
+            output_tokens (int): Generated tokens.
+            cached_input_tokens (int): Prompt tokens read from the provider's prompt cache.
+            cache_creation_input_tokens (int): Prompt tokens written to the provider's prompt cache.
+        """
+        counts = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cached_input_tokens": cached_input_tokens,
+            "cache_creation_input_tokens": cache_creation_input_tokens,
+        }
+        counts = {name: value if isinstance(value, int) else 0 for name, value in counts.items()}
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            for name, value in counts.items():
+                self.usage[name] += value
+        logger.debug(
+            f"LLM usage: {counts['input_tokens']} input tokens ({counts['cached_input_tokens']} cached, "
+            f"{counts['cache_creation_input_tokens']} written to cache), {counts['output_tokens']} output tokens"
+        )
+
+    def _record_chat_completion_usage(self, response):
+        """Record the usage of an OpenAI-compatible chat completion, whose prompt prefixes are cached automatically."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self._record_usage(
+            input_tokens=getattr(usage, "prompt_tokens", None),
+            output_tokens=getattr(usage, "completion_tokens", None),
+            cached_input_tokens=getattr(details, "cached_tokens", None),
+        )
+
+    def _stream_chat_completion(self, params: Dict, include_usage: bool = False) -> Iterator[str]:
+        """
+        Stream an OpenAI-compatible chat completion, yielding the text deltas as they arrive.
+
+        Args:
+            params (dict): Chat completion request parameters.
+            include_usage (bool): Ask for the token usage in the last chunk and record it. Defaults to False.
+        """
+        params = {**params, "stream": True}
+        if include_usage:
+            params["stream_options"] = {"include_usage": True}
+        for chunk in self.client.chat.completions.create(**params):
+            if include_usage and getattr(chunk, "usage", None) is not None:
+                self._record_chat_completion_usage(chunk)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def stream_response(self, messages: List[Dict[str, str]], response_format=None) -> Iterator[str]:
+        """
+        Stream the text of a response based on the given messages.
+
+        Providers without streaming support return the whole response as a single chunk.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to None.
+
+        Returns:
+            Iterator[str]: The generated text, in chunks as they arrive.
+        """
+        yield self.generate_response(messages=messages, response_format=response_format)
+
     @abstractmethod
     def generate_response(self, messages, tools: Optional[List[Dict]] = None, tool_choice: str = "auto"):
         """
@@ -0,0 +1,246 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional
+
+from mem0.configs.base import LlmCacheConfig
+from mem0.memory.utils import is_valid_response
+
+logger = logging.getLogger(__name__)
+
+# Writes between two passes that drop expired and least recently used responses from the SQLite file
+PRUNE_INTERVAL = 100
+
+
+def _canonical_messages(messages):
+    """Messages with surrounding whitespace removed from text content, so formatting noise does not miss the cache."""
+    canonical = []
+    for message in messages:
+        message = dict(message)
+        if isinstance(message.get("content"), str):
+            message["content"] = message["content"].strip()
+        canonical.append(message)
+    return canonical
+
+
+class ResponseCache:
+    """
+    Responses stored by request key: a least recently used map in memory in front of an optional SQLite file.
+    Entries older than the TTL are treated as missing and dropped.
+    """
+
+    def __init__(self, config: LlmCacheConfig):
+        self.config = config
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        if config.path:
+            self._connection = sqlite3.connect(config.path, check_same_thread=False)
+            # Readers in other processes do not block writers
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key         TEXT PRIMARY KEY,
+                    value       TEXT NOT NULL,
+                    created_at  REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)")
+            self._connection.commit()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        return (self.stats["hits"] + self.stats["disk_hits"]) / lookups if lookups else 0.0
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.config.ttl is not None and now - created_at > self.config.ttl
+
+    def _remember(self, key: str, value: str, created_at: float):
+        """Keep an entry in memory. Callers hold the lock."""
+        if self.config.max_entries == 0:
+            return
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[0]
+                del self._entries[key]
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1], now):
+                    self._connection.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                    self._connection.commit()
+                    self._remember(key, row[0], row[1])
+                    self.stats["disk_hits"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, value: str):
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self.stats["writes"] += 1
+            if self._connection is None:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if self.stats["writes"] % PRUNE_INTERVAL == 0:
+                self._prune(now)
+            self._connection.commit()
+
+    def _prune(self, now: float):
+        """Drop expired responses and the least recently used ones over `max_disk_entries`. Callers hold the lock."""
+        if self.config.ttl is not None:
+            self._connection.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.config.ttl,))
+        cursor = self._connection.execute(
+            """
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.config.max_disk_entries,),
+        )
+        self.stats["evictions"] += max(cursor.rowcount, 0)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM llm_cache")
+                self._connection.commit()
+
+
+class CachedLLM:
+    """
+    Serves repeated requests of an LLM from a `ResponseCache`. Other attributes are those of the LLM.
+
+    Requests are keyed by the provider, model, sampling parameters, messages, tools and response format. Only valid
+    responses are stored, so a retry after an unusable answer reaches the model again. Identical requests made
+    while the first one is running wait for its response instead of being sent too.
+    """
+
+    def __init__(self, llm, cache: ResponseCache, provider: str):
+        self.llm = llm
+        self.cache = cache
+        self.provider = provider
+        self._pending: Dict[str, threading.Event] = {}
+        self._pending_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    @property
+    def cache_stats(self) -> Dict:
+        """Memory and disk hits, misses, writes, evictions and hit rate of the cache."""
+        return {**self.cache.stats, "hit_rate": self.cache.hit_rate}
+
+    def _key(self, messages, response_format=None, tools=None, tool_choice=None) -> str:
+        config = self.llm.config
+        request = {
+            "provider": self.provider,
+            "model": config.model,
+            "params": {
+                "temperature": config.temperature,
+                "max_tokens": config.max_tokens,
+                "top_p": config.top_p,
+                "top_k": config.top_k,
+            },
+            "messages": _canonical_messages(messages),
+            "response_format": response_format,
+            "tools": tools,
+            "tool_choice": tool_choice if tools else None,
+        }
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str):
+        """The cached response of `key`, waiting for an identical running request first. Returns the response, or
+        None and an event to set once the caller has stored its own response."""
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return json.loads(cached), None
+            with self._pending_lock:
+                pending = self._pending.get(key)
+                if pending is None:
+                    event = self._pending[key] = threading.Event()
+                    return None, event
+            pending.wait()
+            if self.cache.get(key) is None:
+                # The running request failed or was not cacheable: send this one too
+                with self._pending_lock:
+                    if self._pending.get(key) is None:
+                        event = self._pending[key] = threading.Event()
+                        return None, event
+
+    def _release(self, key: str, event: threading.Event):
+        with self._pending_lock:
+            self._pending.pop(key, None)
+        event.set()
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        key = self._key(messages, response_format, tools, tool_choice)
+        response, event = self._lookup(key)
+        if event is None:
+            logger.debug(f"LLM cache hit {key[:12]}")
+            return response
+
+        try:
+            kwargs = {"messages": messages}
+            if response_format:
+                kwargs["response_format"] = response_format
+            if tools:
+                kwargs["tools"] = tools
+                kwargs["tool_choice"] = tool_choice
+            response = self.llm.generate_response(**kwargs)
+            if is_valid_response(response, response_format, tools):
+                self.cache.put(key, json.dumps(response))
+            return response
+        finally:
+            self._release(key, event)
+
+    def stream_response(self, messages, response_format=None) -> Iterator[str]:
+        # Streamed text is the same response as generate_response's, so both share the cache entry
+        key = self._key(messages, response_format)
+        response, event = self._lookup(key)
+        if event is None:
+            logger.debug(f"LLM cache hit {key[:12]}")
+            yield response
+            return
+
+        try:
+            chunks = []
+            for chunk in self.llm.stream_response(messages=messages, response_format=response_format):
+                chunks.append(chunk)
+                yield chunk
+            response = "".join(chunks)
+            if is_valid_response(response, response_format):
+                self.cache.put(key, json.dumps(response))
+        finally:
+            self._release(key, event)
@@ -1,12 +1,11 @@
-import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from openai import OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
-from mem0.memory.utils import extract_json
+from mem0.memory.utils import parse_tool_arguments
 
 
 class DeepSeekLLM(LLMBase):
@@ -18,7 +17,7 @@ class DeepSeekLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("DEEPSEEK_API_KEY")
         base_url = self.config.deepseek_base_url or os.getenv("DEEPSEEK_API_BASE") or "https://api.deepseek.com"
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(api_key=api_key, base_url=base_url, http_client=self.config.http_client)
 
     def _parse_response(self, response, tools):
         """
@@ -42,7 +41,7 @@ class DeepSeekLLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": parse_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -50,6 +49,27 @@ class DeepSeekLLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _build_params(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """Chat completion request parameters for the given messages."""
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -69,17 +89,19 @@ class DeepSeekLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-
-        if tools:
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
-
+        params = self._build_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    def stream_response(self, messages: List[Dict[str, str]], response_format=None) -> Iterator[str]:
+        """
+        Stream the text of a response based on the given messages using DeepSeek.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+
+        Returns:
+            Iterator[str]: The generated text, in chunks as they arrive.
+        """
+        return self._stream_chat_completion(self._build_params(messages, response_format), include_usage=False)
@@ -9,6 +9,7 @@ except ImportError:
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.http import get_http_transport
 
 
 class GeminiLLM(LLMBase):
@@ -19,7 +20,11 @@ class GeminiLLM(LLMBase):
             self.config.model = "gemini-2.0-flash"
 
         api_key = self.config.api_key or os.getenv("GOOGLE_API_KEY")
-        self.client = genai.Client(api_key=api_key)
+        http_options = None
+        # Older google-genai releases do not take arguments for the httpx client
+        if "client_args" in types.HttpOptions.model_fields:
+            http_options = types.HttpOptions(client_args={"transport": get_http_transport(self.config.http_pool)})
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
 
     def _parse_response(self, response, tools):
         """
@@ -197,5 +202,13 @@ class GeminiLLM(LLMBase):
         response = self.client.models.generate_content(
             model=self.config.model, contents=contents, config=generation_config
         )
+        # The system instruction precedes the contents, so implicit caching reuses it across requests
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self._record_usage(
+                input_tokens=getattr(usage, "prompt_token_count", None),
+                output_tokens=getattr(usage, "candidates_token_count", None),
+                cached_input_tokens=getattr(usage, "cached_content_token_count", None),
+            )
 
         return self._parse_response(response, tools)
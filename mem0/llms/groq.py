@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Dict, List, Optional
 
@@ -9,7 +8,7 @@ except ImportError:
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
-from mem0.memory.utils import extract_json
+from mem0.memory.utils import parse_tool_arguments
 
 
 class GroqLLM(LLMBase):
@@ -44,7 +43,7 @@ class GroqLLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": parse_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -1,4 +1,3 @@
-import json
 from typing import Dict, List, Optional
 
 try:
@@ -8,7 +7,7 @@ except ImportError:
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
-from mem0.memory.utils import extract_json
+from mem0.memory.utils import parse_tool_arguments
 
 
 class LiteLLM(LLMBase):
@@ -40,7 +39,7 @@ class LiteLLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": parse_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from openai import OpenAI
 
@@ -16,7 +16,30 @@ class LMStudioLLM(LLMBase):
         )
         self.config.api_key = self.config.api_key or "lm-studio"
 
-        self.client = OpenAI(base_url=self.config.lmstudio_base_url, api_key=self.config.api_key)
+        self.client = OpenAI(
+            base_url=self.config.lmstudio_base_url, api_key=self.config.api_key, http_client=self.config.http_client
+        )
+
+    def _build_params(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """Chat completion request parameters for the given messages."""
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+        if response_format:
+            params["response_format"] = response_format
+        if self.config.lmstudio_response_format is not None:
+            params["response_format"] = self.config.lmstudio_response_format
+        return params
 
     def generate_response(
         self,
@@ -37,17 +60,19 @@ class LMStudioLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-        if response_format:
-            params["response_format"] = response_format
-        if self.config.lmstudio_response_format is not None:
-            params["response_format"] = self.config.lmstudio_response_format
-
+        params = self._build_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return response.choices[0].message.content
+
+    def stream_response(self, messages: List[Dict[str, str]], response_format=None) -> Iterator[str]:
+        """
+        Stream the text of a response based on the given messages using LM Studio.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+
+        Returns:
+            Iterator[str]: The generated text, in chunks as they arrive.
+        """
+        return self._stream_chat_completion(self._build_params(messages, response_format), include_usage=False)
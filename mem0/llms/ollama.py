@@ -7,6 +7,7 @@ except ImportError:
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.http import get_http_transport
 
 
 class OllamaLLM(LLMBase):
@@ -15,7 +16,7 @@ class OllamaLLM(LLMBase):
 
         if not self.config.model:
             self.config.model = "llama3.1:70b"
-        self.client = Client(host=self.config.ollama_base_url)
+        self.client = Client(host=self.config.ollama_base_url, transport=get_http_transport(self.config.http_pool))
         self._ensure_model_exists()
 
     def _ensure_model_exists(self):
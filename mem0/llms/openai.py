@@ -1,13 +1,12 @@
-import json
 import os
 import warnings
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from openai import OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
-from mem0.memory.utils import extract_json
+from mem0.memory.utils import parse_tool_arguments
 
 
 class OpenAILLM(LLMBase):
@@ -23,6 +22,7 @@ class OpenAILLM(LLMBase):
                 base_url=self.config.openrouter_base_url
                 or os.getenv("OPENROUTER_API_BASE")
                 or "https://openrouter.ai/api/v1",
+                http_client=self.config.http_client,
             )
         else:
             api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
@@ -39,7 +39,7 @@ class OpenAILLM(LLMBase):
                     DeprecationWarning,
                 )
 
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
+            self.client = OpenAI(api_key=api_key, base_url=base_url, http_client=self.config.http_client)
 
     def _parse_response(self, response, tools):
         """
@@ -63,7 +63,7 @@ class OpenAILLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": parse_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -71,25 +71,14 @@ class OpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
+    def _build_params(
         self,
         messages: List[Dict[str, str]],
         response_format=None,
         tools: Optional[List[Dict]] = None,
         tool_choice: str = "auto",
     ):
-        """
-        Generate a JSON response based on the given messages using OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-
-        Returns:
-            json: The generated response.
-        """
+        """Chat completion request parameters for the given messages."""
         params = {
             "model": self.config.model,
             "messages": messages,
@@ -119,6 +108,41 @@ class OpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
 
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a JSON response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            json: The generated response.
+        """
+        params = self._build_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
+        self._record_chat_completion_usage(response)
         return self._parse_response(response, tools)
+
+    def stream_response(self, messages: List[Dict[str, str]], response_format=None) -> Iterator[str]:
+        """
+        Stream the text of a response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+
+        Returns:
+            Iterator[str]: The generated text, in chunks as they arrive.
+        """
+        return self._stream_chat_completion(self._build_params(messages, response_format), include_usage=True)
@@ -0,0 +1,247 @@
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import deque
+from copy import deepcopy
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.memory.utils import is_valid_response
+
+logger = logging.getLogger(__name__)
+
+# Latency samples of a route needed before its percentile replaces the configured hedge delay
+MIN_LATENCY_SAMPLES = 20
+
+
+class Route:
+    """One LLM behind the router, with its latency statistics and circuit breaker."""
+
+    def __init__(self, name: str, llm: LLMBase, failure_threshold: int, reset_timeout: float, window: int = 200):
+        self.name = name
+        self.llm = llm
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latencies = deque(maxlen=window)
+        self.stats = {"requests": 0, "errors": 0, "invalid": 0, "hedges": 0, "wins": 0}
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def try_acquire(self) -> bool:
+        """Whether the route may take a request: always when closed, one trial request at a time when half open."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_request(self, hedge: bool = False):
+        with self._lock:
+            self.stats["requests"] += 1
+            if hedge:
+                self.stats["hedges"] += 1
+
+    def record_latency(self, latency: float):
+        with self._lock:
+            self.latencies.append(latency)
+
+    def record_win(self):
+        with self._lock:
+            self.stats["wins"] += 1
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self, invalid: bool = False):
+        with self._lock:
+            self.stats["invalid" if invalid else "errors"] += 1
+            self.consecutive_failures += 1
+            self._trial_running = False
+            if self.opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(f"LLM route {self.name} failed {self.consecutive_failures} times; opening circuit")
+                self.opened_at = time.monotonic()
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        with self._lock:
+            if len(self.latencies) < MIN_LATENCY_SAMPLES:
+                return None
+            return float(np.percentile(self.latencies, percentile))
+
+
+class RouterLLM(LLMBase):
+    """
+    Routes each request over several LLMs to cut tail latency and ride out provider failures.
+
+    A request goes to the first route whose circuit is closed. If it has not answered after the hedge delay (a
+    percentile of that route's recent latencies), a duplicate is sent to the next route and the first valid answer
+    wins. A route that errors or returns an invalid answer is replaced by the next one, and after repeated failures
+    its circuit opens: it is skipped until `circuit_breaker_timeout` has passed, then tried again with one request.
+    """
+
+    def __init__(self, config: Optional[BaseLlmConfig] = None):
+        super().__init__(config)
+
+        if not self.config.routes:
+            raise ValueError("The router LLM needs at least one route in `routes`.")
+
+        # Imported here: the factory loads this module
+        from mem0.utils.factory import LlmFactory
+
+        self.routes = []
+        for index, route in enumerate(self.config.routes):
+            llm = LlmFactory.create(route["provider"], route.get("config") or {})
+            name = f"{index}:{route['provider']}:{llm.config.model}"
+            self.routes.append(
+                Route(name, llm, self.config.circuit_breaker_threshold, self.config.circuit_breaker_timeout)
+            )
+        if not self.config.model:
+            self.config.model = self.routes[0].llm.config.model
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4 * len(self.routes), thread_name_prefix="mem0-llm-router"
+        )
+
+    @property
+    def stats(self) -> List[Dict]:
+        """Per-route request counts, latency percentiles (seconds) and circuit state."""
+        stats = []
+        for route in self.routes:
+            latencies = list(route.latencies)
+            stats.append(
+                {
+                    "route": route.name,
+                    **route.stats,
+                    "p50": float(np.percentile(latencies, 50)) if latencies else None,
+                    "p95": float(np.percentile(latencies, 95)) if latencies else None,
+                    "p99": float(np.percentile(latencies, 99)) if latencies else None,
+                    "state": route.state,
+                }
+            )
+        return stats
+
+    def _hedge_delay(self, route: Route) -> Optional[float]:
+        if self.config.hedge_percentile is None:
+            return None
+        return route.latency_percentile(self.config.hedge_percentile) or self.config.hedge_delay
+
+    def _next_route(self, tried: set) -> Optional[Route]:
+        for route in self.routes:
+            if route not in tried and route.try_acquire():
+                return route
+        return None
+
+    def _call(self, route: Route, kwargs: Dict):
+        # The outcome is recorded here so that requests that lose the race still count, and a half-open trial
+        # that loses it still closes or reopens the circuit
+        start = time.monotonic()
+        try:
+            response = route.llm.generate_response(**kwargs)
+        except Exception as e:
+            logger.warning(f"LLM route {route.name} failed: {e}")
+            route.record_failure()
+            raise
+        route.record_latency(time.monotonic() - start)
+        if is_valid_response(response, kwargs.get("response_format"), kwargs.get("tools")):
+            route.record_success()
+        else:
+            logger.warning(f"LLM route {route.name} returned an invalid response")
+            route.record_failure(invalid=True)
+        return response
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response with the fastest valid answer of the routes.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to None.
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str or dict: The response of the route that answered first with a valid response.
+        """
+        kwargs = {"messages": messages}
+        if response_format:
+            kwargs["response_format"] = response_format
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = tool_choice
+
+        tried = set()
+        running = {}
+        fallback_response = None
+        last_error = None
+
+        def launch(route: Route, hedge: bool = False):
+            tried.add(route)
+            route.record_request(hedge)
+            # Adapters may rewrite the messages in place
+            running[self._executor.submit(self._call, route, deepcopy(kwargs))] = route
+
+        primary = self._next_route(tried)
+        if primary is None:
+            # Every circuit is open: failing fast would lose the request, so try the preferred route anyway
+            primary = self.routes[0]
+        launch(primary)
+        hedged = False
+
+        while running:
+            # Only the first request is hedged, and only once
+            timeout = self._hedge_delay(primary) if not hedged and len(tried) < len(self.routes) else None
+            done, _ = concurrent.futures.wait(running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                hedge_route = self._next_route(tried)
+                if hedge_route is not None:
+                    launch(hedge_route, hedge=True)
+                continue
+
+            for future in done:
+                route = running.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                else:
+                    if is_valid_response(response, response_format, tools):
+                        route.record_win()
+                        return response
+                    fallback_response = response
+
+                # Replace the failed request with the next route, unless a request is still running
+                if not running:
+                    fallback_route = self._next_route(tried)
+                    if fallback_route is not None:
+                        launch(fallback_route)
+
+        if fallback_response is not None:
+            return fallback_response
+        raise last_error
@@ -0,0 +1,159 @@
+import json
+import logging
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ValidationError, field_validator
+
+from mem0.memory.utils import loads_lenient
+
+logger = logging.getLogger(__name__)
+
+# Providers that enforce a JSON schema on the response (OpenAI structured outputs)
+STRUCTURED_OUTPUT_PROVIDERS = ("openai_structured", "azure_openai_structured")
+
+# Providers whose adapters return the parsed tool calls when tools are passed
+TOOL_CALLING_PROVIDERS = (
+    "openai",
+    "azure_openai",
+    "aws_bedrock",
+    "deepseek",
+    "gemini",
+    "groq",
+    "litellm",
+    "ollama",
+    "together",
+    "vllm",
+)
+
+MEMORY_CHANGES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "facts": {
+            "type": "array",
+            "description": "The facts and preferences extracted from the conversation.",
+            "items": {"type": "string"},
+        },
+        "memory": {
+            "type": "array",
+            "description": "The operations to perform on the memory.",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "description": "ID of an existing memory for UPDATE, DELETE and NONE, or a new ID for ADD.",
+                    },
+                    "text": {"type": "string", "description": "Content of the memory."},
+                    "event": {"type": "string", "enum": ["ADD", "UPDATE", "DELETE", "NONE"]},
+                    "old_memory": {"type": "string", "description": "Previous content, for UPDATE only."},
+                },
+                "required": ["id", "text", "event"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["facts", "memory"],
+    "additionalProperties": False,
+}
+
+# Strict structured outputs need every property required; optional ones are nullable instead
+MEMORY_CHANGES_STRUCT_SCHEMA = json.loads(json.dumps(MEMORY_CHANGES_SCHEMA))
+MEMORY_CHANGES_STRUCT_SCHEMA["properties"]["memory"]["items"]["properties"]["old_memory"]["type"] = ["string", "null"]
+MEMORY_CHANGES_STRUCT_SCHEMA["properties"]["memory"]["items"]["required"] = ["id", "text", "event", "old_memory"]
+
+MEMORY_CHANGES_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "record_memory_changes",
+        "description": "Record the facts extracted from the conversation and the resulting changes to the memory.",
+        "parameters": MEMORY_CHANGES_SCHEMA,
+    },
+}
+
+
+class MemoryAction(BaseModel):
+    id: str
+    text: str
+    event: Literal["ADD", "UPDATE", "DELETE", "NONE"]
+    old_memory: Optional[str] = None
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def coerce_id(cls, value):
+        return str(value) if isinstance(value, int) else value
+
+
+def get_fused_request_params(provider: str) -> Dict[str, Any]:
+    """
+    Keyword arguments for `generate_response` that make `provider` return the memory changes.
+
+    Structured output providers get the JSON schema as `response_format`, tool-calling providers the
+    `record_memory_changes` tool, and the others JSON mode with the format described in the prompt.
+
+    Args:
+        provider (str): LLM provider name.
+
+    Returns:
+        dict: Extra arguments for `generate_response`.
+    """
+    if provider in STRUCTURED_OUTPUT_PROVIDERS:
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "memory_changes", "schema": MEMORY_CHANGES_STRUCT_SCHEMA, "strict": True},
+            }
+        }
+    if provider in TOOL_CALLING_PROVIDERS:
+        return {"tools": [MEMORY_CHANGES_TOOL]}
+    return {"response_format": {"type": "json_object"}}
+
+
+def parse_fused_response(response, existing_ids) -> Dict[str, List]:
+    """
+    Validate the memory changes returned by the fused add call.
+
+    Actions that do not match the schema, and UPDATE or DELETE actions on memories that were not given to the
+    model, are dropped individually so a single bad entry does not discard the whole response.
+
+    Args:
+        response (str or dict): The LLM response, JSON text or a `{"tool_calls": [...]}` dict.
+        existing_ids (Iterable[str]): The IDs of the existing memories in the prompt.
+
+    Returns:
+        dict: "facts" (list of str) and "memory" (list of action dicts).
+
+    Raises:
+        ValueError: If the response is not a JSON object.
+    """
+    try:
+        if isinstance(response, dict):
+            tool_calls = [
+                call for call in response.get("tool_calls") or [] if call.get("name") == "record_memory_changes"
+            ]
+            if tool_calls:
+                data = tool_calls[0]["arguments"]
+            else:
+                data = loads_lenient(response.get("content") or "")
+        else:
+            data = loads_lenient(response)
+        if isinstance(data, str):
+            data = loads_lenient(data)
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    except Exception as e:
+        raise ValueError(f"Invalid memory changes response: {e}") from e
+
+    facts = [fact for fact in data.get("facts") or [] if isinstance(fact, str) and fact.strip()]
+    existing_ids = set(existing_ids)
+    actions = []
+    for item in data.get("memory") or []:
+        try:
+            action = MemoryAction.model_validate(item)
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid memory action {item}: {e}")
+            continue
+        if action.event in ("UPDATE", "DELETE") and action.id not in existing_ids:
+            logger.warning(f"Skipping {action.event} of unknown memory id {action.id}")
+            continue
+        actions.append(action.model_dump())
+    return {"facts": facts, "memory": actions}
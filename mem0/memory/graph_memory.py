@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections import defaultdict
 
 from mem0.memory.utils import format_entities
 
@@ -7,11 +9,9 @@ try:
 except ImportError:
     raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
+from mem0.graphs.connections import get_shared_graph, pool_settings, run_once
+from mem0.graphs.entity_matcher import EntityMatcher
+from mem0.graphs.reranker import BM25Reranker
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -20,40 +20,61 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import (
+    EXTRACT_RELATIONS_PROMPT,
+    aextract_graph_changes,
+    extract_graph_changes,
+    get_delete_messages,
+    iter_graph_relations,
+    paginate_relations,
+)
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+VECTOR_INDEX_PREFIX = "entity_embedding"
+
+# Lookups retried with more vector index candidates when the user's entities may be crowded out by other users',
+# before the user's entities are scanned
+VECTOR_SEARCH_RETRIES = 2
+VECTOR_CANDIDATES_GROWTH = 4
+
 
 class MemoryGraph:
     def __init__(self, config):
         self.config = config
-        self.graph = Neo4jGraph(
-            self.config.graph_store.config.url,
-            self.config.graph_store.config.username,
-            self.config.graph_store.config.password,
-            self.config.graph_store.config.database,
-            refresh_schema=False,
-            driver_config={"notifications_min_severity": "OFF"},
+        neo4j_config = self.config.graph_store.config
+        driver_settings = pool_settings(self.config.graph_store)
+        # Instances with the same endpoint, credentials and pool settings share one driver per process
+        self.connection_key = (
+            "neo4j",
+            neo4j_config.url,
+            neo4j_config.username,
+            neo4j_config.password,
+            neo4j_config.database,
+            tuple(sorted(driver_settings.items())),
+        )
+        self.graph = get_shared_graph(
+            self.connection_key,
+            lambda: Neo4jGraph(
+                neo4j_config.url,
+                neo4j_config.username,
+                neo4j_config.password,
+                neo4j_config.database,
+                refresh_schema=False,
+                driver_config={"notifications_min_severity": "OFF", **driver_settings},
+            ),
         )
         self.embedding_model = EmbedderFactory.create(
             self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
         )
-        self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
+        self.node_label = ":`__Entity__`" if neo4j_config.base_label else ""
 
-        if self.config.graph_store.config.base_label:
-            # Safely add user_id index
-            try:
-                self.graph.query(f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)")
-            except Exception:
-                pass
-            try:  # Safely try to add composite index (Enterprise only)
-                self.graph.query(
-                    f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)"
-                )
-            except Exception:
-                pass
+        self.vector_index_name = None
+        self.vector_index_candidates = neo4j_config.vector_index_candidates
+        if neo4j_config.base_label:
+            dims = self._embedding_dims() if neo4j_config.vector_index else None
+            self.vector_index_name = run_once(self.connection_key + ("schema", dims), lambda: self._setup_schema(dims))
 
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
@@ -65,6 +86,155 @@ class MemoryGraph:
         self.user_id = None
         self.threshold = 0.7
 
+        self.entity_matcher = None
+        if self.config.graph_store.entity_matching:
+            self.entity_matcher = EntityMatcher(
+                self._load_entity_names, ttl=self.config.graph_store.entity_matching_ttl
+            )
+        self.reranker = BM25Reranker(self.iter_all)
+
+    def _embedding_dims(self):
+        dims = getattr(self.embedding_model.config, "embedding_dims", None) or getattr(
+            self.config.vector_store.config, "embedding_model_dims", None
+        )
+        if not dims:
+            logger.warning("Embedding dimensions are unknown, graph similarity search will not use a vector index")
+            return None
+        return int(dims)
+
+    def _setup_schema(self, dims):
+        """
+        Create the entity indexes, and the vector index when `dims` is given. Runs once per process and
+        connection; returns the vector index name or None.
+        """
+        # Safely add user_id index
+        try:
+            self.graph.query(f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)")
+        except Exception:
+            pass
+        try:  # Safely try to add composite index (Enterprise only)
+            self.graph.query(
+                f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)"
+            )
+        except Exception:
+            pass
+
+        if dims is None:
+            return None
+        return self._create_vector_index(dims)
+
+    def _create_vector_index(self, dims):
+        """
+        Create the vector index on entity embeddings.
+
+        The index name carries the embedding dimension, so switching embedders never queries an index of the
+        wrong size. Returns None when the server has no vector index support (Neo4j < 5.11), in which case
+        similarity is computed by scanning the user's nodes.
+        """
+        index_name = f"{VECTOR_INDEX_PREFIX}_{int(dims)}"
+        try:
+            self.graph.query(
+                f"""
+                CREATE VECTOR INDEX {index_name} IF NOT EXISTS
+                FOR (n {self.node_label}) ON (n.embedding)
+                OPTIONS {{indexConfig: {{`vector.dimensions`: {int(dims)}, `vector.similarity_function`: 'cosine'}}}}
+                """
+            )
+            return index_name
+        except Exception:
+            pass
+
+        # Neo4j 5.11 and 5.12 only expose index creation as a procedure, which has no IF NOT EXISTS
+        try:
+            if self.graph.query("SHOW INDEXES YIELD name WHERE name = $name RETURN name", params={"name": index_name}):
+                return index_name
+            self.graph.query(
+                "CALL db.index.vector.createNodeIndex($name, '__Entity__', 'embedding', $dims, 'cosine')",
+                params={"name": index_name, "dims": int(dims)},
+            )
+            return index_name
+        except Exception as e:
+            logger.warning(f"Vector index is not supported, falling back to brute-force graph similarity search: {e}")
+            return None
+
+    def _similar_nodes(self, entities, filters, threshold, best_only=False):
+        """
+        The user's entities whose similarity with each of `entities` is at least `threshold`, best first.
+
+        The vector index returns the nearest entities of every user, and the user's own are filtered out of them
+        afterwards. When the candidates may have cut some of them off (every candidate is above the threshold),
+        the lookup is retried with more candidates, then with an exact scan of the user's entities.
+
+        Args:
+            entities (list): Dicts with the entity "name" and its "embedding".
+            filters (dict): Session filters.
+            threshold (float): Minimum similarity.
+            best_only (bool): Only the most similar node of each entity is needed. Defaults to False.
+
+        Returns:
+            dict: Entity name -> list of {"node_id", "similarity"} dicts, for the entities that matched.
+        """
+        matches = {}
+        pending = entities
+        candidates = self.vector_index_candidates
+        for _ in range(VECTOR_SEARCH_RETRIES + 1 if self.vector_index_name else 0):
+            rows = self.graph.query(
+                self._index_lookup_query(filters),
+                params={
+                    "entities": pending,
+                    "threshold": threshold,
+                    "vector_candidates": candidates,
+                    **self._session_params(filters),
+                },
+            )
+            truncated = set()
+            for row in rows:
+                if row["truncated"] and not (best_only and row["matches"]):
+                    truncated.add(row["name"])
+                elif row["matches"]:
+                    matches[row["name"]] = row["matches"]
+            pending = [entity for entity in pending if entity["name"] in truncated]
+            if not pending:
+                return matches
+            candidates *= VECTOR_CANDIDATES_GROWTH
+
+        if self.vector_index_name:
+            logger.debug(f"Scanning the user's entities for {len(pending)} entities crowded out of the vector index")
+        rows = self.graph.query(
+            self._scan_lookup_query(filters),
+            params={"entities": pending, "threshold": threshold, **self._session_params(filters)},
+        )
+        matches.update({row["name"]: row["matches"] for row in rows if row["matches"]})
+        return matches
+
+    def _index_lookup_query(self, filters):
+        agent_filter = "AND node.agent_id = $agent_id" if filters.get("agent_id") else ""
+        return f"""
+        UNWIND $entities AS entity
+        CALL db.index.vector.queryNodes('{self.vector_index_name}', $vector_candidates, entity.embedding)
+        YIELD node, score
+        WITH entity, node, round(2 * score - 1, 4) AS similarity // denormalize for backward compatibility
+        ORDER BY similarity DESC
+        WITH entity, count(node) AS found, min(similarity) AS lowest,
+            collect(
+                CASE WHEN node.user_id = $user_id {agent_filter} AND similarity >= $threshold
+                THEN {{node_id: elementId(node), similarity: similarity}} END
+            ) AS matches
+        RETURN entity.name AS name, matches, found = $vector_candidates AND lowest >= $threshold AS truncated
+        """
+
+    def _scan_lookup_query(self, filters):
+        agent_filter = "AND n.agent_id = $agent_id" if filters.get("agent_id") else ""
+        return f"""
+        UNWIND $entities AS entity
+        MATCH (n {self.node_label})
+        WHERE n.embedding IS NOT NULL AND n.user_id = $user_id {agent_filter}
+        WITH entity, n, round(2 * vector.similarity.cosine(n.embedding, entity.embedding) - 1, 4) AS similarity // denormalize for backward compatibility
+        WHERE similarity >= $threshold
+        ORDER BY similarity DESC
+        RETURN entity.name AS name, collect({{node_id: elementId(n), similarity: similarity}}) AS matches
+        """
+
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -73,15 +243,33 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        entity_type_map, to_be_added, to_be_deleted = extract_graph_changes(self, data, filters)
+        return self._write_changes(to_be_added, to_be_deleted, filters, entity_type_map)
 
-        # TODO: Batch queries with APOC plugin
+    async def aadd(self, data, filters):
+        """
+        Adds data to the graph from async code, overlapping the LLM and search stages as concurrent tasks.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = await aextract_graph_changes(self, data, filters)
+        return await asyncio.to_thread(self._write_changes, to_be_added, to_be_deleted, filters, entity_type_map)
+
+    def _write_changes(self, to_be_added, to_be_deleted, filters, entity_type_map):
         # TODO: Add more filter support
-        deleted_entities = self._delete_entities(to_be_deleted, filters)
-        added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+        nodes, relations = self._plan_additions(to_be_added, filters, entity_type_map)
+
+        def write(tx):
+            return self._run_deletions(tx, to_be_deleted, filters), self._run_additions(tx, nodes, relations, filters)
+
+        deleted_entities, added_entities = self._execute_write(write)
+        self.reranker.update(filters, added_entities, deleted_entities)
+        if self.entity_matcher:
+            self.entity_matcher.add(
+                filters, [name for item in to_be_added for name in (item["source"], item["destination"])]
+            )
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -99,28 +287,46 @@ class MemoryGraph:
                 - "contexts": List of search results from the base data store.
                 - "entities": List of related graph data based on the query.
         """
-        entity_type_map = self._retrieve_nodes_from_data(query, filters)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        node_list = self._extract_query_entities(query, filters)
+        search_output = self._search_graph_db(node_list=node_list, filters=filters)
 
         if not search_output:
             return []
 
-        search_outputs_sequence = [
-            [item["source"], item["relationship"], item["destination"]] for item in search_output
+        search_results = [
+            {"source": item["source"], "relationship": item["relationship"], "destination": item["destination"]}
+            for item in self.reranker.rerank(query, search_output, filters, n=5)
         ]
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
-
-        search_results = []
-        for item in reranked_results:
-            search_results.append({"source": item[0], "relationship": item[1], "destination": item[2]})
 
         logger.info(f"Returned {len(search_results)} search results")
 
         return search_results
 
+    def _extract_query_entities(self, query, filters):
+        """
+        Entities mentioned in a search query. Known entity names are matched in memory; the LLM is only asked
+        when nothing matches, the user has stored entities, and the fallback is enabled.
+        """
+        if self.entity_matcher is None:
+            return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+        node_list = self.entity_matcher.match(query, filters)
+        if node_list or not self.config.graph_store.entity_matching_llm_fallback:
+            return node_list
+        if not self.entity_matcher.has_entities(filters):
+            return []
+        return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+    def _load_entity_names(self, filters):
+        """Names of all entities stored for the user (and agent), used to seed the entity matcher."""
+        agent_filter = "AND n.agent_id = $agent_id" if filters.get("agent_id") else ""
+        cypher = f"""
+        MATCH (n {self.node_label})
+        WHERE n.user_id = $user_id {agent_filter}
+        RETURN DISTINCT n.name AS name
+        """
+        return [row["name"] for row in self.graph.query(cypher, params=self._session_params(filters))]
+
     def delete_all(self, filters):
         if filters.get("agent_id"):
             cypher = f"""
@@ -135,45 +341,66 @@ class MemoryGraph:
             """
             params = {"user_id": filters["user_id"]}
         self.graph.query(cypher, params=params)
+        if self.entity_matcher:
+            self.entity_matcher.forget(filters)
+        self.reranker.forget(filters)
 
-    def get_all(self, filters, limit=100):
+    def get_all(self, filters, limit=100, cursor=None):
         """
-        Retrieves all nodes and relationships from the graph database based on optional filtering criteria.
-         Args:
+        Retrieves relationships from the graph database based on optional filtering criteria, ordered by
+        relationship id.
+
+        Args:
             filters (dict): A dictionary containing filters to be applied during the retrieval.
-            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (str, optional): Cursor returned by `get_all_page` to continue after. Defaults to None.
+
         Returns:
             list: A list of dictionaries, each containing:
-                - 'contexts': The base data store response for each memory.
-                - 'entities': A list of strings representing the nodes and relationships
+                - 'source': The source node name.
+                - 'relationship': The relationship type.
+                - 'target': The target node name.
+        """
+        return self.get_all_page(filters, limit=limit, cursor=cursor)[0]
+
+    def get_all_page(self, filters, limit=100, cursor=None):
+        """
+        Retrieves one page of relationships, ordered by relationship element id.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (str, optional): Element id of the last relationship of the previous page. Defaults to None.
+
+        Returns:
+            tuple: (relationships, next_cursor); next_cursor is None on the last page.
         """
         agent_filter = ""
-        params = {"user_id": filters["user_id"], "limit": limit}
+        cursor_filter = ""
+        params = {"user_id": filters["user_id"], "limit": limit + 1}
         if filters.get("agent_id"):
             agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
             params["agent_id"] = filters["agent_id"]
+        if cursor is not None:
+            cursor_filter = "AND elementId(r) > $cursor"
+            params["cursor"] = cursor
 
         query = f"""
         MATCH (n {self.node_label} {{user_id: $user_id}})-[r]->(m {self.node_label} {{user_id: $user_id}})
-        WHERE 1=1 {agent_filter}
-        RETURN n.name AS source, type(r) AS relationship, m.name AS target
+        WHERE 1=1 {agent_filter} {cursor_filter}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target, elementId(r) AS relation_id
+        ORDER BY relation_id
         LIMIT $limit
         """
-        results = self.graph.query(query, params=params)
+        results, next_cursor = paginate_relations(self.graph.query(query, params=params), limit)
 
-        final_results = []
-        for result in results:
-            final_results.append(
-                {
-                    "source": result["source"],
-                    "relationship": result["relationship"],
-                    "target": result["target"],
-                }
-            )
+        logger.info(f"Retrieved {len(results)} relationships")
 
-        logger.info(f"Retrieved {len(final_results)} relationships")
+        return results, next_cursor
 
-        return final_results
+    def iter_all(self, filters, page_size=1000):
+        """Stream all relationships of a user (and agent) in pages of `page_size`, in bounded memory."""
+        return iter_graph_relations(self, filters, page_size=page_size)
 
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
@@ -249,49 +476,45 @@ class MemoryGraph:
         return entities
 
     def _search_graph_db(self, node_list, filters, limit=100):
-        """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
-        agent_filter = ""
-        if filters.get("agent_id"):
-            agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
+        """
+        Search similar nodes among and their respective incoming and outgoing relations.
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            cypher_query = f"""
-            MATCH (n {self.node_label})
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
-            {agent_filter}
-            WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
-            WHERE similarity >= $threshold
-            CALL {{
-                MATCH (n)-[r]->(m)
-                WHERE m.user_id = $user_id {agent_filter.replace("n.", "m.")} 
-                RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
-                UNION
-                MATCH (m)-[r]->(n)
-                WHERE m.user_id = $user_id {agent_filter.replace("n.", "m.")}
-                RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
-            }}
-            WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
-            RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
-            ORDER BY similarity DESC
-            LIMIT $limit
-            """
+        All entity names are embedded in one batch and matched with one lookup, and the relations of the matched
+        nodes are read in a single query. Relations reached from several entities are returned once, with their
+        best similarity.
+        """
+        if not node_list:
+            return []
 
-            params = {
-                "n_embedding": n_embedding,
-                "threshold": self.threshold,
-                "user_id": filters["user_id"],
-                "limit": limit,
-            }
-            if filters.get("agent_id"):
-                params["agent_id"] = filters["agent_id"]
+        embeddings = self.embedding_model.embed_batch(node_list)
+        entities = [{"name": node, "embedding": embedding} for node, embedding in zip(node_list, embeddings)]
+        matches = [
+            match for nodes in self._similar_nodes(entities, filters, self.threshold).values() for match in nodes
+        ]
+        if not matches:
+            return []
 
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+        agent_filter = ""
+        if filters.get("agent_id"):
+            agent_filter = "AND m.agent_id = $agent_id"
+
+        cypher_query = f"""
+        UNWIND $matches AS match
+        MATCH (n {self.node_label})
+        WHERE elementId(n) = match.node_id
+        WITH n, max(match.similarity) AS similarity
+        MATCH (n)-[r]-(m)
+        WHERE m.user_id = $user_id {agent_filter}
+        WITH startNode(r) AS source_node, r, endNode(r) AS destination_node, max(similarity) AS similarity
+        RETURN source_node.name AS source, elementId(source_node) AS source_id, type(r) AS relationship,
+            elementId(r) AS relation_id, destination_node.name AS destination,
+            elementId(destination_node) AS destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        """
 
-        return result_relations
+        params = {"matches": matches, "limit": limit, **self._session_params(filters)}
+        return self.graph.query(cypher_query, params=params)
 
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
@@ -327,300 +550,235 @@ class MemoryGraph:
         logger.debug(f"Deleted relationships: {to_be_deleted}")
         return to_be_deleted
 
-    def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        results = []
-
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # Build the agent filter for the query
-            agent_filter = ""
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
-
-            if agent_id:
-                agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
-                params["agent_id"] = agent_id
+    def _execute_write(self, work):
+        """
+        Run `work(tx)` in a single explicit write transaction and return its result.
 
-            # Delete the specific relationship between nodes
-            cypher = f"""
-            MATCH (n {self.node_label} {{name: $source_name, user_id: $user_id}})
-            -[r:{relationship}]->
-            (m {self.node_label} {{name: $dest_name, user_id: $user_id}})
-            WHERE 1=1 {agent_filter}
-            DELETE r
-            RETURN 
-                n.name AS source,
-                m.name AS target,
-                type(r) AS relationship
-            """
+        `Neo4jGraph` only runs auto-commit queries, so the transaction goes through its driver and database
+        directly: writes share the connection pool, settings and database resolution (`NEO4J_DATABASE`) of reads.
+        """
+        with self.graph._driver.session(database=self.graph._database) as session:
+            return session.execute_write(work)
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+    @staticmethod
+    def _run(tx, cypher, params):
+        return [record.data() for record in tx.run(cypher, params)]
 
-        return results
+    def _has_apoc(self):
+        """Whether APOC is installed, checked once per process and connection."""
 
-    def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
-
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            source_label = self.node_label if self.node_label else f":`{source_type}`"
-            source_extra_set = f", source:`{source_type}`" if self.node_label else ""
-            destination_type = entity_type_map.get(destination, "__User__")
-            destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-            destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=0.9)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=0.9)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                # Build destination MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
+        def probe():
+            try:
+                return bool(
+                    self.graph.query("SHOW PROCEDURES YIELD name WHERE name = 'apoc.merge.relationship' RETURN name")
+                )
+            except Exception:
+                return False
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    source.created = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
+        return run_once(self.connection_key + ("apoc",), probe)
 
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
+    def _identity_props(self, prefix, filters):
+        props = [f"name: {prefix}.name", "user_id: $user_id"]
+        if filters.get("agent_id"):
+            props.append("agent_id: $agent_id")
+        return ", ".join(props)
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
+    def _session_params(self, filters):
+        params = {"user_id": filters["user_id"]}
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
+        return params
 
-            else:
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET source.created = timestamp(),
-                            source.mentions = 1
-                            {source_extra_set}
-                ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET destination.created = timestamp(),
-                            destination.mentions = 1
-                            {destination_extra_set}
-                ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
-                WITH source, destination
-                MERGE (source)-[rel:{relationship}]->(destination)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN source.name AS source, type(rel) AS relationship, destination.name AS target
-                """
+    def _delete_entities(self, to_be_deleted, filters):
+        """Delete the entities from the graph."""
+        return self._execute_write(lambda tx: self._run_deletions(tx, to_be_deleted, filters))
 
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+    def _add_entities(self, to_be_added, filters, entity_type_map):
+        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        nodes, relations = self._plan_additions(to_be_added, filters, entity_type_map)
+        return self._execute_write(lambda tx: self._run_additions(tx, nodes, relations, filters))
 
-    def _remove_spaces_from_entities(self, entity_list):
-        for item in entity_list:
-            item["source"] = item["source"].lower().replace(" ", "_")
-            item["relationship"] = item["relationship"].lower().replace(" ", "_")
-            item["destination"] = item["destination"].lower().replace(" ", "_")
-        return entity_list
+    def _run_deletions(self, tx, to_be_deleted, filters):
+        """Delete all the given relationships with a single UNWIND statement."""
+        if not to_be_deleted:
+            return []
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
         agent_filter = ""
         if filters.get("agent_id"):
-            agent_filter = "AND source_candidate.agent_id = $agent_id"
+            agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
 
         cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE source_candidate.embedding IS NOT NULL 
-            AND source_candidate.user_id = $user_id
-            {agent_filter}
+        UNWIND $relations AS relation
+        MATCH (n {self.node_label} {{name: relation.source, user_id: $user_id}})
+        -[r]->
+        (m {self.node_label} {{name: relation.destination, user_id: $user_id}})
+        WHERE type(r) = relation.relationship {agent_filter}
+        DELETE r
+        RETURN relation.index AS index, n.name AS source, m.name AS target, relation.relationship AS relationship
+        """
+        params = {
+            "relations": [
+                {
+                    "index": index,
+                    "source": item["source"],
+                    "destination": item["destination"],
+                    "relationship": item["relationship"],
+                }
+                for index, item in enumerate(to_be_deleted)
+            ],
+            **self._session_params(filters),
+        }
+        return self._per_relation(self._run(tx, cypher, params), len(to_be_deleted))
+
+    @staticmethod
+    def _per_relation(rows, count):
+        """Split the rows of a batched statement into one result list per relation, in the order given."""
+        results = [[] for _ in range(count)]
+        for row in rows:
+            results[row.pop("index")].append(row)
+        return results
 
-            WITH source_candidate,
-            round(2 * vector.similarity.cosine(source_candidate.embedding, $source_embedding) - 1, 4) AS source_similarity // denormalize for backward compatibility
-            WHERE source_similarity >= $threshold
+    def _resolve_nodes(self, entities, filters, threshold=0.9):
+        """
+        Find the existing node closest to each entity, with one lookup for all of them.
 
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
+        Args:
+            entities (list): Dicts with the entity "name" and its "embedding".
+            filters (dict): Session filters.
+            threshold (float): Minimum similarity for an existing node to be reused.
 
-            RETURN elementId(source_candidate)
-            """
+        Returns:
+            dict: Entity name -> elementId of the matched node, for the entities that matched.
+        """
+        matches = self._similar_nodes(entities, filters, threshold, best_only=True)
+        return {name: nodes[0]["node_id"] for name, nodes in matches.items()}
 
-        params = {
-            "source_embedding": source_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
+    def _plan_additions(self, to_be_added, filters, entity_type_map):
+        """
+        Embed and resolve every entity of the relations to add with one embedding batch and one lookup query.
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        Returns:
+            tuple: (nodes, relations). Nodes are the entities without a matching node, which will be merged;
+                relations reference their endpoints by name.
+        """
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        if not names:
+            return [], []
+
+        embeddings = self.embedding_model.embed_batch(names)
+        entities = [{"name": name, "embedding": embedding} for name, embedding in zip(names, embeddings)]
+        resolved = self._resolve_nodes(entities, filters)
+
+        nodes = [
+            {**entity, "type": entity_type_map.get(entity["name"], "__User__")}
+            for entity in entities
+            if entity["name"] not in resolved
+        ]
+        relations = [
+            {
+                "source": item["source"],
+                "source_id": resolved.get(item["source"]),
+                "destination": item["destination"],
+                "destination_id": resolved.get(item["destination"]),
+                "relationship": item["relationship"],
+            }
+            for item in to_be_added
+        ]
+        return nodes, relations
 
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
-        agent_filter = ""
-        if filters.get("agent_id"):
-            agent_filter = "AND destination_candidate.agent_id = $agent_id"
+    def _merge_nodes(self, tx, nodes, filters):
+        """
+        Merge the unresolved entities, grouped by type since labels cannot be parameterized.
+        Nodes are created with zero mentions; mentions are counted when relationships are merged.
 
-        cypher = f"""
-            MATCH (destination_candidate {self.node_label})
-            WHERE destination_candidate.embedding IS NOT NULL 
-            AND destination_candidate.user_id = $user_id
-            {agent_filter}
+        Returns:
+            dict: Entity name -> elementId of the merged node.
+        """
+        nodes_by_type = defaultdict(list)
+        for node in nodes:
+            nodes_by_type[node["type"]].append(node)
+
+        node_ids = {}
+        for node_type, group in nodes_by_type.items():
+            if self.node_label:
+                merge_label = self.node_label
+                type_set = f", n:`{node_type}`"
+            else:
+                merge_label = f":`{node_type}`"
+                type_set = ""
 
-            WITH destination_candidate,
-            round(2 * vector.similarity.cosine(destination_candidate.embedding, $destination_embedding) - 1, 4) AS destination_similarity // denormalize for backward compatibility
+            cypher = f"""
+            UNWIND $nodes AS node
+            MERGE (n {merge_label} {{{self._identity_props("node", filters)}}})
+            ON CREATE SET n.created = timestamp(), n.mentions = 0{type_set}
+            WITH n, node
+            CALL db.create.setNodeVectorProperty(n, 'embedding', node.embedding)
+            RETURN node.name AS name, elementId(n) AS node_id
+            """
+            params = {"nodes": group, **self._session_params(filters)}
+            node_ids.update({row["name"]: row["node_id"] for row in self._run(tx, cypher, params)})
+        return node_ids
+
+    def _run_additions(self, tx, nodes, relations, filters):
+        """
+        Merge the planned nodes and relationships. Relationships are merged with one APOC statement,
+        or one statement per relationship type when APOC is not installed.
 
-            WHERE destination_similarity >= $threshold
+        Returns:
+            list: One list of merged {"source", "relationship", "target"} rows per relation, in the order given.
+        """
+        if not relations:
+            return []
 
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
+        node_ids = self._merge_nodes(tx, nodes, filters)
+        for index, relation in enumerate(relations):
+            relation["index"] = index
+            relation["source_id"] = relation["source_id"] or node_ids.get(relation["source"])
+            relation["destination_id"] = relation["destination_id"] or node_ids.get(relation["destination"])
+
+        match_endpoints = """
+        UNWIND $relations AS relation
+        MATCH (source) WHERE elementId(source) = relation.source_id
+        MATCH (destination) WHERE elementId(destination) = relation.destination_id
+        SET source.mentions = coalesce(source.mentions, 0) + 1,
+            destination.mentions = coalesce(destination.mentions, 0) + 1
+        WITH source, destination, relation
+        """
+        merged = """
+        SET r.mentions = coalesce(r.mentions, 0) + 1
+        RETURN relation.index AS index, source.name AS source, type(r) AS relationship, destination.name AS target
+        """
 
-            RETURN elementId(destination_candidate)
+        if self._has_apoc():
+            cypher = f"""
+            {match_endpoints}
+            CALL apoc.merge.relationship(source, relation.relationship, {{}}, {{created: timestamp()}}, destination, {{}})
+            YIELD rel AS r
+            {merged}
             """
+            return self._per_relation(self._run(tx, cypher, {"relations": relations}), len(relations))
 
-        params = {
-            "destination_embedding": destination_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
+        relations_by_type = defaultdict(list)
+        for relation in relations:
+            relations_by_type[relation["relationship"]].append(relation)
+
+        rows = []
+        for relationship, group in relations_by_type.items():
+            cypher = f"""
+            {match_endpoints}
+            MERGE (source)-[r:`{relationship}`]->(destination)
+            ON CREATE SET r.created = timestamp()
+            {merged}
+            """
+            rows.extend(self._run(tx, cypher, {"relations": group}))
+        return self._per_relation(rows, len(relations))
 
-        result = self.graph.query(cypher, params=params)
-        return result
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
 
     # Reset is not defined in base.py
     def reset(self):
@@ -629,4 +787,7 @@ class MemoryGraph:
         cypher_query = """
         MATCH (n) DETACH DELETE n
         """
+        if self.entity_matcher:
+            self.entity_matcher.forget()
+        self.reranker.forget()
         return self.graph.query(cypher_query)
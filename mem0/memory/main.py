@@ -1,10 +1,11 @@
 import asyncio
 import concurrent
+import contextvars
 import gc
 import hashlib
-import json
 import logging
 import os
+import sys
 import uuid
 import warnings
 from copy import deepcopy
@@ -14,24 +15,63 @@ from typing import Any, Dict, Optional
 import pytz
 from pydantic import ValidationError
 
-from mem0.configs.base import MemoryConfig, MemoryItem
+from mem0.configs.base import LlmCacheConfig, MemoryConfig, MemoryItem
 from mem0.configs.enums import MemoryType
 from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
-    get_update_memory_messages,
+    get_fused_memory_prompts,
+    get_update_memory_prompts,
 )
+from mem0.llms.cache import ResponseCache
 from mem0.memory.base import MemoryBase
+from mem0.memory.fused import get_fused_request_params, parse_fused_response
+from mem0.memory.parsing import ResponseParser
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
 from mem0.memory.utils import (
-    get_fact_retrieval_messages,
+    get_parse_stats,
     parse_messages,
     parse_vision_messages,
     process_telemetry_filters,
-    remove_code_blocks,
 )
+from mem0.memory.vision import ImageDescriber
+from mem0.memory.window import InputWindow, extract_facts
 from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
+from mem0.utils.scheduler import background_priority
+
+
+# Marks the end of the streamed facts in AsyncMemory
+_END_OF_STREAM = object()
+
+
+def _supports_delete_by_filters(vector_store) -> bool:
+    """Whether the vector store class deletes a whole scope in one request (Elasticsearch, OpenSearch)."""
+    return callable(getattr(type(vector_store), "delete_by_filters", None))
+
+
+def _delete_by_filters(vector_store, db, filters: Dict[str, Any]) -> int:
+    """Delete every memory matching `filters` with a single `delete_by_filters` request.
+
+    The matching memories are listed first, paged past the default result window, so that each of them
+    still gets its DELETE history entry.
+
+    Returns:
+        int: Number of memories deleted.
+    """
+    memories = vector_store.list(filters=filters, limit=sys.maxsize)[0]
+    vector_store.delete_by_filters(filters)
+    for memory in memories:
+        db.add_history(
+            memory.id,
+            memory.payload.get("data"),
+            None,
+            "DELETE",
+            actor_id=memory.payload.get("actor_id"),
+            role=memory.payload.get("role"),
+            is_deleted=1,
+        )
+    return len(memories)
 
 
 def _build_filters_and_metadata(
@@ -129,6 +169,18 @@ class Memory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.response_parser = ResponseParser(self.llm, self.config.llm.provider, self.config.max_parse_reasks)
+        self.input_window = (
+            InputWindow(self.config.input_window, self.llm.config.model) if self.config.input_window else None
+        )
+        self.image_describer = None
+        if self.config.llm.config.get("enable_vision"):
+            self.image_describer = ImageDescriber(
+                self.llm,
+                self.llm.config.vision_details,
+                self.llm.config.vision_concurrency,
+                ResponseCache(self.llm.config.vision_cache or LlmCacheConfig()),
+            )
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
@@ -140,6 +192,8 @@ class Memory(MemoryBase):
                 from mem0.memory.memgraph_memory import MemoryGraph
             elif self.config.graph_store.provider == "neptune":
                 from mem0.graphs.neptune.main import MemoryGraph
+            elif self.config.graph_store.provider == "sqlite":
+                from mem0.memory.sqlite_graph_memory import MemoryGraph
             else:
                 from mem0.memory.graph_memory import MemoryGraph
 
@@ -157,6 +211,11 @@ class Memory(MemoryBase):
         )
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
+    @property
+    def parse_stats(self) -> Dict[str, int]:
+        """Counters of the LLM responses parsed in this process: parse errors, repairs, follow-ups and failures."""
+        return get_parse_stats()
+
     @classmethod
     def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -249,19 +308,41 @@ class Memory(MemoryBase):
             results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
             return results
 
-        if self.config.llm.config.get("enable_vision"):
-            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        window_mark = None
+        if infer and self.input_window is not None:
+            messages, window_mark = self.input_window.select(messages, effective_filters)
+
+        if not messages:
+            logger.info("No messages that earlier adds have not processed; nothing to add.")
+            vector_store_result, graph_result = [], []
         else:
-            messages = parse_vision_messages(messages)
+            if self.image_describer is not None:
+                messages = self.image_describer.parse(messages)
+            else:
+                messages = parse_vision_messages(messages)
+
+            # Provider requests of add yield to those of search when they are rate limited
+            with background_priority(), concurrent.futures.ThreadPoolExecutor() as executor:
+                future1 = executor.submit(
+                    contextvars.copy_context().run,
+                    self._add_to_vector_store,
+                    messages,
+                    processed_metadata,
+                    effective_filters,
+                    infer,
+                )
+                future2 = executor.submit(
+                    contextvars.copy_context().run, self._add_to_graph, messages, effective_filters
+                )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
-            future2 = executor.submit(self._add_to_graph, messages, effective_filters)
+                concurrent.futures.wait([future1, future2])
 
-            concurrent.futures.wait([future1, future2])
+                vector_store_result, inferred = future1.result()
+                graph_result = future2.result()
 
-            vector_store_result = future1.result()
-            graph_result = future2.result()
+            # Messages whose inference failed are processed again by the next add
+            if window_mark is not None and inferred:
+                self.input_window.commit(effective_filters, window_mark)
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -316,82 +397,19 @@ class Memory(MemoryBase):
                         "role": message_dict["role"],
                     }
                 )
-            return returned_memories
-
-        parsed_messages = parse_messages(messages)
-
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
-        else:
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
-
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+            return returned_memories, True
 
-        try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
-                limit=5,
-                filters=filters,
-            )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-
-        # mapping UUIDs with integers for handling UUID hallucinations
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
-
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+        if self.config.add_mode == "fused":
+            parsed_messages = parse_messages(messages)
+            new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred = (
+                self._get_fused_memory_actions(messages, parsed_messages, filters)
             )
-
-            try:
-                response: str = self.llm.generate_response(
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-
-            try:
-                response = remove_code_blocks(response)
-                new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
         else:
-            new_memories_with_actions = {}
+            # Long conversations are extracted in chunks, in parallel
+            parsed_messages = self.input_window.chunk(messages) if self.input_window else parse_messages(messages)
+            new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred = self._get_memory_actions(
+                parsed_messages, filters
+            )
 
         returned_memories = []
         try:
@@ -448,7 +466,165 @@ class Memory(MemoryBase):
             self,
             {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"},
         )
-        return returned_memories
+        return returned_memories, inferred
+
+    def _get_memory_actions(self, parsed_messages, filters):
+        """
+        Extract facts from the conversation, then decide how they change the related existing memories, in two
+        LLM calls (one extraction call per chunk when the conversation is split).
+
+        Args:
+            parsed_messages (str or List[str]): Conversation text, or its chunks.
+            filters (dict): Filters of the related memories.
+
+        Returns:
+            tuple: (actions response, mapping of the integer IDs in the prompt to memory IDs, fact embeddings,
+                whether every LLM call succeeded)
+        """
+        chunks = [parsed_messages] if isinstance(parsed_messages, str) else parsed_messages
+        inferred = True
+        facts = extract_facts(self.llm, chunks, self.config.custom_fact_extraction_prompt, self.response_parser)
+
+        def process_fact_for_search(new_mem_content):
+            embeddings = self.embedding_model.embed(new_mem_content, "add")
+            existing_mems = self.vector_store.search(
+                query=new_mem_content,
+                vectors=embeddings,
+                limit=5,
+                filters=filters,
+            )
+            return embeddings, existing_mems
+
+        # Each fact is embedded and searched as soon as it is generated, while the later facts are still streaming
+        new_retrieved_facts = []
+        search_futures = []
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            try:
+                for new_mem in facts:
+                    new_retrieved_facts.append(new_mem)
+                    search_futures.append(
+                        executor.submit(contextvars.copy_context().run, process_fact_for_search, new_mem)
+                    )
+            except ValueError as e:
+                logger.error(f"Error in new_retrieved_facts: {e}")
+                inferred = False
+
+            retrieved_old_memory = []
+            new_message_embeddings = {}
+            for new_mem, future in zip(new_retrieved_facts, search_futures):
+                messages_embeddings, existing_memories = future.result()
+                new_message_embeddings[new_mem] = messages_embeddings
+                for mem in existing_memories:
+                    retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
+
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        unique_data = {}
+        for item in retrieved_old_memory:
+            unique_data[item["id"]] = item
+        retrieved_old_memory = list(unique_data.values())
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+
+        # mapping UUIDs with integers for handling UUID hallucinations
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        if new_retrieved_facts:
+            update_system_prompt, update_user_prompt = get_update_memory_prompts(
+                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            )
+
+            update_messages = [
+                {"role": "system", "content": update_system_prompt},
+                {"role": "user", "content": update_user_prompt},
+            ]
+            try:
+                response: str = self.llm.generate_response(
+                    messages=update_messages,
+                    response_format=self.response_parser.memory_actions_format,
+                )
+            except Exception as e:
+                logger.error(f"Error in new memory actions response: {e}")
+                response = ""
+
+            try:
+                new_memories_with_actions = self.response_parser.parse_memory_actions(
+                    response, update_messages, temp_uuid_mapping
+                )
+            except Exception as e:
+                logger.error(f"Invalid JSON response: {e}")
+                new_memories_with_actions = {}
+                inferred = False
+        else:
+            new_memories_with_actions = {}
+
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred
+
+    def _get_fused_memory_actions(self, messages, parsed_messages, filters):
+        """
+        Retrieve the existing memories related to the conversation from a single embedding of it, then extract facts
+        and decide how they change those memories in one LLM call.
+
+        Returns:
+            tuple: (actions response, mapping of the integer IDs in the prompt to memory IDs, action text embeddings,
+                whether the LLM call succeeded)
+        """
+        conversation = "\n".join(
+            msg["content"] for msg in messages if msg.get("role") != "system" and isinstance(msg.get("content"), str)
+        )
+        if not conversation.strip():
+            return {}, {}, {}, True
+
+        conversation_embeddings = self.embedding_model.embed(conversation, "search")
+        existing_memories = self.vector_store.search(
+            query=conversation,
+            vectors=conversation_embeddings,
+            limit=self.config.fused_add_candidates,
+            filters=filters,
+        )
+        logger.info(f"Total existing memories: {len(existing_memories)}")
+
+        # mapping UUIDs with integers for handling UUID hallucinations
+        temp_uuid_mapping = {str(idx): mem.id for idx, mem in enumerate(existing_memories)}
+        retrieved_old_memory = [
+            {"id": str(idx), "text": mem.payload["data"]} for idx, mem in enumerate(existing_memories)
+        ]
+
+        system_prompt, user_prompt = get_fused_memory_prompts(
+            retrieved_old_memory,
+            parsed_messages,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
+        )
+        try:
+            response = self.llm.generate_response(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                **get_fused_request_params(self.config.llm.provider),
+            )
+        except Exception as e:
+            logger.error(f"Error in memory changes response: {e}")
+            response = ""
+
+        try:
+            new_memories_with_actions, inferred = parse_fused_response(response, temp_uuid_mapping), True
+        except ValueError as e:
+            logger.error(str(e))
+            new_memories_with_actions, inferred = {"facts": [], "memory": []}, False
+        texts = list(
+            dict.fromkeys(
+                action["text"]
+                for action in new_memories_with_actions["memory"]
+                if action["event"] in ("ADD", "UPDATE") and action["text"]
+            )
+        )
+        new_message_embeddings = dict(zip(texts, self.embedding_model.embed_batch(texts, "add"))) if texts else {}
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred
 
     def _add_to_graph(self, messages, filters):
         added_entities = []
@@ -512,6 +688,7 @@ class Memory(MemoryBase):
         run_id: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
+        relations_cursor: Optional[Any] = None,
     ):
         """
         List all memories.
@@ -523,12 +700,14 @@ class Memory(MemoryBase):
             filters (dict, optional): Additional custom key-value filters to apply to the search.
                 These are merged with the ID-based scoping filters. For example,
                 `filters={"actor_id": "some_user"}`.
-            limit (int, optional): The maximum number of memories to return. Defaults to 100.
+            limit (int, optional): The maximum number of memories, and of graph relations, to return. Defaults to 100.
+            relations_cursor (optional): The "next_relations_cursor" of a previous call, to continue listing
+                graph relations after it. Defaults to None.
 
         Returns:
             dict: A dictionary containing a list of memories under the "results" key,
-                  and potentially "relations" if graph store is enabled. For API v1.0,
-                  it might return a direct list (see deprecation warning).
+                  and potentially "relations" with "next_relations_cursor" (None on the last page) if graph
+                  store is enabled. For API v1.0, it might return a direct list (see deprecation warning).
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", ...}]}`
         """
 
@@ -547,7 +726,9 @@ class Memory(MemoryBase):
         with concurrent.futures.ThreadPoolExecutor() as executor:
             future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
             future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
+                executor.submit(self.graph.get_all_page, effective_filters, limit, relations_cursor)
+                if self.enable_graph
+                else None
             )
 
             concurrent.futures.wait(
@@ -558,7 +739,12 @@ class Memory(MemoryBase):
             graph_entities_result = future_graph_entities.result() if future_graph_entities else None
 
         if self.enable_graph:
-            return {"results": all_memories_result, "relations": graph_entities_result}
+            relations, next_relations_cursor = graph_entities_result
+            return {
+                "results": all_memories_result,
+                "relations": relations,
+                "next_relations_cursor": next_relations_cursor,
+            }
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -778,11 +964,15 @@ class Memory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"})
-        memories = self.vector_store.list(filters=filters)[0]
-        for memory in memories:
-            self._delete_memory(memory.id)
+        if _supports_delete_by_filters(self.vector_store):
+            deleted = _delete_by_filters(self.vector_store, self.db, filters)
+        else:
+            memories = self.vector_store.list(filters=filters)[0]
+            for memory in memories:
+                self._delete_memory(memory.id)
+            deleted = len(memories)
 
-        logger.info(f"Deleted {len(memories)} memories")
+        logger.info(f"Deleted {deleted} memories")
 
         if self.enable_graph:
             self.graph.delete_all(filters)
@@ -982,6 +1172,18 @@ class AsyncMemory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.response_parser = ResponseParser(self.llm, self.config.llm.provider, self.config.max_parse_reasks)
+        self.input_window = (
+            InputWindow(self.config.input_window, self.llm.config.model) if self.config.input_window else None
+        )
+        self.image_describer = None
+        if self.config.llm.config.get("enable_vision"):
+            self.image_describer = ImageDescriber(
+                self.llm,
+                self.llm.config.vision_details,
+                self.llm.config.vision_concurrency,
+                ResponseCache(self.llm.config.vision_cache or LlmCacheConfig()),
+            )
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
@@ -989,7 +1191,10 @@ class AsyncMemory(MemoryBase):
         self.enable_graph = False
 
         if self.config.graph_store.config:
-            from mem0.memory.graph_memory import MemoryGraph
+            if self.config.graph_store.provider == "sqlite":
+                from mem0.memory.sqlite_graph_memory import MemoryGraph
+            else:
+                from mem0.memory.graph_memory import MemoryGraph
 
             self.graph = MemoryGraph(self.config)
             self.enable_graph = True
@@ -998,6 +1203,11 @@ class AsyncMemory(MemoryBase):
 
         capture_event("mem0.init", self, {"sync_type": "async"})
 
+    @property
+    def parse_stats(self) -> Dict[str, int]:
+        """Counters of the LLM responses parsed in this process: parse errors, repairs, follow-ups and failures."""
+        return get_parse_stats()
+
     @classmethod
     async def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -1077,17 +1287,31 @@ class AsyncMemory(MemoryBase):
             )
             return results
 
-        if self.config.llm.config.get("enable_vision"):
-            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
+        window_mark = None
+        if infer and self.input_window is not None:
+            messages, window_mark = self.input_window.select(messages, effective_filters)
+
+        if not messages:
+            logger.info("No messages that earlier adds have not processed; nothing to add.")
+            vector_store_result, graph_result = [], []
         else:
-            messages = parse_vision_messages(messages)
+            if self.image_describer is not None:
+                messages = await self.image_describer.aparse(messages)
+            else:
+                messages = parse_vision_messages(messages)
 
-        vector_store_task = asyncio.create_task(
-            self._add_to_vector_store(messages, processed_metadata, effective_filters, infer)
-        )
-        graph_task = asyncio.create_task(self._add_to_graph(messages, effective_filters))
+            # Provider requests of add yield to those of search when they are rate limited
+            with background_priority():
+                vector_store_task = asyncio.create_task(
+                    self._add_to_vector_store(messages, processed_metadata, effective_filters, infer)
+                )
+                graph_task = asyncio.create_task(self._add_to_graph(messages, effective_filters))
+
+            (vector_store_result, inferred), graph_result = await asyncio.gather(vector_store_task, graph_task)
 
-        vector_store_result, graph_result = await asyncio.gather(vector_store_task, graph_task)
+            # Messages whose inference failed are processed again by the next add
+            if window_mark is not None and inferred:
+                self.input_window.commit(effective_filters, window_mark)
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -1148,79 +1372,25 @@ class AsyncMemory(MemoryBase):
                         "role": message_dict["role"],
                     }
                 )
-            return returned_memories
-
-        parsed_messages = parse_messages(messages)
-        if self.config.custom_fact_extraction_prompt:
-            system_prompt = self.config.custom_fact_extraction_prompt
-            user_prompt = f"Input:\n{parsed_messages}"
+            return returned_memories, True
+
+        if self.config.add_mode == "fused":
+            parsed_messages = parse_messages(messages)
+            (
+                new_memories_with_actions,
+                temp_uuid_mapping,
+                new_message_embeddings,
+                inferred,
+            ) = await self._get_fused_memory_actions(messages, parsed_messages, effective_filters)
         else:
-            system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
-
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
-            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-            response_format={"type": "json_object"},
-        )
-        try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logger.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        if not new_retrieved_facts:
-            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
-                limit=5,
-                filters=effective_filters,  # 'filters' is query_filters_for_inference
-            )
-            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
-
-        if new_retrieved_facts:
-            function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
-            )
-            try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
-                    messages=[{"role": "user", "content": function_calling_prompt}],
-                    response_format={"type": "json_object"},
-                )
-            except Exception as e:
-                logger.error(f"Error in new memory actions response: {e}")
-                response = ""
-            try:
-                response = remove_code_blocks(response)
-                new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+            # Long conversations are extracted in chunks, in parallel
+            parsed_messages = self.input_window.chunk(messages) if self.input_window else parse_messages(messages)
+            (
+                new_memories_with_actions,
+                temp_uuid_mapping,
+                new_message_embeddings,
+                inferred,
+            ) = await self._get_memory_actions(parsed_messages, effective_filters)
 
         returned_memories = []
         try:
@@ -1287,7 +1457,179 @@ class AsyncMemory(MemoryBase):
             self,
             {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
         )
-        return returned_memories
+        return returned_memories, inferred
+
+    async def _get_memory_actions(self, parsed_messages, filters):
+        """
+        Extract facts from the conversation, then decide how they change the related existing memories, in two
+        LLM calls (one extraction call per chunk when the conversation is split).
+
+        Args:
+            parsed_messages (str or List[str]): Conversation text, or its chunks.
+            filters (dict): Filters of the related memories.
+
+        Returns:
+            tuple: (actions response, mapping of the integer IDs in the prompt to memory IDs, fact embeddings,
+                whether every LLM call succeeded)
+        """
+        chunks = [parsed_messages] if isinstance(parsed_messages, str) else parsed_messages
+        inferred = True
+
+        retrieved_old_memory = []
+        new_message_embeddings = {}
+
+        async def process_fact_for_search(new_mem_content):
+            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            new_message_embeddings[new_mem_content] = embeddings
+            existing_mems = await asyncio.to_thread(
+                self.vector_store.search,
+                query=new_mem_content,
+                vectors=embeddings,
+                limit=5,
+                filters=filters,  # 'filters' is query_filters_for_inference
+            )
+            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
+
+        # The response streams in a worker thread that hands over each fact as soon as it is generated, so that it
+        # is embedded and searched while the later facts are still streaming
+        loop = asyncio.get_running_loop()
+        facts_queue = asyncio.Queue()
+
+        def stream_facts():
+            try:
+                for fact in extract_facts(
+                    self.llm, chunks, self.config.custom_fact_extraction_prompt, self.response_parser
+                ):
+                    loop.call_soon_threadsafe(facts_queue.put_nowait, fact)
+            finally:
+                loop.call_soon_threadsafe(facts_queue.put_nowait, _END_OF_STREAM)
+
+        streaming_task = asyncio.create_task(asyncio.to_thread(stream_facts))
+        new_retrieved_facts = []
+        search_tasks = []
+        while (fact := await facts_queue.get()) is not _END_OF_STREAM:
+            new_retrieved_facts.append(fact)
+            search_tasks.append(asyncio.create_task(process_fact_for_search(fact)))
+        try:
+            await streaming_task
+        except ValueError as e:
+            logger.error(f"Error in new_retrieved_facts: {e}")
+            inferred = False
+
+        if not new_retrieved_facts:
+            logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
+
+        search_results_list = await asyncio.gather(*search_tasks)
+        for result_group in search_results_list:
+            retrieved_old_memory.extend(result_group)
+
+        unique_data = {}
+        for item in retrieved_old_memory:
+            unique_data[item["id"]] = item
+        retrieved_old_memory = list(unique_data.values())
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        if new_retrieved_facts:
+            update_system_prompt, update_user_prompt = get_update_memory_prompts(
+                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+            )
+            update_messages = [
+                {"role": "system", "content": update_system_prompt},
+                {"role": "user", "content": update_user_prompt},
+            ]
+            try:
+                response = await asyncio.to_thread(
+                    self.llm.generate_response,
+                    messages=update_messages,
+                    response_format=self.response_parser.memory_actions_format,
+                )
+            except Exception as e:
+                logger.error(f"Error in new memory actions response: {e}")
+                response = ""
+            try:
+                new_memories_with_actions = await asyncio.to_thread(
+                    self.response_parser.parse_memory_actions, response, update_messages, temp_uuid_mapping
+                )
+            except Exception as e:
+                logger.error(f"Invalid JSON response: {e}")
+                new_memories_with_actions = {}
+                inferred = False
+        else:
+            new_memories_with_actions = {}
+
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred
+
+    async def _get_fused_memory_actions(self, messages, parsed_messages, filters):
+        """
+        Retrieve the existing memories related to the conversation from a single embedding of it, then extract facts
+        and decide how they change those memories in one LLM call.
+
+        Returns:
+            tuple: (actions response, mapping of the integer IDs in the prompt to memory IDs, action text embeddings,
+                whether the LLM call succeeded)
+        """
+        conversation = "\n".join(
+            msg["content"] for msg in messages if msg.get("role") != "system" and isinstance(msg.get("content"), str)
+        )
+        if not conversation.strip():
+            return {}, {}, {}, True
+
+        conversation_embeddings = await asyncio.to_thread(self.embedding_model.embed, conversation, "search")
+        existing_memories = await asyncio.to_thread(
+            self.vector_store.search,
+            query=conversation,
+            vectors=conversation_embeddings,
+            limit=self.config.fused_add_candidates,
+            filters=filters,
+        )
+        logger.info(f"Total existing memories: {len(existing_memories)}")
+
+        # mapping UUIDs with integers for handling UUID hallucinations
+        temp_uuid_mapping = {str(idx): mem.id for idx, mem in enumerate(existing_memories)}
+        retrieved_old_memory = [
+            {"id": str(idx), "text": mem.payload["data"]} for idx, mem in enumerate(existing_memories)
+        ]
+
+        system_prompt, user_prompt = get_fused_memory_prompts(
+            retrieved_old_memory,
+            parsed_messages,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
+        )
+        try:
+            response = await asyncio.to_thread(
+                self.llm.generate_response,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                **get_fused_request_params(self.config.llm.provider),
+            )
+        except Exception as e:
+            logger.error(f"Error in memory changes response: {e}")
+            response = ""
+
+        try:
+            new_memories_with_actions, inferred = parse_fused_response(response, temp_uuid_mapping), True
+        except ValueError as e:
+            logger.error(str(e))
+            new_memories_with_actions, inferred = {"facts": [], "memory": []}, False
+        texts = list(
+            dict.fromkeys(
+                action["text"]
+                for action in new_memories_with_actions["memory"]
+                if action["event"] in ("ADD", "UPDATE") and action["text"]
+            )
+        )
+        new_message_embeddings = {}
+        if texts:
+            embeddings = await asyncio.to_thread(self.embedding_model.embed_batch, texts, "add")
+            new_message_embeddings = dict(zip(texts, embeddings))
+        return new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, inferred
 
     async def _add_to_graph(self, messages, filters):
         added_entities = []
@@ -1296,7 +1638,7 @@ class AsyncMemory(MemoryBase):
                 filters["user_id"] = "user"
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
-            added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            added_entities = await self.graph.aadd(data, filters)
 
         return added_entities
 
@@ -1351,6 +1693,7 @@ class AsyncMemory(MemoryBase):
         run_id: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
+        relations_cursor: Optional[Any] = None,
     ):
         """
         List all memories.
@@ -1362,12 +1705,14 @@ class AsyncMemory(MemoryBase):
              filters (dict, optional): Additional custom key-value filters to apply to the search.
                  These are merged with the ID-based scoping filters. For example,
                  `filters={"actor_id": "some_user"}`.
-             limit (int, optional): The maximum number of memories to return. Defaults to 100.
+             limit (int, optional): The maximum number of memories, and of graph relations, to return. Defaults to 100.
+             relations_cursor (optional): The "next_relations_cursor" of a previous call, to continue listing
+                 graph relations after it. Defaults to None.
 
          Returns:
              dict: A dictionary containing a list of memories under the "results" key,
-                   and potentially "relations" if graph store is enabled. For API v1.0,
-                   it might return a direct list (see deprecation warning).
+                   and potentially "relations" with "next_relations_cursor" (None on the last page) if graph
+                   store is enabled. For API v1.0, it might return a direct list (see deprecation warning).
                    Example for v1.1+: `{"results": [{"id": "...", "memory": "...", ...}]}`
         """
 
@@ -1389,7 +1734,9 @@ class AsyncMemory(MemoryBase):
         with concurrent.futures.ThreadPoolExecutor() as executor:
             future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
             future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
+                executor.submit(self.graph.get_all_page, effective_filters, limit, relations_cursor)
+                if self.enable_graph
+                else None
             )
 
             concurrent.futures.wait(
@@ -1400,7 +1747,12 @@ class AsyncMemory(MemoryBase):
             graph_entities_result = future_graph_entities.result() if future_graph_entities else None
 
         if self.enable_graph:
-            return {"results": all_memories_result, "relations": graph_entities_result}
+            relations, next_relations_cursor = graph_entities_result
+            return {
+                "results": all_memories_result,
+                "relations": relations,
+                "next_relations_cursor": next_relations_cursor,
+            }
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -1626,15 +1978,19 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        if _supports_delete_by_filters(self.vector_store):
+            deleted = await asyncio.to_thread(_delete_by_filters, self.vector_store, self.db, filters)
+        else:
+            memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
 
-        delete_tasks = []
-        for memory in memories[0]:
-            delete_tasks.append(self._delete_memory(memory.id))
+            delete_tasks = []
+            for memory in memories[0]:
+                delete_tasks.append(self._delete_memory(memory.id))
 
-        await asyncio.gather(*delete_tasks)
+            await asyncio.gather(*delete_tasks)
+            deleted = len(memories[0])
 
-        logger.info(f"Deleted {len(memories[0])} memories")
+        logger.info(f"Deleted {deleted} memories")
 
         if self.enable_graph:
             await asyncio.to_thread(self.graph.delete_all, filters)
@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from mem0.memory.utils import format_entities
 
@@ -7,11 +8,8 @@ try:
 except ImportError:
     raise ImportError("langchain_memgraph is not installed. Please install it using pip install langchain-memgraph")
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
+from mem0.graphs.connections import get_shared_graph, pool_settings, run_once
+from mem0.graphs.reranker import BM25Reranker
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -20,19 +18,52 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import (
+    EXTRACT_RELATIONS_PROMPT,
+    extract_graph_changes,
+    get_delete_messages,
+    iter_graph_relations,
+    paginate_relations,
+)
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+VECTOR_INDEX_NAME = "memzero"
+# Grow the vector index once it would be filled beyond this fraction of its capacity
+VECTOR_INDEX_FILL_RATIO = 0.9
+# Lookups whose candidates may have crowded out the user's entities are retried with this many times more
+# candidates, then with the whole index
+VECTOR_SEARCH_RETRIES = 2
+VECTOR_CANDIDATES_GROWTH = 4
+
+
+class _VectorIndexState:
+    """Capacity and (upper bound of the) size of the vector index, shared by the instances of one connection."""
+
+    def __init__(self):
+        self.capacity = 0
+        self.size = 0
+        self.lock = threading.Lock()
+
 
 class MemoryGraph:
     def __init__(self, config):
         self.config = config
-        self.graph = Memgraph(
-            self.config.graph_store.config.url,
-            self.config.graph_store.config.username,
-            self.config.graph_store.config.password,
+        memgraph_config = self.config.graph_store.config
+        driver_settings = pool_settings(self.config.graph_store)
+        # Instances with the same endpoint, credentials and pool settings share one driver per process
+        self.connection_key = (
+            "memgraph",
+            memgraph_config.url,
+            memgraph_config.username,
+            memgraph_config.password,
+            tuple(sorted(driver_settings.items())),
+        )
+        driver_kwargs = {"driver_config": driver_settings} if driver_settings else {}
+        self.graph = get_shared_graph(
+            self.connection_key,
+            lambda: Memgraph(memgraph_config.url, memgraph_config.username, memgraph_config.password, **driver_kwargs),
         )
         self.embedding_model = EmbedderFactory.create(
             self.config.embedder.provider,
@@ -50,16 +81,23 @@ class MemoryGraph:
         self.user_id = None
         self.threshold = 0.7
 
-        # Setup Memgraph:
-        # 1. Create vector index (created Entity label on all nodes)
-        # 2. Create label property index for performance optimizations
-        embedding_dims = self.config.embedder.config["embedding_dims"]
-        create_vector_index_query = f"CREATE VECTOR INDEX memzero ON :Entity(embedding) WITH CONFIG {{'dimension': {embedding_dims}, 'capacity': 1000, 'metric': 'cos'}};"
-        self.graph.query(create_vector_index_query, params={})
+        self.embedding_dims = self.config.embedder.config["embedding_dims"]
+        self.vector_index = run_once(self.connection_key + ("schema", self.embedding_dims), self._setup_schema)
+        self.reranker = BM25Reranker(self.iter_all)
+
+    def _setup_schema(self):
+        """
+        Setup Memgraph, once per process and connection:
+        1. Create vector index (created Entity label on all nodes), sized from config and existing entities
+        2. Create label property index for performance optimizations
+        """
+        vector_index = _VectorIndexState()
+        self._setup_vector_index(vector_index)
         create_label_prop_index_query = "CREATE INDEX ON :Entity(user_id);"
         self.graph.query(create_label_prop_index_query, params={})
         create_label_index_query = "CREATE INDEX ON :Entity;"
         self.graph.query(create_label_index_query, params={})
+        return vector_index
 
     def add(self, data, filters):
         """
@@ -69,15 +107,15 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        entity_type_map, to_be_added, to_be_deleted = extract_graph_changes(self, data, filters)
 
         # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
+        # Each relation creates at most two entity nodes
+        self._ensure_vector_index_capacity(2 * len(to_be_added))
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+        self.reranker.update(filters, added_entities, deleted_entities)
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -101,17 +139,10 @@ class MemoryGraph:
         if not search_output:
             return []
 
-        search_outputs_sequence = [
-            [item["source"], item["relationship"], item["destination"]] for item in search_output
+        search_results = [
+            {"source": item["source"], "relationship": item["relationship"], "destination": item["destination"]}
+            for item in self.reranker.rerank(query, search_output, filters, n=5)
         ]
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
-
-        search_results = []
-        for item in reranked_results:
-            search_results.append({"source": item[0], "relationship": item[1], "destination": item[2]})
 
         logger.info(f"Returned {len(search_results)} search results")
 
@@ -132,52 +163,130 @@ class MemoryGraph:
             """
             params = {"user_id": filters["user_id"]}
         self.graph.query(cypher, params=params)
+        self.reranker.forget(filters)
 
-    def get_all(self, filters, limit=100):
+    def get_all(self, filters, limit=100, cursor=None):
         """
-        Retrieves all nodes and relationships from the graph database based on optional filtering criteria.
+        Retrieves relationships from the graph database based on optional filtering criteria, ordered by
+        relationship id.
 
         Args:
             filters (dict): A dictionary containing filters to be applied during the retrieval.
                 Supports 'user_id' (required) and 'agent_id' (optional).
-            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (int, optional): Cursor returned by `get_all_page` to continue after. Defaults to None.
         Returns:
             list: A list of dictionaries, each containing:
                 - 'source': The source node name.
                 - 'relationship': The relationship type.
                 - 'target': The target node name.
         """
-        # Build query based on whether agent_id is provided
-        if filters.get("agent_id"):
-            query = """
-            MATCH (n:Entity {user_id: $user_id, agent_id: $agent_id})-[r]->(m:Entity {user_id: $user_id, agent_id: $agent_id})
-            RETURN n.name AS source, type(r) AS relationship, m.name AS target
-            LIMIT $limit
-            """
-            params = {"user_id": filters["user_id"], "agent_id": filters["agent_id"], "limit": limit}
-        else:
-            query = """
-            MATCH (n:Entity {user_id: $user_id})-[r]->(m:Entity {user_id: $user_id})
-            RETURN n.name AS source, type(r) AS relationship, m.name AS target
-            LIMIT $limit
-            """
-            params = {"user_id": filters["user_id"], "limit": limit}
+        return self.get_all_page(filters, limit=limit, cursor=cursor)[0]
 
-        results = self.graph.query(query, params=params)
+    def get_all_page(self, filters, limit=100, cursor=None):
+        """
+        Retrieves one page of relationships, ordered by relationship id.
 
-        final_results = []
-        for result in results:
-            final_results.append(
-                {
-                    "source": result["source"],
-                    "relationship": result["relationship"],
-                    "target": result["target"],
-                }
-            )
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (int, optional): Id of the last relationship of the previous page. Defaults to None.
+
+        Returns:
+            tuple: (relationships, next_cursor); next_cursor is None on the last page.
+        """
+        agent_filter = ""
+        cursor_filter = ""
+        params = {"user_id": filters["user_id"], "limit": limit + 1}
+        if filters.get("agent_id"):
+            agent_filter = "AND n.agent_id = $agent_id AND m.agent_id = $agent_id"
+            params["agent_id"] = filters["agent_id"]
+        if cursor is not None:
+            cursor_filter = "AND id(r) > $cursor"
+            params["cursor"] = cursor
+
+        query = f"""
+        MATCH (n:Entity {{user_id: $user_id}})-[r]->(m:Entity {{user_id: $user_id}})
+        WHERE true {agent_filter} {cursor_filter}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target, id(r) AS relation_id
+        ORDER BY relation_id
+        LIMIT $limit
+        """
+        results, next_cursor = paginate_relations(self.graph.query(query, params=params), limit)
+
+        logger.info(f"Retrieved {len(results)} relationships")
+
+        return results, next_cursor
+
+    def iter_all(self, filters, page_size=1000):
+        """Stream all relationships of a user (and agent) in pages of `page_size`, in bounded memory."""
+        return iter_graph_relations(self, filters, page_size=page_size)
+
+    def _vector_index_info(self):
+        """Return the (capacity, size) of the entity vector index, or None when the index does not exist."""
+        rows = self.graph.query("CALL vector_search.show_index_info() YIELD * RETURN *;", params={})
+        for row in rows:
+            if row.get("index_name") == VECTOR_INDEX_NAME:
+                return row["capacity"], row["size"]
+        return None
+
+    def _grown_capacity(self, capacity, needed):
+        """Grow `capacity` geometrically until `needed` embeddings stay below the fill ratio."""
+        growth_factor = self.config.graph_store.config.vector_index_growth_factor
+        while needed >= VECTOR_INDEX_FILL_RATIO * capacity:
+            capacity = int(capacity * growth_factor) + 1
+        return capacity
+
+    def _create_vector_index(self, vector_index, capacity):
+        self.graph.query(
+            f"CREATE VECTOR INDEX {VECTOR_INDEX_NAME} ON :Entity(embedding) WITH CONFIG "
+            f"{{'dimension': {self.embedding_dims}, 'capacity': {capacity}, 'metric': 'cos'}};",
+            params={},
+        )
+        vector_index.capacity = capacity
+
+    def _setup_vector_index(self, vector_index):
+        """Create the entity vector index, or adopt an existing one, with room for the entities already stored."""
+        info = self._vector_index_info()
+        if info is not None:
+            vector_index.capacity, vector_index.size = info
+            self._ensure_vector_index_capacity(0, vector_index)
+            return
+
+        result = self.graph.query(
+            "MATCH (n:Entity) WHERE n.embedding IS NOT NULL RETURN count(n) AS count;",
+            params={},
+        )
+        vector_index.size = result[0]["count"] if result else 0
+        capacity = self._grown_capacity(self.config.graph_store.config.vector_index_capacity, vector_index.size)
+        self._create_vector_index(vector_index, capacity)
 
-        logger.info(f"Retrieved {len(final_results)} relationships")
+    def _ensure_vector_index_capacity(self, pending, vector_index=None):
+        """
+        Make room in the vector index for up to `pending` new entity embeddings.
 
-        return final_results
+        The size is tracked per connection from an upper bound of the nodes written and only refreshed from the
+        server when the index looks nearly full. Memgraph cannot resize a vector index in place, so a full index
+        is dropped and recreated with a larger capacity; searches issued while it is rebuilt return no matches.
+        """
+        vector_index = vector_index or self.vector_index
+        with vector_index.lock:
+            if vector_index.size + pending >= VECTOR_INDEX_FILL_RATIO * vector_index.capacity:
+                info = self._vector_index_info()
+                if info is not None:
+                    vector_index.capacity, vector_index.size = info
+
+                needed = vector_index.size + pending
+                if info is None or needed >= VECTOR_INDEX_FILL_RATIO * vector_index.capacity:
+                    capacity = self._grown_capacity(vector_index.capacity, needed)
+                    logger.info(
+                        f"Growing vector index {VECTOR_INDEX_NAME} from {vector_index.capacity} to {capacity} entries"
+                    )
+                    if info is not None:
+                        self.graph.query(f"DROP VECTOR INDEX {VECTOR_INDEX_NAME};", params={})
+                    self._create_vector_index(vector_index, capacity)
+
+            vector_index.size += pending
 
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
@@ -254,75 +363,111 @@ class MemoryGraph:
         return entities
 
     def _search_graph_db(self, node_list, filters, limit=100):
-        """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
-
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            # Build query based on whether agent_id is provided
-            if filters.get("agent_id"):
-                cypher_query = """
-                MATCH (n:Entity {user_id: $user_id, agent_id: $agent_id})-[r]->(m:Entity)
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node1.name AS source, id(node1) AS source_id, type(r) AS relationship, id(r) AS relation_id, node2.name AS destination, id(node2) AS destination_id, similarity
-                UNION
-                MATCH (n:Entity {user_id: $user_id, agent_id: $agent_id})<-[r]-(m:Entity)
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node2.name AS source, id(node2) AS source_id, type(r) AS relationship, id(r) AS relation_id, node1.name AS destination, id(node1) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "agent_id": filters["agent_id"],
-                    "limit": limit,
-                }
-            else:
-                cypher_query = """
-                MATCH (n:Entity {user_id: $user_id})-[r]->(m:Entity)
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node1.name AS source, id(node1) AS source_id, type(r) AS relationship, id(r) AS relation_id, node2.name AS destination, id(node2) AS destination_id, similarity
-                UNION
-                MATCH (n:Entity {user_id: $user_id})<-[r]-(m:Entity)
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node2.name AS source, id(node2) AS source_id, type(r) AS relationship, id(r) AS relation_id, node1.name AS destination, id(node1) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "limit": limit,
-                }
+        """
+        Search similar nodes among and their respective incoming and outgoing relations.
+
+        All entity names are embedded in one batch and matched through the vector index (see `_similar_nodes`), then
+        the relations of the matched nodes are fetched in one query. Relations reached from several entities are
+        returned once, with their best similarity.
+        """
+        if not node_list:
+            return []
 
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+        embeddings = self.embedding_model.embed_batch(node_list)
+        entities = [{"name": node, "embedding": embedding} for node, embedding in zip(node_list, embeddings)]
+        matches = [
+            match for found in self._similar_nodes(entities, filters, self.threshold).values() for match in found
+        ]
+        if not matches:
+            return []
+
+        agent_filter = ""
+        if filters.get("agent_id"):
+            agent_filter = "AND m.agent_id = $agent_id"
+
+        cypher_query = f"""
+        UNWIND $matches AS match
+        MATCH (n:Entity)
+        WHERE id(n) = match.node_id
+        WITH n, max(match.similarity) AS similarity
+        MATCH (n)-[r]-(m:Entity)
+        WHERE m.user_id = $user_id {agent_filter}
+        WITH startNode(r) AS source_node, r, endNode(r) AS destination_node, max(similarity) AS similarity
+        RETURN source_node.name AS source, id(source_node) AS source_id, type(r) AS relationship, id(r) AS relation_id,
+            destination_node.name AS destination, id(destination_node) AS destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit;
+        """
+        params = {"matches": matches, "user_id": filters["user_id"], "limit": limit}
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
 
-        return result_relations
+        return self.graph.query(cypher_query, params=params)
+
+    def _similar_nodes(self, entities, filters, threshold, best_only=False):
+        """
+        The user's entities whose similarity with each of `entities` is at least `threshold`, best first.
+
+        The vector index returns the nearest entities of every user, and the user's own are filtered out of them
+        afterwards. When the candidates may have cut some of them off (every candidate is above the threshold),
+        the lookup is retried with more candidates, then with every entity of the index.
+
+        Args:
+            entities (list): Dicts with the entity "name" and its "embedding".
+            filters (dict): Session filters.
+            threshold (float): Minimum similarity.
+            best_only (bool): Only the most similar node of each entity is needed. Defaults to False.
+
+        Returns:
+            dict: Entity name -> list of {"node_id", "similarity"} dicts, for the entities that matched.
+        """
+        matches = {}
+        pending = entities
+        candidates = self.config.graph_store.config.vector_index_candidates
+        for attempt in range(VECTOR_SEARCH_RETRIES + 2):
+            if attempt > VECTOR_SEARCH_RETRIES:
+                info = self._vector_index_info()
+                if info is None or info[1] <= candidates:
+                    break
+                logger.debug(f"Searching the whole vector index for {len(pending)} entities crowded out of it")
+                candidates = info[1]
+            rows = self.graph.query(
+                self._lookup_query(filters),
+                params={
+                    "entities": pending,
+                    "threshold": threshold,
+                    "candidates": candidates,
+                    "user_id": filters["user_id"],
+                    **({"agent_id": filters["agent_id"]} if filters.get("agent_id") else {}),
+                },
+            )
+            truncated = set()
+            for row in rows:
+                if row["matches"]:
+                    matches[row["name"]] = row["matches"]
+                if row["truncated"] and not (best_only and row["matches"]):
+                    truncated.add(row["name"])
+            pending = [entity for entity in pending if entity["name"] in truncated]
+            if not pending:
+                break
+            candidates *= VECTOR_CANDIDATES_GROWTH
+        return matches
+
+    def _lookup_query(self, filters):
+        agent_filter = "AND node.agent_id = $agent_id" if filters.get("agent_id") else ""
+        return f"""
+        UNWIND $entities AS entity
+        CALL vector_search.search("{VECTOR_INDEX_NAME}", $candidates, entity.embedding)
+        YIELD node, similarity
+        WITH entity, node, similarity
+        ORDER BY similarity DESC
+        WITH entity, count(node) AS found, min(similarity) AS lowest,
+            collect(
+                CASE WHEN node.user_id = $user_id {agent_filter} AND similarity >= $threshold
+                THEN {{node_id: id(node), similarity: similarity}} END
+            ) AS matches
+        RETURN entity.name AS name, matches, found = $candidates AND lowest >= $threshold AS truncated;
+        """
 
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
@@ -524,80 +669,17 @@ class MemoryGraph:
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
 
+    def _search_node(self, embedding, filters, threshold, alias):
+        """Search the vector index for the user's most similar node and return its id under `id(<alias>)`."""
+        matches = self._similar_nodes([{"name": alias, "embedding": embedding}], filters, threshold, best_only=True)
+        if alias not in matches:
+            return []
+        return [{f"id({alias})": matches[alias][0]["node_id"]}]
+
     def _search_source_node(self, source_embedding, filters, threshold=0.9):
         """Search for source nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND source_candidate.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
-
-        result = self.graph.query(cypher, params=params)
-        return result
+        return self._search_node(source_embedding, filters, threshold, "source_candidate")
 
     def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
         """Search for destination nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND node.agent_id = $agent_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding) 
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id 
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
-
-        result = self.graph.query(cypher, params=params)
-        return result
+        return self._search_node(destination_embedding, filters, threshold, "destination_candidate")
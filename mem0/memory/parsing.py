@@ -0,0 +1,244 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from mem0.memory.fused import MEMORY_CHANGES_STRUCT_SCHEMA, STRUCTURED_OUTPUT_PROVIDERS, MemoryAction
+from mem0.memory.utils import count_parse_event, iter_json_list_items, loads_lenient, parse_json_response
+
+logger = logging.getLogger(__name__)
+
+FACTS_SCHEMA = {
+    "type": "object",
+    "properties": {"facts": {"type": "array", "items": {"type": "string"}}},
+    "required": ["facts"],
+    "additionalProperties": False,
+}
+
+MEMORY_ACTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {"memory": MEMORY_CHANGES_STRUCT_SCHEMA["properties"]["memory"]},
+    "required": ["memory"],
+    "additionalProperties": False,
+}
+
+INVALID_JSON_REASK = (
+    "Your answer is not valid JSON ({error}). Reply with the same answer as a single valid JSON object, without "
+    "any other text."
+)
+
+INVALID_ACTIONS_REASK = """Some entries of your answer are invalid:
+{entries}
+
+Reply with only the corrected entries, in the same JSON format: {{"memory": [...]}}. UPDATE and DELETE entries must use \
+the ID of one of the existing memories you were given."""
+
+
+def _validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, err['loc'])) or 'entry'}: {err['msg']}" for err in error.errors())
+
+
+class ResponseParser:
+    """
+    Parses the fact extraction and memory update responses of an LLM.
+
+    Providers with structured outputs are asked for the JSON schema of each response. Other responses are repaired
+    when they are not valid JSON, and validated entry by entry. When something is still wrong, the model is asked
+    to fix only that part (the JSON, or the invalid entries) in a follow-up turn of the same conversation, instead
+    of the whole request being sent again.
+    """
+
+    def __init__(self, llm, provider: Optional[str] = None, max_reasks: int = 1):
+        """
+        Initialize the parser.
+
+        Args:
+            llm: LLM that answered, asked again for invalid parts.
+            provider (str, optional): LLM provider name. Defaults to None.
+            max_reasks (int, optional): Follow-up requests per response. Defaults to 1.
+        """
+        self.llm = llm
+        self.provider = provider
+        self.max_reasks = max_reasks
+
+    def response_format(self, name: str, schema: Dict) -> Dict:
+        """`response_format` asking for `schema`: enforced by structured output providers, JSON mode otherwise."""
+        if self.provider in STRUCTURED_OUTPUT_PROVIDERS:
+            return {"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+        return {"type": "json_object"}
+
+    @property
+    def facts_format(self) -> Dict:
+        return self.response_format("facts", FACTS_SCHEMA)
+
+    @property
+    def memory_actions_format(self) -> Dict:
+        return self.response_format("memory_actions", MEMORY_ACTIONS_SCHEMA)
+
+    def _reask(self, messages: List[Dict], answer: str, instruction: str, response_format: Dict) -> Optional[str]:
+        count_parse_event("reasks")
+        try:
+            return self.llm.generate_response(
+                messages=messages
+                + [{"role": "assistant", "content": answer}, {"role": "user", "content": instruction}],
+                response_format=response_format,
+            )
+        except Exception as e:
+            logger.error(f"Error in the follow-up request for an invalid response: {e}")
+            return None
+
+    def _load_list(
+        self, text: str, key: str, messages: List[Dict], response_format: Dict, error: Exception
+    ) -> Tuple[List, int]:
+        """The `key` list of a response that did not parse as is: repaired, or asked again. Returns the list and
+        the follow-up requests made."""
+        count_parse_event("parse_errors")
+        reasks = 0
+        while True:
+            try:
+                value, _ = parse_json_response(text)
+                if isinstance(value, dict) and isinstance(value.get(key), list):
+                    if not reasks:
+                        count_parse_event("repaired")
+                        logger.debug("Repaired an invalid JSON response")
+                    return value[key], reasks
+                error = ValueError(f"no '{key}' list in the JSON object")
+            except ValueError as e:
+                error = e
+            if not text or not text.strip() or reasks >= self.max_reasks:
+                count_parse_event("failures")
+                raise ValueError(f"No '{key}' list in the response: {error}")
+            answer = text
+            text = self._reask(messages, answer, INVALID_JSON_REASK.format(error=error), response_format) or ""
+            reasks += 1
+            if isinstance(text, str) and text.strip():
+                count_parse_event("responses")
+
+    def stream_items(
+        self, messages: List[Dict], key: str, validate: Callable[[Any], Optional[str]], response_format: Dict
+    ) -> Iterator:
+        """
+        Stream a response and yield the valid items of its `key` list as soon as each one is complete.
+
+        Args:
+            messages (List[Dict]): Request messages.
+            key (str): Key of the list in the JSON object.
+            validate (callable): Returns the reason an item is invalid, or None.
+            response_format (dict): Response format of the request.
+
+        Yields:
+            Any: The valid items, in order and without duplicates.
+
+        Raises:
+            ValueError: If no `key` list can be read from the response, even repaired or asked again.
+        """
+        count_parse_event("responses")
+        chunks = []
+        seen = []
+
+        def collect(stream: Iterable[str]):
+            for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+
+        def emit(items):
+            for item in items:
+                if item in seen:
+                    continue
+                seen.append(item)
+                reason = validate(item)
+                if reason is None:
+                    yield item
+                else:
+                    count_parse_event("invalid_items")
+                    count_parse_event("dropped_items")
+                    logger.warning(f"Skipping invalid '{key}' item {item!r}: {reason}")
+
+        stream = self.llm.stream_response(messages=messages, response_format=response_format)
+        try:
+            yield from emit(iter_json_list_items(collect(stream), key))
+            return
+        except ValueError as e:
+            error = e
+        items, _ = self._load_list("".join(chunks), key, messages, response_format, error)
+        yield from emit(items)
+
+    def stream_facts(self, messages: List[Dict]) -> Iterator[str]:
+        """The facts of a fact extraction request, as soon as each one is generated. See `stream_items`."""
+
+        def validate(fact):
+            if not isinstance(fact, str) or not fact.strip():
+                return "not a non-empty string"
+            return None
+
+        return self.stream_items(messages, "facts", validate, self.facts_format)
+
+    @staticmethod
+    def _validate_actions(items, existing_ids) -> Tuple[List[Dict], List[Dict]]:
+        actions, invalid = [], []
+        for item in items:
+            try:
+                action = MemoryAction.model_validate(item)
+            except ValidationError as e:
+                invalid.append({"entry": item, "error": _validation_error(e)})
+                continue
+            if action.event in ("UPDATE", "DELETE") and action.id not in existing_ids:
+                invalid.append({"entry": item, "error": f"unknown memory id {action.id} for {action.event}"})
+                continue
+            actions.append(action.model_dump())
+        return actions, invalid
+
+    def parse_memory_actions(self, response, messages: List[Dict], existing_ids: Iterable[str]) -> Dict[str, List]:
+        """
+        Parse and validate the response of a memory update request.
+
+        Args:
+            response (str): The LLM response.
+            messages (List[Dict]): Messages of the request, continued for follow-ups.
+            existing_ids (Iterable[str]): IDs of the existing memories in the prompt.
+
+        Returns:
+            dict: "memory", the valid actions. Entries still invalid after the follow-ups are dropped.
+
+        Raises:
+            ValueError: If no "memory" list can be read from the response, even repaired or asked again.
+        """
+        text = response if isinstance(response, str) else ""
+        response_format = self.memory_actions_format
+        count_parse_event("responses")
+        try:
+            data, repaired = parse_json_response(text)
+            if not isinstance(data, dict) or not isinstance(data.get("memory"), list):
+                raise ValueError("no 'memory' list in the JSON object")
+            items, reasks = data["memory"], 0
+            if repaired:
+                count_parse_event("parse_errors")
+                count_parse_event("repaired")
+        except ValueError as e:
+            items, reasks = self._load_list(text, "memory", messages, response_format, e)
+
+        existing_ids = set(existing_ids)
+        actions, invalid = self._validate_actions(items, existing_ids)
+        count_parse_event("invalid_items", len(invalid))
+        while invalid and reasks < self.max_reasks:
+            logger.warning(f"Asking again for {len(invalid)} invalid memory actions")
+            entries = json.dumps(invalid, ensure_ascii=False, default=str)
+            reply = self._reask(messages, text, INVALID_ACTIONS_REASK.format(entries=entries), response_format)
+            reasks += 1
+            try:
+                fixed = loads_lenient(reply) if isinstance(reply, str) else None
+            except ValueError:
+                fixed = None
+            if not isinstance(fixed, dict) or not isinstance(fixed.get("memory"), list):
+                break
+            # Entries the reply leaves out are dropped
+            count_parse_event("dropped_items", max(len(invalid) - len(fixed["memory"]), 0))
+            corrected, invalid = self._validate_actions(fixed["memory"], existing_ids)
+            actions.extend(corrected)
+
+        if invalid:
+            count_parse_event("dropped_items", len(invalid))
+            for entry in invalid:
+                logger.warning(f"Skipping invalid memory action {entry['entry']}: {entry['error']}")
+        return {"memory": actions}
@@ -0,0 +1,618 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from mem0.memory.utils import format_entities
+
+from mem0.graphs.entity_matcher import EntityMatcher
+from mem0.graphs.reranker import BM25Reranker
+from mem0.graphs.tools import (
+    DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+    DELETE_MEMORY_TOOL_GRAPH,
+    EXTRACT_ENTITIES_STRUCT_TOOL,
+    EXTRACT_ENTITIES_TOOL,
+    RELATIONS_STRUCT_TOOL,
+    RELATIONS_TOOL,
+)
+from mem0.graphs.utils import (
+    EXTRACT_RELATIONS_PROMPT,
+    aextract_graph_changes,
+    extract_graph_changes,
+    get_delete_messages,
+    iter_graph_relations,
+    paginate_relations,
+)
+from mem0.memory.setup import mem0_dir
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL,
+    type TEXT,
+    embedding BLOB NOT NULL,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    created_at REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS nodes_identity ON nodes (user_id, agent_id, name);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes (user_id, name);
+CREATE TABLE IF NOT EXISTS edges (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+    relationship TEXT NOT NULL,
+    destination_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+    mentions INTEGER NOT NULL DEFAULT 1,
+    created_at REAL,
+    updated_at REAL,
+    UNIQUE (source_id, relationship, destination_id)
+);
+CREATE INDEX IF NOT EXISTS edges_destination ON edges (destination_id);
+"""
+
+
+class _UserEmbeddings:
+    """Normalized entity embeddings of one user as a contiguous matrix, with the node ids and agents of its rows."""
+
+    def __init__(self):
+        self.size = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._agent_ids = np.empty(0, dtype=object)
+        self._matrix = None
+
+    def append(self, ids, agent_ids, vectors):
+        """Append rows, doubling the preallocated buffers when full so appends stay amortized O(rows)."""
+        count = len(ids)
+        if self._matrix is None:
+            self._matrix = np.empty((0, vectors.shape[1]), dtype=np.float32)
+        if self.size + count > len(self._ids):
+            capacity = max(2 * len(self._ids), self.size + count, 64)
+            self._ids = np.resize(self._ids, capacity)
+            self._agent_ids = np.resize(self._agent_ids, capacity)
+            matrix = np.empty((capacity, self._matrix.shape[1]), dtype=np.float32)
+            matrix[: self.size] = self._matrix[: self.size]
+            self._matrix = matrix
+        self._ids[self.size : self.size + count] = ids
+        self._agent_ids[self.size : self.size + count] = agent_ids
+        self._matrix[self.size : self.size + count] = vectors
+        self.size += count
+
+    def similarities(self, vectors, agent_id=None):
+        """Cosine similarity of each query vector with each entity in scope; returns (ids, scores)."""
+        ids = self._ids[: self.size]
+        if not self.size:
+            return ids, np.empty((len(vectors), 0), dtype=np.float32)
+        matrix = self._matrix[: self.size]
+        if agent_id:
+            mask = self._agent_ids[: self.size] == agent_id
+            ids, matrix = ids[mask], matrix[mask]
+        return ids, vectors @ matrix.T
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class MemoryGraph:
+    def __init__(self, config):
+        """
+        Graph memory embedded in the process: nodes and edges live in SQLite, entity embeddings are kept in
+        memory as one contiguous NumPy matrix per user so similarity lookups are a single matrix product.
+        """
+        self.config = config
+        self.path = self.config.graph_store.config.path or os.path.join(mem0_dir, "graph.db")
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            # In WAL mode, NORMAL only risks the last commits on power loss, never corruption
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            self.connection.execute("PRAGMA foreign_keys = ON")
+            self.connection.executescript(SCHEMA)
+        self._data_version = self._read_data_version()
+        self._embeddings = {}
+
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+        )
+
+        self.llm_provider = "openai_structured"
+        if self.config.llm.provider:
+            self.llm_provider = self.config.llm.provider
+        if self.config.graph_store.llm:
+            self.llm_provider = self.config.graph_store.llm.provider
+
+        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.user_id = None
+        self.threshold = 0.7
+
+        self.entity_matcher = None
+        if self.config.graph_store.entity_matching:
+            self.entity_matcher = EntityMatcher(
+                self._load_entity_names, ttl=self.config.graph_store.entity_matching_ttl
+            )
+        self.reranker = BM25Reranker(self.iter_all)
+
+    def add(self, data, filters):
+        """
+        Adds data to the graph.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = extract_graph_changes(self, data, filters)
+        return self._write_changes(to_be_added, to_be_deleted, filters, entity_type_map)
+
+    async def aadd(self, data, filters):
+        """
+        Adds data to the graph from async code, overlapping the LLM and search stages as concurrent tasks.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = await aextract_graph_changes(self, data, filters)
+        return await asyncio.to_thread(self._write_changes, to_be_added, to_be_deleted, filters, entity_type_map)
+
+    def search(self, query, filters, limit=100):
+        """
+        Search for memories and related graph data.
+
+        Args:
+            query (str): Query to search for.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+
+        Returns:
+            list: Up to five relations reranked against the query, each with "source", "relationship" and
+                "destination".
+        """
+        node_list = self._extract_query_entities(query, filters)
+        search_output = self._search_graph_db(node_list=node_list, filters=filters, limit=limit)
+
+        if not search_output:
+            return []
+
+        search_results = [
+            {"source": item["source"], "relationship": item["relationship"], "destination": item["destination"]}
+            for item in self.reranker.rerank(query, search_output, filters, n=5)
+        ]
+
+        logger.info(f"Returned {len(search_results)} search results")
+
+        return search_results
+
+    def delete_all(self, filters):
+        """Delete all nodes and relationships for a user or specific agent."""
+        conditions, params = self._scope("nodes", filters)
+        with self._lock:
+            with self.connection:
+                self.connection.execute(f"DELETE FROM nodes WHERE {conditions}", params)
+            self._embeddings.pop(filters["user_id"], None)
+        if self.entity_matcher:
+            self.entity_matcher.forget(filters)
+        self.reranker.forget(filters)
+
+    def get_all(self, filters, limit=100, cursor=None):
+        """
+        Retrieves relationships of a user (and agent), ordered by relationship id.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (int, optional): Cursor returned by `get_all_page` to continue after. Defaults to None.
+
+        Returns:
+            list: A list of dictionaries with "source", "relationship" and "target".
+        """
+        return self.get_all_page(filters, limit=limit, cursor=cursor)[0]
+
+    def get_all_page(self, filters, limit=100, cursor=None):
+        """
+        Retrieves one page of relationships, ordered by relationship id.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+            cursor (int, optional): Id of the last relationship of the previous page. Defaults to None.
+
+        Returns:
+            tuple: (relationships, next_cursor); next_cursor is None on the last page.
+        """
+        source_conditions, source_params = self._scope("s", filters)
+        destination_conditions, destination_params = self._scope("d", filters)
+        query = f"""
+        SELECT s.name AS source, e.relationship AS relationship, d.name AS target, e.id AS relation_id
+        FROM edges e
+        JOIN nodes s ON s.id = e.source_id
+        JOIN nodes d ON d.id = e.destination_id
+        WHERE e.id > ? AND {source_conditions} AND {destination_conditions}
+        ORDER BY e.id
+        LIMIT ?
+        """
+        params = [cursor if cursor is not None else -1, *source_params, *destination_params, limit + 1]
+        with self._lock:
+            rows = self.connection.execute(query, params).fetchall()
+
+        final_results, next_cursor = paginate_relations(rows, limit)
+        logger.info(f"Retrieved {len(final_results)} relationships")
+
+        return final_results, next_cursor
+
+    def iter_all(self, filters, page_size=1000):
+        """Stream all relationships of a user (and agent) in pages of `page_size`, in bounded memory."""
+        return iter_graph_relations(self, filters, page_size=page_size)
+
+    def reset(self):
+        """Reset the graph by clearing all nodes and relationships."""
+        logger.warning("Clearing graph...")
+        with self._lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM edges")
+                self.connection.execute("DELETE FROM nodes")
+            self._embeddings.clear()
+        if self.entity_matcher:
+            self.entity_matcher.forget()
+        self.reranker.forget()
+
+    def _extract_query_entities(self, query, filters):
+        """
+        Entities mentioned in a search query. Known entity names are matched in memory; the LLM is only asked
+        when nothing matches, the user has stored entities, and the fallback is enabled.
+        """
+        if self.entity_matcher is None:
+            return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+        self._sync()
+        node_list = self.entity_matcher.match(query, filters)
+        if node_list or not self.config.graph_store.entity_matching_llm_fallback:
+            return node_list
+        if not self.entity_matcher.has_entities(filters):
+            return []
+        return list(self._retrieve_nodes_from_data(query, filters).keys())
+
+    def _load_entity_names(self, filters):
+        """Names of all entities stored for the user (and agent), used to seed the entity matcher."""
+        conditions, params = self._scope("nodes", filters)
+        with self._lock:
+            rows = self.connection.execute(f"SELECT DISTINCT name FROM nodes WHERE {conditions}", params).fetchall()
+        return [row["name"] for row in rows]
+
+    def _retrieve_nodes_from_data(self, data, filters):
+        """Extracts all the entities mentioned in the query."""
+        _tools = [EXTRACT_ENTITIES_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_ENTITIES_STRUCT_TOOL]
+        search_results = self.llm.generate_response(
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"You are a smart assistant who understands entities and their types in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source entity. Extract all the entities from the text. ***DO NOT*** answer the question itself if the given text is a question.",
+                },
+                {"role": "user", "content": data},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+
+        try:
+            for tool_call in search_results["tool_calls"]:
+                if tool_call["name"] != "extract_entities":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+        except Exception as e:
+            logger.exception(
+                f"Error in search tool: {e}, llm_provider={self.llm_provider}, search_results={search_results}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
+        return entity_type_map
+
+    def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
+        """Establish relations among the extracted nodes."""
+
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+
+        if self.config.graph_store.custom_prompt:
+            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
+            # Add the custom prompt line if configured
+            system_content = system_content.replace("CUSTOM_PROMPT", f"4. {self.config.graph_store.custom_prompt}")
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": data},
+            ]
+        else:
+            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": f"List of entities: {list(entity_type_map.keys())}. \n\nText: {data}"},
+            ]
+
+        _tools = [RELATIONS_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [RELATIONS_STRUCT_TOOL]
+
+        extracted_entities = self.llm.generate_response(
+            messages=messages,
+            tools=_tools,
+        )
+
+        entities = []
+        if extracted_entities.get("tool_calls"):
+            entities = extracted_entities["tool_calls"][0].get("arguments", {}).get("entities", [])
+
+        entities = self._remove_spaces_from_entities(entities)
+        logger.debug(f"Extracted entities: {entities}")
+        return entities
+
+    def _search_graph_db(self, node_list, filters, limit=100):
+        """
+        Search similar nodes among and their respective incoming and outgoing relations.
+
+        All entity names are embedded in one batch and scored against the user's embedding matrix in one
+        matrix product. Relations reached from several entities are returned once, with their best similarity.
+        """
+        if not node_list:
+            return []
+
+        embeddings = _normalize(self.embedding_model.embed_batch(node_list))
+        with self._lock:
+            ids, scores = self._user_embeddings(filters["user_id"]).similarities(embeddings, filters.get("agent_id"))
+            if not len(ids):
+                return []
+            best = scores.max(axis=0)
+            matched = best >= self.threshold
+            if not matched.any():
+                return []
+            similarity = dict(zip(ids[matched].tolist(), best[matched].tolist()))
+
+            source_conditions, source_params = self._scope("s", filters)
+            destination_conditions, destination_params = self._scope("d", filters)
+            # Drive the join from the matched ids through the adjacency indexes; CROSS JOIN fixes the join order
+            query = f"""
+            SELECT s.name AS source, s.id AS source_id, e.relationship AS relationship, e.id AS relation_id,
+                d.name AS destination, d.id AS destination_id
+            FROM (
+                SELECT edges.* FROM json_each(?) AS matched CROSS JOIN edges ON edges.source_id = matched.value
+                UNION
+                SELECT edges.* FROM json_each(?) AS matched CROSS JOIN edges ON edges.destination_id = matched.value
+            ) AS e
+            CROSS JOIN nodes s ON s.id = e.source_id
+            CROSS JOIN nodes d ON d.id = e.destination_id
+            WHERE {source_conditions} AND {destination_conditions}
+            """
+            matched_ids = json.dumps(list(similarity))
+            rows = self.connection.execute(
+                query, [matched_ids, matched_ids, *source_params, *destination_params]
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            result = dict(row)
+            result["similarity"] = round(
+                max(similarity.get(row["source_id"], -1.0), similarity.get(row["destination_id"], -1.0)), 4
+            )
+            results.append(result)
+        results.sort(key=lambda item: item["similarity"], reverse=True)
+        return results[:limit]
+
+    def _get_delete_entities_from_search_output(self, search_output, data, filters):
+        """Get the entities to be deleted from the search output."""
+        search_output_string = format_entities(search_output)
+
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+
+        system_prompt, user_prompt = get_delete_messages(search_output_string, data, user_identity)
+
+        _tools = [DELETE_MEMORY_TOOL_GRAPH]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [
+                DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+            ]
+
+        memory_updates = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        to_be_deleted = []
+        for item in memory_updates.get("tool_calls", []):
+            if item.get("name") == "delete_graph_memory":
+                to_be_deleted.append(item.get("arguments"))
+        # Clean entities formatting
+        to_be_deleted = self._remove_spaces_from_entities(to_be_deleted)
+        logger.debug(f"Deleted relationships: {to_be_deleted}")
+        return to_be_deleted
+
+    def _write_changes(self, to_be_added, to_be_deleted, filters, entity_type_map):
+        """Apply the deletions and additions of one add in a single SQLite transaction."""
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = _normalize(self.embedding_model.embed_batch(names)) if names else None
+
+        with self._lock:
+            with self.connection:
+                deleted_entities = self._delete_entities(to_be_deleted, filters)
+                node_ids, new_nodes = self._resolve_nodes(names, embeddings, filters, entity_type_map)
+                added_entities = self._add_entities(to_be_added, node_ids)
+            # A matrix dropped meanwhile is reloaded with the new nodes on its next use
+            entities = self._embeddings.get(filters["user_id"])
+            if new_nodes and entities is not None:
+                ids, vectors = zip(*new_nodes)
+                entities.append(ids, [filters.get("agent_id") or ""] * len(ids), np.vstack(vectors))
+
+        if self.entity_matcher:
+            self.entity_matcher.add(filters, names)
+        self.reranker.update(filters, added_entities, deleted_entities)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
+    def _delete_entities(self, to_be_deleted, filters):
+        """Delete the relationships chosen by the delete decision. Nodes are kept."""
+        source_conditions, source_params = self._scope("s", filters)
+        destination_conditions, destination_params = self._scope("d", filters)
+        results = []
+        for item in to_be_deleted:
+            cursor = self.connection.execute(
+                f"""
+                DELETE FROM edges WHERE id IN (
+                    SELECT e.id FROM edges e
+                    JOIN nodes s ON s.id = e.source_id
+                    JOIN nodes d ON d.id = e.destination_id
+                    WHERE s.name = ? AND d.name = ? AND e.relationship = ?
+                        AND {source_conditions} AND {destination_conditions}
+                )
+                """,
+                [item["source"], item["destination"], item["relationship"], *source_params, *destination_params],
+            )
+            # Only relations that existed are reported, as the other backends do
+            if cursor.rowcount > 0:
+                results.append(
+                    [{"source": item["source"], "relationship": item["relationship"], "target": item["destination"]}]
+                )
+        return results
+
+    def _resolve_nodes(self, names, embeddings, filters, entity_type_map, threshold=0.9):
+        """
+        Map each name to an existing node with a similar embedding, or insert a new node.
+
+        Returns:
+            tuple: ({name: node id}, [(node id, embedding) of the inserted nodes])
+        """
+        node_ids, new_nodes = {}, []
+        if not names:
+            return node_ids, new_nodes
+
+        ids, scores = self._user_embeddings(filters["user_id"]).similarities(embeddings, filters.get("agent_id"))
+        agent_id = filters.get("agent_id") or ""
+        now = time.time()
+        for i, name in enumerate(names):
+            if len(ids):
+                best = int(scores[i].argmax())
+                if scores[i, best] >= threshold:
+                    node_ids[name] = int(ids[best])
+                    continue
+            cursor = self.connection.execute(
+                """
+                INSERT INTO nodes (user_id, agent_id, name, type, embedding, created_at) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, agent_id, name) DO NOTHING
+                """,
+                [
+                    filters["user_id"],
+                    agent_id,
+                    name,
+                    entity_type_map.get(name, "__User__"),
+                    embeddings[i].tobytes(),
+                    now,
+                ],
+            )
+            if cursor.rowcount:
+                node_ids[name] = cursor.lastrowid
+                new_nodes.append((cursor.lastrowid, embeddings[i]))
+            else:
+                node_ids[name] = self.connection.execute(
+                    "SELECT id FROM nodes WHERE user_id = ? AND agent_id = ? AND name = ?",
+                    [filters["user_id"], agent_id, name],
+                ).fetchone()["id"]
+        return node_ids, new_nodes
+
+    def _add_entities(self, to_be_added, node_ids):
+        """Merge the new relationships between resolved nodes and count the mentions of their endpoints."""
+        now = time.time()
+        results = []
+        for item in to_be_added:
+            source_id, destination_id = node_ids[item["source"]], node_ids[item["destination"]]
+            self.connection.execute(
+                "UPDATE nodes SET mentions = mentions + 1 WHERE id IN (?, ?)", [source_id, destination_id]
+            )
+            self.connection.execute(
+                """
+                INSERT INTO edges (source_id, relationship, destination_id, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source_id, relationship, destination_id)
+                DO UPDATE SET mentions = mentions + 1, updated_at = excluded.updated_at
+                """,
+                [source_id, item["relationship"], destination_id, now, now],
+            )
+            results.append(
+                [{"source": item["source"], "relationship": item["relationship"], "target": item["destination"]}]
+            )
+        return results
+
+    def _user_embeddings(self, user_id):
+        """The user's embedding matrix, loaded from SQLite on first use. Callers hold the lock."""
+        self._sync()
+        if user_id not in self._embeddings:
+            rows = self.connection.execute(
+                "SELECT id, agent_id, embedding FROM nodes WHERE user_id = ? ORDER BY id", [user_id]
+            ).fetchall()
+            entities = _UserEmbeddings()
+            if rows:
+                entities.append(
+                    [row["id"] for row in rows],
+                    [row["agent_id"] for row in rows],
+                    np.vstack([np.frombuffer(row["embedding"], dtype=np.float32) for row in rows]),
+                )
+            self._embeddings[user_id] = entities
+        return self._embeddings[user_id]
+
+    def _read_data_version(self):
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _sync(self):
+        """Drop cached embeddings, names and term statistics when another connection has committed to the database."""
+        with self._lock:
+            data_version = self._read_data_version()
+            if data_version == self._data_version:
+                return
+            self._data_version = data_version
+            self._embeddings.clear()
+        if self.entity_matcher:
+            self.entity_matcher.forget()
+        self.reranker.forget()
+
+    @staticmethod
+    def _scope(table, filters):
+        """SQL conditions and parameters restricting `table` rows to the user (and agent) of `filters`."""
+        conditions, params = [f"{table}.user_id = ?"], [filters["user_id"]]
+        if filters.get("agent_id"):
+            conditions.append(f"{table}.agent_id = ?")
+            params.append(filters["agent_id"])
+        return " AND ".join(conditions), params
+
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
@@ -1,23 +1,28 @@
 import hashlib
+import json
+import logging
 import re
+import threading
+from typing import Any, Dict, List, Tuple
 
 from mem0.configs.prompts import FACT_RETRIEVAL_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 def get_fact_retrieval_messages(message):
     return FACT_RETRIEVAL_PROMPT, f"Input:\n{message}"
 
 
+def format_message(msg):
+    """The line of a message in the conversation text given to the LLM; empty for roles that are left out."""
+    if msg["role"] in ("system", "user", "assistant"):
+        return f"{msg['role']}: {msg['content']}\n"
+    return ""
+
+
 def parse_messages(messages):
-    response = ""
-    for msg in messages:
-        if msg["role"] == "system":
-            response += f"system: {msg['content']}\n"
-        if msg["role"] == "user":
-            response += f"user: {msg['content']}\n"
-        if msg["role"] == "assistant":
-            response += f"assistant: {msg['content']}\n"
-    return response
+    return "".join(format_message(msg) for msg in messages)
 
 
 def format_entities(entities):
@@ -46,6 +51,23 @@ def remove_code_blocks(content: str) -> str:
     return match.group(1).strip() if match else content.strip()
 
 
+def is_valid_response(response, response_format=None, tools=None) -> bool:
+    """
+    Whether an LLM response has the shape the request asked for: parsed tool calls when tools were passed, valid
+    JSON in JSON mode, and non-empty text otherwise.
+    """
+    if tools:
+        return isinstance(response, dict)
+    if not isinstance(response, str) or not response.strip():
+        return False
+    if isinstance(response_format, dict) and response_format.get("type") in ("json_object", "json_schema"):
+        try:
+            json.loads(remove_code_blocks(response))
+        except ValueError:
+            return False
+    return True
+
+
 def extract_json(text):
     """
     Extracts JSON content from a string, removing enclosing triple backticks and optional 'json' tag if present.
@@ -60,6 +82,260 @@ def extract_json(text):
     return json_str
 
 
+def iter_json_list_items(chunks, key):
+    """
+    Yield the items of the `key` list of a streamed JSON object as soon as each one is complete.
+
+    An item is emitted once the text after it has arrived, so a value whose end cannot be seen yet (a number still
+    being generated) is not cut short. When the list cannot be followed incrementally, the whole response is parsed
+    once the stream ends and the items not yielded yet are yielded then.
+
+    Args:
+        chunks (Iterable[str]): Text of the response, in chunks as they arrive.
+        key (str): Key of the list in the JSON object.
+
+    Yields:
+        Any: The items of the list, in order.
+
+    Raises:
+        ValueError: If the complete response has no `key` list.
+    """
+    decoder = json.JSONDecoder()
+    key_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    text = ""
+    position = None  # Start of the next item, once the list has been found
+    closed = False
+    emitted = 0
+    for chunk in chunks:
+        text += chunk
+        if closed:
+            continue
+        if position is None:
+            match = key_pattern.search(text)
+            if match is None:
+                continue
+            position = match.end()
+        while True:
+            while position < len(text) and text[position] in " \t\r\n,":
+                position += 1
+            if position == len(text):
+                break
+            if text[position] == "]":
+                closed = True
+                break
+            try:
+                item, end = decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                break
+            if end == len(text):
+                break
+            yield item
+            emitted += 1
+            position = end
+
+    if closed:
+        return
+    try:
+        items = json.loads(remove_code_blocks(text))[key]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"No '{key}' list in the response: {e}") from e
+    if not isinstance(items, list):
+        raise ValueError(f"'{key}' is not a list in the response")
+    yield from items[emitted:]
+
+
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Process-wide counters of the parsed LLM responses
+_stats = {
+    "responses": 0,
+    "parse_errors": 0,
+    "repaired": 0,
+    "reasks": 0,
+    "invalid_items": 0,
+    "dropped_items": 0,
+    "failures": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def count_parse_event(name: str, n: int = 1):
+    """Add `n` to a counter of `get_parse_stats`."""
+    with _stats_lock:
+        _stats[name] += n
+
+
+def get_parse_stats() -> Dict[str, int]:
+    """
+    Counters of the LLM responses parsed in this process.
+
+    Returns:
+        dict: "responses" parsed, "parse_errors" (responses that were not valid JSON as returned), "repaired" (of
+            those, fixed without asking the model again), "reasks" (follow-up requests for invalid parts),
+            "invalid_items" (list entries that did not match the schema), "dropped_items" (entries still invalid
+            after the follow-ups) and "failures" (responses that could not be used at all).
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_parse_stats():
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def _trim_dangling(out: List[str], string_starts: List[int]):
+    """Drop what cannot end a truncated value: trailing commas, and a key whose value never came."""
+    while out:
+        if out[-1].isspace() or out[-1] == ",":
+            out.pop()
+        elif out[-1] == ":":
+            out.pop()
+            while out and out[-1].isspace():
+                out.pop()
+            del out[string_starts.pop() :]
+        else:
+            break
+
+
+def repair_json(text: str) -> str:
+    """
+    Rewrite the JSON written by an LLM so that it parses, in a single pass over the text.
+
+    Text around the first object or array is ignored. Single-quoted strings, raw newlines in strings, Python
+    literals, comments and trailing commas are fixed, and a truncated response is closed after its last complete
+    value.
+
+    Args:
+        text (str): Response text.
+
+    Returns:
+        str: The repaired JSON text.
+
+    Raises:
+        ValueError: If the text has no JSON object or array.
+    """
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        raise ValueError("no JSON object or array in the response")
+
+    out: List[str] = []
+    stack: List[str] = []
+    string_starts: List[int] = []
+    quote = None
+    i, n = min(starts), len(text)
+    while i < n:
+        c = text[i]
+        if quote:
+            if c == "\\":
+                if i + 1 < n:
+                    out.append("'" if text[i + 1] == "'" else text[i : i + 2])
+                i += 2
+                continue
+            if c == quote:
+                out.append('"')
+                quote = None
+            elif c == '"':
+                out.append('\\"')
+            elif c < " ":
+                out.append(json.dumps(c)[1:-1])
+            else:
+                out.append(c)
+            i += 1
+            continue
+
+        if c in "\"'":
+            quote = c
+            string_starts.append(len(out))
+            out.append('"')
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+            out.append(c)
+        elif c in "}]":
+            while out and (out[-1].isspace() or out[-1] == ","):
+                out.pop()
+            if stack:
+                out.append(stack.pop())
+            if not stack:
+                break
+        elif c.isalpha() or c == "_":
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            out.append(_LITERALS.get(text[i:j], text[i:j]))
+            i = j
+            continue
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        else:
+            out.append(c)
+        i += 1
+
+    if quote:
+        # Truncated inside a string: the value is incomplete
+        del out[string_starts.pop() :]
+    _trim_dangling(out, string_starts)
+    out.extend(reversed(stack))
+    return "".join(out)
+
+
+def parse_json_response(text: str) -> Tuple[Any, bool]:
+    """The JSON value of a response, and whether it had to be repaired. Raises ValueError."""
+    content = extract_json(text)
+    try:
+        return json.loads(content), False
+    except ValueError as e:
+        error = e
+    try:
+        return json.loads(repair_json(content)), True
+    except ValueError:
+        raise ValueError(f"Invalid JSON: {error}") from error
+
+
+def loads_lenient(text: str) -> Any:
+    """
+    Parse the JSON of an LLM response: strictly first, then repaired with `repair_json`.
+
+    Args:
+        text (str): Response text, possibly in a code block or surrounded by prose.
+
+    Returns:
+        Any: The parsed value.
+
+    Raises:
+        ValueError: If the response cannot be parsed even once repaired.
+    """
+    count_parse_event("responses")
+    try:
+        value, repaired = parse_json_response(text)
+    except ValueError:
+        count_parse_event("parse_errors")
+        count_parse_event("failures")
+        raise
+    if repaired:
+        count_parse_event("parse_errors")
+        count_parse_event("repaired")
+        logger.debug("Repaired an invalid JSON response")
+    return value
+
+
+def parse_tool_arguments(arguments) -> Dict:
+    """
+    The arguments of a tool call, as returned by the provider (JSON text or an already parsed dict).
+
+    Raises:
+        ValueError: If the arguments cannot be parsed.
+    """
+    if isinstance(arguments, dict):
+        return arguments
+    if not arguments or not arguments.strip():
+        return {}
+    return loads_lenient(arguments)
+
+
 def get_image_description(image_obj, llm, vision_details):
     """
     Get the description of the image
@@ -89,30 +365,10 @@ def parse_vision_messages(messages, llm=None, vision_details="auto"):
     """
     Parse the vision messages from the messages
     """
-    returned_messages = []
-    for msg in messages:
-        if msg["role"] == "system":
-            returned_messages.append(msg)
-            continue
-
-        # Handle message content
-        if isinstance(msg["content"], list):
-            # Multiple image URLs in content
-            description = get_image_description(msg, llm, vision_details)
-            returned_messages.append({"role": msg["role"], "content": description})
-        elif isinstance(msg["content"], dict) and msg["content"].get("type") == "image_url":
-            # Single image content
-            image_url = msg["content"]["image_url"]["url"]
-            try:
-                description = get_image_description(image_url, llm, vision_details)
-                returned_messages.append({"role": msg["role"], "content": description})
-            except Exception:
-                raise Exception(f"Error while downloading {image_url}.")
-        else:
-            # Regular text content
-            returned_messages.append(msg)
+    # Imported here: the describer builds on this module
+    from mem0.memory.vision import ImageDescriber
 
-    return returned_messages
+    return ImageDescriber(llm, vision_details).parse(messages)
 
 
 def process_telemetry_filters(filters):
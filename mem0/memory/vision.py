@@ -0,0 +1,151 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from mem0.llms.cache import ResponseCache
+from mem0.memory.utils import get_image_description
+
+logger = logging.getLogger(__name__)
+
+
+def _image_url(part: Any) -> Optional[str]:
+    if isinstance(part, dict) and part.get("type") == "image_url":
+        return part["image_url"]["url"]
+    return None
+
+
+def _message_images(msg: Dict) -> List[str]:
+    """The URLs of the images of a message, in order: every image part of a list content, or a single image
+    content. Empty for text and system messages."""
+    if msg["role"] == "system":
+        return []
+    if isinstance(msg["content"], list):
+        return [url for url in map(_image_url, msg["content"]) if url is not None]
+    url = _image_url(msg["content"])
+    return [url] if url is not None else []
+
+
+class ImageDescriber:
+    """
+    Replaces the images of a conversation by their descriptions.
+
+    Each distinct image is described once per call, all images concurrently, and the descriptions are cached by
+    image (URL or data URL content) when a cache is given. A message with several parts becomes its text parts and
+    the descriptions of its images, in order.
+    """
+
+    def __init__(
+        self,
+        llm,
+        vision_details: Optional[str] = "auto",
+        max_concurrency: int = 4,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initialize the describer.
+
+        Args:
+            llm: Vision-capable LLM used for the descriptions.
+            vision_details (str, optional): Image detail level sent to the LLM. Defaults to "auto".
+            max_concurrency (int, optional): Descriptions requested at the same time. Defaults to 4.
+            cache (ResponseCache, optional): Cache of the descriptions. Not cached when None.
+        """
+        self.llm = llm
+        self.vision_details = vision_details
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+
+    def _key(self, image) -> str:
+        model = getattr(getattr(self.llm, "config", None), "model", None)
+        request = {"model": model, "details": self.vision_details, "image": image}
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _describe(self, key: str, image: str) -> str:
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return json.loads(cached)
+        try:
+            description = get_image_description(image, self.llm, self.vision_details)
+        except Exception as e:
+            raise Exception(f"Error while downloading {image}.") from e
+        if self.cache is not None and isinstance(description, str) and description.strip():
+            self.cache.put(key, json.dumps(description))
+        return description
+
+    def _images(self, messages: List[Dict]) -> Dict[str, str]:
+        """The distinct images of the messages, by cache key."""
+        images = {}
+        for msg in messages:
+            for image in _message_images(msg):
+                images.setdefault(self._key(image), image)
+        return images
+
+    def _replace(self, messages: List[Dict], descriptions: Dict[str, str]) -> List[Dict]:
+        returned_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                returned_messages.append(msg)
+            elif isinstance(msg["content"], list):
+                parts = []
+                for part in msg["content"]:
+                    url = _image_url(part)
+                    if url is not None:
+                        parts.append(descriptions[self._key(url)])
+                    elif isinstance(part, dict) and part.get("type") == "text":
+                        parts.append(part["text"])
+                returned_messages.append({"role": msg["role"], "content": "\n".join(parts)})
+            elif _image_url(msg["content"]) is not None:
+                returned_messages.append(
+                    {"role": msg["role"], "content": descriptions[self._key(_image_url(msg["content"]))]}
+                )
+            else:
+                returned_messages.append(msg)
+        return returned_messages
+
+    def parse(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Replace the image messages by their descriptions.
+
+        Args:
+            messages (List[Dict]): Conversation messages.
+
+        Returns:
+            List[Dict]: The messages, with the content of image messages replaced by their description.
+        """
+        images = self._images(messages)
+        if len(images) <= 1:
+            descriptions = {key: self._describe(key, image) for key, image in images.items()}
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(images))) as pool:
+                futures = {
+                    key: pool.submit(contextvars.copy_context().run, self._describe, key, image)
+                    for key, image in images.items()
+                }
+                descriptions = {key: future.result() for key, future in futures.items()}
+        return self._replace(messages, descriptions)
+
+    async def aparse(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Replace the image messages by their descriptions, without blocking the event loop.
+
+        Args:
+            messages (List[Dict]): Conversation messages.
+
+        Returns:
+            List[Dict]: The messages, with the content of image messages replaced by their description.
+        """
+        images = self._images(messages)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def describe(key, image):
+            async with semaphore:
+                return await asyncio.to_thread(self._describe, key, image)
+
+        results = await asyncio.gather(*(describe(key, image) for key, image in images.items()))
+        return self._replace(messages, dict(zip(images, results)))
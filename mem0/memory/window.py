@@ -0,0 +1,227 @@
+import concurrent.futures
+import contextvars
+import hashlib
+import json
+import logging
+import math
+import queue
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from mem0.configs.base import InputWindowConfig
+from mem0.memory.parsing import ResponseParser
+from mem0.memory.utils import format_message, get_fact_retrieval_messages
+from mem0.utils.scheduler import CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+_END_OF_CHUNK = object()
+
+
+def _load_encoding(model: Optional[str]):
+    """The tiktoken encoding of `model`, or o200k_base for models tiktoken does not know. None without tiktoken."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model or "")
+    except KeyError:
+        pass
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.debug(f"No tiktoken encoding available, estimating tokens from characters: {e}")
+        return None
+
+
+def _message_hash(message: Dict) -> str:
+    content = json.dumps(message.get("content"), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{message.get('role')}\0{content}".encode("utf-8")).hexdigest()
+
+
+def _pair_hash(previous: Optional[str], current: str) -> str:
+    return hashlib.sha256(f"{previous or ''}:{current}".encode("utf-8")).hexdigest()
+
+
+class InputWindow:
+    """
+    Selects the part of a conversation that `add` has not processed yet, and splits it into chunks that fit one
+    fact extraction call.
+
+    The high-water mark of a session is the hash of its last processed message together with the one before it.
+    When a later conversation contains that pair, everything up to it is skipped. A single message is never
+    matched on its own, so a short reply repeated in a new turn ("yes") is still processed.
+    """
+
+    def __init__(self, config: InputWindowConfig, model: Optional[str] = None):
+        self.config = config
+        self._encoding = _load_encoding(model)
+        self._marks: "OrderedDict[Tuple, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _session(filters: Dict) -> Tuple:
+        return filters.get("user_id"), filters.get("agent_id"), filters.get("run_id")
+
+    def count_tokens(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+    def select(self, messages: List[Dict], filters: Dict) -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
+        """
+        The messages that follow the session's high-water mark.
+
+        Args:
+            messages (List[Dict]): Conversation passed to `add`.
+            filters (dict): Session ids of the `add`.
+
+        Returns:
+            tuple: The unprocessed messages, and the mark to `commit` once they are processed (None when there are
+                none or marks are not kept).
+        """
+        if not self.config.skip_processed or not messages:
+            return messages, None
+
+        session = self._session(filters)
+        with self._lock:
+            last_hash, mark = self._marks.get(session, (None, None))
+
+        hashes = [_message_hash(message) for message in messages]
+        start = 0
+        if mark is not None:
+            for j in range(len(hashes) - 1, 0, -1):
+                if _pair_hash(hashes[j - 1], hashes[j]) == mark:
+                    start = j + 1
+                    break
+        if start:
+            logger.debug(f"Skipping {start} of {len(messages)} messages already processed for {session}")
+        if start == len(messages):
+            return [], None
+
+        # A single new message is paired with the last message of the previous add
+        previous = hashes[-2] if len(hashes) >= 2 else last_hash
+        return messages[start:], (hashes[-1], _pair_hash(previous, hashes[-1]))
+
+    def commit(self, filters: Dict, mark: Optional[Tuple[str, str]]):
+        """Record that the messages selected with `mark` were processed."""
+        if mark is None:
+            return
+        session = self._session(filters)
+        with self._lock:
+            self._marks[session] = mark
+            self._marks.move_to_end(session)
+            while len(self._marks) > self.config.max_sessions:
+                self._marks.popitem(last=False)
+
+    def _split_content(self, content: str, limit: int) -> List[str]:
+        """Pieces of a message content that are each `limit` tokens long at most."""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(content, disallowed_special=())
+            return [self._encoding.decode(tokens[i : i + limit]) for i in range(0, len(tokens), limit)]
+        size = limit * CHARS_PER_TOKEN
+        return [content[i : i + size] for i in range(0, len(content), size)]
+
+    def chunk(self, messages: List[Dict]) -> List[str]:
+        """
+        The conversation text of the messages (as `parse_messages` formats it), in chunks of at most
+        `chunk_tokens` tokens. Messages are kept whole unless a single message is longer than a chunk.
+
+        Args:
+            messages (List[Dict]): Messages to split.
+
+        Returns:
+            List[str]: The chunks, in order. A single chunk when the conversation fits one.
+        """
+        if not self.config.chunk_tokens:
+            return ["".join(map(format_message, messages))]
+
+        chunks, current, size = [], [], 0
+        for message in messages:
+            line = format_message(message)
+            if not line:
+                continue
+            tokens = self.count_tokens(line)
+            if tokens > self.config.chunk_tokens and isinstance(message["content"], str):
+                # Every piece keeps the role prefix of the message
+                overhead = self.count_tokens(format_message({**message, "content": ""}))
+                parts = self._split_content(message["content"], max(self.config.chunk_tokens - overhead, 1))
+                pieces = [format_message({**message, "content": part}) for part in parts]
+                pieces = [(piece, self.count_tokens(piece)) for piece in pieces]
+            else:
+                pieces = [(line, tokens)]
+            for piece, piece_tokens in pieces:
+                if current and size + piece_tokens > self.config.chunk_tokens:
+                    chunks.append("".join(current))
+                    current, size = [], 0
+                current.append(piece)
+                size += piece_tokens
+        if current or not chunks:
+            chunks.append("".join(current))
+        return chunks
+
+
+def _stream_chunk_facts(parser: ResponseParser, parsed_messages: str, custom_prompt: Optional[str]) -> Iterator[str]:
+    if custom_prompt:
+        system_prompt, user_prompt = custom_prompt, f"Input:\n{parsed_messages}"
+    else:
+        system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
+    return parser.stream_facts([{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}])
+
+
+def extract_facts(
+    llm, chunks: List[str], custom_prompt: Optional[str] = None, parser: Optional[ResponseParser] = None
+) -> Iterator[str]:
+    """
+    Extract the facts of a conversation, yielding each one as soon as it is generated.
+
+    Several chunks are extracted in parallel, one LLM call each, and their facts merged without duplicates. A chunk
+    whose extraction fails is skipped with an error log; the facts of the others are yielded before the failure is
+    raised.
+
+    Args:
+        llm: LLM used for extraction.
+        chunks (List[str]): Conversation text, in one or more chunks.
+        custom_prompt (str, optional): Custom fact extraction prompt. Defaults to None.
+        parser (ResponseParser, optional): Parser of the responses. Defaults to a JSON mode parser of `llm`.
+
+    Yields:
+        str: The facts.
+
+    Raises:
+        ValueError: If the extraction of a chunk failed.
+    """
+    parser = parser or ResponseParser(llm)
+    if len(chunks) == 1:
+        yield from _stream_chunk_facts(parser, chunks[0], custom_prompt)
+        return
+
+    facts = queue.Queue()
+    failed = []
+
+    def extract(chunk):
+        try:
+            for fact in _stream_chunk_facts(parser, chunk, custom_prompt):
+                facts.put(fact)
+        except Exception as e:
+            logger.error(f"Error extracting facts from a conversation chunk: {e}")
+            failed.append(e)
+        finally:
+            facts.put(_END_OF_CHUNK)
+
+    seen = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk in chunks:
+            executor.submit(contextvars.copy_context().run, extract, chunk)
+        remaining = len(chunks)
+        while remaining:
+            fact = facts.get()
+            if fact is _END_OF_CHUNK:
+                remaining -= 1
+            elif fact not in seen:
+                seen.add(fact)
+                yield fact
+    if failed:
+        raise ValueError(f"Fact extraction failed for {len(failed)} of {len(chunks)} conversation chunks")
@@ -4,6 +4,9 @@ from typing import Optional
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.cache import CachedLLM, ResponseCache
+from mem0.utils.scheduler import RateLimitedEmbedding, RateLimitedLLM, get_scheduler
+from mem0.vector_stores.tuning import load_search_params
 
 
 def load_class(class_type):
@@ -31,6 +34,7 @@ class LlmFactory:
         "lmstudio": "mem0.llms.lmstudio.LMStudioLLM",
         "vllm": "mem0.llms.vllm.VllmLLM",
         "langchain": "mem0.llms.langchain.LangchainLLM",
+        "router": "mem0.llms.router.RouterLLM",
     }
 
     @classmethod
@@ -39,7 +43,14 @@ class LlmFactory:
         if class_type:
             llm_instance = load_class(class_type)
             base_config = BaseLlmConfig(**config)
-            return llm_instance(base_config)
+            llm = llm_instance(base_config)
+            if base_config.rate_limit:
+                scheduler = get_scheduler(("llm", provider_name, llm.config.model), base_config.rate_limit)
+                llm = RateLimitedLLM(llm, scheduler)
+            if base_config.cache:
+                # Outermost, so that cached responses do not use up rate limits
+                llm = CachedLLM(llm, ResponseCache(base_config.cache), provider_name)
+            return llm
         else:
             raise ValueError(f"Unsupported Llm provider: {provider_name}")
 
@@ -66,7 +77,11 @@ class EmbedderFactory:
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if base_config.rate_limit:
+                scheduler = get_scheduler(("embedder", provider_name, embedder.config.model), base_config.rate_limit)
+                embedder = RateLimitedEmbedding(embedder, scheduler)
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -88,6 +103,7 @@ class VectorStoreFactory:
         "supabase": "mem0.vector_stores.supabase.Supabase",
         "weaviate": "mem0.vector_stores.weaviate.Weaviate",
         "faiss": "mem0.vector_stores.faiss.FAISS",
+        "memmap": "mem0.vector_stores.memmap.MemmapDB",
         "langchain": "mem0.vector_stores.langchain.Langchain",
     }
 
@@ -97,8 +113,11 @@ class VectorStoreFactory:
         if class_type:
             if not isinstance(config, dict):
                 config = config.model_dump()
-            vector_store_instance = load_class(class_type)
-            return vector_store_instance(**config)
+            vector_store_instance = load_class(class_type)(**config)
+            tuned_search_params = load_search_params(provider_name, config.get("collection_name"), config=config)
+            if tuned_search_params:
+                vector_store_instance.set_search_params(tuned_search_params, strict=False)
+            return vector_store_instance
         else:
             raise ValueError(f"Unsupported VectorStore provider: {provider_name}")
 
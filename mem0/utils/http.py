@@ -0,0 +1,182 @@
+import json
+import logging
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+import httpx
+
+from mem0.configs.base import HttpPoolConfig
+
+logger = logging.getLogger(__name__)
+
+# Clients are shared per process. A client pools connections per origin, and the SDKs send credentials as request
+# headers, so one client per pool settings and proxy serves every provider without mixing their connections.
+_clients: Dict[Tuple, Union[httpx.Client, httpx.AsyncClient, httpx.HTTPTransport]] = {}
+_clients_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _key(kind: str, config: HttpPoolConfig, proxies) -> Tuple:
+    return kind, config.model_dump_json(), json.dumps(proxies, sort_keys=True)
+
+
+def _transport_kwargs(config: HttpPoolConfig) -> Dict:
+    http2 = config.http2 and _http2_available()
+    if config.http2 and not http2:
+        logger.debug("HTTP/2 needs the 'h2' package (pip install httpx[http2]); using HTTP/1.1")
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    return {"http2": http2, "limits": limits}
+
+
+def _timeout(config: HttpPoolConfig) -> httpx.Timeout:
+    return httpx.Timeout(config.timeout, connect=config.connect_timeout)
+
+
+def _proxy_kwargs(proxies: Optional[Union[Dict, str]], transport_kwargs: Dict, transport_class) -> Dict:
+    """httpx arguments for the `http_client_proxies` setting: one proxy URL, or proxy URLs by URL pattern."""
+    if not proxies:
+        return {}
+    if isinstance(proxies, str):
+        return {"proxy": proxies}
+    return {"mounts": {pattern: transport_class(proxy=url, **transport_kwargs) for pattern, url in proxies.items()}}
+
+
+def _get_or_create(key: Tuple, create):
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = create()
+        return client
+
+
+def get_http_client(
+    config: Optional[HttpPoolConfig] = None, proxies: Optional[Union[Dict, str]] = None
+) -> httpx.Client:
+    """
+    The process-wide HTTP client for these pool settings and proxies, to pass to SDK clients as `http_client`.
+
+    Args:
+        config (HttpPoolConfig, optional): Pool limits, timeouts and HTTP/2. Defaults to HttpPoolConfig().
+        proxies (dict or str, optional): Proxy URL, or proxy URLs by URL pattern. Defaults to None.
+
+    Returns:
+        httpx.Client: A client shared by every caller with the same settings.
+    """
+    config = config or HttpPoolConfig()
+
+    def create():
+        kwargs = _transport_kwargs(config)
+        return httpx.Client(timeout=_timeout(config), **kwargs, **_proxy_kwargs(proxies, kwargs, httpx.HTTPTransport))
+
+    return _get_or_create(_key("client", config, proxies), create)
+
+
+def get_async_http_client(
+    config: Optional[HttpPoolConfig] = None, proxies: Optional[Union[Dict, str]] = None
+) -> httpx.AsyncClient:
+    """
+    The process-wide async HTTP client for these pool settings and proxies. Async clients must be used from a single
+    event loop.
+
+    Args:
+        config (HttpPoolConfig, optional): Pool limits, timeouts and HTTP/2. Defaults to HttpPoolConfig().
+        proxies (dict or str, optional): Proxy URL, or proxy URLs by URL pattern. Defaults to None.
+
+    Returns:
+        httpx.AsyncClient: A client shared by every caller with the same settings.
+    """
+    config = config or HttpPoolConfig()
+
+    def create():
+        kwargs = _transport_kwargs(config)
+        return httpx.AsyncClient(
+            timeout=_timeout(config), **kwargs, **_proxy_kwargs(proxies, kwargs, httpx.AsyncHTTPTransport)
+        )
+
+    return _get_or_create(_key("async_client", config, proxies), create)
+
+
+def get_http_transport(config: Optional[HttpPoolConfig] = None) -> httpx.HTTPTransport:
+    """
+    The process-wide connection pool for these settings, for SDKs that build their own `httpx.Client` and accept
+    its arguments (`transport=`) rather than a client.
+
+    Args:
+        config (HttpPoolConfig, optional): Pool limits and HTTP/2. Defaults to HttpPoolConfig().
+
+    Returns:
+        httpx.HTTPTransport: A transport shared by every caller with the same settings.
+    """
+    config = config or HttpPoolConfig()
+    return _get_or_create(_key("transport", config, None), lambda: httpx.HTTPTransport(**_transport_kwargs(config)))
+
+
+def get_boto3_client(
+    service: str,
+    region_name: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    aws_session_token: Optional[str] = None,
+    config: Optional[HttpPoolConfig] = None,
+):
+    """
+    The process-wide boto3 client of a service, region and credentials, with keep-alive connections pooled to the
+    configured size. boto3 clients are thread-safe, so the LLM and the embedder of the same region share one.
+
+    Args:
+        service (str): AWS service name, e.g. "bedrock-runtime".
+        region_name (str, optional): AWS region. Defaults to None.
+        aws_access_key_id (str, optional): Access key; the default credential chain when None.
+        aws_secret_access_key (str, optional): Secret key; the default credential chain when None.
+        aws_session_token (str, optional): Session token of temporary credentials. Defaults to None.
+        config (HttpPoolConfig, optional): Pool size and timeouts. Defaults to HttpPoolConfig().
+
+    Returns:
+        botocore.client.BaseClient: The shared client.
+    """
+    import boto3
+    from botocore.config import Config
+
+    config = config or HttpPoolConfig()
+    credentials = (aws_access_key_id, aws_secret_access_key, aws_session_token)
+    key = ("boto3", service, region_name, credentials, config.model_dump_json())
+
+    def create():
+        client_config = Config(
+            max_pool_connections=config.max_connections,
+            tcp_keepalive=True,
+            connect_timeout=config.connect_timeout,
+            read_timeout=config.timeout,
+        )
+        return boto3.client(
+            service,
+            region_name=region_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            config=client_config,
+        )
+
+    return _get_or_create(key, create)
+
+
+def clear_http_clients():
+    """Close and forget the shared clients, e.g. after a fork or in tests."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if isinstance(client, (httpx.Client, httpx.HTTPTransport)) and close is not None:
+            close()
@@ -0,0 +1,388 @@
+import contextvars
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from mem0.configs.base import RateLimitConfig
+from mem0.embeddings.base import EmbeddingBase
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes: waiting interactive requests (search) are served before background ones (add)
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_priority = contextvars.ContextVar("mem0_request_priority", default=INTERACTIVE)
+
+# Schedulers are shared per process, so that every Memory instance using the same provider and model draws from
+# one quota
+_schedulers: Dict[Tuple, "RequestScheduler"] = {}
+_schedulers_lock = threading.Lock()
+
+# Rough size of a token in characters, used to estimate token usage before a request is sent
+CHARS_PER_TOKEN = 4
+
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+
+@contextmanager
+def background_priority():
+    """Run the provider requests made in this context (and the threads or tasks it starts with a copy of the
+    context) in the background lane."""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for attribute in ("status_code", "status", "code"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    if isinstance(value, int):
+        return value
+    if isinstance(response, dict):  # botocore ClientError
+        return response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether a provider SDK error reports that the request was rate limited or over quota."""
+    if _status_code(error) == 429:
+        return True
+    name = type(error).__name__.lower()
+    if "ratelimit" in name or "throttl" in name or "toomanyrequests" in name:
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):  # botocore ClientError
+        code = response.get("Error", {}).get("Code", "")
+        return code in ("ThrottlingException", "TooManyRequestsException", "ServiceQuotaExceededException")
+    return "resource_exhausted" in str(error).lower()
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether a provider SDK error is worth retrying: rate limiting, server errors, timeouts and dropped
+    connections."""
+    if is_rate_limit_error(error):
+        return True
+    status = _status_code(error)
+    if status is not None and (status >= 500 or status == 408):
+        return True
+    name = type(error).__name__.lower()
+    return "timeout" in name or "connection" in name
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Delay in seconds the provider asked for in a Retry-After header, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at `per_minute` units per minute, holding at most one minute of quota.
+    Callers synchronize access."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available. Amounts above the capacity wait for a full bucket."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(missing, 0.0) / self.rate
+
+    def take(self, amount: float):
+        """Take `amount` units; the level goes negative when more was used than estimated."""
+        self._refill()
+        self.level -= amount
+
+
+class RequestScheduler:
+    """
+    Client-side scheduling of the requests to one provider model.
+
+    Requests wait in priority order for a concurrency slot and for request and token quota (token buckets), so
+    bursts are spread over the quota instead of being rejected by the provider. The number of concurrent requests
+    adapts with AIMD: it grows by one per window of successful requests and is halved when the provider rate limits
+    a request (or reduced when latency exceeds the target). Rate limited and transiently failed requests are retried
+    with jittered exponential backoff.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config (RateLimitConfig): Quotas, concurrency and retry settings.
+        """
+        self.config = config
+        self.requests = TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        self.tokens = TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self.limit = float(config.max_concurrency)
+        self.in_flight = 0
+        self.latency = None  # Moving average of successful request latency, in seconds
+        self.stats = {"requests": 0, "rate_limited": 0, "retries": 0}
+        self._last_decrease = 0.0
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _quota_wait(self, tokens: float) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def acquire(self, tokens: float = 0, priority: Optional[int] = None):
+        """
+        Block until the request may be sent: it is first in line, a concurrency slot is free and the quota allows it.
+
+        Args:
+            tokens (float): Estimated tokens of the request.
+            priority (int, optional): INTERACTIVE or BACKGROUND. Defaults to the priority of the current context.
+        """
+        ticket = (_priority.get() if priority is None else priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] == ticket and self.in_flight < max(int(self.limit), 1):
+                        wait = self._quota_wait(tokens)
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(tokens)
+            self.in_flight += 1
+            self.stats["requests"] += 1
+            self._condition.notify_all()
+
+    def release(self, latency: Optional[float] = None, rate_limited: bool = False, tokens: float = 0):
+        """
+        Free the slot of a finished request and adapt the concurrency limit.
+
+        Args:
+            latency (float, optional): Duration of a successful request, in seconds.
+            rate_limited (bool): The provider rate limited the request.
+            tokens (float): Tokens used beyond the estimate given to `acquire` (e.g. the generated text).
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if self.tokens is not None and tokens:
+                self.tokens.take(tokens)
+            if rate_limited:
+                self.stats["rate_limited"] += 1
+                self._decrease(0.5)
+            elif latency is not None:
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+                if self.config.target_latency and latency > self.config.target_latency:
+                    self._decrease(0.9)
+                else:
+                    self.limit = min(float(self.config.max_concurrency), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _decrease(self, factor: float):
+        """Multiplicative decrease, at most once per request latency so that a burst of failures of requests sent
+        together counts once."""
+        now = time.monotonic()
+        if now - self._last_decrease < (self.latency or 1.0):
+            return
+        self._last_decrease = now
+        self.limit = max(1.0, self.limit * factor)
+        logger.debug(f"Reduced provider concurrency to {self.limit:.1f}")
+
+    def _backoff(self, attempt: int, error: Exception):
+        self.stats["retries"] += 1
+        delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+        delay = max(delay, _retry_after(error) or 0.0)
+        logger.warning(f"Retrying provider request in {delay:.2f}s after: {error}")
+        time.sleep(delay)
+
+    def call(self, fn: Callable[[], Any], tokens: float = 0, output_tokens: Callable[[Any], float] = None):
+        """
+        Run a provider request under the scheduler, retrying it when it is rate limited or fails transiently.
+
+        Args:
+            fn (Callable[[], Any]): Sends the request.
+            tokens (float): Estimated tokens of the request.
+            output_tokens (Callable[[Any], float], optional): Estimates the tokens of the result.
+
+        Returns:
+            Any: The result of `fn`.
+        """
+        for attempt in itertools.count():
+            self.acquire(tokens)
+            start = time.monotonic()
+            try:
+                result = fn()
+            except Exception as e:
+                self.release(rate_limited=is_rate_limit_error(e))
+                if attempt >= self.config.max_retries or not is_retryable_error(e):
+                    raise
+                self._backoff(attempt, e)
+                continue
+            self.release(time.monotonic() - start, tokens=output_tokens(result) if output_tokens else 0)
+            return result
+
+    def stream(self, fn: Callable[[], Iterator[str]], tokens: float = 0) -> Iterator[str]:
+        """
+        Run a streaming provider request under the scheduler. The slot is held until the stream is consumed; the
+        request is retried only when it fails before its first chunk.
+
+        Args:
+            fn (Callable[[], Iterator[str]]): Starts the request and returns its text chunks.
+            tokens (float): Estimated tokens of the request.
+
+        Yields:
+            str: The text chunks.
+        """
+        for attempt in itertools.count():
+            self.acquire(tokens)
+            start = time.monotonic()
+            try:
+                chunks = iter(fn())
+                first = next(chunks, None)
+            except Exception as e:
+                self.release(rate_limited=is_rate_limit_error(e))
+                if attempt >= self.config.max_retries or not is_retryable_error(e):
+                    raise
+                self._backoff(attempt, e)
+                continue
+            break
+
+        generated = 0
+        completed = False
+        try:
+            if first is not None:
+                generated += len(first)
+                yield first
+                for chunk in chunks:
+                    generated += len(chunk)
+                    yield chunk
+            completed = True
+        finally:
+            latency = time.monotonic() - start if completed else None
+            self.release(latency, tokens=generated / CHARS_PER_TOKEN)
+
+
+def get_scheduler(key: Tuple, config: RateLimitConfig) -> RequestScheduler:
+    """
+    Return the process-wide scheduler for `key`, creating it with `config` on first use.
+
+    Args:
+        key (tuple): Kind ("llm" or "embedder"), provider and model.
+        config (RateLimitConfig): Settings of a new scheduler; an existing scheduler keeps its settings.
+
+    Returns:
+        RequestScheduler: Shared scheduler.
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            scheduler = _schedulers[key] = RequestScheduler(config)
+        return scheduler
+
+
+def clear_schedulers():
+    """Forget the shared schedulers."""
+    with _schedulers_lock:
+        _schedulers.clear()
+
+
+def _estimate_tokens(text: str) -> float:
+    return len(text) / CHARS_PER_TOKEN
+
+
+def _message_tokens(messages) -> float:
+    return sum(_estimate_tokens(str(message.get("content", ""))) for message in messages or [])
+
+
+def _response_tokens(response) -> float:
+    if isinstance(response, dict):
+        return _estimate_tokens(str(response.get("content") or "")) + _estimate_tokens(
+            str(response.get("tool_calls") or "")
+        )
+    return _estimate_tokens(str(response or ""))
+
+
+class RateLimitedLLM:
+    """Sends the requests of an LLM through a shared `RequestScheduler`. Other attributes are those of the LLM."""
+
+    def __init__(self, llm, scheduler: RequestScheduler):
+        self.llm = llm
+        self.scheduler = scheduler
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def generate_response(self, messages, **kwargs):
+        return self.scheduler.call(
+            lambda: self.llm.generate_response(messages=messages, **kwargs),
+            tokens=_message_tokens(messages),
+            output_tokens=_response_tokens,
+        )
+
+    def stream_response(self, messages, response_format=None) -> Iterator[str]:
+        return self.scheduler.stream(
+            lambda: self.llm.stream_response(messages=messages, response_format=response_format),
+            tokens=_message_tokens(messages),
+        )
+
+
+class RateLimitedEmbedding:
+    """Sends the requests of an embedding model through a shared `RequestScheduler`. Other attributes are those of
+    the embedding model."""
+
+    def __init__(self, embedder: EmbeddingBase, scheduler: RequestScheduler):
+        self.embedder = embedder
+        self.scheduler = scheduler
+
+    def __getattr__(self, name):
+        return getattr(self.embedder, name)
+
+    def embed(self, text, memory_action=None):
+        return self.scheduler.call(lambda: self.embedder.embed(text, memory_action), tokens=_estimate_tokens(text))
+
+    def embed_batch(self, texts, memory_action=None):
+        if type(self.embedder).embed_batch is EmbeddingBase.embed_batch:
+            # No batch endpoint: one request per text
+            return [self.embed(text, memory_action) for text in texts]
+        return self.scheduler.call(
+            lambda: self.embedder.embed_batch(texts, memory_action),
+            tokens=sum(_estimate_tokens(text) for text in texts),
+        )
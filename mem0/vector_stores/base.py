@@ -1,4 +1,8 @@
+import logging
 from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
 
 
 class VectorStoreBase(ABC):
@@ -56,3 +60,23 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    def get_search_param_grid(self, k: int) -> Dict[str, List[Any]]:
+        """Candidate values of each tunable search parameter for searches returning `k` results."""
+        return {}
+
+    def set_search_params(self, params: Dict[str, Any], strict: bool = True) -> None:
+        """Apply tuned search parameters, e.g. the output of `SearchParamTuner`.
+
+        Args:
+            params (dict): Search parameter values by attribute name.
+            strict (bool): Raise on unknown parameters. When False they are logged and skipped, so parameters
+                persisted by an older version do not prevent the store from loading.
+        """
+        for name, value in params.items():
+            if not hasattr(self, name):
+                if strict:
+                    raise ValueError(f"Unknown search parameter for {type(self).__name__}: {name}")
+                logger.warning(f"Skipping unknown search parameter for {type(self).__name__}: {name}")
+                continue
+            setattr(self, name, value)
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -13,6 +14,46 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Clients are shared per process so that several Memory instances on the same path or server reuse
+# one SQLite/HNSW handle instead of each loading the segments again.
+_client_registry: Dict[Tuple, Any] = {}
+_client_registry_lock = threading.Lock()
+
+
+def get_shared_client(host: Optional[str] = None, port: Optional[int] = None, path: Optional[str] = None):
+    """
+    Return the process-wide chromadb client for a server address or persistent path, creating it on first use.
+
+    Args:
+        host (str, optional): Host address for chromadb server. Defaults to None.
+        port (int, optional): Port for chromadb server. Defaults to None.
+        path (str, optional): Path for local chromadb database. Defaults to None.
+
+    Returns:
+        chromadb.Client: Shared client instance.
+    """
+    settings = Settings(anonymized_telemetry=False)
+
+    if host and port:
+        settings.chroma_server_host = host
+        settings.chroma_server_http_port = port
+        settings.chroma_api_impl = "chromadb.api.fastapi.FastAPI"
+        key = ("http", host, port)
+    else:
+        if path is None:
+            path = "db"
+        key = ("path", path)
+
+    settings.persist_directory = path
+    settings.is_persistent = True
+
+    with _client_registry_lock:
+        client = _client_registry.get(key)
+        if client is None:
+            client = chromadb.Client(settings)
+            _client_registry[key] = client
+        return client
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -42,23 +83,54 @@ class ChromaDB(VectorStoreBase):
         if client:
             self.client = client
         else:
-            self.settings = Settings(anonymized_telemetry=False)
+            self.client = get_shared_client(host=host, port=port, path=path)
 
-            if host and port:
-                self.settings.chroma_server_host = host
-                self.settings.chroma_server_http_port = port
-                self.settings.chroma_api_impl = "chromadb.api.fastapi.FastAPI"
-            else:
-                if path is None:
-                    path = "db"
+        self.collection_name = collection_name
+        self.collection = self.create_col(collection_name)
+        self.max_batch_size = self._get_max_batch_size()
 
-            self.settings.persist_directory = path
-            self.settings.is_persistent = True
+    def _get_max_batch_size(self) -> Optional[int]:
+        """
+        Get the largest number of records the client accepts in a single write.
 
-            self.client = chromadb.Client(self.settings)
+        Returns:
+            Optional[int]: Maximum batch size, or None if the client does not report one.
+        """
+        try:
+            max_batch_size = self.client.get_max_batch_size()
+        except Exception:
+            return None
+        return max_batch_size if isinstance(max_batch_size, int) and max_batch_size > 0 else None
+
+    @staticmethod
+    def _generate_where_clause(filters: Optional[Dict]) -> Optional[Dict]:
+        """
+        Translate mem0 filters into a Chroma `where` expression.
 
-        self.collection_name = collection_name
-        self.collection = self.create_col(collection_name)
+        Chroma only accepts a single key per expression, so multiple keys are combined with `$and`,
+        and list values are matched with `$in`.
+
+        Args:
+            filters (Optional[Dict]): Filters such as user_id, agent_id and run_id.
+
+        Returns:
+            Optional[Dict]: Chroma `where` expression, or None if there is nothing to filter on.
+        """
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            if key.startswith("$"):
+                conditions.append({key: value})
+            elif isinstance(value, (list, tuple, set)):
+                conditions.append({key: {"$in": list(value)}})
+            else:
+                conditions.append({key: value})
+
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
 
     def _parse_output(self, data: Dict) -> List[OutputData]:
         """
@@ -125,7 +197,17 @@ class ChromaDB(VectorStoreBase):
             ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        self.collection.add(ids=ids, embeddings=vectors, metadatas=payloads)
+        if not self.max_batch_size or len(vectors) <= self.max_batch_size:
+            self.collection.add(ids=ids, embeddings=vectors, metadatas=payloads)
+            return
+
+        for start in range(0, len(vectors), self.max_batch_size):
+            end = start + self.max_batch_size
+            self.collection.add(
+                ids=ids[start:end] if ids else None,
+                embeddings=vectors[start:end],
+                metadatas=payloads[start:end] if payloads else None,
+            )
 
     def search(
         self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
@@ -142,7 +224,8 @@ class ChromaDB(VectorStoreBase):
         Returns:
             List[OutputData]: Search results.
         """
-        results = self.collection.query(query_embeddings=vectors, where=filters, n_results=limit)
+        where = self._generate_where_clause(filters)
+        results = self.collection.query(query_embeddings=vectors, where=where, n_results=limit)
         final_results = self._parse_output(results)
         return final_results
 
@@ -219,7 +302,8 @@ class ChromaDB(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        results = self.collection.get(where=filters, limit=limit)
+        where = self._generate_where_clause(filters)
+        results = self.collection.get(where=where, limit=limit)
         return [self._parse_output(results)]
 
     def reset(self):
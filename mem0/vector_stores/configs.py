@@ -27,6 +27,7 @@ class VectorStoreConfig(BaseModel):
         "supabase": "SupabaseConfig",
         "weaviate": "WeaviateConfig",
         "faiss": "FAISSConfig",
+        "memmap": "MemmapConfig",
         "langchain": "LangchainConfig",
     }
 
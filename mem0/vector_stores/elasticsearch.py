@@ -41,6 +41,10 @@ class ElasticsearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.num_candidates = config.num_candidates
+        self.index_type = config.index_type
+        self.index_options = config.index_options or {}
+        self.list_page_size = config.list_page_size
 
         # Create index only if auto_create_index is True
         if config.auto_create_index:
@@ -63,6 +67,7 @@ class ElasticsearchDB(VectorStoreBase):
                         "dims": self.embedding_model_dims,
                         "index": True,
                         "similarity": "cosine",
+                        "index_options": {"type": self.index_type, **self.index_options},
                     },
                     "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
                 }
@@ -137,14 +142,15 @@ class ElasticsearchDB(VectorStoreBase):
         if self.custom_search_query:
             search_query = self.custom_search_query(vectors, limit, filters)
         else:
+            # num_candidates must lie in [k, 10000]
+            num_candidates = min(max(self.num_candidates or limit * 2, limit), 10000)
             search_query = {
-                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
+                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": num_candidates},
+                "size": limit,
+                "_source": {"excludes": ["vector"]},
             }
             if filters:
-                filter_conditions = []
-                for key, value in filters.items():
-                    filter_conditions.append({"term": {f"metadata.{key}": value}})
-                search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+                search_query["knn"]["filter"] = self._build_filter(filters)
 
         response = self.client.search(index=self.collection_name, body=search_query)
 
@@ -156,6 +162,17 @@ class ElasticsearchDB(VectorStoreBase):
 
         return results
 
+    def get_search_param_grid(self, k: int) -> Dict[str, List[Any]]:
+        """Candidate kNN pool sizes for searches returning `k` results."""
+        return {"num_candidates": sorted({min(k * factor, 10000) for factor in (1, 2, 4, 8, 16)})}
+
+    def _build_filter(self, filters: Dict) -> Dict:
+        """Translate mem0 filters into an Elasticsearch bool filter."""
+        filter_conditions = []
+        for key, value in filters.items():
+            filter_conditions.append({"term": {f"metadata.{key}": value}})
+        return {"bool": {"must": filter_conditions}}
+
     def delete(self, vector_id: str) -> None:
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
@@ -202,22 +219,26 @@ class ElasticsearchDB(VectorStoreBase):
         return self.client.indices.get(index=name)
 
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
-        """List all memories."""
-        query: Dict[str, Any] = {"query": {"match_all": {}}}
+        """List all memories.
 
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                filter_conditions.append({"term": {f"metadata.{key}": value}})
-            query["query"] = {"bool": {"must": filter_conditions}}
+        Requests larger than `list_page_size` are paged with `search_after` over a point in time, so
+        the result window limit does not apply and each response stays bounded.
+        """
+        query: Dict[str, Any] = {"query": {"match_all": {}}, "_source": {"excludes": ["vector"]}}
 
-        if limit:
-            query["size"] = limit
+        if filters:
+            query["query"] = self._build_filter(filters)
 
-        response = self.client.search(index=self.collection_name, body=query)
+        if limit and limit > self.list_page_size:
+            hits = self._search_after(query, limit)
+        else:
+            if limit:
+                query["size"] = limit
+            response = self.client.search(index=self.collection_name, body=query)
+            hits = response["hits"]["hits"]
 
         results = []
-        for hit in response["hits"]["hits"]:
+        for hit in hits:
             results.append(
                 OutputData(
                     id=hit["_id"],
@@ -228,6 +249,46 @@ class ElasticsearchDB(VectorStoreBase):
 
         return [results]
 
+    def _search_after(self, query: Dict[str, Any], limit: int) -> List[Dict]:
+        """Collect up to `limit` hits by paging through a point in time with search_after."""
+        pit_id = self.client.open_point_in_time(index=self.collection_name, keep_alive="1m")["id"]
+        hits: List[Dict] = []
+        search_after = None
+        try:
+            while len(hits) < limit:
+                body = {
+                    **query,
+                    "size": min(self.list_page_size, limit - len(hits)),
+                    "pit": {"id": pit_id, "keep_alive": "1m"},
+                    "sort": [{"_shard_doc": "asc"}],
+                }
+                if search_after is not None:
+                    body["search_after"] = search_after
+
+                response = self.client.search(body=body)
+                page = response["hits"]["hits"]
+                if not page:
+                    break
+                hits.extend(page)
+                pit_id = response.get("pit_id", pit_id)
+                search_after = page[-1]["sort"]
+        finally:
+            self.client.close_point_in_time(id=pit_id)
+        return hits
+
+    def delete_by_filters(self, filters: Dict) -> int:
+        """Delete every memory matching the filters in a single delete_by_query request.
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        if not filters:
+            raise ValueError("At least one filter is required to delete by filters.")
+        response = self.client.delete_by_query(
+            index=self.collection_name, body={"query": self._build_filter(filters)}, refresh=True
+        )
+        return response.get("deleted", 0)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -56,6 +56,8 @@ class FAISS(VectorStoreBase):
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
+        # Over-fetch factor for filtered searches, tunable with SearchParamTuner
+        self.fetch_k_multiplier = 2
 
         # Initialize storage structures
         self.index = None
@@ -244,7 +246,7 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(query_vectors)
 
-        fetch_k = limit * 2 if filters else limit
+        fetch_k = limit * self.fetch_k_multiplier if filters else limit
         scores, indices = self.index.search(query_vectors, fetch_k)
 
         results = self._parse_output(scores[0], indices[0], limit)
@@ -260,6 +262,10 @@ class FAISS(VectorStoreBase):
 
         return results
 
+    def get_search_param_grid(self, k: int) -> Dict[str, List]:
+        """Candidate over-fetch factors used before applying filters."""
+        return {"fetch_k_multiplier": [1, 2, 4, 8, 16]}
+
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
         Apply filters to a payload.
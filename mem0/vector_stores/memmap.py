@@ -0,0 +1,561 @@
+import glob
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+# Payload keys promoted to indexed SQLite columns so session-scoped filters never scan the payload JSON
+SESSION_COLUMNS = ("user_id", "agent_id", "run_id", "actor_id")
+
+INITIAL_CAPACITY = 1024
+
+
+class OutputData(BaseModel):
+    id: Optional[str]  # memory id
+    score: Optional[float]  # similarity (cosine, inner_product) or distance (euclidean)
+    payload: Optional[Dict]  # metadata
+
+
+class MemmapDB(VectorStoreBase):
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        embedding_model_dims: int = 1536,
+        distance_strategy: str = "cosine",
+        dtype: str = "float32",
+        block_size: int = 65536,
+        compaction_threshold: float = 0.25,
+    ):
+        """
+        Initialize the memory-mapped vector store.
+
+        Vectors live in an append-only float32/float16 matrix file that is memory-mapped, so opening a
+        collection does not load it and RAM stays bounded by the OS page cache. Payloads live in SQLite
+        with indexed session columns. Deleted rows are tombstoned and reclaimed by compaction.
+
+        Args:
+            collection_name (str): Name of the collection.
+            path (str, optional): Directory holding the collections. Defaults to "/tmp/memmap".
+            embedding_model_dims (int, optional): Dimension of the embedding vector. Defaults to 1536.
+            distance_strategy (str, optional): 'cosine', 'inner_product' or 'euclidean'. Defaults to "cosine".
+            dtype (str, optional): Storage type of the matrix, 'float32' or 'float16'. Defaults to "float32".
+            block_size (int, optional): Rows scored per matrix multiplication block. Defaults to 65536.
+            compaction_threshold (float, optional): Fraction of deleted rows that triggers compaction.
+                Defaults to 0.25.
+        """
+        self.path = path or "/tmp/memmap"
+        self.embedding_model_dims = embedding_model_dims
+        self.distance_strategy = distance_strategy
+        self.dtype = np.dtype(dtype)
+        self.block_size = block_size
+        self.compaction_threshold = compaction_threshold
+
+        self._lock = threading.RLock()
+        self.conn = None
+        self.matrix = None
+        self.tombstones = None
+
+        self.create_col(collection_name)
+
+    @property
+    def _collection_dir(self) -> str:
+        return os.path.join(self.path, self.collection_name)
+
+    def _matrix_path(self, generation: int) -> str:
+        return os.path.join(self._collection_dir, f"vectors.{generation}.bin")
+
+    def _tombstones_path(self, generation: int) -> str:
+        return os.path.join(self._collection_dir, f"tombstones.{generation}.bin")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def create_col(self, name: str, vector_size: Optional[int] = None, distance: Optional[str] = None):
+        """
+        Create a new collection, or open it if it already exists.
+
+        Args:
+            name (str): Name of the collection.
+            vector_size (int, optional): Dimension of the vectors. Defaults to the configured dimension.
+            distance (str, optional): Distance strategy. Defaults to the configured strategy.
+
+        Returns:
+            self: The MemmapDB instance.
+        """
+        with self._lock:
+            self.collection_name = name
+            if vector_size:
+                self.embedding_model_dims = vector_size
+            if distance:
+                self.distance_strategy = distance
+
+            os.makedirs(self._collection_dir, exist_ok=True)
+            self.conn = sqlite3.connect(os.path.join(self._collection_dir, "payloads.db"), check_same_thread=False)
+            self.conn.executescript(
+                f"""
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS vectors (
+                    id TEXT PRIMARY KEY,
+                    row INTEGER NOT NULL UNIQUE,
+                    {", ".join(f"{column} TEXT" for column in SESSION_COLUMNS)},
+                    payload TEXT NOT NULL
+                );
+                {"".join(f"CREATE INDEX IF NOT EXISTS idx_{column} ON vectors ({column});" for column in SESSION_COLUMNS)}
+                """
+            )
+
+            stored_dims = self._get_meta("dims")
+            if stored_dims is None:
+                self._set_meta("dims", self.embedding_model_dims)
+                self._set_meta("dtype", self.dtype.name)
+                self._set_meta("distance", self.distance_strategy)
+                self._set_meta("num_rows", 0)
+                self._set_meta("num_deleted", 0)
+                self._set_meta("generation", 0)
+                self.conn.commit()
+            else:
+                if int(stored_dims) != self.embedding_model_dims:
+                    raise ValueError(
+                        f"Collection {name} stores {stored_dims}-dimensional vectors, "
+                        f"got embedding_model_dims={self.embedding_model_dims}"
+                    )
+                self.dtype = np.dtype(self._get_meta("dtype"))
+                self.distance_strategy = self._get_meta("distance")
+
+            self.num_rows = int(self._get_meta("num_rows"))
+            self.num_deleted = int(self._get_meta("num_deleted"))
+            self.generation = int(self._get_meta("generation"))
+            self._open_arrays()
+            self._remove_stale_generations()
+        return self
+
+    def _open_arrays(self, min_capacity: int = INITIAL_CAPACITY) -> None:
+        """Memory-map the vector matrix and tombstones of the current generation, growing them to `min_capacity`."""
+        row_bytes = self.embedding_model_dims * self.dtype.itemsize
+        matrix_path = self._matrix_path(self.generation)
+        tombstones_path = self._tombstones_path(self.generation)
+
+        capacity = os.path.getsize(matrix_path) // row_bytes if os.path.exists(matrix_path) else 0
+        if capacity < min_capacity:
+            capacity = max(min_capacity, capacity * 2, INITIAL_CAPACITY)
+            for file_path, size in ((matrix_path, capacity * row_bytes), (tombstones_path, capacity)):
+                with open(file_path, "ab") as f:
+                    f.truncate(size)
+
+        self.capacity = capacity
+        self.matrix = np.memmap(matrix_path, dtype=self.dtype, mode="r+", shape=(capacity, self.embedding_model_dims))
+        self.tombstones = np.memmap(tombstones_path, dtype=np.uint8, mode="r+", shape=(capacity,))
+
+    def _close_arrays(self) -> None:
+        for array in (self.matrix, self.tombstones):
+            if array is not None:
+                array.flush()
+        self.matrix = None
+        self.tombstones = None
+
+    def _remove_stale_generations(self) -> None:
+        current = {self._matrix_path(self.generation), self._tombstones_path(self.generation)}
+        for pattern in ("vectors.*.bin", "tombstones.*.bin"):
+            for file_path in glob.glob(os.path.join(self._collection_dir, pattern)):
+                if file_path not in current:
+                    os.remove(file_path)
+
+    def _prepare_vectors(self, vectors) -> np.ndarray:
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        if array.shape[1] != self.embedding_model_dims:
+            raise ValueError(f"Expected vectors of dimension {self.embedding_model_dims}, got {array.shape[1]}")
+        if self.distance_strategy == "cosine":
+            array = array / np.maximum(np.linalg.norm(array, axis=1, keepdims=True), 1e-12)
+        return array
+
+    @staticmethod
+    def _session_values(payload: Dict) -> List[Optional[str]]:
+        return [None if payload.get(column) is None else str(payload[column]) for column in SESSION_COLUMNS]
+
+    def insert(
+        self,
+        vectors: List[list],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+    ):
+        """
+        Append vectors to the collection.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (Optional[List[Dict]], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if ids is None:
+            raise ValueError("IDs are required to insert into a memmap collection")
+        if payloads is None:
+            payloads = [{} for _ in range(len(vectors))]
+        if len(vectors) != len(ids) or len(vectors) != len(payloads):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+        if not ids:
+            return
+
+        array = self._prepare_vectors(vectors)
+
+        with self._lock:
+            start = self.num_rows
+            end = start + len(ids)
+            if end > self.capacity:
+                self._close_arrays()
+                self._open_arrays(min_capacity=end)
+
+            self.matrix[start:end] = array.astype(self.dtype)
+            self.tombstones[start:end] = 0
+            self.matrix.flush()
+
+            # Re-inserting an existing id replaces it, so its old row becomes a tombstone
+            replaced = self._rows_for_ids(ids)
+            self.conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO vectors (id, row, {", ".join(SESSION_COLUMNS)}, payload)
+                VALUES (?, ?, {", ".join("?" for _ in SESSION_COLUMNS)}, ?)
+                """,
+                [
+                    (str(vector_id), start + i, *self._session_values(payload), json.dumps(payload))
+                    for i, (vector_id, payload) in enumerate(zip(ids, payloads))
+                ],
+            )
+            self.num_rows = end
+            self.num_deleted += len(replaced)
+            self._set_meta("num_rows", self.num_rows)
+            self._set_meta("num_deleted", self.num_deleted)
+            self.conn.commit()
+
+            if replaced:
+                self.tombstones[replaced] = 1
+                self.tombstones.flush()
+
+        logger.info(f"Inserted {len(ids)} vectors into collection {self.collection_name}")
+
+    def _rows_for_ids(self, ids: List[str]) -> List[int]:
+        rows = []
+        for start in range(0, len(ids), 500):
+            chunk = [str(vector_id) for vector_id in ids[start : start + 500]]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows.extend(
+                row for (row,) in self.conn.execute(f"SELECT row FROM vectors WHERE id IN ({placeholders})", chunk)
+            )
+        return rows
+
+    def _where_clause(self, filters: Optional[Dict]):
+        """
+        Translate mem0 filters into a SQL WHERE clause over the payload table.
+
+        Returns:
+            tuple: (clause, params). The clause is empty if there is nothing to filter on.
+        """
+        if not filters:
+            return "", []
+
+        conditions = []
+        params = []
+        for key, value in filters.items():
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if key in SESSION_COLUMNS:
+                column = key
+                values = [str(v) for v in values]
+            else:
+                column = "json_extract(payload, ?)"
+                params.append(f'$."{key}"')
+
+            if len(values) == 1:
+                conditions.append(f"{column} = ?")
+            else:
+                conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+
+        return "WHERE " + " AND ".join(conditions), params
+
+    def _filter_rows(self, filters: Dict) -> np.ndarray:
+        clause, params = self._where_clause(filters)
+        rows = self.conn.execute(f"SELECT row FROM vectors {clause} ORDER BY row", params).fetchall()
+        return np.fromiter((row for (row,) in rows), dtype=np.int64, count=len(rows))
+
+    def _score(self, block: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Higher is better for every distance strategy; euclidean uses the negated squared distance."""
+        block = block.astype(np.float32, copy=False)
+        if self.distance_strategy == "euclidean":
+            return 2 * (block @ query) - np.einsum("ij,ij->i", block, block) - query @ query
+        return block @ query
+
+    def search(
+        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Search for similar vectors with blocked matrix multiplication over the memory-mapped matrix.
+
+        Filters are resolved in SQLite first, so scoped searches only read the matching rows.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[list]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results.
+        """
+        query_vector = self._prepare_vectors(vectors)[0]
+
+        with self._lock:
+            if filters:
+                rows = self._filter_rows(filters)
+                blocks = (rows[i : i + self.block_size] for i in range(0, len(rows), self.block_size))
+            else:
+                blocks = (
+                    np.arange(i, min(i + self.block_size, self.num_rows))
+                    for i in range(0, self.num_rows, self.block_size)
+                )
+
+            best_scores = np.empty(0, dtype=np.float32)
+            best_rows = np.empty(0, dtype=np.int64)
+            for block_rows in blocks:
+                if filters:
+                    block = self.matrix[block_rows]
+                else:
+                    block = self.matrix[block_rows[0] : block_rows[-1] + 1]
+                scores = self._score(block, query_vector)
+                if not filters:
+                    scores[self.tombstones[block_rows[0] : block_rows[-1] + 1] == 1] = -np.inf
+
+                best_scores = np.concatenate([best_scores, scores])
+                best_rows = np.concatenate([best_rows, block_rows])
+                if len(best_scores) > limit:
+                    top = np.argpartition(-best_scores, limit - 1)[:limit]
+                    best_scores, best_rows = best_scores[top], best_rows[top]
+
+            order = np.argsort(-best_scores)
+            best_scores, best_rows = best_scores[order], best_rows[order]
+            keep = np.isfinite(best_scores)
+            best_scores, best_rows = best_scores[keep], best_rows[keep]
+            if not len(best_rows):
+                return []
+
+            placeholders = ", ".join("?" for _ in best_rows)
+            payloads = {
+                row: (vector_id, payload)
+                for row, vector_id, payload in self.conn.execute(
+                    f"SELECT row, id, payload FROM vectors WHERE row IN ({placeholders})", [int(r) for r in best_rows]
+                )
+            }
+
+        results = []
+        for row, score in zip(best_rows, best_scores):
+            if int(row) not in payloads:
+                continue
+            vector_id, payload = payloads[int(row)]
+            if self.distance_strategy == "euclidean":
+                score = float(np.sqrt(max(-score, 0.0)))
+            results.append(OutputData(id=vector_id, score=float(score), payload=json.loads(payload)))
+        return results
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID. The row is tombstoned and reclaimed by the next compaction.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT row FROM vectors WHERE id = ?", (str(vector_id),)).fetchone()
+            if row is None:
+                logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
+                return
+
+            self.conn.execute("DELETE FROM vectors WHERE id = ?", (str(vector_id),))
+            self.num_deleted += 1
+            self._set_meta("num_deleted", self.num_deleted)
+            self.conn.commit()
+            self.tombstones[row[0]] = 1
+            self.tombstones.flush()
+
+            if self.num_rows and self.num_deleted / self.num_rows >= self.compaction_threshold:
+                self.compact()
+
+    def update(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[Dict] = None,
+    ):
+        """
+        Update a vector in place and/or replace its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (Optional[List[float]], optional): Updated vector. Defaults to None.
+            payload (Optional[Dict], optional): Updated payload. Defaults to None.
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT row FROM vectors WHERE id = ?", (str(vector_id),)).fetchone()
+            if row is None:
+                raise ValueError(f"Vector {vector_id} not found")
+
+            if vector is not None:
+                self.matrix[row[0]] = self._prepare_vectors(vector)[0].astype(self.dtype)
+                self.matrix.flush()
+
+            if payload is not None:
+                self.conn.execute(
+                    f"""
+                    UPDATE vectors SET {", ".join(f"{column} = ?" for column in SESSION_COLUMNS)}, payload = ?
+                    WHERE id = ?
+                    """,
+                    (*self._session_values(payload), json.dumps(payload), str(vector_id)),
+                )
+                self.conn.commit()
+
+    def get(self, vector_id: str) -> Optional[OutputData]:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector.
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT payload FROM vectors WHERE id = ?", (str(vector_id),)).fetchone()
+        if row is None:
+            return None
+        return OutputData(id=str(vector_id), score=None, payload=json.loads(row[0]))
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            name for name in os.listdir(self.path) if os.path.exists(os.path.join(self.path, name, "payloads.db"))
+        )
+
+    def delete_col(self):
+        """
+        Delete a collection.
+        """
+        with self._lock:
+            self._close_arrays()
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+            shutil.rmtree(self._collection_dir, ignore_errors=True)
+            logger.info(f"Deleted collection {self.collection_name}")
+
+    def col_info(self) -> Dict:
+        """
+        Get information about a collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        return {
+            "name": self.collection_name,
+            "count": self.num_rows - self.num_deleted,
+            "deleted": self.num_deleted,
+            "dimension": self.embedding_model_dims,
+            "distance": self.distance_strategy,
+            "dtype": self.dtype.name,
+        }
+
+    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+        """
+        List all vectors in a collection.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[OutputData]: List of vectors.
+        """
+        clause, params = self._where_clause(filters)
+        limit_clause = "LIMIT ?" if limit else ""
+        if limit:
+            params = [*params, limit]
+
+        with self._lock:
+            rows = self.conn.execute(f"SELECT id, payload FROM vectors {clause} ORDER BY row {limit_clause}", params)
+            results = [OutputData(id=vector_id, score=None, payload=json.loads(payload)) for vector_id, payload in rows]
+        return [results]
+
+    def compact(self):
+        """
+        Rewrite the live rows into a new matrix generation and drop the tombstoned ones.
+
+        The new generation only becomes current when the SQLite transaction that renumbers the rows commits,
+        so an interrupted compaction leaves the previous generation intact.
+        """
+        with self._lock:
+            live = self.conn.execute("SELECT id, row FROM vectors ORDER BY row").fetchall()
+            generation = self.generation + 1
+            capacity = max(INITIAL_CAPACITY, len(live))
+            row_bytes = self.embedding_model_dims * self.dtype.itemsize
+
+            for file_path, size in (
+                (self._matrix_path(generation), capacity * row_bytes),
+                (self._tombstones_path(generation), capacity),
+            ):
+                with open(file_path, "wb") as f:
+                    f.truncate(size)
+
+            matrix = np.memmap(
+                self._matrix_path(generation), dtype=self.dtype, mode="r+", shape=(capacity, self.embedding_model_dims)
+            )
+            old_rows = np.fromiter((row for _, row in live), dtype=np.int64, count=len(live))
+            for start in range(0, len(old_rows), self.block_size):
+                chunk = old_rows[start : start + self.block_size]
+                matrix[start : start + len(chunk)] = self.matrix[chunk]
+            matrix.flush()
+            del matrix
+
+            # Rows only move down and are renumbered in ascending order, so the UNIQUE(row) constraint holds
+            self.conn.executemany(
+                "UPDATE vectors SET row = ? WHERE id = ?",
+                [(new_row, vector_id) for new_row, (vector_id, _) in enumerate(live)],
+            )
+            self._set_meta("num_rows", len(live))
+            self._set_meta("num_deleted", 0)
+            self._set_meta("generation", generation)
+            self.conn.commit()
+
+            self._close_arrays()
+            self.generation = generation
+            self.num_rows = len(live)
+            self.num_deleted = 0
+            self._open_arrays()
+            self._remove_stale_generations()
+            logger.info(f"Compacted collection {self.collection_name} to {self.num_rows} rows")
+
+    def reset(self):
+        """Reset the collection by deleting and recreating it."""
+        logger.warning(f"Resetting collection {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name)
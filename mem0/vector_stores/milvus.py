@@ -1,5 +1,6 @@
+import json
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -15,6 +16,8 @@ from pymilvus import CollectionSchema, DataType, FieldSchema, MilvusClient
 
 logger = logging.getLogger(__name__)
 
+PARTITION_KEY_FIELD = "user_id"
+
 
 class OutputData(BaseModel):
     id: Optional[str]  # memory id
@@ -30,6 +33,12 @@ class MilvusDB(VectorStoreBase):
         collection_name: str,
         embedding_model_dims: int,
         metric_type: MetricType,
+        index_type: str = "AUTOINDEX",
+        index_params: Optional[Dict[str, Any]] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+        enable_partition_key: bool = True,
+        num_partitions: Optional[int] = None,
+        json_index_keys: Optional[List[str]] = None,
     ) -> None:
         """Initialize the MilvusDB database.
 
@@ -39,16 +48,29 @@ class MilvusDB(VectorStoreBase):
             collection_name (str): Name of the collection (defaults to mem0).
             embedding_model_dims (int): Dimensions of the embedding model (defaults to 1536).
             metric_type (MetricType): Metric type for similarity search (defaults to L2).
+            index_type (str, optional): Vector index type (defaults to AUTOINDEX).
+            index_params (Dict, optional): Build parameters for the vector index. Defaults to None.
+            search_params (Dict, optional): Search parameters such as ef/nprobe. Defaults to None.
+            enable_partition_key (bool, optional): Use user_id as partition key. Defaults to True.
+            num_partitions (int, optional): Number of partitions for the partition key. Defaults to None.
+            json_index_keys (List[str], optional): Metadata keys to index by JSON path. Defaults to None.
         """
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.metric_type = metric_type
+        self.index_type = index_type
+        self.index_params = index_params or {}
+        self.search_params = search_params or {}
+        self.enable_partition_key = enable_partition_key
+        self.num_partitions = num_partitions
+        self.json_index_keys = json_index_keys or []
         self.client = MilvusClient(uri=url, token=token)
         self.create_col(
             collection_name=self.collection_name,
             vector_size=self.embedding_model_dims,
             metric_type=self.metric_type,
         )
+        self.has_partition_key = self._has_field(PARTITION_KEY_FIELD)
 
     def create_col(
         self,
@@ -56,7 +78,10 @@ class MilvusDB(VectorStoreBase):
         vector_size: str,
         metric_type: MetricType = MetricType.COSINE,
     ) -> None:
-        """Create a new collection with index_type AUTOINDEX.
+        """Create a new collection with the configured vector index.
+
+        When the partition key is enabled, `user_id` is declared as a partition key scalar field so that
+        searches scoped to one user only touch that user's partition.
 
         Args:
             collection_name (str): Name of the collection (defaults to mem0).
@@ -72,29 +97,103 @@ class MilvusDB(VectorStoreBase):
                 FieldSchema(name="vectors", dtype=DataType.FLOAT_VECTOR, dim=vector_size),
                 FieldSchema(name="metadata", dtype=DataType.JSON),
             ]
+            if self.enable_partition_key:
+                fields.append(
+                    FieldSchema(name=PARTITION_KEY_FIELD, dtype=DataType.VARCHAR, max_length=512, is_partition_key=True)
+                )
 
             schema = CollectionSchema(fields, enable_dynamic_field=True)
 
-            index = self.client.prepare_index_params(
-                field_name="vectors", metric_type=metric_type, index_type="AUTOINDEX", index_name="vector_index"
+            index = self.client.prepare_index_params()
+            index.add_index(
+                field_name="vectors",
+                index_type=self.index_type,
+                index_name="vector_index",
+                metric_type=metric_type,
+                params=self.index_params,
+            )
+            collection_kwargs = {}
+            if self.enable_partition_key and self.num_partitions:
+                collection_kwargs["num_partitions"] = self.num_partitions
+            self.client.create_collection(
+                collection_name=collection_name, schema=schema, index_params=index, **collection_kwargs
+            )
+            self._create_json_indexes(collection_name)
+
+    def _create_json_indexes(self, collection_name: str) -> None:
+        """Create JSON path indexes on the metadata keys used for filtering.
+
+        JSON path indexes require Milvus 2.5.11+, so failures are logged and filtering falls back to a scan.
+
+        Args:
+            collection_name (str): Name of the collection.
+        """
+        if not self.json_index_keys:
+            return
+
+        index = self.client.prepare_index_params()
+        for key in self.json_index_keys:
+            index.add_index(
+                field_name="metadata",
+                index_type="INVERTED",
+                index_name=f"metadata_{key}_index",
+                params={"json_path": f'metadata["{key}"]', "json_cast_type": "varchar"},
             )
-            self.client.create_collection(collection_name=collection_name, schema=schema, index_params=index)
+        try:
+            self.client.create_index(collection_name=collection_name, index_params=index)
+        except Exception as e:
+            logger.warning(f"Could not create JSON path indexes on {collection_name}: {e}")
+
+    def _has_field(self, field_name: str) -> bool:
+        """Check whether the collection schema declares a field.
+
+        Args:
+            field_name (str): Name of the field.
+
+        Returns:
+            bool: True if the field exists in the collection schema.
+        """
+        try:
+            description = self.client.describe_collection(collection_name=self.collection_name)
+        except Exception as e:
+            logger.warning(f"Could not describe collection {self.collection_name}: {e}")
+            return False
+        return any(field.get("name") == field_name for field in description.get("fields", []))
+
+    def _build_row(self, vector_id: str, vector: list, payload: Optional[Dict]) -> Dict:
+        """Build a row for the collection, promoting the partition key out of the metadata.
+
+        Args:
+            vector_id (str): ID of the vector.
+            vector (List[float]): Vector.
+            payload (Dict, optional): Payload of the vector.
+
+        Returns:
+            Dict: Row to insert.
+        """
+        row = {"id": vector_id, "vectors": vector, "metadata": payload}
+        if self.has_partition_key:
+            row[PARTITION_KEY_FIELD] = str((payload or {}).get(PARTITION_KEY_FIELD) or "")
+        return row
 
     def insert(self, ids, vectors, payloads, **kwargs: Optional[dict[str, any]]):
-        """Insert vectors into a collection.
+        """Insert vectors into a collection in a single request.
 
         Args:
             vectors (List[List[float]]): List of vectors to insert.
             payloads (List[Dict], optional): List of payloads corresponding to vectors.
             ids (List[str], optional): List of IDs corresponding to vectors.
         """
-        for idx, embedding, metadata in zip(ids, vectors, payloads):
-            data = {"id": idx, "vectors": embedding, "metadata": metadata}
+        data = [self._build_row(idx, embedding, metadata) for idx, embedding, metadata in zip(ids, vectors, payloads)]
+        if data:
             self.client.insert(collection_name=self.collection_name, data=data, **kwargs)
 
     def _create_filter(self, filters: dict):
         """Prepare filters for efficient query.
 
+        `user_id` is matched against the partition key field when the collection has one; every other key
+        is matched inside the metadata JSON field.
+
         Args:
             filters (dict): filters [user_id, agent_id, run_id]
 
@@ -103,10 +202,11 @@ class MilvusDB(VectorStoreBase):
         """
         operands = []
         for key, value in filters.items():
+            field = key if key == PARTITION_KEY_FIELD and self.has_partition_key else f'metadata["{key}"]'
             if isinstance(value, str):
-                operands.append(f'(metadata["{key}"] == "{value}")')
+                operands.append(f"({field} == {json.dumps(value)})")
             else:
-                operands.append(f'(metadata["{key}"] == {value})')
+                operands.append(f"({field} == {value})")
 
         return " and ".join(operands)
 
@@ -153,11 +253,27 @@ class MilvusDB(VectorStoreBase):
             data=[vectors],
             limit=limit,
             filter=query_filter,
-            output_fields=["*"],
+            output_fields=["metadata"],
+            search_params={"params": self.search_params} if self.search_params else None,
         )
         result = self._parse_output(data=hits[0])
         return result
 
+    def get_search_param_grid(self, k: int) -> Dict[str, List[Any]]:
+        """Candidate search parameters of the configured index type for searches returning `k` results."""
+        index_type = str(self.index_type).upper()
+        if index_type == "HNSW":
+            return {"ef": [k * factor for factor in (1, 2, 4, 8, 16)]}
+        if index_type.startswith("IVF"):
+            return {"nprobe": [1, 2, 4, 8, 16, 32, 64]}
+        if index_type == "DISKANN":
+            return {"search_list": [k * factor for factor in (1, 2, 4, 8, 16)]}
+        return {}
+
+    def set_search_params(self, params: Dict[str, Any], strict: bool = True) -> None:
+        """Apply tuned search parameters such as ef/nprobe to every subsequent search."""
+        self.search_params = {**self.search_params, **params}
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -176,7 +292,7 @@ class MilvusDB(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        schema = {"id": vector_id, "vectors": vector, "metadata": payload}
+        schema = self._build_row(vector_id, vector, payload)
         self.client.upsert(collection_name=self.collection_name, data=schema)
 
     def get(self, vector_id):
@@ -231,7 +347,9 @@ class MilvusDB(VectorStoreBase):
             List[OutputData]: List of vectors.
         """
         query_filter = self._create_filter(filters) if filters else None
-        result = self.client.query(collection_name=self.collection_name, filter=query_filter, limit=limit)
+        result = self.client.query(
+            collection_name=self.collection_name, filter=query_filter, limit=limit, output_fields=["id", "metadata"]
+        )
         memories = []
         for data in result:
             obj = OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
@@ -243,3 +361,4 @@ class MilvusDB(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col(self.collection_name, self.embedding_model_dims, self.metric_type)
+        self.has_partition_key = self._has_field(PARTITION_KEY_FIELD)
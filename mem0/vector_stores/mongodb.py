@@ -40,6 +40,7 @@ class MongoDB(VectorStoreBase):
         self.embedding_model_dims = embedding_model_dims
         self.db_name = db_name
 
+        self.num_candidates = None  # kNN candidate pool, tunable with SearchParamTuner
         self.client = MongoClient(mongo_uri)
         self.db = self.client[db_name]
         self.collection = self.create_col()
@@ -140,7 +141,7 @@ class MongoDB(VectorStoreBase):
                     "$vectorSearch": {
                         "index": self.index_name,
                         "limit": limit,
-                        "numCandidates": limit,
+                        "numCandidates": min(max(self.num_candidates or limit, limit), 10000),
                         "queryVector": query_vector,
                         "path": "embedding",
                     }
@@ -157,6 +158,10 @@ class MongoDB(VectorStoreBase):
         output = [OutputData(id=str(doc["_id"]), score=doc.get("score"), payload=doc.get("payload")) for doc in results]
         return output
 
+    def get_search_param_grid(self, k: int) -> Dict[str, List[Any]]:
+        """Candidate numCandidates values for searches returning `k` results."""
+        return {"num_candidates": sorted({min(k * factor, 10000) for factor in (1, 2, 4, 8, 16)})}
+
     def delete(self, vector_id: str) -> None:
         """
         Delete a vector by ID.
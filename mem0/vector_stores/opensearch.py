@@ -39,8 +39,38 @@ class OpenSearchDB(VectorStoreBase):
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.engine = config.engine
+        self.space_type = config.space_type
+        self.ef_construction = config.ef_construction
+        self.m = config.m
+        self.ef_search = config.ef_search
+        self.encoder = config.encoder
+        self.num_candidates = config.num_candidates
+        self.list_page_size = config.list_page_size
         self.create_col(self.collection_name, self.embedding_model_dims)
 
+    def _knn_method(self) -> Dict[str, Any]:
+        """Build the k-NN method definition for the vector field from the configured HNSW options."""
+        parameters: Dict[str, Any] = {}
+        if self.ef_construction is not None:
+            parameters["ef_construction"] = self.ef_construction
+        if self.m is not None:
+            parameters["m"] = self.m
+        if self.encoder:
+            parameters["encoder"] = self.encoder
+
+        method = {"engine": self.engine, "name": "hnsw", "space_type": self.space_type}
+        if parameters:
+            method["parameters"] = parameters
+        return method
+
+    def _index_settings(self) -> Dict[str, Any]:
+        """Index settings enabling k-NN, with ef_search applied at the index level for nmslib."""
+        settings: Dict[str, Any] = {"index.knn": True}
+        if self.ef_search is not None and self.engine == "nmslib":
+            settings["index.knn.algo_param.ef_search"] = self.ef_search
+        return settings
+
     def create_index(self) -> None:
         """Create OpenSearch index with proper mappings if it doesn't exist."""
         index_settings = {
@@ -53,12 +83,14 @@ class OpenSearchDB(VectorStoreBase):
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": self.embedding_model_dims,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self._knn_method(),
                     },
                     "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
                 }
             },
         }
+        if self.ef_search is not None and self.engine == "nmslib":
+            index_settings["settings"]["index"]["knn.algo_param.ef_search"] = self.ef_search
 
         if not self.client.indices.exists(index=self.collection_name):
             self.client.indices.create(index=self.collection_name, body=index_settings)
@@ -69,13 +101,13 @@ class OpenSearchDB(VectorStoreBase):
     def create_col(self, name: str, vector_size: int) -> None:
         """Create a new collection (index in OpenSearch)."""
         index_settings = {
-            "settings": {"index.knn": True},
+            "settings": self._index_settings(),
             "mappings": {
                 "properties": {
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": vector_size,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self._knn_method(),
                     },
                     "payload": {"type": "object"},
                     "id": {"type": "keyword"},
@@ -135,21 +167,19 @@ class OpenSearchDB(VectorStoreBase):
             "knn": {
                 "vector_field": {
                     "vector": vectors,
-                    "k": limit * 2,
+                    "k": max(self.num_candidates or limit * 2, limit),
                 }
             }
         }
+        # faiss and lucene engines accept ef_search per query; nmslib reads it from the index settings
+        if self.ef_search is not None and self.engine != "nmslib":
+            knn_query["knn"]["vector_field"]["method_parameters"] = {"ef_search": self.ef_search}
 
-        # Start building the full query
-        query_body = {"size": limit * 2, "query": None}
+        # Start building the full query, leaving the vector out of the returned documents
+        query_body = {"size": limit, "query": None, "_source": {"excludes": ["vector_field"]}}
 
         # Prepare filter conditions if applicable
-        filter_clauses = []
-        if filters:
-            for key in ["user_id", "run_id", "agent_id"]:
-                value = filters.get(key)
-                if value:
-                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        filter_clauses = self._build_filter_clauses(filters)
 
         # Combine knn with filters if needed
         if filter_clauses:
@@ -167,6 +197,23 @@ class OpenSearchDB(VectorStoreBase):
         ]
         return results
 
+    def get_search_param_grid(self, k: int) -> Dict[str, List[Any]]:
+        """Candidate k (and ef_search where the engine accepts it per query) for searches returning `k` results."""
+        grid = {"num_candidates": [k * factor for factor in (1, 2, 4, 8, 16)]}
+        if self.engine != "nmslib":
+            grid["ef_search"] = [k * factor for factor in (1, 2, 4, 8, 16)]
+        return grid
+
+    def _build_filter_clauses(self, filters: Optional[Dict]) -> List[Dict]:
+        """Translate the session filters into term clauses."""
+        filter_clauses = []
+        if filters:
+            for key in ["user_id", "run_id", "agent_id"]:
+                value = filters.get(key)
+                if value:
+                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        return filter_clauses
+
     def delete(self, vector_id: str) -> None:
         """Delete a vector by custom ID."""
         # First, find the document by custom ID
@@ -246,24 +293,23 @@ class OpenSearchDB(VectorStoreBase):
 
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
         try:
-            """List all memories with optional filters."""
-            query: Dict = {"query": {"match_all": {}}}
+            """List all memories with optional filters.
 
-            filter_clauses = []
-            if filters:
-                for key in ["user_id", "run_id", "agent_id"]:
-                    value = filters.get(key)
-                    if value:
-                        filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+            Requests larger than `list_page_size` are paged with `search_after` sorted on the `id` keyword.
+            """
+            query: Dict = {"query": {"match_all": {}}, "_source": {"excludes": ["vector_field"]}}
 
+            filter_clauses = self._build_filter_clauses(filters)
             if filter_clauses:
                 query["query"] = {"bool": {"filter": filter_clauses}}
 
-            if limit:
-                query["size"] = limit
-
-            response = self.client.search(index=self.collection_name, body=query)
-            hits = response["hits"]["hits"]
+            if limit and limit > self.list_page_size:
+                hits = self._search_after(query, limit)
+            else:
+                if limit:
+                    query["size"] = limit
+                response = self.client.search(index=self.collection_name, body=query)
+                hits = response["hits"]["hits"]
 
             return [
                 [
@@ -274,6 +320,37 @@ class OpenSearchDB(VectorStoreBase):
         except Exception:
             return []
 
+    def _search_after(self, query: Dict[str, Any], limit: int) -> List[Dict]:
+        """Collect up to `limit` hits by paging with search_after on the `id` keyword."""
+        hits: List[Dict] = []
+        search_after = None
+        while len(hits) < limit:
+            body = {**query, "size": min(self.list_page_size, limit - len(hits)), "sort": [{"id": "asc"}]}
+            if search_after is not None:
+                body["search_after"] = search_after
+
+            response = self.client.search(index=self.collection_name, body=body)
+            page = response["hits"]["hits"]
+            if not page:
+                break
+            hits.extend(page)
+            search_after = page[-1]["sort"]
+        return hits
+
+    def delete_by_filters(self, filters: Dict) -> int:
+        """Delete every memory matching the filters in a single delete_by_query request.
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        filter_clauses = self._build_filter_clauses(filters)
+        if not filter_clauses:
+            raise ValueError("At least one of 'user_id', 'agent_id' or 'run_id' is required to delete by filters.")
+        response = self.client.delete_by_query(
+            index=self.collection_name, body={"query": {"bool": {"filter": filter_clauses}}}, refresh=True
+        )
+        return response.get("deleted", 0)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -52,6 +52,7 @@ class PGVector(VectorStoreBase):
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        self.ef_search = None  # hnsw.ef_search for this session, tunable with SearchParamTuner
 
         self.conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
         self.cur = self.conn.cursor()
@@ -159,6 +160,18 @@ class PGVector(VectorStoreBase):
         results = self.cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
+    def get_search_param_grid(self, k):
+        """Candidate hnsw.ef_search values for searches returning `k` results."""
+        if not self.use_hnsw:
+            return {}
+        return {"ef_search": sorted({min(max(k * factor, 10), 1000) for factor in (1, 2, 4, 8, 16)})}
+
+    def set_search_params(self, params, strict=True):
+        """Apply tuned search parameters to the current session."""
+        super().set_search_params(params, strict=strict)
+        if self.ef_search is not None:
+            self.cur.execute("SET hnsw.ef_search = %s", (int(self.ef_search),))
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
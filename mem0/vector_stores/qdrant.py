@@ -11,6 +11,7 @@ from qdrant_client.models import (
     PointIdsList,
     PointStruct,
     Range,
+    SearchParams,
     VectorParams,
 )
 
@@ -68,6 +69,7 @@ class Qdrant(VectorStoreBase):
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.hnsw_ef = None  # HNSW ef at query time, tunable with SearchParamTuner
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -143,14 +145,20 @@ class Qdrant(VectorStoreBase):
             list: Search results.
         """
         query_filter = self._create_filter(filters) if filters else None
+        search_kwargs = {"search_params": SearchParams(hnsw_ef=self.hnsw_ef)} if self.hnsw_ef else {}
         hits = self.client.query_points(
             collection_name=self.collection_name,
             query=vectors,
             query_filter=query_filter,
             limit=limit,
+            **search_kwargs,
         )
         return hits.points
 
+    def get_search_param_grid(self, k: int) -> dict:
+        """Candidate HNSW ef values for searches returning `k` results."""
+        return {"hnsw_ef": [k * factor for factor in (1, 2, 4, 8, 16)]}
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -0,0 +1,312 @@
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.memory.setup import mem0_dir
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_PARAMS_PATH = os.path.join(mem0_dir, "search_params.json")
+
+_search_params_lock = threading.Lock()
+
+# Vector store config fields that tell deployments apart, so the same collection name on different servers or
+# local paths is tuned separately
+_DEPLOYMENT_FIELDS = (
+    "url",
+    "host",
+    "port",
+    "path",
+    "cluster_url",
+    "cloud_id",
+    "connection_string",
+    "mongo_uri",
+    "redis_url",
+    "endpoint",
+    "vector_search_api_endpoint",
+    "endpoint_id",
+    "account",
+    "project_id",
+    "region",
+    "dbname",
+    "db_name",
+    "database_name",
+)
+
+
+class TuningTrial(BaseModel):
+    params: Dict[str, Any]
+    recall: float
+    latency_ms: float
+
+
+class TuningResult(BaseModel):
+    params: Dict[str, Any]  # selected search parameters
+    recall: float  # mean recall@k of the selected parameters
+    latency_ms: float  # median search latency of the selected parameters
+    target_met: bool  # whether the selected parameters reach the recall target
+    trials: List[TuningTrial]
+
+
+def _search_params_key(provider: str, collection_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """`provider:deployment:collection_name`, where the deployment is a hash of the location fields of `config`
+    (hashed because connection strings may hold credentials)."""
+    if config is not None and not isinstance(config, dict):
+        config = config.model_dump()
+    location = {field: (config or {}).get(field) for field in _DEPLOYMENT_FIELDS}
+    location = {field: str(value) for field, value in location.items() if value is not None}
+    deployment = hashlib.sha256(json.dumps(location, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return f"{provider}:{deployment}:{collection_name}"
+
+
+def load_search_params(
+    provider: str,
+    collection_name: Optional[str],
+    path: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load persisted search parameters for a vector store collection.
+
+    Args:
+        provider (str): Vector store provider name, e.g. "qdrant".
+        collection_name (str, optional): Collection name.
+        path (str, optional): Path of the JSON file holding tuned parameters. Defaults to ~/.mem0/search_params.json.
+        config (dict, optional): Vector store config; its host, URL or path identify the deployment.
+
+    Returns:
+        Optional[Dict[str, Any]]: Tuned parameters, or None if the collection was never tuned.
+    """
+    path = path or DEFAULT_SEARCH_PARAMS_PATH
+    if not collection_name or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r") as f:
+            stored = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read tuned search parameters from {path}: {e}")
+        return None
+
+    return stored.get(_search_params_key(provider, collection_name, config))
+
+
+def save_search_params(
+    provider: str,
+    collection_name: str,
+    params: Dict[str, Any],
+    path: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+):
+    """
+    Persist search parameters for a vector store collection.
+
+    Args:
+        provider (str): Vector store provider name, e.g. "qdrant".
+        collection_name (str): Collection name.
+        params (Dict[str, Any]): Search parameters to persist.
+        path (str, optional): Path of the JSON file holding tuned parameters. Defaults to ~/.mem0/search_params.json.
+        config (dict, optional): Vector store config; its host, URL or path identify the deployment.
+    """
+    path = path or DEFAULT_SEARCH_PARAMS_PATH
+    with _search_params_lock:
+        stored = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                stored = {}
+
+        stored[_search_params_key(provider, collection_name, config)] = params
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(stored, f, indent=4)
+
+
+def _matches(payload: Optional[Dict], filters: Optional[Dict]) -> bool:
+    if not filters:
+        return True
+    payload = payload or {}
+    return all(payload.get(key) == value for key, value in filters.items())
+
+
+class SearchParamTuner:
+    """
+    Picks the cheapest ANN search parameters of a vector store that reach a recall target.
+
+    Queries are sampled from the collection itself and held out of their own results. Each candidate setting
+    from `vector_store.get_search_param_grid(k)` is scored by recall@k against an exact brute-force top-k
+    computed with NumPy over the exported vectors, and by median search latency.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStoreBase,
+        recall_target: float = 0.95,
+        k: int = 10,
+        num_queries: int = 50,
+        metric: str = "cosine",
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the tuner.
+
+        Args:
+            vector_store (VectorStoreBase): Vector store to tune.
+            recall_target (float, optional): Minimum mean recall@k. Defaults to 0.95.
+            k (int, optional): Number of neighbours to evaluate, usually the search limit. Defaults to 10.
+            num_queries (int, optional): Number of held-out queries sampled from the collection. Defaults to 50.
+            metric (str, optional): Similarity of the collection: "cosine", "ip" or "l2". Defaults to "cosine".
+            seed (int, optional): Seed for query sampling. Defaults to None.
+        """
+        if metric not in ("cosine", "ip", "l2"):
+            raise ValueError(f"Unsupported metric: {metric}. Use one of 'cosine', 'ip' or 'l2'.")
+
+        self.vector_store = vector_store
+        self.recall_target = recall_target
+        self.k = k
+        self.num_queries = num_queries
+        self.metric = metric
+        self.rng = np.random.default_rng(seed)
+
+    def _exact_neighbours(self, corpus: np.ndarray, queries: np.ndarray, candidates: np.ndarray, k: int) -> np.ndarray:
+        """Exact top-k row indices of `candidates` for each query, best first."""
+        subset = corpus[candidates]
+        if self.metric == "l2":
+            scores = -(
+                np.sum(queries**2, axis=1, keepdims=True) - 2 * queries @ subset.T + np.sum(subset**2, axis=1)[None, :]
+            )
+        else:
+            if self.metric == "cosine":
+                subset = subset / np.maximum(np.linalg.norm(subset, axis=1, keepdims=True), 1e-12)
+                queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+            scores = queries @ subset.T
+
+        k = min(k, subset.shape[0])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+        return candidates[np.take_along_axis(top, order, axis=1)]
+
+    def _measure(self, query_vectors: np.ndarray, query_ids: List[str], truth: List[set], filters: Optional[Dict]):
+        """Run every held-out query against the vector store and return (mean recall, median latency in ms)."""
+        recalls = []
+        latencies = []
+        for vector, query_id, expected in zip(query_vectors, query_ids, truth):
+            start = time.perf_counter()
+            hits = self.vector_store.search("", vector.tolist(), self.k + 1, filters)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            found = [str(hit.id) for hit in hits if str(hit.id) != query_id][: self.k]
+            recalls.append(len(expected.intersection(found)) / max(len(expected), 1))
+        return float(np.mean(recalls)), float(np.median(latencies))
+
+    def tune(
+        self,
+        ids: List[str],
+        vectors: List[List[float]],
+        payloads: Optional[List[Dict]] = None,
+        filters: Optional[Dict] = None,
+    ) -> TuningResult:
+        """
+        Measure every candidate setting and apply the fastest one that reaches the recall target.
+
+        If no setting reaches the target, the one with the best recall is applied.
+
+        Args:
+            ids (List[str]): IDs of the stored vectors.
+            vectors (List[List[float]]): Stored vectors exported from the collection.
+            payloads (List[Dict], optional): Stored payloads, required when `filters` is given. Defaults to None.
+            filters (Dict, optional): Filters to tune scoped searches with, e.g. {"user_id": "alice"}.
+
+        Returns:
+            TuningResult: Selected parameters and all measured trials.
+        """
+        grid = self.vector_store.get_search_param_grid(self.k)
+        if not grid:
+            raise ValueError(f"{type(self.vector_store).__name__} has no tunable search parameters.")
+        if filters and payloads is None:
+            raise ValueError("'payloads' are required to compute exact neighbours for filtered searches.")
+
+        ids = [str(i) for i in ids]
+        corpus = np.asarray(vectors, dtype=np.float32)
+        candidates = np.array(
+            [i for i in range(len(ids)) if _matches(payloads[i] if payloads else None, filters)], dtype=np.int64
+        )
+        if len(candidates) <= self.k:
+            raise ValueError(f"At least {self.k + 1} matching vectors are needed to tune recall@{self.k}.")
+
+        sample = self.rng.choice(candidates, size=min(self.num_queries, len(candidates)), replace=False)
+        query_vectors = corpus[sample]
+        query_ids = [ids[i] for i in sample]
+
+        # Hold each query out of its own ground truth by computing k + 1 neighbours and dropping itself
+        neighbours = self._exact_neighbours(corpus, query_vectors, candidates, self.k + 1)
+        truth = [set([ids[j] for j in row if j != query_row][: self.k]) for row, query_row in zip(neighbours, sample)]
+
+        names = list(grid)
+        trials = []
+        for values in itertools.product(*(grid[name] for name in names)):
+            params = dict(zip(names, values))
+            self.vector_store.set_search_params(params)
+            recall, latency_ms = self._measure(query_vectors, query_ids, truth, filters)
+            logger.info(f"Search params {params}: recall@{self.k}={recall:.3f}, latency={latency_ms:.2f}ms")
+            trials.append(TuningTrial(params=params, recall=recall, latency_ms=latency_ms))
+
+        passing = [trial for trial in trials if trial.recall >= self.recall_target]
+        if passing:
+            best = min(passing, key=lambda trial: trial.latency_ms)
+        else:
+            logger.warning(f"No search parameters reached recall@{self.k} >= {self.recall_target}.")
+            best = max(trials, key=lambda trial: (trial.recall, -trial.latency_ms))
+
+        self.vector_store.set_search_params(best.params)
+        return TuningResult(
+            params=best.params,
+            recall=best.recall,
+            latency_ms=best.latency_ms,
+            target_met=bool(passing),
+            trials=trials,
+        )
+
+    def tune_and_save(
+        self,
+        provider: str,
+        config: Dict[str, Any],
+        ids: List[str],
+        vectors: List[List[float]],
+        payloads: Optional[List[Dict]] = None,
+        filters: Optional[Dict] = None,
+        path: Optional[str] = None,
+    ) -> TuningResult:
+        """
+        Tune the search parameters (see `tune`) and persist the selected ones, so that vector stores created later
+        for the same provider, deployment and collection apply them.
+
+        Args:
+            provider (str): Vector store provider name, e.g. "qdrant".
+            config (dict): Vector store config, with the collection name and the host, URL or path of the store.
+            ids (List[str]): IDs of the stored vectors.
+            vectors (List[List[float]]): Stored vectors exported from the collection.
+            payloads (List[Dict], optional): Stored payloads, required when `filters` is given. Defaults to None.
+            filters (Dict, optional): Filters to tune scoped searches with, e.g. {"user_id": "alice"}.
+            path (str, optional): Path of the JSON file holding tuned parameters. Defaults to
+                ~/.mem0/search_params.json.
+
+        Returns:
+            TuningResult: Selected parameters and all measured trials.
+        """
+        if not isinstance(config, dict):
+            config = config.model_dump()
+        result = self.tune(ids, vectors, payloads=payloads, filters=filters)
+        save_search_params(provider, config["collection_name"], result.params, path=path, config=config)
+        return result
@@ -17,3 +17,17 @@ def test_get_update_memory_messages():
     ##
     result = prompts.get_update_memory_messages(retrieved_old_memory_dict, response_content, None)
     assert result.startswith(prompts.DEFAULT_UPDATE_MEMORY_PROMPT)
+
+
+def test_get_update_memory_prompts_keep_dynamic_content_out_of_the_system_prompt():
+    system_prompt, user_prompt = prompts.get_update_memory_prompts(
+        [{"id": "0", "text": "Likes pizza"}], ["Likes sushi"]
+    )
+    other_system_prompt, other_user_prompt = prompts.get_update_memory_prompts([], ["Lives in Paris"])
+
+    # The system prompt is identical across requests, so providers can cache it
+    assert system_prompt == other_system_prompt
+    assert system_prompt.startswith(prompts.DEFAULT_UPDATE_MEMORY_PROMPT)
+    assert "Likes pizza" not in system_prompt and "Likes sushi" not in system_prompt
+    assert "Likes pizza" in user_prompt and "Likes sushi" in user_prompt
+    assert user_prompt != other_user_prompt
@@ -88,3 +88,18 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(index=1, embedding=[0.4, 0.5, 0.6]), Mock(index=0, embedding=[0.1, 0.2, 0.3])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["alice", "bob\nsmith"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["alice", "bob smith"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
@@ -0,0 +1,56 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.anthropic import AnthropicLLM
+
+
+@pytest.fixture
+def mock_anthropic_client():
+    with patch("mem0.llms.anthropic.anthropic.Anthropic") as mock_anthropic:
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        yield mock_client
+
+
+def mock_response(text):
+    return Mock(
+        content=[Mock(text=text)],
+        usage=Mock(input_tokens=30, cache_read_input_tokens=1500, cache_creation_input_tokens=0, output_tokens=12),
+    )
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are a smart memory manager."},
+    {"role": "user", "content": "New facts: likes pizza"},
+]
+
+
+def test_system_prompt_is_a_cache_breakpoint(mock_anthropic_client):
+    llm = AnthropicLLM(BaseLlmConfig(model="claude-3-5-sonnet-20240620", api_key="api_key"))
+    mock_anthropic_client.messages.create.return_value = mock_response("{}")
+
+    assert llm.generate_response(MESSAGES) == "{}"
+
+    params = mock_anthropic_client.messages.create.call_args.kwargs
+    assert params["system"] == [
+        {"type": "text", "text": "You are a smart memory manager.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert params["messages"] == [{"role": "user", "content": "New facts: likes pizza"}]
+    assert llm.usage == {
+        "requests": 1,
+        "input_tokens": 1530,
+        "cached_input_tokens": 1500,
+        "cache_creation_input_tokens": 0,
+        "output_tokens": 12,
+    }
+
+
+def test_prompt_caching_can_be_disabled(mock_anthropic_client):
+    llm = AnthropicLLM(BaseLlmConfig(model="claude-3-5-sonnet-20240620", api_key="api_key", prompt_caching=False))
+    mock_anthropic_client.messages.create.return_value = mock_response("{}")
+
+    llm.generate_response(MESSAGES)
+
+    assert mock_anthropic_client.messages.create.call_args.kwargs["system"] == "You are a smart memory manager."
@@ -4,6 +4,7 @@ import pytest
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.azure_openai import AzureOpenAILLM
+from mem0.utils.http import get_http_client
 
 MODEL = "gpt-4o"  # or your custom deployment name
 TEMPERATURE = 0.7
@@ -96,17 +97,11 @@ def test_generate_response_with_tools(mock_openai_client):
     [None, {"Firstkey": "FirstVal", "SecondKey": "SecondVal"}],
 )
 def test_generate_with_http_proxies(default_headers):
-    mock_http_client = Mock()
-    mock_http_client_instance = Mock()
-    mock_http_client.return_value = mock_http_client_instance
     azure_kwargs = {"api_key": "test"}
     if default_headers:
         azure_kwargs["default_headers"] = default_headers
 
-    with (
-        patch("mem0.llms.azure_openai.AzureOpenAI") as mock_azure_openai,
-        patch("httpx.Client", new=mock_http_client),
-    ):
+    with patch("mem0.llms.azure_openai.AzureOpenAI") as mock_azure_openai:
         config = BaseLlmConfig(
             model=MODEL,
             temperature=TEMPERATURE,
@@ -119,12 +114,13 @@ def test_generate_with_http_proxies(default_headers):
 
         _ = AzureOpenAILLM(config)
 
+        http_client = get_http_client(config.http_pool, "http://testproxy.mem0.net:8000")
+        assert config.http_client is http_client
         mock_azure_openai.assert_called_once_with(
             api_key="test",
-            http_client=mock_http_client_instance,
+            http_client=http_client,
             azure_deployment=None,
             azure_endpoint=None,
             api_version=None,
             default_headers=default_headers,
         )
-        mock_http_client.assert_called_once_with(proxies="http://testproxy.mem0.net:8000")
@@ -0,0 +1,149 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from mem0.configs.base import LlmCacheConfig
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import CachedLLM, ResponseCache
+from mem0.utils.factory import LlmFactory
+
+MESSAGES = [{"role": "system", "content": "Extract facts."}, {"role": "user", "content": "I'm vegetarian."}]
+JSON_MODE = {"type": "json_object"}
+
+
+def make_llm(response='{"facts": ["Is vegetarian"]}', **config):
+    llm = Mock()
+    llm.config = BaseLlmConfig(model="gpt-4o-mini", temperature=0, **config)
+    llm.generate_response.return_value = response
+    return llm
+
+
+def make_cached(llm, **config):
+    return CachedLLM(llm, ResponseCache(LlmCacheConfig(**config)), "openai")
+
+
+def test_repeated_request_is_served_from_cache():
+    llm = make_llm()
+    cached = make_cached(llm)
+
+    first = cached.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+    # Whitespace around the content does not change the key
+    second = cached.generate_response(
+        messages=[MESSAGES[0], {"role": "user", "content": "  I'm vegetarian.\n"}], response_format=JSON_MODE
+    )
+
+    assert first == second == '{"facts": ["Is vegetarian"]}'
+    assert llm.generate_response.call_count == 1
+    assert cached.cache_stats["hits"] == 1 and cached.cache_stats["misses"] == 1
+    assert cached.cache_stats["hit_rate"] == 0.5
+
+
+def test_key_covers_model_params_and_tools():
+    llm = make_llm()
+    cached = make_cached(llm)
+
+    cached.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+    cached.generate_response(messages=MESSAGES)
+    llm.config.temperature = 0.7
+    cached.generate_response(messages=MESSAGES)
+
+    llm.generate_response.return_value = {"content": None, "tool_calls": [{"name": "noop", "arguments": {}}]}
+    tools = [{"type": "function", "function": {"name": "noop"}}]
+    assert cached.generate_response(messages=MESSAGES, tools=tools)["tool_calls"][0]["name"] == "noop"
+    assert cached.generate_response(messages=MESSAGES, tools=tools)["tool_calls"][0]["name"] == "noop"
+
+    assert llm.generate_response.call_count == 4
+
+
+def test_invalid_responses_are_not_cached():
+    llm = make_llm("Sure, here are the facts")
+    cached = make_cached(llm)
+
+    cached.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+    cached.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+
+    assert llm.generate_response.call_count == 2
+
+
+def test_lru_and_ttl_eviction():
+    llm = make_llm("ok")
+    cached = make_cached(llm, max_entries=1, ttl=60)
+
+    cached.generate_response(messages=[{"role": "user", "content": "a"}])
+    cached.generate_response(messages=[{"role": "user", "content": "b"}])
+    cached.generate_response(messages=[{"role": "user", "content": "a"}])
+    assert llm.generate_response.call_count == 3
+    assert cached.cache_stats["evictions"] == 2
+
+    with patch("mem0.llms.cache.time.time", return_value=time.time() + 120):
+        cached.generate_response(messages=[{"role": "user", "content": "a"}])
+    assert llm.generate_response.call_count == 4
+
+
+def test_sqlite_store_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "llm_cache.db")
+    first_llm = make_llm()
+    make_cached(first_llm, path=path).generate_response(messages=MESSAGES, response_format=JSON_MODE)
+
+    second_llm = make_llm()
+    second = make_cached(second_llm, path=path)
+    assert second.generate_response(messages=MESSAGES, response_format=JSON_MODE) == '{"facts": ["Is vegetarian"]}'
+    second_llm.generate_response.assert_not_called()
+    assert second.cache_stats["disk_hits"] == 1
+
+
+def test_sqlite_store_prunes_least_recently_used(tmp_path):
+    cache = ResponseCache(LlmCacheConfig(path=str(tmp_path / "llm_cache.db"), max_entries=0, max_disk_entries=10))
+    for i in range(100):
+        cache.put(f"key-{i}", '"value"')
+
+    assert cache._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 10
+    assert cache.get("key-99") == '"value"' and cache.get("key-0") is None
+
+
+def test_stream_response_shares_cache_entry():
+    llm = make_llm()
+    llm.stream_response.return_value = iter(['{"facts": ', '["Is vegetarian"]}'])
+    cached = make_cached(llm)
+
+    assert "".join(cached.stream_response(messages=MESSAGES, response_format=JSON_MODE)) == (
+        '{"facts": ["Is vegetarian"]}'
+    )
+    assert cached.generate_response(messages=MESSAGES, response_format=JSON_MODE) == '{"facts": ["Is vegetarian"]}'
+    llm.generate_response.assert_not_called()
+
+
+def test_concurrent_identical_requests_are_sent_once():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(**kwargs):
+        started.set()
+        release.wait(5)
+        return "ok"
+
+    llm = make_llm()
+    llm.generate_response.side_effect = slow
+    cached = make_cached(llm)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cached.generate_response(messages=MESSAGES)))]
+    threads[0].start()
+    started.wait(5)
+    threads.append(threading.Thread(target=lambda: results.append(cached.generate_response(messages=MESSAGES))))
+    threads[1].start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["ok", "ok"]
+    assert llm.generate_response.call_count == 1
+
+
+def test_factory_wraps_cached_llm():
+    with patch("mem0.llms.openai.OpenAI"):
+        llm = LlmFactory.create("openai", {"model": "gpt-4o-mini", "api_key": "key", "cache": {"max_entries": 10}})
+
+    assert isinstance(llm, CachedLLM)
+    assert llm.config.model == "gpt-4o-mini"
@@ -104,3 +104,62 @@ def test_generate_response_with_tools(mock_openai_client):
     assert len(response["tool_calls"]) == 1
     assert response["tool_calls"][0]["name"] == "add_memory"
     assert response["tool_calls"][0]["arguments"] == {"data": "Today is a sunny day."}
+
+
+def test_generate_response_records_cached_prompt_tokens(mock_openai_client):
+    config = BaseLlmConfig(model="gpt-4o", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = OpenAILLM(config)
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hello, how are you?"},
+    ]
+
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(content="Fine"))]
+    mock_response.usage = Mock(prompt_tokens=1500, completion_tokens=20, prompt_tokens_details=Mock(cached_tokens=1280))
+    mock_openai_client.chat.completions.create.return_value = mock_response
+
+    llm.generate_response(messages)
+    llm.generate_response(messages)
+
+    assert llm.usage == {
+        "requests": 2,
+        "input_tokens": 3000,
+        "cached_input_tokens": 2560,
+        "cache_creation_input_tokens": 0,
+        "output_tokens": 40,
+    }
+
+
+def test_stream_response(mock_openai_client):
+    config = BaseLlmConfig(model="gpt-4o", temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = OpenAILLM(config)
+    messages = [{"role": "user", "content": "Hello"}]
+
+    def chunk(content=None, usage=None):
+        choices = [Mock(delta=Mock(content=content))] if usage is None else []
+        return Mock(choices=choices, usage=usage)
+
+    mock_openai_client.chat.completions.create.return_value = iter(
+        [
+            chunk('{"facts": '),
+            chunk(None),
+            chunk('["Name is John"]}'),
+            chunk(usage=Mock(prompt_tokens=50, completion_tokens=8, prompt_tokens_details=None)),
+        ]
+    )
+
+    assert "".join(llm.stream_response(messages, response_format={"type": "json_object"})) == (
+        '{"facts": ["Name is John"]}'
+    )
+    mock_openai_client.chat.completions.create.assert_called_once_with(
+        model="gpt-4o",
+        messages=messages,
+        temperature=0.7,
+        max_tokens=100,
+        top_p=1.0,
+        response_format={"type": "json_object"},
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    assert llm.usage["requests"] == 1 and llm.usage["input_tokens"] == 50 and llm.usage["output_tokens"] == 8
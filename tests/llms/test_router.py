@@ -0,0 +1,147 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.router import RouterLLM
+
+MESSAGES = [{"role": "user", "content": "Hi, I'm Sam."}]
+JSON_MODE = {"type": "json_object"}
+
+
+def make_llm(model, response=None, side_effect=None):
+    llm = Mock()
+    llm.config.model = model
+    llm.generate_response.return_value = response
+    if side_effect is not None:
+        llm.generate_response.side_effect = side_effect
+    return llm
+
+
+def make_router(llms, **config):
+    routes = [{"provider": "openai", "config": {"model": llm.config.model}} for llm in llms]
+    with patch("mem0.utils.factory.LlmFactory.create", side_effect=llms):
+        return RouterLLM(BaseLlmConfig(routes=routes, **config))
+
+
+def test_router_requires_routes():
+    with pytest.raises(ValueError):
+        RouterLLM(BaseLlmConfig())
+
+
+def test_router_uses_primary_route():
+    primary = make_llm("primary", '{"facts": ["Name is Sam"]}')
+    secondary = make_llm("secondary", '{"facts": []}')
+    router = make_router([primary, secondary])
+
+    response = router.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+
+    assert response == '{"facts": ["Name is Sam"]}'
+    secondary.generate_response.assert_not_called()
+    assert router.config.model == "primary"
+    assert router.stats[0]["wins"] == 1 and router.stats[0]["p50"] is not None
+
+
+def test_router_falls_back_on_error_and_invalid_json():
+    failing = make_llm("failing", side_effect=RuntimeError("503"))
+    invalid = make_llm("invalid", "Sure! Here are the facts: Name is Sam")
+    valid = make_llm("valid", '{"facts": ["Name is Sam"]}')
+    router = make_router([failing, invalid, valid])
+
+    response = router.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+
+    assert response == '{"facts": ["Name is Sam"]}'
+    stats = router.stats
+    assert stats[0]["errors"] == 1 and stats[1]["invalid"] == 1 and stats[2]["wins"] == 1
+
+
+def test_router_requires_tool_calls_when_tools_are_passed():
+    text_only = make_llm("text_only", "I would call a tool")
+    tool_calling = make_llm("tool_calling", {"content": None, "tool_calls": [{"name": "noop", "arguments": {}}]})
+    router = make_router([text_only, tool_calling])
+
+    response = router.generate_response(messages=MESSAGES, tools=[{"type": "function"}])
+
+    assert response["tool_calls"][0]["name"] == "noop"
+    assert tool_calling.generate_response.call_args.kwargs["tool_choice"] == "auto"
+
+
+def test_router_raises_when_every_route_fails():
+    router = make_router([make_llm("a", side_effect=RuntimeError("a")), make_llm("b", side_effect=RuntimeError("b"))])
+
+    with pytest.raises(RuntimeError):
+        router.generate_response(messages=MESSAGES)
+
+
+def test_router_hedges_slow_request():
+    release = threading.Event()
+
+    def slow(**kwargs):
+        release.wait(5)
+        return '{"facts": ["slow"]}'
+
+    slow_llm = make_llm("slow", side_effect=slow)
+    fast_llm = make_llm("fast", '{"facts": ["fast"]}')
+    router = make_router([slow_llm, fast_llm], hedge_delay=0.05)
+
+    try:
+        response = router.generate_response(messages=MESSAGES, response_format=JSON_MODE)
+    finally:
+        release.set()
+
+    assert response == '{"facts": ["fast"]}'
+    assert router.stats[1]["hedges"] == 1
+
+
+def test_router_circuit_breaker_skips_failing_route():
+    failing = make_llm("failing", side_effect=RuntimeError("503"))
+    healthy = make_llm("healthy", "ok")
+    router = make_router([failing, healthy], circuit_breaker_threshold=2, circuit_breaker_timeout=60)
+
+    for _ in range(4):
+        assert router.generate_response(messages=MESSAGES) == "ok"
+
+    assert failing.generate_response.call_count == 2
+    assert router.stats[0]["state"] == "open"
+
+    # After the timeout a single trial request closes the circuit again
+    router.routes[0].opened_at -= 60
+    failing.generate_response.side_effect = None
+    failing.generate_response.return_value = "recovered"
+    assert router.generate_response(messages=MESSAGES) == "recovered"
+    assert router.stats[0]["state"] == "closed"
+
+
+def test_router_half_open_trial_that_loses_hedge_still_closes_circuit():
+    release = threading.Event()
+
+    def slow(**kwargs):
+        release.wait(5)
+        return "recovered"
+
+    recovering = make_llm("recovering", side_effect=RuntimeError("503"))
+    healthy = make_llm("healthy", "ok")
+    router = make_router(
+        [recovering, healthy], circuit_breaker_threshold=1, circuit_breaker_timeout=60, hedge_delay=0.05
+    )
+
+    assert router.generate_response(messages=MESSAGES) == "ok"
+    assert router.stats[0]["state"] == "open"
+
+    # The half-open trial is slow: the hedge to the healthy route wins the race
+    router.routes[0].opened_at -= 60
+    recovering.generate_response.side_effect = slow
+    try:
+        assert router.generate_response(messages=MESSAGES) == "ok"
+    finally:
+        release.set()
+
+    # Once the losing trial answers, the circuit closes and the route takes requests again
+    for _ in range(100):
+        if router.stats[0]["state"] == "closed":
+            break
+        time.sleep(0.01)
+    assert router.stats[0]["state"] == "closed"
+    assert router.generate_response(messages=MESSAGES) == "recovered"
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, patch
+
+from mem0.graphs.entity_matcher import EntityMatcher
+
+
+def make_matcher(names):
+    loader = MagicMock(return_value=names)
+    return EntityMatcher(loader), loader
+
+
+def test_matches_longest_known_phrases_and_self_references():
+    matcher, loader = make_matcher(["alice", "new_york", "new", "pizza", "bob_smith"])
+    filters = {"user_id": "alice"}
+
+    matches = matcher.match("Where did I meet Bob Smith in New York?", filters)
+
+    assert matches == ["alice", "bob_smith", "new_york"]
+    loader.assert_called_once_with(filters)
+
+
+def test_fuzzy_match_on_trigrams():
+    matcher, _ = make_matcher(["margherita_pizza", "tennis"])
+
+    assert matcher.match("Do I still like margarita pizza?", {"user_id": "u"}) == ["margherita_pizza"]
+    assert matcher.match("What about the weather?", {"user_id": "u"}) == []
+
+
+def test_names_are_cached_per_user_and_kept_current():
+    matcher, loader = make_matcher(["pizza"])
+    filters = {"user_id": "u"}
+
+    assert matcher.match("pizza and sushi", filters) == ["pizza"]
+    matcher.add(filters, ["sushi"])
+    assert matcher.match("pizza and sushi", filters) == ["pizza", "sushi"]
+    assert loader.call_count == 1
+
+    # Users that were never loaded are not populated from writes
+    matcher.add({"user_id": "other"}, ["sushi"])
+    loader.return_value = []
+    assert matcher.match("sushi", {"user_id": "other"}) == []
+
+    matcher.forget({"user_id": "u"})
+    loader.return_value = ["ramen"]
+    assert matcher.match("pizza and ramen", filters) == ["ramen"]
+
+
+def test_names_are_reloaded_after_ttl():
+    loader = MagicMock(return_value=["pizza"])
+    matcher = EntityMatcher(loader, ttl=60)
+    filters = {"user_id": "u"}
+
+    with patch("mem0.graphs.entity_matcher.time.monotonic", return_value=1000.0):
+        assert matcher.match("pizza and sushi", filters) == ["pizza"]
+    # Another process wrote "sushi"
+    loader.return_value = ["pizza", "sushi"]
+    with patch("mem0.graphs.entity_matcher.time.monotonic", return_value=1059.0):
+        assert matcher.match("pizza and sushi", filters) == ["pizza"]
+    with patch("mem0.graphs.entity_matcher.time.monotonic", return_value=1060.0):
+        assert matcher.match("pizza and sushi", filters) == ["pizza", "sushi"]
+    assert loader.call_count == 2
+
+
+def test_least_recently_used_users_are_evicted():
+    loader = MagicMock(return_value=["pizza"])
+    matcher = EntityMatcher(loader, max_users=2)
+
+    for user_id in ["a", "b", "a", "c"]:
+        matcher.match("pizza", {"user_id": user_id})
+    matcher.match("pizza", {"user_id": "a"})
+    matcher.match("pizza", {"user_id": "b"})
+
+    assert [call.args[0]["user_id"] for call in loader.call_args_list] == ["a", "b", "c", "b"]
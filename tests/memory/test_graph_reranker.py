@@ -0,0 +1,131 @@
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.graphs.reranker import BM25Reranker, tokenize
+
+
+def row(source, relationship, target):
+    return {"source": source, "relationship": relationship, "target": target}
+
+
+def candidate(source, relationship, destination):
+    return {"source": source, "relationship": relationship, "destination": destination}
+
+
+def make_reranker(rows):
+    loader = MagicMock(return_value=rows)
+    return BM25Reranker(loader), loader
+
+
+def test_tokenize_lowercases_splits_and_drops_stopwords():
+    assert tokenize("Where does Alice's sister live_in?") == ["alice", "sister", "live"]
+    assert tokenize("works_with New_York") == ["works", "new", "york"]
+
+
+def test_scores_use_statistics_of_the_whole_graph():
+    rows = [row("alice", "likes", "pizza")] + [row("alice", "knows", f"friend_{i}") for i in range(20)]
+    reranker, _ = make_reranker(rows)
+    filters = {"user_id": "alice"}
+    documents = [["alice", "likes", "pizza"], ["alice", "knows", "friend", "0"]]
+
+    scores = reranker.scores("does alice like pizza", documents, filters)
+
+    # Hand-computed Okapi BM25 over the 21 stored relations
+    corpus_size, average_length = 21, (3 + 20 * 4) / 21
+    expected = []
+    for document in documents:
+        score = 0.0
+        for term, df in (("alice", 21), ("like", 0), ("pizza", 1)):
+            tf = document.count(term)
+            idf = math.log1p((corpus_size - df + 0.5) / (df + 0.5))
+            score += idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * len(document) / average_length))
+        expected.append(score)
+    assert scores.tolist() == pytest.approx(expected)
+    assert scores[0] > scores[1]
+
+
+def test_rerank_keeps_candidate_order_on_ties():
+    reranker, _ = make_reranker([])
+    candidates = [candidate("alice", "knows", "bob"), candidate("alice", "works_with", "charlie")]
+
+    assert reranker.rerank("Who works with Charlie?", candidates, {"user_id": "alice"}) == candidates[::-1]
+    assert reranker.rerank("the", candidates, {"user_id": "alice"}) == candidates
+    assert reranker.rerank("alice", candidates, {"user_id": "alice"}, n=1) == candidates[:1]
+
+
+def test_incremental_updates_match_a_fresh_load():
+    reranker, loader = make_reranker([row("alice", "likes", "pizza"), row("alice", "lives_in", "paris")])
+    filters = {"user_id": "alice"}
+    documents = [["alice", "likes", "sushi"], ["alice", "lives", "paris"]]
+    reranker.scores("sushi paris", documents, filters)
+
+    reranker.update(
+        filters,
+        added=[[row("alice", "likes", "sushi")], [row("alice", "likes", "pizza")]],
+        deleted=[[row("alice", "lives_in", "paris")], []],
+    )
+    updated = reranker.scores("sushi paris", documents, filters)
+    assert loader.call_count == 1
+
+    fresh, _ = make_reranker([row("alice", "likes", "pizza"), row("alice", "likes", "sushi")])
+    assert updated.tolist() == pytest.approx(fresh.scores("sushi paris", documents, filters).tolist())
+
+    # The vocabulary grows past its initial capacity
+    reranker.update(filters, added=[[row("alice", "knows", f"friend_{i}")] for i in range(100)])
+    assert reranker.scores("friend 99", [["alice", "knows", "friend", "99"]], filters)[0] > 0
+
+
+def test_writes_drop_overlapping_scopes():
+    reranker, loader = make_reranker([])
+    user, agent, other_agent = {"user_id": "u"}, {"user_id": "u", "agent_id": "a"}, {"user_id": "u", "agent_id": "b"}
+    for filters in (user, agent, other_agent):
+        reranker.scores("pizza", [["pizza"]], filters)
+
+    # An agent write leaves other agents alone but invalidates the user-wide statistics
+    reranker.update(agent, added=[[row("u", "likes", "pizza")]])
+    assert set(reranker._users) == {("u", "a"), ("u", "b")}
+
+    # Users that were never loaded are not populated from writes
+    reranker.update({"user_id": "other"}, added=[[row("other", "likes", "pizza")]])
+    assert ("other", None) not in reranker._users
+
+    reranker.forget(user)
+    assert not reranker._users
+    assert loader.call_count == 3
+
+
+def test_load_overlapping_a_write_is_not_kept():
+    reranker = BM25Reranker(None)
+    filters = {"user_id": "alice"}
+
+    def load(filters):
+        # A write lands while the relations are being read; the rows read before it miss the new relation
+        reranker.update(filters, added=[[row("alice", "likes", "sushi")]])
+        return [row("alice", "likes", "pizza")]
+
+    reranker.loader = MagicMock(side_effect=load)
+    reranker.scores("pizza", [["pizza"]], filters)
+    reranker.loader = MagicMock(return_value=[row("alice", "likes", "pizza"), row("alice", "likes", "sushi")])
+    reranker.scores("pizza", [["pizza"]], filters)
+    reranker.scores("sushi", [["sushi"]], filters)
+
+    reranker.loader.assert_called_once()
+    assert len(reranker._users[("alice", None)].triples) == 2
+    assert reranker._loading == {} and reranker._generations == {}
+
+
+def test_statistics_are_reloaded_after_ttl():
+    loader = MagicMock(return_value=[row("alice", "likes", "pizza")])
+    reranker = BM25Reranker(loader, ttl=60)
+    filters = {"user_id": "alice"}
+
+    with patch("mem0.graphs.reranker.time.monotonic", return_value=1000.0):
+        reranker.scores("pizza", [["pizza"]], filters)
+    with patch("mem0.graphs.reranker.time.monotonic", return_value=1059.0):
+        reranker.scores("pizza", [["pizza"]], filters)
+    assert loader.call_count == 1
+    with patch("mem0.graphs.reranker.time.monotonic", return_value=1060.0):
+        reranker.scores("pizza", [["pizza"]], filters)
+    assert loader.call_count == 2
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from mem0.graphs.utils import aextract_graph_changes, extract_graph_changes, iter_graph_relations, paginate_relations
+
+
+def make_memory_graph(search_output):
+    memory_graph = MagicMock()
+    memory_graph._retrieve_nodes_from_data.return_value = {"alice": "person"}
+    memory_graph._establish_nodes_relations_from_data.return_value = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"}
+    ]
+    memory_graph._search_graph_db.return_value = search_output
+    memory_graph._get_delete_entities_from_search_output.return_value = [
+        {"source": "alice", "relationship": "hates", "destination": "pizza"}
+    ]
+    return memory_graph
+
+
+def test_delete_decision_skipped_without_existing_relations():
+    memory_graph = make_memory_graph(search_output=[])
+
+    entity_type_map, to_be_added, to_be_deleted = extract_graph_changes(memory_graph, "I like pizza", {"user_id": "u"})
+
+    assert entity_type_map == {"alice": "person"}
+    assert to_be_added[0]["relationship"] == "likes"
+    assert to_be_deleted == []
+    memory_graph._get_delete_entities_from_search_output.assert_not_called()
+
+
+def test_relation_extraction_overlaps_search():
+    memory_graph = make_memory_graph(
+        search_output=[{"source": "alice", "relationship": "hates", "destination": "pizza"}]
+    )
+    extraction_started = threading.Event()
+
+    def establish(data, filters, entity_type_map):
+        extraction_started.set()
+        return [{"source": "alice", "relationship": "likes", "destination": "pizza"}]
+
+    def search(node_list, filters):
+        # Only returns if relation extraction runs while the search is still in flight
+        assert extraction_started.wait(timeout=5)
+        return [{"source": "alice", "relationship": "hates", "destination": "pizza"}]
+
+    memory_graph._establish_nodes_relations_from_data.side_effect = establish
+    memory_graph._search_graph_db.side_effect = search
+
+    _, to_be_added, to_be_deleted = extract_graph_changes(memory_graph, "I like pizza now", {"user_id": "u"})
+
+    assert to_be_added[0]["relationship"] == "likes"
+    assert to_be_deleted[0]["relationship"] == "hates"
+
+
+def test_async_extract_graph_changes():
+    memory_graph = make_memory_graph(
+        search_output=[{"source": "alice", "relationship": "hates", "destination": "pizza"}]
+    )
+
+    _, to_be_added, to_be_deleted = asyncio.run(
+        aextract_graph_changes(memory_graph, "I like pizza now", {"user_id": "u"})
+    )
+
+    assert to_be_added[0]["relationship"] == "likes"
+    assert to_be_deleted[0]["relationship"] == "hates"
+    memory_graph._search_graph_db.assert_called_once_with(node_list=["alice"], filters={"user_id": "u"})
+
+
+def test_iter_graph_relations_follows_cursors():
+    rows = [{"source": "alice", "relationship": "likes", "target": f"food_{i}", "relation_id": i} for i in range(5)]
+
+    def get_all_page(filters, limit, cursor):
+        start = 0 if cursor is None else cursor + 1
+        return paginate_relations(rows[start : start + limit + 1], limit)
+
+    memory_graph = MagicMock()
+    memory_graph.get_all_page.side_effect = get_all_page
+
+    relations = list(iter_graph_relations(memory_graph, {"user_id": "alice"}, page_size=2))
+
+    assert [r["target"] for r in relations] == [f"food_{i}" for i in range(5)]
+    assert "relation_id" not in relations[0]
+    assert [c.kwargs["cursor"] for c in memory_graph.get_all_page.call_args_list] == [None, 1, 3]
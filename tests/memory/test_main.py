@@ -43,7 +43,7 @@ class TestAddToVectorStoreErrors:
     def test_empty_llm_response_fact_extraction(self, mocker, mock_memory, caplog):
         """Test empty response from LLM during fact extraction"""
         # Setup
-        mock_memory.llm.generate_response.return_value = ""
+        mock_memory.llm.stream_response.return_value = iter([""])
         mock_capture_event = mocker.MagicMock()
         mocker.patch("mem0.memory.main.capture_event", mock_capture_event)
 
@@ -54,16 +54,18 @@ class TestAddToVectorStoreErrors:
             )
 
         # Verify
-        assert mock_memory.llm.generate_response.call_count == 1
-        assert result == []  # Should return empty list when no memories processed
+        assert mock_memory.llm.stream_response.call_count == 1
+        mock_memory.llm.generate_response.assert_not_called()
+        assert result == ([], False)  # No memories processed, and the inference failed
         assert "Error in new_retrieved_facts" in caplog.text
         assert mock_capture_event.call_count == 1
 
     def test_empty_llm_response_memory_actions(self, mock_memory, caplog):
         """Test empty response from LLM during memory actions"""
         # Setup
-        # First call returns valid JSON, second call returns empty string
-        mock_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        # Fact extraction streams valid JSON, the memory actions call returns an empty string
+        mock_memory.llm.stream_response.return_value = iter(['{"facts": ["test fact"]}'])
+        mock_memory.llm.generate_response.return_value = ""
 
         # Execute
         with caplog.at_level(logging.ERROR):
@@ -72,8 +74,8 @@ class TestAddToVectorStoreErrors:
             )
 
         # Verify
-        assert mock_memory.llm.generate_response.call_count == 2
-        assert result == []  # Should return empty list when no memories processed
+        assert mock_memory.llm.generate_response.call_count == 1
+        assert result == ([], False)  # No memories processed, and the inference failed
         assert "Invalid JSON response" in caplog.text
 
 
@@ -96,7 +98,7 @@ class TestAsyncAddToVectorStoreErrors:
     async def test_async_empty_llm_response_fact_extraction(self, mock_async_memory, caplog, mocker):
         """Test empty response in AsyncMemory._add_to_vector_store"""
         mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=MagicMock())
-        mock_async_memory.llm.generate_response.return_value = ""
+        mock_async_memory.llm.stream_response.return_value = iter([""])
         mock_capture_event = mocker.MagicMock()
         mocker.patch("mem0.memory.main.capture_event", mock_capture_event)
 
@@ -104,8 +106,9 @@ class TestAsyncAddToVectorStoreErrors:
             result = await mock_async_memory._add_to_vector_store(
                 messages=[{"role": "user", "content": "test"}], metadata={}, effective_filters={}, infer=True
             )
-        assert mock_async_memory.llm.generate_response.call_count == 1
-        assert result == []
+        assert mock_async_memory.llm.stream_response.call_count == 1
+        mock_async_memory.llm.generate_response.assert_not_called()
+        assert result == ([], False)
         assert "Error in new_retrieved_facts" in caplog.text
         assert mock_capture_event.call_count == 1
 
@@ -113,7 +116,8 @@ class TestAsyncAddToVectorStoreErrors:
     async def test_async_empty_llm_response_memory_actions(self, mock_async_memory, caplog, mocker):
         """Test empty response in AsyncMemory._add_to_vector_store"""
         mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=MagicMock())
-        mock_async_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        mock_async_memory.llm.stream_response.return_value = iter(['{"facts": ["test fact"]}'])
+        mock_async_memory.llm.generate_response.return_value = ""
         mock_capture_event = mocker.MagicMock()
         mocker.patch("mem0.memory.main.capture_event", mock_capture_event)
 
@@ -122,6 +126,70 @@ class TestAsyncAddToVectorStoreErrors:
                 messages=[{"role": "user", "content": "test"}], metadata={}, effective_filters={}, infer=True
             )
 
-        assert result == []
+        assert result == ([], False)
         assert "Invalid JSON response" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class _BulkDeleteStore:
+    """Vector store stand-in that deletes a whole scope with one delete_by_filters request."""
+
+    def __init__(self, memories):
+        self.memories = memories
+        self.list_calls = []
+        self.deleted_filters = []
+
+    def list(self, filters=None, limit=None):
+        self.list_calls.append(limit)
+        return [self.memories]
+
+    def delete_by_filters(self, filters):
+        self.deleted_filters.append(filters)
+        return len(self.memories)
+
+    def delete(self, vector_id):
+        raise AssertionError("memories should not be deleted one by one")
+
+
+def _bulk_memories():
+    return [
+        MagicMock(id="1", payload={"data": "likes tea", "role": "user"}),
+        MagicMock(id="2", payload={"data": "lives in Paris", "actor_id": "alice"}),
+    ]
+
+
+class TestDeleteAllByFilters:
+    def _assert_deleted_with_history(self, memory, store):
+        assert store.deleted_filters == [{"user_id": "alice"}]
+        # The listing pages past the default result window instead of stopping at the first page
+        assert store.list_calls[0] > 10_000
+        history = [call.args for call in memory.db.add_history.call_args_list]
+        assert history == [("1", "likes tea", None, "DELETE"), ("2", "lives in Paris", None, "DELETE")]
+        assert memory.db.add_history.call_args_list[0].kwargs == {"actor_id": None, "role": "user", "is_deleted": 1}
+
+    def test_delete_all_uses_delete_by_filters(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = Memory()
+        memory.enable_graph = False
+        memory.db = MagicMock()
+        store = memory.vector_store = _BulkDeleteStore(_bulk_memories())
+
+        result = memory.delete_all(user_id="alice")
+
+        assert result == {"message": "Memories deleted successfully!"}
+        self._assert_deleted_with_history(memory, store)
+
+    @pytest.mark.asyncio
+    async def test_async_delete_all_uses_delete_by_filters(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = AsyncMemory()
+        memory.enable_graph = False
+        memory.db = MagicMock()
+        store = memory.vector_store = _BulkDeleteStore(_bulk_memories())
+
+        result = await memory.delete_all(user_id="alice")
+
+        assert result == {"message": "Memories deleted successfully!"}
+        self._assert_deleted_with_history(memory, store)
@@ -0,0 +1,155 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mem0.memory.memgraph_memory import MemoryGraph
+
+
+class TestMemgraphMemory(unittest.TestCase):
+    """Test suite for the Memgraph Memory implementation."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.config = MagicMock()
+        self.config.embedder.config = {"embedding_dims": 8}
+        self.config.graph_store.config.vector_index_capacity = 100
+        self.config.graph_store.config.vector_index_growth_factor = 2.0
+        self.config.graph_store.config.vector_index_candidates = 50
+        self.config.llm.provider = "openai_structured"
+        self.config.graph_store.llm = None
+
+        self.index_info = []
+        self.node_count = 0
+        self.lookup_rows = []
+        self.mock_graph = MagicMock()
+        self.mock_graph.query.side_effect = self._query
+
+        self.mock_embedding_model = MagicMock()
+
+        self.memgraph_patcher = patch("mem0.memory.memgraph_memory.Memgraph", return_value=self.mock_graph)
+        self.embedder_patcher = patch(
+            "mem0.memory.memgraph_memory.EmbedderFactory.create", return_value=self.mock_embedding_model
+        )
+        self.llm_patcher = patch("mem0.memory.memgraph_memory.LlmFactory.create", return_value=MagicMock())
+        self.memgraph_patcher.start()
+        self.embedder_patcher.start()
+        self.llm_patcher.start()
+
+        self.filters = {"user_id": "alice"}
+
+    def tearDown(self):
+        """Tear down test fixtures after each test method."""
+        self.memgraph_patcher.stop()
+        self.embedder_patcher.stop()
+        self.llm_patcher.stop()
+
+    def _query(self, query, params=None):
+        if "show_index_info" in query:
+            return self.index_info
+        if "count(n) AS count" in query:
+            return [{"count": self.node_count}]
+        if "vector_search.search" in query:
+            return self.lookup_rows.pop(0) if self.lookup_rows else []
+        return []
+
+    def _queries(self, fragment):
+        return [c.args[0] for c in self.mock_graph.query.call_args_list if fragment in c.args[0]]
+
+    def test_vector_index_sized_from_config(self):
+        """A new index gets the configured capacity, or more when many entities already exist."""
+        MemoryGraph(self.config)
+        self.assertIn("'dimension': 8, 'capacity': 100, 'metric': 'cos'", self._queries("CREATE VECTOR INDEX")[0])
+
+        self.mock_graph.query.reset_mock()
+        self.node_count = 150
+        self.config.graph_store.config.url = "bolt://populated:7687"
+        MemoryGraph(self.config)
+        self.assertIn("'capacity': 201", self._queries("CREATE VECTOR INDEX")[0])
+
+    def test_vector_index_grows_near_capacity(self):
+        """An existing index is kept while it has room and recreated larger once it is nearly full."""
+        self.index_info = [{"index_name": "memzero", "capacity": 100, "size": 80}]
+        memory_graph = MemoryGraph(self.config)
+        self.assertEqual(self._queries("CREATE VECTOR INDEX"), [])
+
+        memory_graph._ensure_vector_index_capacity(4)
+        self.assertEqual(self._queries("DROP VECTOR INDEX"), [])
+        self.assertEqual(memory_graph.vector_index.size, 84)
+
+        self.index_info = [{"index_name": "memzero", "capacity": 100, "size": 86}]
+        memory_graph._ensure_vector_index_capacity(6)
+        self.assertEqual(self._queries("DROP VECTOR INDEX"), ["DROP VECTOR INDEX memzero;"])
+        self.assertIn("'capacity': 201", self._queries("CREATE VECTOR INDEX")[0])
+        self.assertEqual(memory_graph.vector_index.capacity, 201)
+        self.assertEqual(memory_graph.vector_index.size, 92)
+
+    def test_search_graph_db_uses_vector_index(self):
+        """Entity search goes through the vector index with the query embeddings."""
+        memory_graph = MemoryGraph(self.config)
+        self.mock_embedding_model.embed_batch.return_value = [[0.1] * 8, [0.2] * 8]
+        self.lookup_rows = [[{"name": "bob", "matches": [{"node_id": 7, "similarity": 0.9}], "truncated": False}]]
+        self.mock_graph.query.reset_mock()
+
+        memory_graph._search_graph_db(["bob", "pizza"], self.filters)
+
+        (lookup, relations) = self.mock_graph.query.call_args_list
+        self.assertIn('vector_search.search("memzero", $candidates, entity.embedding)', lookup.args[0])
+        self.assertNotIn("cosine_pairwise", lookup.args[0])
+        self.assertEqual(lookup.kwargs["params"]["candidates"], 50)
+        self.assertEqual([e["embedding"] for e in lookup.kwargs["params"]["entities"]], [[0.1] * 8, [0.2] * 8])
+        self.assertEqual(relations.kwargs["params"]["matches"], [{"node_id": 7, "similarity": 0.9}])
+
+    def test_lookup_is_not_crowded_out_by_other_users(self):
+        """Lookups whose candidates are all similar enough are retried with more candidates, then the whole index."""
+        memory_graph = MemoryGraph(self.config)
+        self.index_info = [{"index_name": "memzero", "capacity": 5000, "size": 4000}]
+        crowded = {"name": "bob", "matches": [], "truncated": True}
+        self.lookup_rows = [
+            [crowded, {"name": "pizza", "matches": [{"node_id": 3, "similarity": 0.8}], "truncated": False}],
+            [crowded],
+            [crowded],
+            [{"name": "bob", "matches": [{"node_id": 7, "similarity": 0.95}], "truncated": True}],
+        ]
+        self.mock_graph.query.reset_mock()
+
+        matches = memory_graph._similar_nodes(
+            [{"name": "bob", "embedding": [0.1] * 8}, {"name": "pizza", "embedding": [0.2] * 8}], self.filters, 0.7
+        )
+
+        lookups = [c for c in self.mock_graph.query.call_args_list if "vector_search.search" in c.args[0]]
+        self.assertEqual([c.kwargs["params"]["candidates"] for c in lookups], [50, 200, 800, 4000])
+        self.assertEqual([e["name"] for e in lookups[-1].kwargs["params"]["entities"]], ["bob"])
+        self.assertEqual(
+            matches, {"pizza": [{"node_id": 3, "similarity": 0.8}], "bob": [{"node_id": 7, "similarity": 0.95}]}
+        )
+
+    def test_node_search_stops_when_a_user_entity_is_found(self):
+        """Merging only needs the best node, so a match among truncated candidates is enough."""
+        memory_graph = MemoryGraph(self.config)
+        self.lookup_rows = [
+            [{"name": "source_candidate", "matches": [{"node_id": 7, "similarity": 0.95}], "truncated": True}]
+        ]
+        self.mock_graph.query.reset_mock()
+
+        result = memory_graph._search_source_node([0.1] * 8, self.filters)
+
+        self.assertEqual(result, [{"id(source_candidate)": 7}])
+        self.assertEqual(self.mock_graph.query.call_count, 1)
+
+    def test_driver_and_vector_index_shared_per_process(self):
+        """Instances on the same connection share the driver, the index setup and the capacity tracking."""
+        with patch("mem0.memory.memgraph_memory.Memgraph", return_value=self.mock_graph) as memgraph:
+            first = MemoryGraph(self.config)
+            ddl_queries = self.mock_graph.query.call_count
+            second = MemoryGraph(self.config)
+
+        memgraph.assert_called_once()
+        self.assertIs(first.graph, second.graph)
+        self.assertIs(first.vector_index, second.vector_index)
+        self.assertEqual(self.mock_graph.query.call_count, ddl_queries)
+
+        first._ensure_vector_index_capacity(10)
+        self.assertEqual(second.vector_index.size, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
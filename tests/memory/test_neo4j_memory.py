@@ -0,0 +1,330 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mem0.graphs import connections
+from mem0.memory.graph_memory import MemoryGraph
+
+
+class TestNeo4jMemory(unittest.TestCase):
+    """Test suite for the Neo4j Memory implementation."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.config = MagicMock()
+        self.config.graph_store.config.base_label = True
+        self.config.graph_store.config.vector_index = True
+        self.config.graph_store.config.vector_index_candidates = 50
+        self.config.llm.provider = "openai_structured"
+        self.config.graph_store.llm = None
+        self.config.graph_store.custom_prompt = None
+        self.config.graph_store.entity_matching = False
+        self.config.graph_store.entity_matching_ttl = 300.0
+
+        self.mock_graph = MagicMock()
+        self.mock_embedding_model = MagicMock()
+        self.mock_embedding_model.config.embedding_dims = 8
+
+        self.neo4j_graph_patcher = patch("mem0.memory.graph_memory.Neo4jGraph", return_value=self.mock_graph)
+        self.embedder_patcher = patch(
+            "mem0.memory.graph_memory.EmbedderFactory.create", return_value=self.mock_embedding_model
+        )
+        self.llm_patcher = patch("mem0.memory.graph_memory.LlmFactory.create", return_value=MagicMock())
+        self.neo4j_graph_patcher.start()
+        self.embedder_patcher.start()
+        self.llm_patcher.start()
+
+        self.filters = {"user_id": "alice"}
+
+    def tearDown(self):
+        """Tear down test fixtures after each test method."""
+        self.neo4j_graph_patcher.stop()
+        self.embedder_patcher.stop()
+        self.llm_patcher.stop()
+
+    def test_vector_index_created_from_embedder_dims(self):
+        """The vector index is sized from the embedder and used for node lookups."""
+        memory_graph = MemoryGraph(self.config)
+
+        self.assertEqual(memory_graph.vector_index_name, "entity_embedding_8")
+        create_query = self.mock_graph.query.call_args_list[-1].args[0]
+        self.assertIn("CREATE VECTOR INDEX entity_embedding_8 IF NOT EXISTS", create_query)
+        self.assertIn("`vector.dimensions`: 8", create_query)
+
+        self.mock_graph.query.reset_mock()
+        memory_graph._resolve_nodes([{"name": "bob", "embedding": [0.1] * 8}], self.filters)
+        cypher = self.mock_graph.query.call_args.args[0]
+        params = self.mock_graph.query.call_args.kwargs["params"]
+        self.assertIn("db.index.vector.queryNodes('entity_embedding_8', $vector_candidates, entity.embedding)", cypher)
+        self.assertNotIn("vector.similarity.cosine", cypher)
+        self.assertEqual(params["vector_candidates"], 50)
+
+    def test_falls_back_to_scan_without_vector_index_support(self):
+        """Servers without vector indexes keep the brute-force cosine scan."""
+
+        def query(cypher, params=None):
+            if "VECTOR INDEX" in cypher or "SHOW INDEXES" in cypher:
+                raise Exception("Invalid input 'VECTOR'")
+            return []
+
+        self.mock_graph.query.side_effect = query
+        memory_graph = MemoryGraph(self.config)
+
+        self.assertIsNone(memory_graph.vector_index_name)
+        memory_graph._search_graph_db(["bob"], {"user_id": "alice", "agent_id": "agent"})
+        cypher = self.mock_graph.query.call_args.args[0]
+        self.assertIn("vector.similarity.cosine(n.embedding, entity.embedding)", cypher)
+        self.assertIn("AND n.agent_id = $agent_id", cypher)
+
+    def test_search_graph_db_batches_entities_in_one_query(self):
+        """All entities are embedded together, looked up with one UNWIND query and their relations read in one."""
+        memory_graph = MemoryGraph(self.config)
+        self.mock_embedding_model.embed_batch.return_value = [[0.1] * 8, [0.2] * 8]
+        self.mock_graph.query.reset_mock()
+        relations = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
+        self.mock_graph.query.side_effect = [
+            [
+                {"name": "alice", "matches": [{"node_id": "4:a", "similarity": 0.9}], "truncated": False},
+                {"name": "bob", "matches": [{"node_id": "4:b", "similarity": 0.8}], "truncated": False},
+            ],
+            relations,
+        ]
+
+        result = memory_graph._search_graph_db(["alice", "bob"], self.filters, limit=10)
+
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob"])
+        self.mock_embedding_model.embed.assert_not_called()
+        self.assertEqual(self.mock_graph.query.call_count, 2)
+        (lookup, lookup_params), (cypher, params) = [
+            (call.args[0], call.kwargs["params"]) for call in self.mock_graph.query.call_args_list
+        ]
+        self.assertIn("UNWIND $entities AS entity", lookup)
+        self.assertEqual(lookup_params["entities"][1], {"name": "bob", "embedding": [0.2] * 8})
+        self.assertIn("max(match.similarity) AS similarity", cypher)
+        self.assertEqual([match["node_id"] for match in params["matches"]], ["4:a", "4:b"])
+        self.assertEqual(result, relations)
+
+    def test_lookup_is_not_crowded_out_by_other_users(self):
+        """When other users' entities fill the vector index candidates, more are fetched, then the user's scanned."""
+        memory_graph = MemoryGraph(self.config)
+        self.mock_graph.query.reset_mock()
+        # Every candidate of the index belongs to another user and is above the threshold
+        crowded = [{"name": "bob", "matches": [], "truncated": True}]
+        scanned = [{"name": "bob", "matches": [{"node_id": "4:bob", "similarity": 0.97}]}]
+        self.mock_graph.query.side_effect = [crowded, crowded, crowded, scanned]
+
+        resolved = memory_graph._resolve_nodes([{"name": "bob", "embedding": [0.1] * 8}], self.filters)
+
+        self.assertEqual(resolved, {"bob": "4:bob"})
+        calls = self.mock_graph.query.call_args_list
+        self.assertEqual([call.kwargs["params"].get("vector_candidates") for call in calls], [50, 200, 800, None])
+        self.assertIn("vector.similarity.cosine(n.embedding, entity.embedding)", calls[-1].args[0])
+        self.assertEqual(calls[-1].kwargs["params"]["user_id"], "alice")
+
+    def test_lookup_stops_when_user_entities_are_found(self):
+        """Candidates that are not all above the threshold contain every match of the user."""
+        memory_graph = MemoryGraph(self.config)
+        self.mock_graph.query.reset_mock()
+        self.mock_graph.query.side_effect = [
+            [
+                {"name": "bob", "matches": [{"node_id": "4:bob", "similarity": 0.95}], "truncated": True},
+                {"name": "carol", "matches": [], "truncated": False},
+            ]
+        ]
+
+        resolved = memory_graph._resolve_nodes(
+            [{"name": "bob", "embedding": [0.1] * 8}, {"name": "carol", "embedding": [0.2] * 8}], self.filters
+        )
+
+        self.assertEqual(resolved, {"bob": "4:bob"})
+        self.mock_graph.query.assert_called_once()
+
+    def _mock_transaction(self):
+        tx = MagicMock()
+        session = self.mock_graph._driver.session.return_value.__enter__.return_value
+        session.execute_write.side_effect = lambda work: work(tx)
+        return tx
+
+    def test_add_writes_relations_in_one_transaction_with_apoc(self):
+        """Node lookup is one query and all writes share one transaction with a single APOC relation merge."""
+        memory_graph = MemoryGraph(self.config)
+        memory_graph._has_apoc = MagicMock(return_value=True)
+        memory_graph._retrieve_nodes_from_data = MagicMock(
+            return_value={"alice": "person", "bob": "person", "pizza": "food"}
+        )
+        memory_graph._establish_nodes_relations_from_data = MagicMock(
+            return_value=[
+                {"source": "alice", "relationship": "knows", "destination": "bob"},
+                {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            ]
+        )
+        memory_graph._search_graph_db = MagicMock(
+            return_value=[{"source": "alice", "relationship": "hates", "destination": "pizza"}]
+        )
+        memory_graph._get_delete_entities_from_search_output = MagicMock(
+            return_value=[{"source": "alice", "relationship": "hates", "destination": "pizza"}]
+        )
+        self.mock_embedding_model.embed_batch.return_value = [[0.1] * 8, [0.2] * 8, [0.3] * 8]
+        self.mock_graph.query.reset_mock()
+        self.mock_graph.query.return_value = [
+            {"name": "alice", "matches": [{"node_id": "4:a", "similarity": 0.95}], "truncated": False}
+        ]
+
+        tx = self._mock_transaction()
+        tx.run.side_effect = lambda cypher, params: [
+            MagicMock(data=lambda node=node: {"name": node["name"], "node_id": f"4:{node['name']}"})
+            for node in params.get("nodes", [])
+        ]
+
+        memory_graph.add("Alice knows Bob and likes pizza", self.filters)
+
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob", "pizza"])
+        self.mock_graph.query.assert_called_once()
+        self.mock_graph._driver.session.return_value.__enter__.return_value.execute_write.assert_called_once()
+        self.mock_graph._driver.session.assert_called_once_with(database=self.mock_graph._database)
+
+        statements = [call.args for call in tx.run.call_args_list]
+        # One delete, one node merge per entity type, one relationship merge
+        self.assertEqual(len(statements), 4)
+        self.assertIn("DELETE r", statements[0][0])
+        self.assertEqual(statements[0][1]["relations"][0]["relationship"], "hates")
+        self.assertIn("n:`person`", statements[1][0])
+        self.assertEqual([node["name"] for node in statements[1][1]["nodes"]], ["bob"])
+        self.assertIn("n:`food`", statements[2][0])
+        self.assertIn("apoc.merge.relationship", statements[3][0])
+        self.assertEqual(
+            [(r["source_id"], r["destination_id"]) for r in statements[3][1]["relations"]],
+            [("4:a", "4:bob"), ("4:a", "4:pizza")],
+        )
+
+    def test_relations_grouped_by_type_without_apoc(self):
+        """Without APOC, relationships are merged with one statement per relationship type."""
+        memory_graph = MemoryGraph(self.config)
+        memory_graph._has_apoc = MagicMock(return_value=False)
+        tx = MagicMock()
+        tx.run.side_effect = lambda cypher, params: [
+            MagicMock(data=lambda r=r: {"index": r["index"], "source": r["source"], "target": r["destination"]})
+            for r in params["relations"]
+        ]
+
+        relations = [
+            {"source": "a", "source_id": "1", "destination": "b", "destination_id": "2", "relationship": "knows"},
+            {"source": "a", "source_id": "1", "destination": "c", "destination_id": "3", "relationship": "knows"},
+            {"source": "b", "source_id": "2", "destination": "c", "destination_id": "3", "relationship": "likes"},
+        ]
+        results = memory_graph._run_additions(tx, [], relations, self.filters)
+
+        # One result per relation, in the order given
+        self.assertEqual(
+            [[(row["source"], row["target"]) for row in rows] for rows in results],
+            [
+                [("a", "b")],
+                [("a", "c")],
+                [("b", "c")],
+            ],
+        )
+        statements = [call.args for call in tx.run.call_args_list]
+        self.assertEqual(len(statements), 2)
+        self.assertIn("MERGE (source)-[r:`knows`]->(destination)", statements[0][0])
+        self.assertEqual(len(statements[0][1]["relations"]), 2)
+        self.assertIn("MERGE (source)-[r:`likes`]->(destination)", statements[1][0])
+
+    def test_search_matches_known_entities_without_llm(self):
+        """Query entities come from the in-memory entity matcher; the LLM is only a fallback."""
+        self.config.graph_store.entity_matching = True
+        memory_graph = MemoryGraph(self.config)
+        memory_graph._retrieve_nodes_from_data = MagicMock(return_value={"pizza": "food"})
+        memory_graph._search_graph_db = MagicMock(return_value=[])
+        self.mock_graph.query.return_value = [{"name": "alice"}, {"name": "pizza"}]
+
+        memory_graph.search("Does alice still like pizza?", self.filters)
+
+        memory_graph._search_graph_db.assert_called_once_with(node_list=["alice", "pizza"], filters=self.filters)
+        memory_graph._retrieve_nodes_from_data.assert_not_called()
+
+        memory_graph.search("What is the weather today?", self.filters)
+        memory_graph._retrieve_nodes_from_data.assert_called_once()
+
+    def test_get_all_page_orders_by_relation_and_returns_cursor(self):
+        """get_all pages by relationship element id and returns the cursor of the next page."""
+        memory_graph = MemoryGraph(self.config)
+        self.mock_graph.query.return_value = [
+            {"source": "alice", "relationship": "likes", "target": f"food_{i}", "relation_id": f"5:x:{i}"}
+            for i in range(3)
+        ]
+
+        relations, cursor = memory_graph.get_all_page(self.filters, limit=2, cursor="5:x:0")
+
+        cypher = self.mock_graph.query.call_args.args[0]
+        params = self.mock_graph.query.call_args.kwargs["params"]
+        self.assertIn("elementId(r) > $cursor", cypher)
+        self.assertIn("ORDER BY relation_id", cypher)
+        self.assertEqual(params["cursor"], "5:x:0")
+        self.assertEqual(params["limit"], 3)
+        self.assertEqual([r["target"] for r in relations], ["food_0", "food_1"])
+        self.assertEqual(cursor, "5:x:1")
+
+    def test_writes_use_the_database_of_reads(self):
+        """Without a database in the config, writes go to the database Neo4jGraph resolved from NEO4J_DATABASE."""
+        self.config.graph_store.config.database = None
+
+        def neo4j_graph(url, username, password, database, **kwargs):
+            self.mock_graph._database = database or os.environ.get("NEO4J_DATABASE", "neo4j")
+            return self.mock_graph
+
+        with patch.dict(os.environ, {"NEO4J_DATABASE": "memories"}):
+            with patch("mem0.memory.graph_memory.Neo4jGraph", side_effect=neo4j_graph):
+                memory_graph = MemoryGraph(self.config)
+        self._mock_transaction()
+
+        memory_graph._delete_entities(
+            [{"source": "alice", "relationship": "likes", "destination": "pizza"}], self.filters
+        )
+
+        self.mock_graph._driver.session.assert_called_once_with(database="memories")
+
+    def test_one_driver_per_endpoint(self):
+        """Reads and explicit write transactions of every instance on one endpoint share a single driver."""
+        with patch("mem0.memory.graph_memory.Neo4jGraph", return_value=self.mock_graph) as neo4j_graph:
+            instances = [MemoryGraph(self.config) for _ in range(3)]
+        self._mock_transaction()
+        for memory_graph in instances:
+            memory_graph._delete_entities(
+                [{"source": "alice", "relationship": "likes", "destination": "pizza"}], self.filters
+            )
+
+        neo4j_graph.assert_called_once()
+        self.assertEqual(self.mock_graph._driver.session.call_count, 3)
+        registered = [
+            key for key in connections._graph_registry if key[:2] == ("neo4j", self.config.graph_store.config.url)
+        ]
+        self.assertEqual(len(registered), 1)
+
+    def test_driver_and_schema_shared_per_process(self):
+        """Instances on the same connection share the driver and run schema setup and the APOC probe once."""
+        self.config.graph_store.max_connection_pool_size = 20
+        self.config.graph_store.connection_timeout = None
+        self.config.graph_store.connection_acquisition_timeout = 5.0
+        self.config.graph_store.max_connection_lifetime = None
+        with patch("mem0.memory.graph_memory.Neo4jGraph", return_value=self.mock_graph) as neo4j_graph:
+            first = MemoryGraph(self.config)
+            ddl_queries = self.mock_graph.query.call_count
+            second = MemoryGraph(self.config)
+
+        neo4j_graph.assert_called_once()
+        self.assertEqual(
+            neo4j_graph.call_args.kwargs["driver_config"],
+            {
+                "notifications_min_severity": "OFF",
+                "max_connection_pool_size": 20,
+                "connection_acquisition_timeout": 5.0,
+            },
+        )
+        self.assertIs(first.graph, second.graph)
+        self.assertEqual(self.mock_graph.query.call_count, ddl_queries)
+        self.assertEqual(second.vector_index_name, "entity_embedding_8")
+
+        self.mock_graph.query.reset_mock()
+        first._has_apoc()
+        second._has_apoc()
+        self.mock_graph.query.assert_called_once()
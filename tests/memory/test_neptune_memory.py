@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import pytest
+from mem0.graphs.connections import clear_graph_registry
 from mem0.graphs.neptune.main import MemoryGraph
 from mem0.graphs.neptune.base import NeptuneBase
 
@@ -18,6 +19,10 @@ class TestNeptuneMemory(unittest.TestCase):
         self.config.llm.provider = "openai_structured"
         self.config.graph_store.llm = None
         self.config.graph_store.custom_prompt = None
+        self.config.graph_store.max_connection_pool_size = None
+        self.config.graph_store.connection_timeout = None
+        self.config.graph_store.connection_acquisition_timeout = None
+        self.config.graph_store.max_connection_lifetime = None
 
         # Create mock for NeptuneAnalyticsGraph
         self.mock_graph = MagicMock()
@@ -53,6 +58,14 @@ class TestNeptuneMemory(unittest.TestCase):
         self.neptune_analytics_graph_patcher.stop()
         self.create_embedding_model_patcher.stop()
         self.create_llm_patcher.stop()
+        clear_graph_registry()
+
+    def test_graph_client_shared_per_process(self):
+        """Instances on the same graph reuse one Neptune Analytics client."""
+        other = MemoryGraph(self.config)
+
+        self.assertIs(other.graph, self.memory_graph.graph)
+        self.mock_neptune_analytics_graph.assert_called_once_with("test-graph")
 
     def test_initialization(self):
         """Test that the MemoryGraph is initialized correctly."""
@@ -103,7 +116,8 @@ class TestNeptuneMemory(unittest.TestCase):
         self.memory_graph._retrieve_nodes_from_data.assert_called_once_with("Alice knows Bob", self.test_filters)
         self.memory_graph._establish_nodes_relations_from_data.assert_called_once()
         self.memory_graph._search_graph_db.assert_called_once()
-        self.memory_graph._get_delete_entities_from_search_output.assert_called_once()
+        # Nothing was found in the graph, so the delete decision is skipped
+        self.memory_graph._get_delete_entities_from_search_output.assert_not_called()
         self.memory_graph._delete_entities.assert_called_once_with([], self.user_id)
         self.memory_graph._add_entities.assert_called_once()
 
@@ -123,27 +137,22 @@ class TestNeptuneMemory(unittest.TestCase):
         ]
         self.memory_graph._search_graph_db = MagicMock(return_value=mock_search_results)
 
-        # Mock BM25Okapi
-        with patch("mem0.graphs.neptune.base.BM25Okapi") as mock_bm25:
-            mock_bm25_instance = MagicMock()
-            mock_bm25.return_value = mock_bm25_instance
-
-            # Mock get_top_n to return reranked results
-            reranked_results = [["alice", "knows", "bob"], ["alice", "works_with", "charlie"]]
-            mock_bm25_instance.get_top_n.return_value = reranked_results
+        # Term statistics are loaded from the stored relations
+        self.mock_graph.query.return_value = []
 
-            # Call the search method
-            result = self.memory_graph.search("Find Alice", self.test_filters, limit=5)
+        # Call the search method
+        result = self.memory_graph.search("Who works with Charlie?", self.test_filters, limit=5)
 
-            # Verify the method calls
-            self.memory_graph._retrieve_nodes_from_data.assert_called_once_with("Find Alice", self.test_filters)
-            self.memory_graph._search_graph_db.assert_called_once_with(node_list=["alice"], filters=self.test_filters)
+        # Verify the method calls
+        self.memory_graph._retrieve_nodes_from_data.assert_called_once_with(
+            "Who works with Charlie?", self.test_filters
+        )
+        self.memory_graph._search_graph_db.assert_called_once_with(node_list=["alice"], filters=self.test_filters)
 
-            # Check the result structure
-            self.assertEqual(len(result), 2)
-            self.assertEqual(result[0]["source"], "alice")
-            self.assertEqual(result[0]["relationship"], "knows")
-            self.assertEqual(result[0]["destination"], "bob")
+        # Check the result structure; the relation matching the query ranks first
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0], {"source": "alice", "relationship": "works_with", "destination": "charlie"})
+        self.assertEqual(result[1], {"source": "alice", "relationship": "knows", "destination": "bob"})
 
     def test_get_all_method(self):
         """Test the get_all method."""
@@ -164,7 +173,7 @@ class TestNeptuneMemory(unittest.TestCase):
         result = self.memory_graph.get_all(self.test_filters, limit=10)
 
         # Verify the method calls
-        self.memory_graph._get_all_cypher.assert_called_once_with(self.test_filters, 10)
+        self.memory_graph._get_all_cypher.assert_called_once_with(self.test_filters, 11, None)
         self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result structure
@@ -240,31 +249,39 @@ class TestNeptuneMemory(unittest.TestCase):
         # Mock node list
         node_list = ["alice", "bob"]
 
-        # Mock embedding
-        mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
+        # Mock embeddings
+        mock_embeddings = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        self.mock_embedding_model.embed_batch.return_value = mock_embeddings
 
         # Mock the _search_graph_db_cypher method
         mock_cypher = "MATCH (n) RETURN n"
-        mock_params = {"n_embedding": mock_embedding, "user_id": self.user_id, "threshold": 0.7, "limit": 10}
+        mock_params = {"user_id": self.user_id, "threshold": 0.7, "limit": 10}
         self.memory_graph._search_graph_db_cypher = MagicMock(return_value=(mock_cypher, mock_params))
 
         # Mock the graph.query results
-        mock_query_result1 = [{"source": "alice", "relationship": "knows", "destination": "bob"}]
-        mock_query_result2 = [{"source": "bob", "relationship": "works_with", "destination": "charlie"}]
-        self.mock_graph.query.side_effect = [mock_query_result1, mock_query_result2]
+        mock_query_result = [
+            {"source": "alice", "relationship": "knows", "destination": "bob"},
+            {"source": "bob", "relationship": "works_with", "destination": "charlie"},
+        ]
+        self.mock_graph.query.return_value = mock_query_result
 
         # Call the _search_graph_db method
         result = self.memory_graph._search_graph_db(node_list, self.test_filters, limit=10)
 
-        # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
-        self.assertEqual(self.memory_graph._search_graph_db_cypher.call_count, 2)
-        self.assertEqual(self.mock_graph.query.call_count, 2)
+        # All entities are embedded and searched in a single round trip
+        self.mock_embedding_model.embed_batch.assert_called_once_with(node_list)
+        self.memory_graph._search_graph_db_cypher.assert_called_once_with(
+            [
+                {"name": "alice", "embedding": mock_embeddings[0]},
+                {"name": "bob", "embedding": mock_embeddings[1]},
+            ],
+            self.test_filters,
+            10,
+        )
+        self.mock_graph.query.assert_called_once_with(mock_cypher, params=mock_params)
 
         # Check the result
-        expected_result = mock_query_result1 + mock_query_result2
-        self.assertEqual(result, expected_result)
+        self.assertEqual(result, mock_query_result)
 
     def test_add_entities(self):
         """Test the _add_entities method."""
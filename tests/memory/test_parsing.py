@@ -0,0 +1,123 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.memory.parsing import ResponseParser
+from mem0.memory.utils import get_parse_stats, loads_lenient, parse_tool_arguments, repair_json, reset_parse_stats
+
+MESSAGES = [{"role": "system", "content": "Extract facts."}, {"role": "user", "content": "I'm vegetarian."}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats():
+    reset_parse_stats()
+    yield
+    reset_parse_stats()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('Here you go:\n```json\n{"facts": ["a", "b",]}\n```', {"facts": ["a", "b"]}),
+        (
+            "{'facts': ['It\\'s raining'], 'done': True, 'next': None}",
+            {"facts": ["It's raining"], "done": True, "next": None},
+        ),
+        ('{"facts": ["line one\nline two"]} // trailing note', {"facts": ["line one\nline two"]}),
+        ('{"facts": ["Likes pizza", "Lives in Par', {"facts": ["Likes pizza"]}),
+        ('{"memory": [{"id": "0", "event": "ADD", "text": ', {"memory": [{"id": "0", "event": "ADD"}]}),
+    ],
+)
+def test_repair_json(text, expected):
+    assert json.loads(repair_json(text)) == expected
+
+
+def test_loads_lenient_counts_repairs():
+    assert loads_lenient('{"facts": []}') == {"facts": []}
+    assert loads_lenient('{"facts": ["a",]}') == {"facts": ["a"]}
+    with pytest.raises(ValueError):
+        loads_lenient("No facts here.")
+
+    stats = get_parse_stats()
+    assert stats["responses"] == 3
+    assert stats["parse_errors"] == 2
+    assert stats["repaired"] == 1
+    assert stats["failures"] == 1
+
+
+def test_tool_arguments():
+    assert parse_tool_arguments('```json\n{"query": "pizza",}\n```') == {"query": "pizza"}
+    assert parse_tool_arguments({"query": "pizza"}) == {"query": "pizza"}
+    assert parse_tool_arguments("") == {}
+
+
+def test_truncated_facts_are_repaired_without_asking_again():
+    llm = Mock()
+    llm.stream_response.return_value = iter(['{"facts": ["Is vegetarian", ', '42, "Lives in Par'])
+
+    assert list(ResponseParser(llm).stream_facts(MESSAGES)) == ["Is vegetarian"]
+    llm.generate_response.assert_not_called()
+    stats = get_parse_stats()
+    assert stats["repaired"] == 1 and stats["dropped_items"] == 1
+
+
+def test_unparseable_facts_are_asked_again():
+    llm = Mock()
+    llm.stream_response.return_value = iter(["The user is vegetarian."])
+    llm.generate_response.return_value = '{"facts": ["Is vegetarian"]}'
+
+    assert list(ResponseParser(llm).stream_facts(MESSAGES)) == ["Is vegetarian"]
+    messages = llm.generate_response.call_args.kwargs["messages"]
+    assert messages[:2] == MESSAGES
+    assert messages[2] == {"role": "assistant", "content": "The user is vegetarian."}
+    assert "not valid JSON" in messages[3]["content"]
+    assert get_parse_stats()["reasks"] == 1
+
+
+def test_empty_facts_response_is_not_asked_again():
+    llm = Mock()
+    llm.stream_response.return_value = iter([""])
+
+    with pytest.raises(ValueError):
+        list(ResponseParser(llm).stream_facts(MESSAGES))
+    llm.generate_response.assert_not_called()
+    assert get_parse_stats()["failures"] == 1
+
+
+def test_only_invalid_memory_actions_are_asked_again():
+    llm = Mock()
+    llm.generate_response.return_value = '{"memory": [{"id": "1", "text": "Likes pizza", "event": "UPDATE"}]}'
+    response = json.dumps(
+        {
+            "memory": [
+                {"id": "0", "text": "Is vegetarian", "event": "ADD"},
+                {"id": "7", "text": "Likes pizza", "event": "UPDATE"},
+                {"id": "1", "text": "Likes pasta", "event": "REPLACE"},
+            ]
+        }
+    )
+
+    result = ResponseParser(llm).parse_memory_actions(response, MESSAGES, ["1"])
+
+    assert [(action["id"], action["event"]) for action in result["memory"]] == [("0", "ADD"), ("1", "UPDATE")]
+    instruction = llm.generate_response.call_args.kwargs["messages"][-1]["content"]
+    assert "unknown memory id 7" in instruction and "REPLACE" in instruction
+    assert "Is vegetarian" not in instruction
+    stats = get_parse_stats()
+    assert stats["invalid_items"] == 2 and stats["reasks"] == 1 and stats["dropped_items"] == 1
+
+
+def test_reasks_can_be_disabled():
+    llm = Mock()
+    response = '{"memory": [{"id": "7", "text": "Likes pizza", "event": "DELETE"}]}'
+
+    assert ResponseParser(llm, max_reasks=0).parse_memory_actions(response, MESSAGES, ["1"]) == {"memory": []}
+    llm.generate_response.assert_not_called()
+
+
+def test_structured_output_providers_get_the_schema():
+    parser = ResponseParser(Mock(), "openai_structured")
+    assert parser.facts_format["type"] == "json_schema"
+    assert parser.memory_actions_format["json_schema"]["schema"]["required"] == ["memory"]
+    assert ResponseParser(Mock(), "openai").facts_format == {"type": "json_object"}
@@ -0,0 +1,156 @@
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mem0.memory.sqlite_graph_memory import MemoryGraph
+
+
+def fake_embedding(text, dims=16):
+    seed = int(hashlib.md5(text.encode()).hexdigest(), 16) % (2**32)
+    return np.random.default_rng(seed).normal(size=dims).tolist()
+
+
+@pytest.fixture
+def embedding_model():
+    model = MagicMock()
+    model.embed.side_effect = fake_embedding
+    model.embed_batch.side_effect = lambda texts, memory_action=None: [fake_embedding(text) for text in texts]
+    return model
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = MagicMock()
+    config.graph_store.config.path = str(tmp_path / "graph.db")
+    config.graph_store.llm = None
+    config.graph_store.custom_prompt = None
+    config.graph_store.entity_matching = True
+    config.graph_store.entity_matching_llm_fallback = True
+    config.graph_store.entity_matching_ttl = None
+    config.llm.provider = "openai_structured"
+    return config
+
+
+@pytest.fixture
+def memory_graph(config, embedding_model):
+    with (
+        patch("mem0.memory.sqlite_graph_memory.EmbedderFactory.create", return_value=embedding_model),
+        patch("mem0.memory.sqlite_graph_memory.LlmFactory.create", return_value=MagicMock()),
+    ):
+        yield MemoryGraph(config)
+
+
+def relation(source, relationship, destination):
+    return {"source": source, "relationship": relationship, "destination": destination}
+
+
+def test_write_and_read_relations(memory_graph):
+    filters = {"user_id": "alice"}
+    result = memory_graph._write_changes(
+        [relation("alice", "likes", "pizza"), relation("alice", "lives_in", "paris")],
+        [],
+        filters,
+        {"alice": "person", "pizza": "food", "paris": "city"},
+    )
+
+    assert result["added_entities"] == [
+        [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "paris"}],
+    ]
+    assert memory_graph.get_all(filters) == [
+        {"source": "alice", "relationship": "likes", "target": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "target": "paris"},
+    ]
+    assert memory_graph.get_all({"user_id": "bob"}) == []
+
+    # Re-adding a relation merges it with the existing nodes and edge
+    memory_graph._write_changes([relation("alice", "likes", "pizza")], [], filters, {})
+    nodes = memory_graph.connection.execute("SELECT name, mentions FROM nodes ORDER BY id").fetchall()
+    assert [(row["name"], row["mentions"]) for row in nodes] == [("alice", 3), ("pizza", 2), ("paris", 1)]
+    assert len(memory_graph.get_all(filters)) == 2
+
+
+def test_search_graph_db_and_deletions(memory_graph):
+    filters = {"user_id": "alice"}
+    memory_graph._write_changes(
+        [relation("alice", "likes", "pizza"), relation("bob", "works_at", "acme")], [], filters, {}
+    )
+
+    results = memory_graph._search_graph_db(["pizza"], filters)
+    assert [(r["source"], r["relationship"], r["destination"]) for r in results] == [("alice", "likes", "pizza")]
+    assert results[0]["similarity"] == pytest.approx(1.0)
+
+    memory_graph._write_changes([], [relation("alice", "likes", "pizza")], filters, {})
+    assert memory_graph._search_graph_db(["pizza"], filters) == []
+    assert memory_graph.get_all(filters) == [{"source": "bob", "relationship": "works_at", "target": "acme"}]
+
+
+def test_deleting_a_missing_relation_reports_nothing(memory_graph):
+    filters = {"user_id": "alice"}
+    memory_graph._write_changes([relation("alice", "likes", "pizza")], [], filters, {})
+    memory_graph.reranker.update = MagicMock()
+
+    result = memory_graph._write_changes([], [relation("alice", "likes", "sushi")], filters, {})
+
+    assert result["deleted_entities"] == []
+    assert memory_graph.reranker.update.call_args.args[2] == []
+    assert memory_graph.get_all(filters) == [{"source": "alice", "relationship": "likes", "target": "pizza"}]
+
+
+def test_search_uses_entity_matcher(memory_graph):
+    filters = {"user_id": "alice"}
+    memory_graph._write_changes([relation("alice", "likes", "pizza")], [], filters, {})
+    memory_graph._retrieve_nodes_from_data = MagicMock()
+
+    assert memory_graph.search("what pizza do I like?", filters) == [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"}
+    ]
+    memory_graph._retrieve_nodes_from_data.assert_not_called()
+
+
+def test_agent_scope_and_delete_all(memory_graph):
+    memory_graph._write_changes([relation("alice", "likes", "pizza")], [], {"user_id": "alice", "agent_id": "a1"}, {})
+    memory_graph._write_changes([relation("alice", "likes", "sushi")], [], {"user_id": "alice", "agent_id": "a2"}, {})
+
+    assert memory_graph.get_all({"user_id": "alice", "agent_id": "a1"}) == [
+        {"source": "alice", "relationship": "likes", "target": "pizza"}
+    ]
+    assert memory_graph._search_graph_db(["sushi"], {"user_id": "alice", "agent_id": "a1"}) == []
+    assert len(memory_graph.get_all({"user_id": "alice"})) == 2
+
+    memory_graph.delete_all({"user_id": "alice", "agent_id": "a1"})
+    assert memory_graph.get_all({"user_id": "alice"}) == [
+        {"source": "alice", "relationship": "likes", "target": "sushi"}
+    ]
+    assert memory_graph._search_graph_db(["pizza"], {"user_id": "alice"}) == []
+
+
+def test_other_connections_invalidate_cached_embeddings(config, embedding_model, memory_graph):
+    filters = {"user_id": "alice"}
+    assert memory_graph._search_graph_db(["pizza"], filters) == []
+
+    with (
+        patch("mem0.memory.sqlite_graph_memory.EmbedderFactory.create", return_value=embedding_model),
+        patch("mem0.memory.sqlite_graph_memory.LlmFactory.create", return_value=MagicMock()),
+    ):
+        other = MemoryGraph(config)
+    other._write_changes([relation("alice", "likes", "pizza")], [], filters, {})
+
+    assert len(memory_graph._search_graph_db(["pizza"], filters)) == 1
+
+
+def test_get_all_pages_with_cursor(memory_graph):
+    filters = {"user_id": "alice"}
+    memory_graph._write_changes([relation("alice", "likes", f"food_{i}") for i in range(5)], [], filters, {})
+
+    page, cursor = memory_graph.get_all_page(filters, limit=2)
+    assert [r["target"] for r in page] == ["food_0", "food_1"]
+    page, cursor = memory_graph.get_all_page(filters, limit=2, cursor=cursor)
+    assert [r["target"] for r in page] == ["food_2", "food_3"]
+    page, cursor = memory_graph.get_all_page(filters, limit=2, cursor=cursor)
+    assert [r["target"] for r in page] == ["food_4"]
+    assert cursor is None
+
+    assert [r["target"] for r in memory_graph.iter_all(filters, page_size=2)] == [f"food_{i}" for i in range(5)]
@@ -0,0 +1,29 @@
+import pytest
+
+from mem0.memory.utils import iter_json_list_items
+
+RESPONSE = '```json\n{"facts" : ["Name is John", "Likes \\"pizza\\"", 12, {"nested": [1, 2]}]}\n```'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, len(RESPONSE)])
+def test_iter_json_list_items_across_chunk_boundaries(chunk_size):
+    chunks = [RESPONSE[i : i + chunk_size] for i in range(0, len(RESPONSE), chunk_size)]
+    assert list(iter_json_list_items(chunks, "facts")) == ["Name is John", 'Likes "pizza"', 12, {"nested": [1, 2]}]
+
+
+def test_iter_json_list_items_yields_before_the_stream_ends():
+    def chunks():
+        yield '{"facts": ["first", "sec'
+        assert received == ["first"]
+        yield 'ond"]}'
+
+    received = []
+    for item in iter_json_list_items(chunks(), "facts"):
+        received.append(item)
+    assert received == ["first", "second"]
+
+
+def test_iter_json_list_items_invalid_response():
+    assert list(iter_json_list_items(['{"facts": []}'], "facts")) == []
+    with pytest.raises(ValueError):
+        list(iter_json_list_items(["I could not find any facts."], "facts"))
@@ -0,0 +1,110 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.base import LlmCacheConfig
+from mem0.llms.cache import ResponseCache
+from mem0.memory.utils import parse_vision_messages
+from mem0.memory.vision import ImageDescriber
+
+
+def image(url):
+    return {"role": "user", "content": {"type": "image_url", "image_url": {"url": url}}}
+
+
+def make_llm():
+    llm = Mock()
+    llm.config.model = "gpt-4o"
+    llm.generate_response.side_effect = lambda messages: "A picture of " + messages[0]["content"][1]["image_url"]["url"]
+    return llm
+
+
+def test_images_are_described_concurrently_once_each():
+    both_started = threading.Barrier(2, timeout=5)
+
+    def describe(messages):
+        both_started.wait()
+        return "A picture of " + messages[0]["content"][1]["image_url"]["url"]
+
+    llm = make_llm()
+    llm.generate_response.side_effect = describe
+    messages = [
+        {"role": "system", "content": "You are helpful."},
+        image("https://example.com/cat.png"),
+        {"role": "user", "content": "And the same again:"},
+        image("https://example.com/cat.png"),
+        image("https://example.com/dog.png"),
+    ]
+
+    parsed = ImageDescriber(llm).parse(messages)
+
+    assert [msg["content"] for msg in parsed] == [
+        "You are helpful.",
+        "A picture of https://example.com/cat.png",
+        "And the same again:",
+        "A picture of https://example.com/cat.png",
+        "A picture of https://example.com/dog.png",
+    ]
+    assert llm.generate_response.call_count == 2
+
+
+def test_parts_of_a_message_are_described_one_image_at_a_time(tmp_path):
+    cache = ResponseCache(LlmCacheConfig(path=str(tmp_path / "vision.db")))
+    llm = make_llm()
+    ImageDescriber(llm, cache=cache).parse([image("https://example.com/cat.png")])
+    message = {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "Which one is cuter?"},
+            {"type": "image_url", "image_url": {"url": "https://example.com/cat.png"}},
+            {"type": "image_url", "image_url": {"url": "https://example.com/dog.png"}},
+        ],
+    }
+
+    parsed = ImageDescriber(llm, cache=cache).parse([message])
+
+    # The cat was described by the earlier call; only the dog is new
+    assert parsed == [
+        {
+            "role": "user",
+            "content": "Which one is cuter?\nA picture of https://example.com/cat.png\n"
+            "A picture of https://example.com/dog.png",
+        }
+    ]
+    assert llm.generate_response.call_count == 2
+
+
+def test_descriptions_are_cached_across_calls(tmp_path):
+    config = LlmCacheConfig(path=str(tmp_path / "vision.db"))
+    llm = make_llm()
+    ImageDescriber(llm, cache=ResponseCache(config)).parse([image("https://example.com/cat.png")])
+
+    # A new process reads the description from disk
+    other_llm = make_llm()
+    parsed = ImageDescriber(other_llm, cache=ResponseCache(config)).parse([image("https://example.com/cat.png")])
+
+    assert parsed[0]["content"] == "A picture of https://example.com/cat.png"
+    other_llm.generate_response.assert_not_called()
+
+
+def test_failed_download_is_reported():
+    llm = make_llm()
+    llm.generate_response.side_effect = RuntimeError("404")
+
+    with pytest.raises(Exception, match="Error while downloading https://example.com/missing.png"):
+        parse_vision_messages([image("https://example.com/missing.png")], llm)
+
+
+@pytest.mark.asyncio
+async def test_aparse_describes_images():
+    llm = make_llm()
+    describer = ImageDescriber(llm, max_concurrency=1, cache=ResponseCache(LlmCacheConfig()))
+    messages = [image("https://example.com/cat.png"), image("https://example.com/dog.png")]
+
+    parsed = await describer.aparse(messages)
+    parsed_again = await describer.aparse(messages)
+
+    assert parsed == parsed_again
+    assert parsed[1] == {"role": "user", "content": "A picture of https://example.com/dog.png"}
+    assert llm.generate_response.call_count == 2
@@ -0,0 +1,93 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mem0.configs.base import InputWindowConfig
+from mem0.memory.utils import parse_messages
+from mem0.memory.window import InputWindow, extract_facts
+
+FILTERS = {"user_id": "alice"}
+
+
+def turns(n):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"} for i in range(n)]
+
+
+def test_full_history_is_skipped_up_to_the_high_water_mark():
+    window = InputWindow(InputWindowConfig())
+    history = turns(4)
+
+    selected, mark = window.select(history, FILTERS)
+    assert selected == history
+    window.commit(FILTERS, mark)
+
+    history += turns(6)[4:]
+    selected, mark = window.select(history, FILTERS)
+    assert selected == history[4:]
+    window.commit(FILTERS, mark)
+
+    # Resending the same history, or a window that slid past the start, adds nothing new
+    assert window.select(history, FILTERS) == ([], None)
+    assert window.select(history[3:], FILTERS) == ([], None)
+    # Other sessions keep their own mark
+    assert window.select(history, {"user_id": "bob"})[0] == history
+
+
+def test_single_messages_are_chained_across_adds():
+    window = InputWindow(InputWindowConfig())
+    first, second = {"role": "user", "content": "yes"}, {"role": "user", "content": "yes"}
+
+    selected, mark = window.select([first], FILTERS)
+    window.commit(FILTERS, mark)
+    # A repeated short reply on its own is still new
+    selected, mark = window.select([second], FILTERS)
+    assert selected == [second]
+    window.commit(FILTERS, mark)
+
+    assert window.select([first, second], FILTERS) == ([], None)
+
+
+def test_uncommitted_messages_are_selected_again():
+    window = InputWindow(InputWindowConfig())
+    window.select(turns(2), FILTERS)
+
+    assert window.select(turns(2), FILTERS)[0] == turns(2)
+
+
+def test_chunks_respect_token_budget():
+    window = InputWindow(InputWindowConfig(chunk_tokens=10))
+    messages = turns(6) + [{"role": "user", "content": "x" * 100}]
+
+    chunks = window.chunk(messages)
+
+    assert len(chunks) > 1
+    assert all(window.count_tokens(chunk) <= 10 for chunk in chunks)
+    assert "".join(chunks[:3]) == parse_messages(turns(6))[: len("".join(chunks[:3]))]
+    assert all(chunk.startswith("user: x") for chunk in chunks[-3:])
+
+
+def test_small_conversation_is_one_chunk():
+    window = InputWindow(InputWindowConfig())
+
+    assert window.chunk(turns(3)) == [parse_messages(turns(3))]
+
+
+def test_chunk_facts_are_extracted_in_parallel_and_merged():
+    responses = {
+        "user: a\n": ['{"facts": ["Likes tea", ', '"Lives in Oslo"]}'],
+        "user: b\n": ['{"facts": ["Lives in Oslo", "Has a cat"]}'],
+        "user: c\n": ["not json"],
+    }
+    llm = Mock()
+    llm.stream_response.side_effect = lambda messages, response_format: iter(
+        responses[messages[1]["content"].split("Input:\n", 1)[1]]
+    )
+
+    # The facts of the other chunks are kept, and the failed chunk is reported at the end
+    facts = []
+    with pytest.raises(ValueError, match="1 of 3"):
+        for fact in extract_facts(llm, ["user: a\n", "user: b\n", "user: c\n"]):
+            facts.append(fact)
+
+    assert sorted(facts) == ["Has a cat", "Likes tea", "Lives in Oslo"]
+    assert llm.stream_response.call_count == 3
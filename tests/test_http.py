@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mem0.configs.base import HttpPoolConfig
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.utils.http import clear_http_clients, get_async_http_client, get_http_client, get_http_transport
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients():
+    clear_http_clients()
+    yield
+    clear_http_clients()
+
+
+def test_clients_are_shared_by_settings():
+    client = get_http_client()
+
+    assert get_http_client(HttpPoolConfig()) is client
+    assert BaseLlmConfig(model="gpt-4o-mini").http_client is client
+    assert BaseEmbedderConfig(model="text-embedding-3-small").http_client is client
+    assert get_http_client(HttpPoolConfig(max_connections=10)) is not client
+    assert get_async_http_client() is not client
+
+
+def test_pool_settings_are_applied():
+    client = get_http_client(HttpPoolConfig(timeout=30.0, connect_timeout=2.0))
+
+    assert client.timeout == httpx.Timeout(30.0, connect=2.0)
+    assert get_http_transport() is get_http_transport(HttpPoolConfig())
+
+
+def test_http2_falls_back_without_h2():
+    with patch("mem0.utils.http._http2_available", return_value=False):
+        with patch("mem0.utils.http.httpx.Client") as mock_client:
+            get_http_client()
+
+    assert mock_client.call_args.kwargs["http2"] is False
+
+
+def test_proxies():
+    single = get_http_client(proxies="http://proxy.mem0.net:8000")
+    by_pattern = get_http_client(proxies={"https://": "http://proxy.mem0.net:8000"})
+
+    assert single is not get_http_client()
+    assert single is get_http_client(proxies="http://proxy.mem0.net:8000")
+    assert any(pattern.pattern == "https://" for pattern in by_pattern._mounts)
+
+
+def test_config_accepts_dict():
+    config = BaseLlmConfig(model="gpt-4o-mini", http_pool={"max_connections": 10})
+
+    assert config.http_pool.max_connections == 10
+    assert config.http_client is get_http_client(HttpPoolConfig(max_connections=10))
+    with pytest.raises(ValueError):
+        HttpPoolConfig(max_conections=10)
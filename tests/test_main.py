@@ -1,4 +1,5 @@
 import os
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -61,7 +62,7 @@ def memory_custom_instance():
 def test_add(memory_instance, version, enable_graph):
     memory_instance.config.version = version
     memory_instance.enable_graph = enable_graph
-    memory_instance._add_to_vector_store = Mock(return_value=[{"memory": "Test memory", "event": "ADD"}])
+    memory_instance._add_to_vector_store = Mock(return_value=([{"memory": "Test memory", "event": "ADD"}], True))
     memory_instance._add_to_graph = Mock(return_value=[])
 
     result = memory_instance.add(messages=[{"role": "user", "content": "Test message"}], user_id="test_user")
@@ -221,8 +222,8 @@ def test_get_all(memory_instance, version, enable_graph, expected_result):
     memory_instance.enable_graph = enable_graph
     mock_memories = [Mock(id="1", payload={"data": "Memory 1", "user_id": "test_user"})]
     memory_instance.vector_store.list = Mock(return_value=(mock_memories, None))
-    memory_instance.graph.get_all = Mock(
-        return_value=[{"source": "entity1", "relationship": "rel", "target": "entity2"}]
+    memory_instance.graph.get_all_page = Mock(
+        return_value=([{"source": "entity1", "relationship": "rel", "target": "entity2"}], None)
     )
 
     result = memory_instance.get_all(user_id="test_user")
@@ -239,36 +240,38 @@ def test_get_all(memory_instance, version, enable_graph, expected_result):
     if enable_graph:
         assert "relations" in result
         assert result["relations"] == expected_result["relations"]
+        assert result["next_relations_cursor"] is None
     else:
         assert "relations" not in result
 
     memory_instance.vector_store.list.assert_called_once_with(filters={"user_id": "test_user"}, limit=100)
 
     if enable_graph:
-        memory_instance.graph.get_all.assert_called_once_with({"user_id": "test_user"}, 100)
+        memory_instance.graph.get_all_page.assert_called_once_with({"user_id": "test_user"}, 100, None)
     else:
-        memory_instance.graph.get_all.assert_not_called()
+        memory_instance.graph.get_all_page.assert_not_called()
 
 
 def test_custom_prompts(memory_custom_instance):
     messages = [{"role": "user", "content": "Test message"}]
     from mem0.embeddings.mock import MockEmbeddings
 
-    memory_custom_instance.llm.generate_response = Mock()
-    memory_custom_instance.llm.generate_response.return_value = '{"facts": ["fact1", "fact2"]}'
+    memory_custom_instance.llm.stream_response = Mock(return_value=iter(['{"facts": ["fa', 'ct1", "fact2"]}']))
+    memory_custom_instance.llm.generate_response = Mock(return_value='{"memory": []}')
     memory_custom_instance.embedding_model = MockEmbeddings()
 
     with patch("mem0.memory.main.parse_messages", return_value="Test message") as mock_parse_messages:
         with patch(
-            "mem0.memory.main.get_update_memory_messages", return_value="custom update memory prompt"
-        ) as mock_get_update_memory_messages:
+            "mem0.memory.main.get_update_memory_prompts",
+            return_value=("custom update memory prompt", "existing memories and new facts"),
+        ) as mock_get_update_memory_prompts:
             memory_custom_instance.add(messages=messages, user_id="test_user")
 
             ## custom prompt
             ##
             mock_parse_messages.assert_called_once_with(messages)
 
-            memory_custom_instance.llm.generate_response.assert_any_call(
+            memory_custom_instance.llm.stream_response.assert_called_once_with(
                 messages=[
                     {"role": "system", "content": memory_custom_instance.config.custom_fact_extraction_prompt},
                     {"role": "user", "content": f"Input:\n{mock_parse_messages.return_value}"},
@@ -278,11 +281,151 @@ def test_custom_prompts(memory_custom_instance):
 
             ## custom update memory prompt
             ##
-            mock_get_update_memory_messages.assert_called_once_with(
+            mock_get_update_memory_prompts.assert_called_once_with(
                 [], ["fact1", "fact2"], memory_custom_instance.config.custom_update_memory_prompt
             )
 
             memory_custom_instance.llm.generate_response.assert_any_call(
-                messages=[{"role": "user", "content": mock_get_update_memory_messages.return_value}],
+                messages=[
+                    {"role": "system", "content": "custom update memory prompt"},
+                    {"role": "user", "content": "existing memories and new facts"},
+                ],
                 response_format={"type": "json_object"},
             )
+
+
+def test_fused_add_mode(memory_instance):
+    memory_instance.config.add_mode = "fused"
+    memory_instance.config.llm.provider = "openai_structured"
+    existing = Mock(id="uuid-1", payload={"data": "Likes pizza"})
+    memory_instance.vector_store.search.return_value = [existing]
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed.return_value = [0.1, 0.2]
+    memory_instance.embedding_model.embed_batch.return_value = [[0.3, 0.4], [0.5, 0.6]]
+    memory_instance.llm.generate_response = Mock(
+        return_value="""{"facts": ["Lives in Paris", "Loves pizza"], "memory": [
+            {"id": "0", "text": "Loves pizza", "event": "UPDATE", "old_memory": "Likes pizza"},
+            {"id": "1", "text": "Lives in Paris", "event": "ADD", "old_memory": null},
+            {"id": "7", "text": "Hallucinated", "event": "DELETE", "old_memory": null}]}"""
+    )
+    memory_instance._create_memory = Mock(return_value="uuid-2")
+    memory_instance._update_memory = Mock()
+    memory_instance._delete_memory = Mock()
+
+    with patch("mem0.memory.main.capture_event"):
+        result = memory_instance._add_to_vector_store(
+            [{"role": "user", "content": "I moved to Paris and I love pizza"}], {}, {"user_id": "test_user"}, True
+        )
+
+    # One embedding and one search of the raw turn, then a single schema-constrained LLM call
+    memory_instance.embedding_model.embed.assert_called_once_with("I moved to Paris and I love pizza", "search")
+    memory_instance.vector_store.search.assert_called_once()
+    memory_instance.llm.generate_response.assert_called_once()
+    response_format = memory_instance.llm.generate_response.call_args.kwargs["response_format"]
+    assert response_format["type"] == "json_schema" and response_format["json_schema"]["strict"] is True
+
+    embeddings = {"Loves pizza": [0.3, 0.4], "Lives in Paris": [0.5, 0.6]}
+    memory_instance._update_memory.assert_called_once_with(
+        memory_id="uuid-1", data="Loves pizza", existing_embeddings=embeddings, metadata={}
+    )
+    memory_instance._create_memory.assert_called_once_with(
+        data="Lives in Paris", existing_embeddings=embeddings, metadata={}
+    )
+    memory_instance._delete_memory.assert_not_called()
+    result, inferred = result
+    assert inferred is True
+    assert [(r["id"], r["event"]) for r in result] == [("uuid-1", "UPDATE"), ("uuid-2", "ADD")]
+
+
+def test_fused_add_request_per_provider():
+    from mem0.memory.fused import get_fused_request_params, parse_fused_response
+
+    assert get_fused_request_params("azure_openai_structured")["response_format"]["type"] == "json_schema"
+    assert get_fused_request_params("gemini")["tools"][0]["function"]["name"] == "record_memory_changes"
+    assert get_fused_request_params("anthropic") == {"response_format": {"type": "json_object"}}
+
+    tool_response = {
+        "content": "",
+        "tool_calls": [
+            {
+                "name": "record_memory_changes",
+                "arguments": {
+                    "facts": ["Is vegetarian"],
+                    "memory": [{"id": 0, "text": "Is vegetarian", "event": "UPDATE"}, {"id": "1", "event": "ADD"}],
+                },
+            }
+        ],
+    }
+    assert parse_fused_response(tool_response, ["0"]) == {
+        "facts": ["Is vegetarian"],
+        "memory": [{"id": "0", "text": "Is vegetarian", "event": "UPDATE", "old_memory": None}],
+    }
+    with pytest.raises(ValueError):
+        parse_fused_response("not json", [])
+
+
+def test_facts_searched_while_streaming(memory_instance):
+    first_fact_searched = threading.Event()
+
+    def stream_response(messages, response_format):
+        yield '{"facts": ["Lives in Paris", '
+        # The first fact is embedded and searched before the rest of the response is generated
+        assert first_fact_searched.wait(timeout=5)
+        yield '"Loves pizza"]}'
+
+    def search(query, vectors, limit, filters):
+        first_fact_searched.set()
+        return []
+
+    memory_instance.vector_store.search.side_effect = search
+    memory_instance.embedding_model = Mock()
+    memory_instance.embedding_model.embed.return_value = [0.1]
+    memory_instance.llm.stream_response = stream_response
+    memory_instance.llm.generate_response = Mock(return_value='{"memory": []}')
+
+    actions, _, embeddings, inferred = memory_instance._get_memory_actions("user: hi", {"user_id": "test_user"})
+
+    assert embeddings == {"Lives in Paris": [0.1], "Loves pizza": [0.1]}
+    assert inferred is True
+    assert "Loves pizza" in memory_instance.llm.generate_response.call_args.kwargs["messages"][1]["content"]
+
+
+def test_add_skips_messages_processed_by_earlier_adds(memory_instance):
+    from mem0.configs.base import InputWindowConfig
+    from mem0.memory.window import InputWindow
+
+    memory_instance.input_window = InputWindow(InputWindowConfig())
+    memory_instance._add_to_vector_store = Mock(return_value=([], True))
+    memory_instance._add_to_graph = Mock(return_value=[])
+    history = [
+        {"role": "user", "content": "I live in Paris"},
+        {"role": "assistant", "content": "Nice!"},
+    ]
+
+    memory_instance.add(history, user_id="test_user")
+    history += [{"role": "user", "content": "I have a cat"}]
+    memory_instance.add(history, user_id="test_user")
+    result = memory_instance.add(history, user_id="test_user")
+
+    sent = [call.args[0] for call in memory_instance._add_to_vector_store.call_args_list]
+    assert sent == [history[:2], history[2:]]
+    assert result == {"results": [], "relations": []}
+
+
+def test_messages_are_selected_again_after_failed_inference(memory_instance):
+    from mem0.configs.base import InputWindowConfig
+    from mem0.memory.window import InputWindow
+
+    memory_instance.input_window = InputWindow(InputWindowConfig())
+    memory_instance._add_to_vector_store = Mock(side_effect=[([], False), ([], True)])
+    memory_instance._add_to_graph = Mock(return_value=[])
+    history = [
+        {"role": "user", "content": "I live in Paris"},
+        {"role": "assistant", "content": "Nice!"},
+    ]
+
+    memory_instance.add(history, user_id="test_user")
+    memory_instance.add(history, user_id="test_user")
+
+    sent = [call.args[0] for call in memory_instance._add_to_vector_store.call_args_list]
+    assert sent == [history, history]
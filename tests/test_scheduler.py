@@ -0,0 +1,136 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.base import RateLimitConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.factory import LlmFactory
+from mem0.utils.scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    RateLimitedEmbedding,
+    RateLimitedLLM,
+    RequestScheduler,
+    TokenBucket,
+    clear_schedulers,
+    is_rate_limit_error,
+)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("mem0.utils.scheduler.time.sleep") as sleep:
+        yield sleep
+
+
+def test_token_bucket_refills_over_time():
+    with patch("mem0.utils.scheduler.time.monotonic", return_value=100.0) as clock:
+        bucket = TokenBucket(per_minute=60)
+        assert bucket.wait_time(60) == 0
+        bucket.take(60)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+
+        clock.return_value = 130.0
+        assert bucket.wait_time(30) == 0
+        # Requests larger than the bucket wait for a full bucket instead of forever
+        assert bucket.wait_time(600) == pytest.approx(30.0)
+
+
+def test_rate_limited_requests_are_retried_and_reduce_concurrency(no_sleep):
+    scheduler = RequestScheduler(RateLimitConfig(max_concurrency=8, max_retries=3))
+    fn = Mock(side_effect=[RateLimitError("slow down"), RateLimitError("slow down"), "ok"])
+
+    assert scheduler.call(fn) == "ok"
+    assert fn.call_count == 3
+    assert scheduler.stats == {"requests": 3, "rate_limited": 2, "retries": 2}
+    # Rate limits of requests sent together count once
+    assert scheduler.limit == pytest.approx(4 + 1 / 4)
+    assert no_sleep.call_count == 2
+    assert scheduler.in_flight == 0
+
+
+def test_non_retryable_errors_and_exhausted_retries_raise():
+    scheduler = RequestScheduler(RateLimitConfig(max_retries=1))
+    with pytest.raises(ValueError):
+        scheduler.call(Mock(side_effect=ValueError("bad request")))
+    with pytest.raises(RateLimitError):
+        scheduler.call(Mock(side_effect=RateLimitError("slow down")))
+    assert scheduler.stats["requests"] == 3
+    assert scheduler.in_flight == 0
+
+
+def test_interactive_requests_go_first():
+    scheduler = RequestScheduler(RateLimitConfig(max_concurrency=1))
+    scheduler.acquire()
+    served = []
+
+    def request(priority):
+        scheduler.acquire(priority=priority)
+        served.append(priority)
+        scheduler.release()
+
+    background = threading.Thread(target=request, args=(BACKGROUND,))
+    background.start()
+    while not scheduler._waiting:
+        time.sleep(0.001)
+    interactive = threading.Thread(target=request, args=(INTERACTIVE,))
+    interactive.start()
+    while len(scheduler._waiting) < 2:
+        time.sleep(0.001)
+
+    scheduler.release()
+    background.join(timeout=5)
+    interactive.join(timeout=5)
+    assert served == [INTERACTIVE, BACKGROUND]
+
+
+def test_factory_shares_schedulers_per_model():
+    config = {"model": "gpt-4o-mini", "api_key": "key", "rate_limit": {"requests_per_minute": 500}}
+    with patch("mem0.llms.openai.OpenAI"):
+        first = LlmFactory.create("openai", config)
+        second = LlmFactory.create("openai", config)
+        other = LlmFactory.create("openai", {**config, "model": "gpt-4o"})
+        plain = LlmFactory.create("openai", {"model": "gpt-4o-mini", "api_key": "key"})
+
+    assert isinstance(first, RateLimitedLLM) and first.config.model == "gpt-4o-mini"
+    assert first.scheduler is second.scheduler
+    assert first.scheduler is not other.scheduler
+    assert first.scheduler.requests.capacity == 500
+    assert not isinstance(plain, RateLimitedLLM)
+    clear_schedulers()
+
+
+def test_stream_holds_its_slot_until_consumed():
+    scheduler = RequestScheduler(RateLimitConfig(max_concurrency=2))
+    chunks = scheduler.stream(lambda: iter(["a", "b"]))
+    assert next(chunks) == "a"
+    assert scheduler.in_flight == 1
+    assert list(chunks) == ["b"]
+    assert scheduler.in_flight == 0
+
+
+def test_embedding_without_batch_endpoint_counts_each_text():
+    class Embedder(EmbeddingBase):
+        def embed(self, text, memory_action=None):
+            return [len(text)]
+
+    scheduler = RequestScheduler(RateLimitConfig())
+    embedder = RateLimitedEmbedding(Embedder(), scheduler)
+
+    assert embedder.embed_batch(["a", "bb"], "add") == [[1], [2]]
+    assert scheduler.stats["requests"] == 2
+    assert embedder.config is embedder.embedder.config
+
+
+def test_rate_limit_error_detection():
+    assert is_rate_limit_error(RateLimitError())
+    throttled = Exception()
+    throttled.response = {"Error": {"Code": "ThrottlingException"}}
+    assert is_rate_limit_error(throttled)
+    assert not is_rate_limit_error(ValueError("bad request"))
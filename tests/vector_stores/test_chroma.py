@@ -100,3 +100,45 @@ def test_list_vectors(chromadb_instance):
     assert len(results[0]) == 2
     assert results[0][0].id == "id1"
     assert results[0][1].id == "id2"
+
+
+def test_search_translates_multi_key_filters(chromadb_instance):
+    chromadb_instance.collection.query.return_value = {"ids": [[]], "distances": [[]], "metadatas": [[]]}
+
+    chromadb_instance.search(query="", vectors=[[0.1, 0.2, 0.3]], limit=2, filters={"user_id": "alice", "run_id": "r1"})
+
+    chromadb_instance.collection.query.assert_called_once_with(
+        query_embeddings=[[0.1, 0.2, 0.3]],
+        where={"$and": [{"user_id": "alice"}, {"run_id": "r1"}]},
+        n_results=2,
+    )
+
+
+def test_generate_where_clause():
+    assert ChromaDB._generate_where_clause(None) is None
+    assert ChromaDB._generate_where_clause({"user_id": "alice"}) == {"user_id": "alice"}
+    assert ChromaDB._generate_where_clause({"user_id": ["alice", "bob"]}) == {"user_id": {"$in": ["alice", "bob"]}}
+
+
+def test_insert_is_chunked_by_max_batch_size(chromadb_instance):
+    chromadb_instance.max_batch_size = 2
+    vectors = [[0.1], [0.2], [0.3]]
+    payloads = [{"n": 1}, {"n": 2}, {"n": 3}]
+    ids = ["id1", "id2", "id3"]
+
+    chromadb_instance.insert(vectors=vectors, payloads=payloads, ids=ids)
+
+    assert chromadb_instance.collection.add.call_count == 2
+    chromadb_instance.collection.add.assert_called_with(ids=["id3"], embeddings=[[0.3]], metadatas=[{"n": 3}])
+
+
+def test_clients_are_shared_per_path(mock_chromadb_client):
+    mock_chromadb_client.side_effect = lambda settings: Mock()
+    with patch.dict("mem0.vector_stores.chroma._client_registry", clear=True):
+        first = ChromaDB(collection_name="first", path="/tmp/shared_chroma")
+        second = ChromaDB(collection_name="second", path="/tmp/shared_chroma")
+        other = ChromaDB(collection_name="third", path="/tmp/other_chroma")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert mock_chromadb_client.call_count == 2
@@ -204,6 +204,7 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(body["knn"]["query_vector"], vectors)
         self.assertEqual(body["knn"]["k"], 5)
         self.assertEqual(body["knn"]["num_candidates"], 10)
+        self.assertEqual(body["_source"], {"excludes": ["vector"]})
 
         # Verify results
         self.assertEqual(len(results), 1)
@@ -211,6 +212,53 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_with_configured_num_candidates(self):
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+        self.es_db.num_candidates = 200
+
+        self.es_db.search(query="", vectors=[[0.1] * 1536], limit=5, filters={"user_id": "alice"})
+
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["knn"]["num_candidates"], 200)
+        self.assertEqual(body["knn"]["filter"], {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}})
+
+    def test_list_uses_search_after_for_large_limits(self):
+        self.es_db.list_page_size = 2
+        self.client_mock.open_point_in_time.return_value = {"id": "pit1"}
+        self.client_mock.search.side_effect = [
+            {
+                "pit_id": "pit1",
+                "hits": {
+                    "hits": [
+                        {"_id": "id1", "_source": {"metadata": {"data": "a"}}, "sort": [1]},
+                        {"_id": "id2", "_source": {"metadata": {"data": "b"}}, "sort": [2]},
+                    ]
+                },
+            },
+            {"pit_id": "pit1", "hits": {"hits": [{"_id": "id3", "_source": {"metadata": {"data": "c"}}, "sort": [3]}]}},
+        ]
+
+        results = self.es_db.list(filters={"user_id": "alice"}, limit=3)
+
+        self.assertEqual([r.id for r in results[0]], ["id1", "id2", "id3"])
+        second_body = self.client_mock.search.call_args_list[1][1]["body"]
+        self.assertEqual(second_body["search_after"], [2])
+        self.assertEqual(second_body["size"], 1)
+        self.assertEqual(second_body["pit"]["id"], "pit1")
+        self.client_mock.close_point_in_time.assert_called_once_with(id="pit1")
+
+    def test_delete_by_filters(self):
+        self.client_mock.delete_by_query.return_value = {"deleted": 4}
+
+        deleted = self.es_db.delete_by_filters({"user_id": "alice"})
+
+        self.assertEqual(deleted, 4)
+        self.client_mock.delete_by_query.assert_called_once_with(
+            index="test_collection",
+            body={"query": {"bool": {"must": [{"term": {"metadata.user_id": "alice"}}]}}},
+            refresh=True,
+        )
+
     def test_custom_search_query(self):
         # Mock custom search query
         self.es_db.custom_search_query = Mock()
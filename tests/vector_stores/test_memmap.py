@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from mem0.utils.factory import VectorStoreFactory
+from mem0.vector_stores.memmap import MemmapDB
+
+
+@pytest.fixture
+def memmap_db(tmp_path):
+    return MemmapDB(collection_name="test_collection", path=str(tmp_path), embedding_model_dims=3)
+
+
+def test_insert_search_and_persist(memmap_db, tmp_path):
+    memmap_db.insert(
+        vectors=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.9, 0.1, 0.0]],
+        payloads=[
+            {"data": "a", "user_id": "alice"},
+            {"data": "b", "user_id": "bob"},
+            {"data": "c", "user_id": "alice"},
+        ],
+        ids=["id1", "id2", "id3"],
+    )
+
+    results = memmap_db.search(query="", vectors=[1.0, 0.0, 0.0], limit=2)
+    assert [r.id for r in results] == ["id1", "id3"]
+    assert results[0].score == pytest.approx(1.0)
+
+    reopened = MemmapDB(collection_name="test_collection", path=str(tmp_path), embedding_model_dims=3)
+    assert reopened.get("id2").payload == {"data": "b", "user_id": "bob"}
+    assert reopened.col_info()["count"] == 3
+
+
+def test_filters_are_pushed_down(memmap_db):
+    memmap_db.insert(
+        vectors=[[1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.8, 0.2, 0.0]],
+        payloads=[
+            {"user_id": "alice", "category": "movies"},
+            {"user_id": "bob", "category": "movies"},
+            {"user_id": "alice", "category": "food"},
+        ],
+        ids=["id1", "id2", "id3"],
+    )
+
+    results = memmap_db.search(query="", vectors=[1.0, 0.0, 0.0], limit=5, filters={"user_id": "alice"})
+    assert [r.id for r in results] == ["id1", "id3"]
+
+    results = memmap_db.search(
+        query="", vectors=[1.0, 0.0, 0.0], limit=5, filters={"user_id": "alice", "category": "food"}
+    )
+    assert [r.id for r in results] == ["id3"]
+
+    listed = memmap_db.list(filters={"category": ["movies", "food"]}, limit=2)[0]
+    assert [r.id for r in listed] == ["id1", "id2"]
+
+
+def test_update_delete_and_compaction(tmp_path):
+    db = MemmapDB(collection_name="c", path=str(tmp_path), embedding_model_dims=2, compaction_threshold=0.5)
+    db.insert(vectors=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], payloads=[{}, {}, {}], ids=["a", "b", "c"])
+
+    db.update("b", vector=[1.0, 0.0], payload={"data": "moved"})
+    assert db.search(query="", vectors=[1.0, 0.0], limit=2)[1].id == "b"
+
+    db.delete("a")
+    assert db.col_info()["deleted"] == 1
+    assert [r.id for r in db.search(query="", vectors=[1.0, 0.0], limit=3)] == ["b", "c"]
+
+    db.delete("c")
+    info = db.col_info()
+    assert info["deleted"] == 0 and info["count"] == 1
+    assert db.get("b").payload == {"data": "moved"}
+    assert db.search(query="", vectors=[1.0, 0.0], limit=3)[0].id == "b"
+
+
+def test_matches_brute_force_across_blocks(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(3000, 8)).astype(np.float32)
+    db = MemmapDB(
+        collection_name="c", path=str(tmp_path), embedding_model_dims=8, distance_strategy="euclidean", block_size=256
+    )
+    db.insert(vectors=vectors.tolist(), payloads=[{} for _ in vectors], ids=[str(i) for i in range(len(vectors))])
+
+    query = rng.normal(size=8).astype(np.float32)
+    distances = np.linalg.norm(vectors - query, axis=1)
+    expected = np.argsort(distances)[:10]
+
+    results = db.search(query="", vectors=query.tolist(), limit=10)
+    assert [int(r.id) for r in results] == expected.tolist()
+    assert results[0].score == pytest.approx(distances[expected[0]], rel=1e-4)
+
+
+def test_factory_creates_memmap_store(tmp_path):
+    store = VectorStoreFactory.create(
+        "memmap", {"collection_name": "factory", "path": str(tmp_path), "embedding_model_dims": 4}
+    )
+    assert isinstance(store, MemmapDB)
+    assert store.list_cols() == ["factory"]
+    store.delete_col()
+    assert store.list_cols() == []
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.configs.vector_stores.milvus import MetricType
+from mem0.vector_stores.milvus import MilvusDB
+
+
+@pytest.fixture
+def mock_milvus_client():
+    with patch("mem0.vector_stores.milvus.MilvusClient") as mock_client:
+        client = MagicMock()
+        client.has_collection.return_value = False
+        client.describe_collection.return_value = {
+            "fields": [{"name": "id"}, {"name": "vectors"}, {"name": "metadata"}, {"name": "user_id"}]
+        }
+        mock_client.return_value = client
+        yield client
+
+
+@pytest.fixture
+def milvus_db(mock_milvus_client):
+    return MilvusDB(
+        url="http://localhost:19530",
+        token=None,
+        collection_name="test_collection",
+        embedding_model_dims=3,
+        metric_type=MetricType.COSINE,
+        index_type="HNSW",
+        index_params={"M": 16, "efConstruction": 200},
+        search_params={"ef": 64},
+        num_partitions=32,
+        json_index_keys=["agent_id"],
+    )
+
+
+def test_create_col_declares_partition_key(milvus_db, mock_milvus_client):
+    call_kwargs = mock_milvus_client.create_collection.call_args.kwargs
+    fields = {field.name: field for field in call_kwargs["schema"].fields}
+
+    assert fields["user_id"].is_partition_key
+    assert call_kwargs["num_partitions"] == 32
+    mock_milvus_client.create_index.assert_called_once()
+
+
+def test_insert_is_batched(milvus_db, mock_milvus_client):
+    ids = ["id1", "id2"]
+    vectors = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    payloads = [{"user_id": "alice", "data": "a"}, {"agent_id": "bot", "data": "b"}]
+
+    milvus_db.insert(ids=ids, vectors=vectors, payloads=payloads)
+
+    mock_milvus_client.insert.assert_called_once_with(
+        collection_name="test_collection",
+        data=[
+            {"id": "id1", "vectors": vectors[0], "metadata": payloads[0], "user_id": "alice"},
+            {"id": "id2", "vectors": vectors[1], "metadata": payloads[1], "user_id": ""},
+        ],
+    )
+
+
+def test_search_uses_partition_key_and_search_params(milvus_db, mock_milvus_client):
+    mock_milvus_client.search.return_value = [
+        [{"id": "id1", "distance": 0.9, "entity": {"metadata": {"user_id": "alice", "data": "a"}}}]
+    ]
+
+    results = milvus_db.search(query="", vectors=[0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice", "run_id": "r1"})
+
+    mock_milvus_client.search.assert_called_once_with(
+        collection_name="test_collection",
+        data=[[0.1, 0.2, 0.3]],
+        limit=2,
+        filter='(user_id == "alice") and (metadata["run_id"] == "r1")',
+        output_fields=["metadata"],
+        search_params={"params": {"ef": 64}},
+    )
+    assert results[0].id == "id1"
+    assert results[0].score == 0.9
+
+
+def test_filter_falls_back_to_metadata_without_partition_key(mock_milvus_client):
+    mock_milvus_client.has_collection.return_value = True
+    mock_milvus_client.describe_collection.return_value = {"fields": [{"name": "id"}, {"name": "metadata"}]}
+
+    db = MilvusDB(
+        url="http://localhost:19530",
+        token=None,
+        collection_name="legacy",
+        embedding_model_dims=3,
+        metric_type=MetricType.L2,
+    )
+
+    assert db._create_filter({"user_id": "alice"}) == '(metadata["user_id"] == "alice")'
+    db.update(vector_id="id1", vector=[0.1, 0.2, 0.3], payload={"user_id": "alice"})
+    mock_milvus_client.upsert.assert_called_once_with(
+        collection_name="legacy", data={"id": "id1", "vectors": [0.1, 0.2, 0.3], "metadata": {"user_id": "alice"}}
+    )
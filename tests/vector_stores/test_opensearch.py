@@ -172,11 +172,45 @@ class TestOpenSearchDB(unittest.TestCase):
         self.assertIn("vector_field", body["query"]["knn"])
         self.assertEqual(body["query"]["knn"]["vector_field"]["vector"], vectors)
         self.assertEqual(body["query"]["knn"]["vector_field"]["k"], 10)
+        self.assertEqual(body["size"], 5)
+        self.assertEqual(body["_source"], {"excludes": ["vector_field"]})
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].id, "id1")
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_search_with_ef_search_on_faiss(self):
+        self.client_mock.search.return_value = {"hits": {"hits": []}}
+        self.os_db.engine = "faiss"
+        self.os_db.ef_search = 128
+        self.os_db.num_candidates = 50
+        self.os_db.search(query="", vectors=[[0.1] * 1536], limit=5)
+        knn = self.client_mock.search.call_args[1]["body"]["query"]["knn"]["vector_field"]
+        self.assertEqual(knn["k"], 50)
+        self.assertEqual(knn["method_parameters"], {"ef_search": 128})
+
+    def test_list_uses_search_after_for_large_limits(self):
+        self.os_db.list_page_size = 1
+        self.client_mock.search.side_effect = [
+            {"hits": {"hits": [{"_source": {"id": "id1", "payload": {}}, "sort": ["id1"]}]}},
+            {"hits": {"hits": []}},
+        ]
+        results = self.os_db.list(limit=3)
+        self.assertEqual([r.id for r in results[0]], ["id1"])
+        second_body = self.client_mock.search.call_args_list[1][1]["body"]
+        self.assertEqual(second_body["search_after"], ["id1"])
+        self.assertEqual(second_body["sort"], [{"id": "asc"}])
+
+    def test_delete_by_filters(self):
+        self.client_mock.delete_by_query = MagicMock(return_value={"deleted": 2})
+        deleted = self.os_db.delete_by_filters({"user_id": "alice"})
+        self.assertEqual(deleted, 2)
+        self.client_mock.delete_by_query.assert_called_once_with(
+            index="test_collection",
+            body={"query": {"bool": {"filter": [{"term": {"payload.user_id.keyword": "alice"}}]}}},
+            refresh=True,
+        )
+
     def test_delete(self):
         mock_search_response = {"hits": {"hits": [{"_id": "doc1", "_source": {"id": "id1"}}]}}
         self.client_mock.search.return_value = mock_search_response
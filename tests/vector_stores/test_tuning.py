@@ -0,0 +1,154 @@
+import logging
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mem0.utils.factory import VectorStoreFactory
+from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.tuning import SearchParamTuner, load_search_params, save_search_params
+
+
+class Hit:
+    def __init__(self, id, score):
+        self.id = id
+        self.score = score
+        self.payload = {}
+
+
+class ApproximateStore(VectorStoreBase):
+    """Exact search over only the first `candidates` vectors, so recall grows with the candidate pool."""
+
+    def __init__(self, ids, vectors):
+        self.ids = ids
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self.candidates = 1
+
+    def get_search_param_grid(self, k):
+        return {"candidates": [k, 10 * k, len(self.ids)]}
+
+    def search(self, query, vectors, limit=5, filters=None):
+        pool = self.vectors[: self.candidates]
+        scores = pool @ np.asarray(vectors, dtype=np.float32)
+        order = np.argsort(-scores)[:limit]
+        return [Hit(self.ids[i], float(scores[i])) for i in order]
+
+    def create_col(self, name, vector_size, distance):
+        pass
+
+    def insert(self, vectors, payloads=None, ids=None):
+        pass
+
+    def delete(self, vector_id):
+        pass
+
+    def update(self, vector_id, vector=None, payload=None):
+        pass
+
+    def get(self, vector_id):
+        pass
+
+    def list_cols(self):
+        pass
+
+    def delete_col(self):
+        pass
+
+    def col_info(self):
+        pass
+
+    def list(self, filters=None, limit=None):
+        pass
+
+    def reset(self):
+        pass
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"id{i}" for i in range(len(vectors))]
+    return ids, vectors
+
+
+def test_tuner_picks_cheapest_setting_meeting_recall(corpus):
+    ids, vectors = corpus
+    store = ApproximateStore(ids, vectors)
+    tuner = SearchParamTuner(store, recall_target=0.99, k=5, num_queries=20, metric="ip", seed=1)
+
+    result = tuner.tune(ids=ids, vectors=vectors)
+
+    assert result.target_met
+    assert result.params == {"candidates": 200}
+    assert store.candidates == 200
+    assert len(result.trials) == 3
+    assert result.trials[0].recall < result.recall
+
+
+def test_tuner_requires_payloads_for_filters(corpus):
+    ids, vectors = corpus
+    tuner = SearchParamTuner(ApproximateStore(ids, vectors), k=5)
+
+    with pytest.raises(ValueError):
+        tuner.tune(ids=ids, vectors=vectors, filters={"user_id": "alice"})
+
+
+def test_factory_applies_persisted_search_params(tmp_path):
+    path = str(tmp_path / "search_params.json")
+    config = {"collection_name": "tuned", "path": str(tmp_path / "faiss"), "embedding_model_dims": 4}
+    save_search_params("faiss", "tuned", {"fetch_k_multiplier": 8}, path=path, config=config)
+    assert load_search_params("faiss", "tuned", path=path, config=config) == {"fetch_k_multiplier": 8}
+
+    with patch("mem0.vector_stores.tuning.DEFAULT_SEARCH_PARAMS_PATH", path):
+        store = VectorStoreFactory.create("faiss", config)
+        other = VectorStoreFactory.create("faiss", {**config, "path": str(tmp_path / "other")})
+
+    assert store.fetch_k_multiplier == 8
+    assert other.fetch_k_multiplier != 8
+
+
+def test_params_are_kept_per_deployment(tmp_path):
+    path = str(tmp_path / "search_params.json")
+    save_search_params("qdrant", "mem0", {"hnsw_ef": 64}, path=path, config={"host": "a.internal", "port": 6333})
+    save_search_params("qdrant", "mem0", {"hnsw_ef": 256}, path=path, config={"host": "b.internal", "port": 6333})
+
+    assert load_search_params("qdrant", "mem0", path=path, config={"host": "a.internal", "port": 6333}) == {
+        "hnsw_ef": 64
+    }
+    assert load_search_params("qdrant", "mem0", path=path, config={"host": "b.internal", "port": 6333}) == {
+        "hnsw_ef": 256
+    }
+    assert load_search_params("qdrant", "mem0", path=path, config={"host": "c.internal", "port": 6333}) is None
+    # Connection details are hashed, not written to the file
+    with open(path) as f:
+        assert "internal" not in f.read()
+
+
+def test_tune_and_save_persists_the_selected_params(corpus, tmp_path):
+    ids, vectors = corpus
+    path = str(tmp_path / "search_params.json")
+    config = {"collection_name": "mem0", "url": "http://localhost:6333"}
+    tuner = SearchParamTuner(ApproximateStore(ids, vectors), recall_target=0.99, k=5, num_queries=20, seed=1)
+
+    result = tuner.tune_and_save("qdrant", config, ids=ids, vectors=vectors, path=path)
+
+    assert load_search_params("qdrant", "mem0", path=path, config=config) == result.params
+
+
+def test_factory_skips_stale_search_params(tmp_path, caplog):
+    path = str(tmp_path / "search_params.json")
+    config = {"collection_name": "tuned", "path": str(tmp_path / "faiss"), "embedding_model_dims": 4}
+    save_search_params("faiss", "tuned", {"fetch_k_multiplier": 8, "removed_param": 1}, path=path, config=config)
+
+    with patch("mem0.vector_stores.tuning.DEFAULT_SEARCH_PARAMS_PATH", path):
+        with caplog.at_level(logging.WARNING):
+            store = VectorStoreFactory.create("faiss", config)
+
+    assert store.fetch_k_multiplier == 8
+    assert not hasattr(store, "removed_param")
+    assert "removed_param" in caplog.text
+    # Explicit calls still reject unknown parameters
+    with pytest.raises(ValueError):
+        store.set_search_params({"removed_param": 1})